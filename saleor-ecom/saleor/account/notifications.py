@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from urllib.parse import urlencode
 
 from django.contrib.auth.tokens import default_token_generator
@@ -37,6 +38,10 @@ def get_user_custom_payload(user: User):
     return payload
 
 
+def get_users_custom_payload(users: Iterable[User]):
+    return [get_user_custom_payload(user) for user in users]
+
+
 def send_password_reset_notification(
     redirect_url, user, manager, channel_slug: str | None, staff=False
 ):
@@ -0,0 +1,91 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:13
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0198_variant_sku_gin_index"),
+        ("attribute", "0046_auto_20240611_1143"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductAttributeFilterValue",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attribute_filter_values",
+                        to="product.product",
+                    ),
+                ),
+                (
+                    "product_value_assignment",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="filter_value",
+                        to="attribute.assignedproductattributevalue",
+                    ),
+                ),
+                (
+                    "value",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="product_filter_values",
+                        to="attribute.attributevalue",
+                    ),
+                ),
+                (
+                    "variant_value_assignment",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="filter_value",
+                        to="attribute.assignedvariantattributevalue",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    django.contrib.postgres.indexes.BTreeIndex(
+                        fields=["value", "product"], name="prodattrfilterval_value_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO attribute_productattributefiltervalue
+                (product_id, value_id, product_value_assignment_id)
+            SELECT product_id, value_id, id
+            FROM attribute_assignedproductattributevalue;
+
+            INSERT INTO attribute_productattributefiltervalue
+                (product_id, value_id, variant_value_assignment_id)
+            SELECT variant.product_id, variant_value.value_id, variant_value.id
+            FROM attribute_assignedvariantattributevalue variant_value
+            INNER JOIN attribute_assignedvariantattribute assignment
+                ON assignment.id = variant_value.assignment_id
+            INNER JOIN product_productvariant variant
+                ON variant.id = assignment.variant_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
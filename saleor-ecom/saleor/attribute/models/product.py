@@ -48,3 +48,41 @@ class AttributeProduct(SortableModel):
 
     def get_ordering_queryset(self):
         return self.product_type.attributeproduct.all()
+
+
+class ProductAttributeFilterValue(models.Model):
+    """Attribute value assigned to a product or to any of the product variants.
+
+    Denormalized from the product and variant value assignments, so products can be
+    filtered by the attribute values with a single indexed semi-join. The rows are
+    created with the assignments and deleted with them by the cascade.
+    """
+
+    product = models.ForeignKey(
+        Product, related_name="attribute_filter_values", on_delete=models.CASCADE
+    )
+    value = models.ForeignKey(
+        "AttributeValue",
+        related_name="product_filter_values",
+        on_delete=models.CASCADE,
+        db_index=False,
+    )
+    product_value_assignment = models.OneToOneField(
+        AssignedProductAttributeValue,
+        related_name="filter_value",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    variant_value_assignment = models.OneToOneField(
+        "AssignedVariantAttributeValue",
+        related_name="filter_value",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        indexes = [
+            BTreeIndex(fields=["value", "product"], name="prodattrfilterval_value_idx")
+        ]
@@ -3,9 +3,15 @@ import pytest
 from ...attribute.models import AssignedPageAttributeValue
 from ...product.models import ProductType
 from .. import AttributeInputType, AttributeType
-from ..models import Attribute, AttributeValue
+from ..models import (
+    AssignedProductAttributeValue,
+    Attribute,
+    AttributeValue,
+    ProductAttributeFilterValue,
+)
 from ..utils import (
     associate_attribute_values_to_instance,
+    update_product_attribute_filter_values,
     validate_attribute_owns_values,
 )
 from .model_helpers import (
@@ -264,3 +270,65 @@ def test_validate_attribute_owns_values(attribute_1, attribute_2):
         attribute_1.id: [attribute_1.values.first()],
         attribute_2.id: [attribute_2.values.first()],
     }
+
+
+def test_associate_attribute_to_product_updates_filter_values(
+    product, attribute_value_generator
+):
+    """Ensure the filter values follow the values assigned to the product."""
+    attribute = get_product_attributes(product).first()
+    new_value = attribute_value_generator(attribute=attribute, slug="attr-value2")
+
+    associate_attribute_values_to_instance(product, {attribute.id: [new_value]})
+
+    assert list(
+        ProductAttributeFilterValue.objects.filter(
+            product=product, value__attribute=attribute
+        ).values_list("value_id", flat=True)
+    ) == [new_value.pk]
+
+    associate_attribute_values_to_instance(product, {attribute.id: []})
+
+    assert not ProductAttributeFilterValue.objects.filter(
+        product=product, value__attribute=attribute
+    ).exists()
+
+
+def test_associate_attribute_to_variant_updates_filter_values(
+    variant, attribute_value_generator
+):
+    """Ensure the values assigned to the variant are stored for the product."""
+    attribute = variant.product.product_type.variant_attributes.first()
+    new_value = attribute_value_generator(attribute=attribute, slug="attr-value2")
+
+    associate_attribute_values_to_instance(variant, {attribute.id: [new_value]})
+
+    filter_values = ProductAttributeFilterValue.objects.filter(
+        variant_value_assignment__assignment__variant=variant
+    )
+    assert list(filter_values.values_list("product_id", "value_id")) == [
+        (variant.product_id, new_value.pk)
+    ]
+
+    variant.delete()
+
+    assert not filter_values.exists()
+
+
+def test_update_product_attribute_filter_values_changed_value(
+    product, attribute_value_generator
+):
+    """Ensure the filter value is updated when the assigned value is changed."""
+    attribute = get_product_attributes(product).first()
+    new_value = attribute_value_generator(attribute=attribute, slug="attr-value2")
+    AssignedProductAttributeValue.objects.filter(product=product).update(
+        value=new_value
+    )
+
+    update_product_attribute_filter_values(product_ids=[product.pk])
+
+    assert list(
+        ProductAttributeFilterValue.objects.filter(
+            product=product, value__attribute=attribute
+        ).values_list("value_id", flat=True)
+    ) == [new_value.pk]
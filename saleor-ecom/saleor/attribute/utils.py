@@ -1,6 +1,10 @@
 from collections import defaultdict
+from collections.abc import Iterable
 from functools import reduce
 
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
 from django.db.models import Exists, OuterRef, Q
 
 from ..page.models import Page
@@ -14,6 +18,7 @@ from .models import (
     AttributeProduct,
     AttributeValue,
     AttributeVariant,
+    ProductAttributeFilterValue,
 )
 
 T_INSTANCE = Product | ProductVariant | Page
@@ -49,6 +54,58 @@ def associate_attribute_values_to_instance(
     # Associate the attribute and the passed values
     _associate_attribute_to_instance(instance, attr_val_map)
 
+    if isinstance(instance, Product):
+        update_product_attribute_filter_values(product_ids=[instance.pk])
+    elif isinstance(instance, ProductVariant):
+        update_product_attribute_filter_values(variant_ids=[instance.pk])
+
+
+def update_product_attribute_filter_values(
+    *, product_ids: Iterable[int] = (), variant_ids: Iterable[int] = ()
+):
+    """Create or update the filter values of the given products and variants.
+
+    The values assigned directly to the products and to the variants are
+    upserted with a single query each. The filter values of the unassigned
+    values are deleted by the cascade, so they don't need to be handled here.
+    """
+    product_ids = list(product_ids)
+    variant_ids = list(variant_ids)
+    if product_ids:
+        _insert_product_attribute_filter_values(
+            AssignedProductAttributeValue.objects.filter(
+                product_id__in=product_ids
+            ).values_list("product_id", "value_id", "id"),
+            "product_value_assignment",
+        )
+    if variant_ids:
+        _insert_product_attribute_filter_values(
+            AssignedVariantAttributeValue.objects.filter(
+                assignment__variant_id__in=variant_ids
+            ).values_list("assignment__variant__product_id", "value_id", "id"),
+            "variant_value_assignment",
+        )
+
+
+def _insert_product_attribute_filter_values(assigned_values, assignment_field: str):
+    try:
+        sql, params = assigned_values.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return
+    meta = ProductAttributeFilterValue._meta
+    product_column = meta.get_field("product").column
+    value_column = meta.get_field("value").column
+    assignment_column = meta.get_field(assignment_field).column
+    with connections[settings.DATABASE_CONNECTION_DEFAULT_NAME].cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {meta.db_table} "
+            f"({product_column}, {value_column}, {assignment_column}) {sql} "
+            f"ON CONFLICT ({assignment_column}) DO UPDATE SET "
+            f"{product_column} = EXCLUDED.{product_column}, "
+            f"{value_column} = EXCLUDED.{value_column}",
+            params,
+        )
+
 
 def validate_attribute_owns_values(attr_val_map: dict[int, list]) -> None:
     if not attr_val_map:
@@ -58,9 +115,12 @@ def validate_attribute_owns_values(attr_val_map: dict[int, list]) -> None:
 
     # we need to fetch the proper values which attribute ids and value slug matches
     lookup = reduce(
-        lambda acc, val_map_item: acc
-        | Q(
-            attribute_id=val_map_item[0], slug__in=[val.slug for val in val_map_item[1]]
+        lambda acc, val_map_item: (
+            acc
+            | Q(
+                attribute_id=val_map_item[0],
+                slug__in=[val.slug for val in val_map_item[1]],
+            )
         ),
         attr_val_map.items(),
         Q(),
@@ -32,7 +32,10 @@ from ..tax.utils import (
     normalize_tax_rate_for_db,
     validate_tax_data,
 )
-from .fetch import find_checkout_line_info
+from .fetch import (
+    find_checkout_line_info,
+    request_external_shipping_methods_in_background,
+)
 from .models import Checkout
 from .payment_utils import update_checkout_payment_statuses
 
@@ -387,6 +390,16 @@ def _fetch_checkout_prices_if_expired(
         checkout_info, lines, database_connection_name
     )
 
+    wait_for_shipping_methods = None
+    if tax_calculation_strategy == TaxCalculationStrategy.TAX_APP and (
+        prices_entered_with_tax or should_charge_tax
+    ):
+        # Fetch the external shipping methods concurrently with the tax app call,
+        # both are sync webhooks independent of each other.
+        wait_for_shipping_methods = request_external_shipping_methods_in_background(
+            checkout_info, lines
+        )
+
     checkout.tax_error = None
     if prices_entered_with_tax:
         # If prices are entered with tax, we need to always calculate it anyway, to
@@ -446,6 +459,9 @@ def _fetch_checkout_prices_if_expired(
             # Calculate net prices without taxes.
             _set_checkout_base_prices(checkout, checkout_info, lines)
 
+    if wait_for_shipping_methods:
+        wait_for_shipping_methods()
+
     checkout_update_fields = [
         "voucher_code",
         "total_net_amount",
@@ -720,6 +720,7 @@ def _create_order(
 
     OrderLine.objects.bulk_create(order_lines)
     OrderLineDiscount.objects.bulk_create(order_line_discounts)
+    order.lines_count = len(order_lines)
 
     country_code = checkout_info.get_country()
     additional_warehouse_lookup = (
@@ -1407,12 +1408,14 @@ def _create_order_from_checkout(
     currency = checkout_info.checkout.currency
     subtotal_list = [line.line.total_price for line in order_lines_info]
     order.subtotal = sum(subtotal_list, zero_taxed_money(currency))
+    order.lines_count = len(order_lines_info)
     order.save(
         update_fields=[
             "undiscounted_total_net_amount",
             "undiscounted_total_gross_amount",
             "subtotal_net_amount",
             "subtotal_gross_amount",
+            "lines_count",
         ]
     )
     # allocations
@@ -1,5 +1,5 @@
 import itertools
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from decimal import Decimal
 from functools import cached_property, singledispatch
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 from uuid import UUID
 
 from django.conf import settings
+from django.utils.functional import SimpleLazyObject
 from prices import Money
 
 from ..core.db.connection import allow_writer
@@ -125,6 +126,9 @@ class CheckoutInfo:
     pregenerated_payloads_for_excluded_shipping_method: dict | None = None
 
     allow_sync_webhooks: bool = True
+    # Set when the shipping methods are resolved together with the prices, so
+    # the external ones can be requested while the taxes are calculated.
+    shipping_methods_requested: bool = False
     _cached_built_in_shipping_methods: list[ShippingMethodData] | None = None
     _cached_external_shipping_methods: list[ShippingMethodData] | None = None
 
@@ -675,6 +679,51 @@ def get_external_shipping_methods_for_checkout_info(
     )
 
 
+def request_external_shipping_methods_in_background(
+    checkout_info: "CheckoutInfo", lines: list[CheckoutLineInfo]
+) -> Callable[[], Any] | None:
+    """Start requesting the external shipping methods in the background.
+
+    The responses are stored in the shipping webhooks cache, so the external
+    shipping methods fetched later for the checkout are taken from the cache.
+    Nothing is requested unless `checkout_info.shipping_methods_requested` is
+    set, as the checkout updates that don't return the shipping methods don't
+    need them. Return the function waiting for the requests, or `None` when nothing is
+    requested.
+    """
+    from ..webhook.event_types import WebhookEventSyncType
+    from ..webhook.transport.shipping import request_shipping_methods_for_checkout
+    from ..webhook.utils import get_webhooks_for_event
+    from .utils import get_external_shipping_id, is_shipping_required
+
+    if (
+        settings.WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS <= 1
+        or not checkout_info.shipping_methods_requested
+        or not checkout_info.allow_sync_webhooks
+        or checkout_info._cached_external_shipping_methods is not None
+        or not is_shipping_required(lines)
+    ):
+        return None
+    # The selected external shipping method is required to calculate the prices,
+    # so the methods are fetched before them.
+    if get_external_shipping_id(checkout_info.checkout):
+        return None
+
+    webhooks = get_webhooks_for_event(
+        WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    )
+    if not webhooks:
+        return None
+    requestor_getter = checkout_info.manager.requestor_getter
+    return request_shipping_methods_for_checkout(
+        checkout_info.checkout,
+        webhooks,
+        allow_replica=False,
+        requestor=SimpleLazyObject(requestor_getter) if requestor_getter else None,
+        in_background=True,
+    )
+
+
 def get_all_shipping_methods_list(
     checkout_info,
 ):
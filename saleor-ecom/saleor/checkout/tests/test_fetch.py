@@ -1,7 +1,15 @@
+from unittest import mock
+
 import pytest
 
+from ...plugins.manager import get_plugins_manager
 from ...product.models import ProductChannelListing, ProductVariantChannelListing
-from ..fetch import CheckoutLineInfo, fetch_checkout_lines
+from ..fetch import (
+    CheckoutLineInfo,
+    fetch_checkout_info,
+    fetch_checkout_lines,
+    request_external_shipping_methods_in_background,
+)
 
 
 def test_checkout_line_info_undiscounted_unit_price(checkout_with_item_on_promotion):
@@ -312,3 +320,76 @@ def test_fetch_checkout_lines_info_when_variant_channel_listing_without_price(
     line = lines[0]
     assert line_info.line.pk == line.pk
     assert unavailable_variants == [line.variant_id]
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_request_external_shipping_methods_in_background(
+    mocked_webhook, checkout_with_item, address, shipping_app, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS = 4
+    checkout_with_item.shipping_address = address
+    checkout_with_item.save(update_fields=["shipping_address"])
+    mocked_webhook.return_value = []
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    manager = get_plugins_manager(allow_replica=False)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, manager)
+    checkout_info.shipping_methods_requested = True
+
+    # when
+    wait_for_shipping_methods = request_external_shipping_methods_in_background(
+        checkout_info, lines
+    )
+
+    # then
+    assert wait_for_shipping_methods is not None
+    assert wait_for_shipping_methods() == []
+    mocked_webhook.assert_called_once()
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_request_external_shipping_methods_in_background_external_shipping_selected(
+    mocked_webhook, checkout_with_item, address, shipping_app, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS = 4
+    checkout_with_item.shipping_address = address
+    checkout_with_item.external_shipping_method_id = "external-id"
+    checkout_with_item.save(
+        update_fields=["shipping_address", "external_shipping_method_id"]
+    )
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    manager = get_plugins_manager(allow_replica=False)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, manager)
+    checkout_info.shipping_methods_requested = True
+
+    # when
+    wait_for_shipping_methods = request_external_shipping_methods_in_background(
+        checkout_info, lines
+    )
+
+    # then
+    assert wait_for_shipping_methods is None
+    assert not mocked_webhook.called
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_request_external_shipping_methods_in_background_not_requested(
+    mocked_webhook, checkout_with_item, address, shipping_app, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS = 4
+    checkout_with_item.shipping_address = address
+    checkout_with_item.save(update_fields=["shipping_address"])
+    lines, _ = fetch_checkout_lines(checkout_with_item)
+    manager = get_plugins_manager(allow_replica=False)
+    checkout_info = fetch_checkout_info(checkout_with_item, lines, manager)
+
+    # when
+    wait_for_shipping_methods = request_external_shipping_methods_in_background(
+        checkout_info, lines
+    )
+
+    # then
+    assert wait_for_shipping_methods is None
+    assert not mocked_webhook.called
@@ -1,7 +1,28 @@
-from django.db.models import Case, F, JSONField, Value, When
+from django.db.models import Case, F, Field, Func, JSONField, Value, When
 from django.db.models.expressions import Expression
 
 
+class RowValue(Func):
+    """PostgreSQL row constructor.
+
+    Rows are compared column by column, so `RowValue(F("a"), F("b")) > (x, y)`
+    matches the same records as `a > x OR (a = x AND b > y)`, but can be
+    resolved by a single range scan of an index on `(a, b)`.
+
+    Examples
+        Model.objects.filter(
+            GreaterThan(
+                RowValue(F("name"), F("pk")),
+                RowValue(Value("name"), Value(1)),
+            )
+        )
+
+    """
+
+    function = "ROW"
+    output_field = Field()
+
+
 class PostgresJsonConcatenate(Expression):
     """Implementation of PostgreSQL concatenation for JSON fields.
 
@@ -0,0 +1,31 @@
+from ....warehouse.models import Stock
+from ..update import bulk_update_from_values
+
+
+def test_bulk_update_from_values(variant_with_many_stocks, django_assert_num_queries):
+    # given
+    stocks = list(variant_with_many_stocks.stocks.order_by("pk"))
+    for index, stock in enumerate(stocks):
+        stock.quantity = 100 + index
+        stock.quantity_allocated = 10
+
+    # when
+    with django_assert_num_queries(2):
+        updated = bulk_update_from_values(stocks, ["quantity"], batch_size=1)
+
+    # then
+    assert updated == len(stocks)
+    assert list(
+        Stock.objects.filter(pk__in=[stock.pk for stock in stocks])
+        .order_by("pk")
+        .values_list("quantity", "quantity_allocated")
+    ) == [(100 + index, 0) for index in range(len(stocks))]
+
+
+def test_bulk_update_from_values_no_objects(django_assert_num_queries):
+    # when
+    with django_assert_num_queries(0):
+        updated = bulk_update_from_values([], ["quantity"])
+
+    # then
+    assert updated == 0
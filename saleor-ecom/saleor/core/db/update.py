@@ -0,0 +1,56 @@
+from collections.abc import Sequence
+
+from django.db import connections
+from django.db.models import Model
+
+
+def bulk_update_from_values(
+    objs: Sequence[Model],
+    fields: Sequence[str],
+    batch_size: int = 1000,
+    using: str = "default",
+) -> int:
+    """Update the fields of the instances with `UPDATE ... FROM (VALUES ...)`.
+
+    Unlike `QuerySet.bulk_update`, which renders a `CASE` expression with a branch
+    for every instance and every field, the new values are joined to the table by
+    the primary key, so the statement stays cheap to plan and run for thousands
+    of rows. Return the number of updated rows.
+    """
+    if not objs:
+        return 0
+    model = type(objs[0])
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+    pk_field = model._meta.pk
+    model_fields = [pk_field] + [model._meta.get_field(name) for name in fields]
+
+    # The types of the columns are given explicitly, as PostgreSQL resolves
+    # quoted literals in a `VALUES` list as text.
+    placeholder = "({})".format(
+        ", ".join(f"%s::{field.db_type(connection)}" for field in model_fields)
+    )
+    aliases = ", ".join(quote_name(field.column) for field in model_fields)
+    assignments = ", ".join(
+        f"{quote_name(field.column)} = v.{quote_name(field.column)}"
+        for field in model_fields[1:]
+    )
+    pk_column = quote_name(pk_field.column)
+
+    updated = 0
+    with connection.cursor() as cursor:
+        for start in range(0, len(objs), batch_size):
+            batch = objs[start : start + batch_size]
+            params = [
+                field.get_db_prep_save(getattr(obj, field.attname), connection)
+                for obj in batch
+                for field in model_fields
+            ]
+            cursor.execute(
+                f"UPDATE {quote_name(model._meta.db_table)} AS t SET {assignments} "
+                f"FROM (VALUES {', '.join([placeholder] * len(batch))}) "
+                f"AS v({aliases}) WHERE t.{pk_column} = v.{pk_column}",
+                params,
+            )
+            updated += cursor.rowcount
+    return updated
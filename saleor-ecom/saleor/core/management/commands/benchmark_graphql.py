@@ -0,0 +1,374 @@
+"""Measure a fixed set of storefront and dashboard GraphQL operations.
+
+Each operation is sent through the API view the number of times given by
+`--repeat`, after `--warmup` requests which are not measured. For every operation
+the command reports the number of database queries, the median and the 95th
+percentile of the response time and the peak memory allocated while handling
+the request.
+
+The results can be saved with `--output` and passed as `--baseline` to a later
+run, which fails when an operation makes more database queries than in
+the baseline, or when its latency or memory grows above the `--tolerance`.
+Use `populatedb` to generate the data set before running the benchmark.
+"""
+
+import json
+import statistics
+import time
+import tracemalloc
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ....account.models import User
+from ....channel.models import Channel
+from ....product.models import Product
+from ...jwt import create_access_token
+
+PRODUCT_LIST_QUERY = """
+query Products($channel: String) {
+  products(first: 100, channel: $channel) {
+    totalCount
+    edges {
+      node {
+        id
+        name
+        slug
+        thumbnail {
+          url
+        }
+        category {
+          name
+        }
+        pricing {
+          onSale
+          priceRange {
+            start {
+              gross {
+                amount
+                currency
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+PRODUCT_DETAILS_QUERY = """
+query ProductDetails($channel: String, $slug: String) {
+  product(channel: $channel, slug: $slug) {
+    id
+    name
+    description
+    media {
+      url
+    }
+    attributes {
+      attribute {
+        name
+      }
+      values {
+        name
+      }
+    }
+    variants {
+      id
+      name
+      quantityAvailable
+      pricing {
+        price {
+          gross {
+            amount
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+CATEGORY_TREE_QUERY = """
+query Categories {
+  categories(first: 100, level: 0) {
+    edges {
+      node {
+        id
+        name
+        slug
+        children(first: 100) {
+          edges {
+            node {
+              id
+              name
+              slug
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+DASHBOARD_ORDER_LIST_QUERY = """
+query Orders {
+  orders(first: 100) {
+    totalCount
+    edges {
+      node {
+        id
+        number
+        created
+        status
+        paymentStatus
+        userEmail
+        total {
+          gross {
+            amount
+            currency
+          }
+        }
+        lines {
+          id
+          productName
+          quantity
+        }
+      }
+    }
+  }
+}
+"""
+
+DASHBOARD_PRODUCT_LIST_QUERY = """
+query DashboardProducts($channel: String) {
+  products(first: 100, channel: $channel, sortBy: {field: NAME, direction: ASC}) {
+    totalCount
+    edges {
+      node {
+        id
+        name
+        productType {
+          name
+        }
+        channelListings {
+          isPublished
+          channel {
+            slug
+          }
+        }
+        variants {
+          id
+          sku
+          stocks {
+            quantity
+            quantityAllocated
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+DASHBOARD_CUSTOMER_LIST_QUERY = """
+query Customers {
+  customers(first: 100) {
+    totalCount
+    edges {
+      node {
+        id
+        email
+        orders {
+          totalCount
+        }
+      }
+    }
+  }
+}
+"""
+
+# Name: (query, sent as staff user)
+OPERATIONS = {
+    "storefront_product_list": (PRODUCT_LIST_QUERY, False),
+    "storefront_product_details": (PRODUCT_DETAILS_QUERY, False),
+    "storefront_category_tree": (CATEGORY_TREE_QUERY, False),
+    "dashboard_order_list": (DASHBOARD_ORDER_LIST_QUERY, True),
+    "dashboard_product_list": (DASHBOARD_PRODUCT_LIST_QUERY, True),
+    "dashboard_customer_list": (DASHBOARD_CUSTOMER_LIST_QUERY, True),
+}
+
+
+class Command(BaseCommand):
+    help = "Measure query counts, latency and memory of GraphQL operations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--channel", type=str, help="Channel slug.")
+        parser.add_argument(
+            "--staff-email",
+            type=str,
+            help="Email of the staff user sending the dashboard operations. "
+            "Defaults to the first active superuser.",
+        )
+        parser.add_argument(
+            "--operation",
+            choices=list(OPERATIONS),
+            action="append",
+            help="Operation to measure, can be repeated. Defaults to all.",
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument("--output", type=str, help="Save the results as JSON.")
+        parser.add_argument(
+            "--baseline", type=str, help="Compare the results with saved ones."
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=20.0,
+            help="Allowed growth of latency and memory over the baseline in %%.",
+        )
+
+    def handle(self, **options):
+        if options["repeat"] < 2:
+            raise CommandError("--repeat must be at least 2.")
+        channel = self.get_channel(options["channel"])
+        staff_user = self.get_staff_user(options["staff_email"])
+        variables = {"channel": channel.slug, "slug": self.get_product_slug(channel)}
+
+        storefront_client = self.create_client()
+        dashboard_client = self.create_client(staff_user)
+        results = {}
+        for name in options["operation"] or OPERATIONS:
+            query, as_staff = OPERATIONS[name]
+            client = dashboard_client if as_staff else storefront_client
+            results[name] = self.measure(client, query, variables, options)
+            self.stdout.write(
+                f"{name}: {results[name]['queries']} queries, "
+                f"p50 {results[name]['p50_ms']:.1f}ms, "
+                f"p95 {results[name]['p95_ms']:.1f}ms, "
+                f"memory {results[name]['memory_kb']:.0f}kB"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(results, f, indent=2)
+
+        if options["baseline"]:
+            with open(options["baseline"]) as f:
+                baseline = json.load(f)
+            regressions = get_regressions(results, baseline, options["tolerance"])
+            if regressions:
+                raise CommandError(
+                    "Regressions against the baseline:\n" + "\n".join(regressions)
+                )
+            self.stdout.write("No regressions against the baseline.")
+
+    def measure(self, client, query, variables, options):
+        def send():
+            response = client.post(
+                reverse("api"),
+                {"query": query, "variables": variables},
+                content_type="application/json",
+            )
+            content = response.json()
+            if "errors" in content:
+                raise CommandError(f"Operation failed: {content['errors']}")
+
+        for _ in range(options["warmup"]):
+            send()
+
+        durations = []
+        for _ in range(options["repeat"]):
+            start = time.perf_counter()
+            send()
+            durations.append((time.perf_counter() - start) * 1000)
+
+        with ExitStack() as stack:
+            contexts = [
+                stack.enter_context(CaptureQueriesContext(connections[alias]))
+                for alias in settings.DATABASES
+            ]
+            tracemalloc.start()
+            try:
+                send()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        return {
+            "queries": sum(len(context) for context in contexts),
+            "p50_ms": statistics.median(durations),
+            "p95_ms": statistics.quantiles(durations, n=20)[-1],
+            "memory_kb": peak / 1024,
+        }
+
+    @staticmethod
+    def create_client(user=None):
+        headers = {}
+        if user:
+            headers["HTTP_AUTHORIZATION"] = f"JWT {create_access_token(user)}"
+        host = next(
+            (host.lstrip(".") for host in settings.ALLOWED_HOSTS if host != "*"),
+            "localhost",
+        )
+        return Client(HTTP_HOST=host, **headers)
+
+    @staticmethod
+    def get_channel(slug):
+        channels = Channel.objects.filter(is_active=True).order_by("pk")
+        if slug:
+            channels = channels.filter(slug=slug)
+        channel = channels.first()
+        if not channel:
+            raise CommandError("No active channel found.")
+        return channel
+
+    @staticmethod
+    def get_staff_user(email):
+        users = User.objects.filter(is_active=True, is_staff=True).order_by("pk")
+        users = users.filter(email=email) if email else users.filter(is_superuser=True)
+        user = users.first()
+        if not user:
+            raise CommandError("No active staff user found.")
+        return user
+
+    @staticmethod
+    def get_product_slug(channel):
+        slug = (
+            Product.objects.filter(channel_listings__channel=channel)
+            .order_by("pk")
+            .values_list("slug", flat=True)
+            .first()
+        )
+        if not slug:
+            raise CommandError(f"No products in the {channel.slug} channel.")
+        return slug
+
+
+def get_regressions(results, baseline, tolerance):
+    """Return descriptions of the results which are worse than the baseline."""
+    regressions = []
+    limit = 1 + tolerance / 100
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]
+        if result["queries"] > expected["queries"]:
+            regressions.append(
+                f"{name}: {result['queries']} queries, baseline {expected['queries']}"
+            )
+        for metric in ["p50_ms", "p95_ms", "memory_kb"]:
+            if result[metric] > expected[metric] * limit:
+                regressions.append(
+                    f"{name}: {metric} {result[metric]:.1f}, "
+                    f"baseline {expected[metric]:.1f}"
+                )
+    return regressions
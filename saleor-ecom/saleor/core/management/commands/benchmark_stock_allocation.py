@@ -0,0 +1,133 @@
+"""Measure the stock allocation throughput for a single hot variant.
+
+The command simulates concurrent checkouts of the same variant. Each simulated
+checkout allocates the stocks in its own transaction, keeps the transaction open
+for `--hold-ms` to mimic the rest of the checkout completion, and rolls back,
+so the stock data is not changed. The throughput is reported for the
+allocation mode with locking all stocks and with conditional updates.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import override_settings
+from prices import TaxedMoney
+
+from ....channel.models import Channel
+from ....core.exceptions import InsufficientStock
+from ....order import OrderOrigin, OrderStatus
+from ....order.fetch import OrderLineInfo
+from ....order.models import Order
+from ....plugins.manager import get_plugins_manager
+from ....product.models import ProductVariant
+from ....warehouse.management import allocate_stocks
+
+MODES = {
+    "locking": False,
+    "conditional": True,
+}
+
+
+class Command(BaseCommand):
+    help = "Measure the checkouts per second allocating stocks of a single variant."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sku", type=str, required=True, help="Variant SKU.")
+        parser.add_argument("--channel", type=str, required=True, help="Slug.")
+        parser.add_argument("--country", type=str, default="US")
+        parser.add_argument("--checkouts", type=int, default=500)
+        parser.add_argument("--workers", type=int, default=16)
+        parser.add_argument("--quantity", type=int, default=1)
+        parser.add_argument(
+            "--hold-ms",
+            type=int,
+            default=20,
+            help="Time the checkout transaction is kept open after the allocation.",
+        )
+        parser.add_argument(
+            "--mode", choices=[*MODES, "all"], default="all", help="Allocation mode."
+        )
+
+    def handle(self, **options):
+        try:
+            variant = ProductVariant.objects.get(sku=options["sku"])
+            channel = Channel.objects.get(slug=options["channel"])
+        except (ProductVariant.DoesNotExist, Channel.DoesNotExist) as e:
+            raise CommandError(str(e)) from e
+
+        order = self.create_order(channel)
+        line = self.create_order_line(order, variant, options["quantity"])
+        modes = MODES if options["mode"] == "all" else [options["mode"]]
+        try:
+            for mode in modes:
+                with override_settings(STOCK_ALLOCATION_CONDITIONAL_UPDATE=MODES[mode]):
+                    self.run_benchmark(mode, line, channel, options)
+        finally:
+            order.delete()
+
+    def run_benchmark(self, mode, line, channel, options):
+        manager = get_plugins_manager(allow_replica=False)
+        hold = options["hold_ms"] / 1000
+        line_info = OrderLineInfo(
+            line=line, variant=line.variant, quantity=options["quantity"]
+        )
+
+        def checkout(_index):
+            try:
+                with transaction.atomic():
+                    allocate_stocks([line_info], options["country"], channel, manager)
+                    time.sleep(hold)
+                    transaction.set_rollback(True)
+            except InsufficientStock:
+                return False
+            finally:
+                connection.close()
+            return True
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            results = list(executor.map(checkout, range(options["checkouts"])))
+        duration = time.monotonic() - start
+
+        self.stdout.write(
+            f"{mode}: {len(results)} checkouts in {duration:.2f}s "
+            f"({len(results) / duration:.1f} checkouts/s), "
+            f"{results.count(False)} failed with insufficient stock"
+        )
+
+    @staticmethod
+    def create_order(channel):
+        return Order.objects.create(
+            channel=channel,
+            currency=channel.currency_code,
+            origin=OrderOrigin.CHECKOUT,
+            status=OrderStatus.UNCONFIRMED,
+            should_refresh_prices=False,
+            undiscounted_base_shipping_price_amount=Decimal("0.0"),
+        )
+
+    @staticmethod
+    def create_order_line(order, variant, quantity):
+        channel_listing = variant.channel_listings.get(channel=order.channel)
+        price = variant.get_price(channel_listing)
+        unit_price = TaxedMoney(net=price, gross=price)
+        return order.lines.create(
+            product_name=str(variant.product),
+            variant_name=str(variant),
+            product_sku=variant.sku,
+            product_variant_id=variant.get_global_id(),
+            is_shipping_required=variant.is_shipping_required(),
+            is_gift_card=variant.is_gift_card(),
+            quantity=quantity,
+            variant=variant,
+            unit_price=unit_price,
+            total_price=unit_price * quantity,
+            undiscounted_unit_price=unit_price,
+            undiscounted_total_price=unit_price * quantity,
+            base_unit_price=unit_price.gross,
+            undiscounted_base_unit_price=unit_price.gross,
+            tax_rate=Decimal("0.00"),
+        )
@@ -0,0 +1,124 @@
+"""Measure the throughput of the stock bulk update.
+
+The command updates the quantities of `--stocks` existing stocks in the same way
+as the `stockBulkUpdate` mutation: the inputs are validated, the stocks are
+looked up and locked by their selectors, and the new quantities are written in
+batches. The writes are measured for the `UPDATE ... FROM (VALUES ...)`
+statements used by the mutation and for Django's `bulk_update`, which renders
+a `CASE` expression. Every run is rolled back, so the stock data is not changed.
+"""
+
+import random
+import time
+from collections import defaultdict
+
+import graphene
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from ....graphql.warehouse.bulk_mutations.stock_bulk_update import (
+    STOCK_UPDATE_BATCH_SIZE,
+    StockBulkUpdate,
+)
+from ....warehouse.models import Stock
+from ...db.update import bulk_update_from_values
+
+
+def _update_with_values(stocks):
+    bulk_update_from_values(stocks, ["quantity"], batch_size=STOCK_UPDATE_BATCH_SIZE)
+
+
+def _update_with_case(stocks):
+    Stock.objects.bulk_update(stocks, ["quantity"], batch_size=STOCK_UPDATE_BATCH_SIZE)
+
+
+MODES = {
+    "values": _update_with_values,
+    "case": _update_with_case,
+}
+
+
+class Command(BaseCommand):
+    help = "Measure the stocks per second updated by the stock bulk update."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--stocks", type=int, default=10000)
+        parser.add_argument(
+            "--selector",
+            choices=["id", "external_reference"],
+            default="id",
+            help="Selector of the variants and warehouses in the inputs.",
+        )
+        parser.add_argument(
+            "--mode", choices=[*MODES, "all"], default="all", help="Write mode."
+        )
+
+    def handle(self, **options):
+        stocks_input = self.get_stocks_input(options["stocks"], options["selector"])
+        if not stocks_input:
+            raise CommandError("No stocks to update.")
+        modes = MODES if options["mode"] == "all" else [options["mode"]]
+        for mode in modes:
+            self.run_benchmark(mode, stocks_input)
+
+    def run_benchmark(self, mode, stocks_input):
+        with transaction.atomic():
+            start = time.monotonic()
+            index_error_map: dict = defaultdict(list)
+            cleaned_inputs_map = StockBulkUpdate.clean_stocks(
+                [dict(stock_input) for stock_input in stocks_input], index_error_map
+            )
+            warehouse_selector, variant_selector = StockBulkUpdate.get_selectors(
+                cleaned_inputs_map
+            )
+            instances_data = StockBulkUpdate.update_stocks(
+                cleaned_inputs_map,
+                warehouse_selector,
+                variant_selector,
+                index_error_map,
+            )
+            lookup_duration = time.monotonic() - start
+            stocks = [data["instance"] for data in instances_data if data["instance"]]
+            MODES[mode](stocks)
+            duration = time.monotonic() - start
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"{mode}: {len(stocks)} stocks in {duration:.2f}s "
+            f"({len(stocks) / duration:.0f} stocks/s), "
+            f"lookup {lookup_duration:.2f}s, write {duration - lookup_duration:.2f}s"
+        )
+
+    @staticmethod
+    def get_stocks_input(count, selector):
+        stocks = Stock.objects.order_by("pk").select_related(
+            "product_variant", "warehouse"
+        )
+        if selector == "external_reference":
+            stocks = stocks.filter(
+                product_variant__external_reference__isnull=False,
+                warehouse__external_reference__isnull=False,
+            )
+        stocks_input = []
+        for stock in stocks[:count]:
+            if selector == "id":
+                stock_input = {
+                    "variant_id": graphene.Node.to_global_id(
+                        "ProductVariant", stock.product_variant_id
+                    ),
+                    "warehouse_id": graphene.Node.to_global_id(
+                        "Warehouse", stock.warehouse_id
+                    ),
+                }
+            else:
+                stock_input = {
+                    "variant_external_reference": (
+                        stock.product_variant.external_reference
+                    ),
+                    "warehouse_external_reference": (
+                        stock.warehouse.external_reference
+                    ),
+                }
+            stock_input["quantity"] = random.randint(0, 1000)
+            stocks_input.append(stock_input)
+        return stocks_input
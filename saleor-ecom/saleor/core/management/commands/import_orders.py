@@ -0,0 +1,179 @@
+"""Create orders from a newline-delimited JSON file.
+
+Each line is a JSON object with the same fields as `OrderBulkCreateInput`.
+The lines are read in chunks, parsed with the GraphQL input type and validated
+with the rules of the `orderBulkCreate` mutation. The orders of a chunk and
+their related objects are written with `COPY`, in a separate transaction.
+Rejected lines do not stop the import, as with the `REJECT_FAILED_ROWS` error
+policy.
+
+The number of processed lines is saved to the checkpoint file after each
+chunk, so an interrupted import can be continued with `--resume`. Rejected
+lines are written to the errors file with their line numbers. Webhooks are not
+sent for the imported orders.
+"""
+
+import json
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from graphql.execution.values import coerce_value
+from graphql.utils.is_valid_value import is_valid_value
+
+from ....graphql.api import schema
+from ....graphql.core.enums import ErrorPolicy
+from ....graphql.order.bulk_mutations.order_bulk_create import (
+    OrderBulkCreate,
+    OrderBulkError,
+)
+from ....order import StockUpdatePolicy
+from ....order.error_codes import OrderBulkCreateErrorCode
+from ...db.copy import copy_instances
+from .import_stocks import read_checkpoint, write_checkpoint
+
+
+class Command(BaseCommand):
+    help = "Create orders from a newline-delimited JSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="Path to the NDJSON file.")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--stock-update-policy",
+            choices=[choice for choice, _ in StockUpdatePolicy.CHOICES],
+            default=StockUpdatePolicy.UPDATE,
+            help="Determine how stocks are updated, as in the mutation.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=str,
+            help="Path to the checkpoint file. Defaults to <path>.checkpoint.",
+        )
+        parser.add_argument(
+            "--errors",
+            type=str,
+            help="Path to the file with the rejected lines. Defaults to <path>.errors.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the lines processed before, according to the checkpoint.",
+        )
+
+    def handle(self, **options):
+        path = options["path"]
+        checkpoint_path = options["checkpoint"] or f"{path}.checkpoint"
+        errors_path = options["errors"] or f"{path}.errors"
+        processed = read_checkpoint(checkpoint_path) if options["resume"] else 0
+        skipped = processed
+
+        start = time.monotonic()
+        created_count = rejected_count = 0
+        with (
+            open(path) as file,
+            open(errors_path, "a" if options["resume"] else "w") as errors_file,
+        ):
+            lines = islice(file, processed, None)
+            while chunk := list(islice(lines, options["chunk_size"])):
+                first_line = processed + 1
+                orders_input, line_numbers, errors = parse_chunk(chunk, first_line)
+                with transaction.atomic():
+                    orders_data = import_orders(
+                        orders_input, options["stock_update_policy"]
+                    )
+                for line_number, order_data in zip(
+                    line_numbers, orders_data, strict=True
+                ):
+                    if order_data.order:
+                        created_count += 1
+                    else:
+                        errors[line_number] = order_data.errors
+                write_errors(errors_file, errors)
+
+                processed += len(chunk)
+                write_checkpoint(checkpoint_path, processed)
+                rejected_count += len(errors)
+                duration = time.monotonic() - start
+                self.stdout.write(
+                    f"Processed {processed} lines: {created_count} orders created, "
+                    f"{rejected_count} lines rejected "
+                    f"({(processed - skipped) / max(duration, 1e-6):.0f} lines/s)"
+                )
+
+
+def parse_chunk(chunk, first_line):
+    """Parse the lines with the `OrderBulkCreateInput` GraphQL type.
+
+    Return the parsed inputs, their line numbers and the errors of the rejected
+    lines by line number.
+    """
+    input_type = schema.get_type("OrderBulkCreateInput")
+    errors: dict[int, list[OrderBulkError]] = {}
+    orders_input = []
+    line_numbers = []
+    for line_number, line in enumerate(chunk, start=first_line):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            errors[line_number] = [
+                OrderBulkError(
+                    message="Invalid line.", code=OrderBulkCreateErrorCode.INVALID
+                )
+            ]
+            continue
+        if messages := is_valid_value(data, input_type):
+            errors[line_number] = [
+                OrderBulkError(message=message, code=OrderBulkCreateErrorCode.INVALID)
+                for message in messages
+            ]
+            continue
+        orders_input.append(coerce_value(input_type, data))
+        line_numbers.append(line_number)
+    return orders_input, line_numbers, errors
+
+
+def import_orders(orders_input, stock_update_policy):
+    """Create the orders with the rules of the `orderBulkCreate` mutation.
+
+    Orders with errors are rejected, as with the `REJECT_FAILED_ROWS` error
+    policy. The instances are written with `COPY` instead of `bulk_create`.
+    """
+    if not orders_input:
+        return []
+    object_storage = OrderBulkCreate.get_all_instances(orders_input)
+    orders_data = [
+        OrderBulkCreate.create_single_order(order_input, object_storage, None)
+        for order_input in orders_input
+    ]
+    OrderBulkCreate.handle_error_policy(orders_data, ErrorPolicy.REJECT_FAILED_ROWS)
+    stocks = []
+    if stock_update_policy != StockUpdatePolicy.SKIP:
+        stocks = OrderBulkCreate.handle_stocks(orders_data, stock_update_policy)
+    return OrderBulkCreate.save_data(
+        orders_data, stocks, create_instances=copy_instances
+    )
+
+
+def write_errors(errors_file, errors):
+    for line_number, line_errors in sorted(errors.items()):
+        errors_file.write(
+            json.dumps(
+                {
+                    "line": line_number,
+                    "errors": [
+                        {
+                            "path": error.path,
+                            "message": error.message,
+                            "code": error.code.value if error.code else None,
+                        }
+                        for error in line_errors
+                    ],
+                }
+            )
+            + "\n"
+        )
+    errors_file.flush()
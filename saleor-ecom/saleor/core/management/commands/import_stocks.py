@@ -0,0 +1,305 @@
+"""Update stock quantities from a newline-delimited JSON file.
+
+Each line is a JSON object with the same fields as `StockBulkUpdateInput`:
+`variantId` or `variantExternalReference`, `warehouseId` or
+`warehouseExternalReference`, and `quantity`. The lines are validated with the
+rules of the `stockBulkUpdate` mutation, in chunks. The valid rows of a chunk
+are written with `COPY` to a temporary table and applied to the stocks with a
+single statement, in a separate transaction.
+
+The number of processed lines is saved to the checkpoint file after each
+chunk, so an interrupted import can be continued with `--resume`. Rejected
+lines are written to the errors file with their line numbers. Webhooks are not
+sent for the imported stocks.
+"""
+
+import json
+import time
+import uuid
+from collections import defaultdict
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from ....graphql.core.types import StockBulkUpdateError
+from ....graphql.warehouse.bulk_mutations.stock_bulk_update import StockBulkUpdate
+from ....warehouse.error_codes import StockBulkUpdateErrorCode
+from ....warehouse.stock_availability import schedule_products_stock_availability_update
+from ...db.copy import copy_rows
+
+INPUT_FIELDS = {
+    "variantId": "variant_id",
+    "variantExternalReference": "variant_external_reference",
+    "warehouseId": "warehouse_id",
+    "warehouseExternalReference": "warehouse_external_reference",
+    "quantity": "quantity",
+}
+
+STAGING_TABLE = "warehouse_stock_import"
+STAGING_COLUMNS = [
+    "line",
+    "product_variant_id",
+    "variant_external_reference",
+    "warehouse_id",
+    "warehouse_external_reference",
+    "quantity",
+]
+
+
+class Command(BaseCommand):
+    help = "Update stock quantities from a newline-delimited JSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="Path to the NDJSON file.")
+        parser.add_argument("--chunk-size", type=int, default=10000)
+        parser.add_argument(
+            "--checkpoint",
+            type=str,
+            help="Path to the checkpoint file. Defaults to <path>.checkpoint.",
+        )
+        parser.add_argument(
+            "--errors",
+            type=str,
+            help="Path to the file with the rejected lines. Defaults to <path>.errors.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the lines processed before, according to the checkpoint.",
+        )
+
+    def handle(self, **options):
+        path = options["path"]
+        checkpoint_path = options["checkpoint"] or f"{path}.checkpoint"
+        errors_path = options["errors"] or f"{path}.errors"
+        processed = read_checkpoint(checkpoint_path) if options["resume"] else 0
+        skipped = processed
+
+        start = time.monotonic()
+        updated_count = rejected_count = 0
+        with (
+            open(path) as file,
+            open(errors_path, "a" if options["resume"] else "w") as errors_file,
+        ):
+            lines = islice(file, processed, None)
+            while chunk := list(islice(lines, options["chunk_size"])):
+                first_line = processed + 1
+                rows, errors = clean_chunk(chunk, first_line)
+                with transaction.atomic():
+                    variant_ids, not_found_lines = import_rows(rows)
+                    schedule_products_stock_availability_update(variant_ids)
+                for line in not_found_lines:
+                    errors[line] = [
+                        StockBulkUpdateError(
+                            message="Stock was not found.",
+                            code=StockBulkUpdateErrorCode.NOT_FOUND.value,
+                        )
+                    ]
+                write_errors(errors_file, errors)
+
+                processed += len(chunk)
+                write_checkpoint(checkpoint_path, processed)
+                updated_count += len(variant_ids)
+                rejected_count += len(errors)
+                duration = time.monotonic() - start
+                self.stdout.write(
+                    f"Processed {processed} lines: {updated_count} stocks updated, "
+                    f"{rejected_count} lines rejected "
+                    f"({(processed - skipped) / max(duration, 1e-6):.0f} lines/s)"
+                )
+
+
+def clean_chunk(chunk, first_line):
+    """Validate the lines with the rules of the `stockBulkUpdate` mutation.
+
+    Return the rows to import and the errors of the rejected lines by line number.
+    """
+    errors: dict[int, list] = {}
+    stocks_input = []
+    line_numbers = []
+    for line_number, line in enumerate(chunk, start=first_line):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+            stock_input = {INPUT_FIELDS[field]: value for field, value in data.items()}
+        except (ValueError, AttributeError, KeyError):
+            errors[line_number] = [
+                StockBulkUpdateError(
+                    message="Invalid line.",
+                    code=StockBulkUpdateErrorCode.INVALID.value,
+                )
+            ]
+            continue
+        if not isinstance(stock_input.get("quantity"), int):
+            errors[line_number] = [
+                StockBulkUpdateError(
+                    field="quantity",
+                    message="Quantity should be an integer.",
+                    code=StockBulkUpdateErrorCode.INVALID.value,
+                )
+            ]
+            continue
+        stocks_input.append(stock_input)
+        line_numbers.append(line_number)
+
+    # Unlike in the mutation, the selectors can differ between the lines, as
+    # the references are resolved for each row of the staging table.
+    index_error_map: dict = defaultdict(list)
+    cleaned_inputs_map = StockBulkUpdate.clean_stocks(stocks_input, index_error_map)
+    rows = []
+    for index, cleaned_input in cleaned_inputs_map.items():
+        line_number = line_numbers[index]
+        if cleaned_input:
+            cleaned_input, input_errors = _clean_ids(cleaned_input)
+            index_error_map[index].extend(input_errors)
+        if index_error_map[index]:
+            errors[line_number] = index_error_map[index]
+            continue
+        rows.append(
+            (
+                line_number,
+                cleaned_input.get("product_variant_id"),
+                cleaned_input.get("variant_external_reference"),
+                cleaned_input.get("warehouse_id"),
+                cleaned_input.get("warehouse_external_reference"),
+                cleaned_input["quantity"],
+            )
+        )
+    return rows, errors
+
+
+def _clean_ids(cleaned_input):
+    # The mutation fails on the database lookup when the global IDs contain
+    # primary keys of a wrong type, which would abort the whole chunk here.
+    errors = []
+    if cleaned_input.get("product_variant_id"):
+        try:
+            int(cleaned_input["product_variant_id"])
+        except ValueError:
+            errors.append(
+                StockBulkUpdateError(
+                    field="variantId",
+                    message="Invalid variantId.",
+                    code=StockBulkUpdateErrorCode.INVALID.value,
+                )
+            )
+    if warehouse_id := cleaned_input.get("warehouse_id"):
+        try:
+            uuid.UUID(warehouse_id)
+        except ValueError:
+            errors.append(
+                StockBulkUpdateError(
+                    field="warehouseId",
+                    message="Invalid warehouseId.",
+                    code=StockBulkUpdateErrorCode.INVALID.value,
+                )
+            )
+    return cleaned_input, errors
+
+
+def import_rows(rows):
+    """Update the stocks of the rows staged with `COPY`.
+
+    Return IDs of the variants which stock quantity was changed and the line
+    numbers of the rows without a matching stock.
+    """
+    if not rows:
+        return [], []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            CREATE TEMPORARY TABLE {STAGING_TABLE} (
+                line integer PRIMARY KEY,
+                product_variant_id integer,
+                variant_external_reference varchar(250),
+                warehouse_id uuid,
+                warehouse_external_reference varchar(250),
+                quantity integer NOT NULL
+            ) ON COMMIT DROP
+            """
+        )
+        copy_rows(STAGING_TABLE, STAGING_COLUMNS, rows)
+        cursor.execute(
+            f"""
+            UPDATE {STAGING_TABLE} AS i SET product_variant_id = v.id
+            FROM product_productvariant AS v
+            WHERE i.product_variant_id IS NULL
+                AND v.external_reference = i.variant_external_reference
+            """
+        )
+        cursor.execute(
+            f"""
+            UPDATE {STAGING_TABLE} AS i SET warehouse_id = w.id
+            FROM warehouse_warehouse AS w
+            WHERE i.warehouse_id IS NULL
+                AND w.external_reference = i.warehouse_external_reference
+            """
+        )
+        cursor.execute(
+            f"""
+            SELECT i.line FROM {STAGING_TABLE} AS i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM warehouse_stock AS s
+                WHERE s.product_variant_id = i.product_variant_id
+                    AND s.warehouse_id = i.warehouse_id
+            )
+            ORDER BY i.line
+            """
+        )
+        not_found_lines = [line for (line,) in cursor.fetchall()]
+        # The last line wins when the file contains the same stock more than once.
+        cursor.execute(
+            f"""
+            UPDATE warehouse_stock AS s SET quantity = i.quantity
+            FROM (
+                SELECT DISTINCT ON (product_variant_id, warehouse_id) *
+                FROM {STAGING_TABLE}
+                ORDER BY product_variant_id, warehouse_id, line DESC
+            ) AS i
+            WHERE s.product_variant_id = i.product_variant_id
+                AND s.warehouse_id = i.warehouse_id
+                AND s.quantity <> i.quantity
+            RETURNING s.product_variant_id
+            """
+        )
+        variant_ids = [variant_id for (variant_id,) in cursor.fetchall()]
+        # Drop the table right away in case the command runs in an outer
+        # transaction, where the next chunk would create it again.
+        cursor.execute(f"DROP TABLE {STAGING_TABLE}")
+    return variant_ids, not_found_lines
+
+
+def write_errors(errors_file, errors):
+    for line_number, line_errors in sorted(errors.items()):
+        errors_file.write(
+            json.dumps(
+                {
+                    "line": line_number,
+                    "errors": [
+                        {
+                            "field": error.field,
+                            "message": error.message,
+                            "code": error.code,
+                        }
+                        for error in line_errors
+                    ],
+                }
+            )
+            + "\n"
+        )
+    errors_file.flush()
+
+
+def read_checkpoint(path):
+    try:
+        with open(path) as f:
+            return int(f.read().strip() or 0)
+    except FileNotFoundError:
+        return 0
+
+
+def write_checkpoint(path, processed):
+    with open(path, "w") as f:
+        f.write(str(processed))
@@ -14,6 +14,7 @@ from ...utils.random_data import (
     create_checkout_with_custom_prices,
     create_checkout_with_preorders,
     create_checkout_with_same_variant_in_multiple_lines,
+    create_data_in_bulk,
     create_gift_cards,
     create_menus,
     create_order_promotions,
@@ -60,6 +61,27 @@ class Command(BaseCommand):
             default=False,
             help="Don't reset SQL sequences that are out of sync.",
         )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=0,
+            help=(
+                "Additionally create the given number of products and customers "
+                "and ten times more orders, saved in bulk."
+            ),
+        )
+        parser.add_argument(
+            "--batch_size",
+            type=int,
+            default=1000,
+            help="Number of objects saved at once in the --scale mode.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes creating the objects in the --scale mode.",
+        )
 
     def sequence_reset(self):
         """Run a SQL sequence reset on all saleor.* apps.
@@ -123,6 +145,14 @@ class Command(BaseCommand):
             self.stdout.write(msg)
         for msg in create_checkout_with_same_variant_in_multiple_lines():
             self.stdout.write(msg)
+        if options["scale"]:
+            for msg in create_data_in_bulk(
+                options["scale"],
+                user_password,
+                batch_size=options["batch_size"],
+                workers=options["workers"],
+            ):
+                self.stdout.write(msg)
 
         if options["createsuperuser"]:
             credentials = {
@@ -0,0 +1,177 @@
+"""Rebuild the search data of all products, orders, users and gift cards.
+
+Each table is split into ranges of `--partition-size` values of its partition
+field and the ranges are processed in parallel by a pool of worker processes.
+The finished ranges are stored in the checkpoint file, so an interrupted rebuild
+can be continued with `--resume`. The checkpoint file is removed once all
+indexes are rebuilt.
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from ...search_tasks import (
+    SEARCH_INDEXES,
+    get_search_index_partitions,
+    update_search_index_in_range,
+)
+
+DEFAULT_PARTITION_SIZE = 10000
+DEFAULT_CHECKPOINT_PATH = "rebuild_search_indexes.json"
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search indexes in parallel, partitioned by the id ranges."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--index",
+            choices=list(SEARCH_INDEXES),
+            action="append",
+            dest="indexes",
+            help="Index to rebuild, can be passed multiple times. Default: all.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of worker processes. Default: number of CPUs.",
+        )
+        parser.add_argument(
+            "--partition-size",
+            type=int,
+            default=DEFAULT_PARTITION_SIZE,
+            help="Width of the id range processed by a single worker call.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=str,
+            default=DEFAULT_CHECKPOINT_PATH,
+            help="Path of the file storing the finished partitions.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the partitions stored in the checkpoint file.",
+        )
+
+    def handle(self, **options):
+        if options["partition_size"] < 1:
+            raise CommandError("--partition-size must be a positive number.")
+        if options["workers"] < 1:
+            raise CommandError("--workers must be a positive number.")
+
+        checkpoint_path = options["checkpoint"]
+        if options["resume"]:
+            checkpoint = self.load_checkpoint(
+                checkpoint_path, options["partition_size"]
+            )
+        else:
+            checkpoint = {"partition_size": options["partition_size"], "done": {}}
+
+        start = time.monotonic()
+        updated_count = 0
+        for index_name in options["indexes"] or SEARCH_INDEXES:
+            updated_count += self.rebuild_index(
+                index_name, checkpoint, checkpoint_path, options
+            )
+        duration = time.monotonic() - start
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        self.stdout.write(
+            f"Rebuilt {updated_count} search documents in {duration:.2f}s "
+            f"({_rate(updated_count, duration):.1f}/s)."
+        )
+
+    def rebuild_index(self, index_name, checkpoint, checkpoint_path, options) -> int:
+        done = checkpoint["done"].setdefault(index_name, [])
+        all_partitions = get_search_index_partitions(
+            index_name, options["partition_size"]
+        )
+        finished = set(done)
+        partitions = [
+            partition for partition in all_partitions if partition[0] not in finished
+        ]
+        self.stdout.write(
+            f"{index_name}: {len(partitions)} of {len(all_partitions)} partitions "
+            "to rebuild"
+        )
+
+        start = time.monotonic()
+        updated_count = 0
+        for partition, count in self.run_partitions(
+            index_name, partitions, options["workers"]
+        ):
+            updated_count += count
+            done.append(partition[0])
+            self.save_checkpoint(checkpoint_path, checkpoint)
+            duration = time.monotonic() - start
+            self.stdout.write(
+                f"{index_name}: {len(done)}/{len(all_partitions)} partitions, "
+                f"{updated_count} rows ({_rate(updated_count, duration):.1f}/s)"
+            )
+
+        duration = time.monotonic() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{index_name}: rebuilt {updated_count} rows in {duration:.2f}s "
+                f"({_rate(updated_count, duration):.1f}/s)"
+            )
+        )
+        return updated_count
+
+    @staticmethod
+    def run_partitions(index_name, partitions, workers):
+        if workers == 1 or len(partitions) <= 1:
+            for partition in partitions:
+                yield partition, update_search_index_in_range(index_name, *partition)
+            return
+
+        # The forked workers can't share the database connections of this process.
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            futures = {
+                executor.submit(
+                    update_search_index_in_range, index_name, *partition
+                ): partition
+                for partition in partitions
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    @staticmethod
+    def load_checkpoint(path, partition_size) -> dict:
+        try:
+            with open(path) as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return {"partition_size": partition_size, "done": {}}
+        except ValueError as e:
+            raise CommandError(f"Invalid checkpoint file {path}: {e}") from e
+
+        if checkpoint.get("partition_size") != partition_size:
+            raise CommandError(
+                f"The checkpoint was created with --partition-size "
+                f"{checkpoint.get('partition_size')}, use the same value to resume."
+            )
+        return checkpoint
+
+    @staticmethod
+    def save_checkpoint(path, checkpoint):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, path)
+
+
+def _rate(count: int, duration: float) -> float:
+    return count / duration if duration > 0 else 0.0
@@ -1,8 +1,8 @@
 def get_external_notification_payload(objects, extra_payload, payload_function):
-    return [
-        _get_extracted_payload_input(payload_input, extra_payload, payload_function)
-        for payload_input in objects
-    ]
+    payloads = payload_function(objects)
+    for payload in payloads:
+        payload.update({"extra_payload": extra_payload})
+    return payloads
 
 
 def send_notification(
@@ -26,10 +26,3 @@ def trigger_notifications(
 ):
     method_kwargs = {"event": external_event_type, "payload_func": lambda: payload}
     manager.notify(**method_kwargs, plugin_id=plugin_id, channel_slug=channel_slug)
-
-
-def _get_extracted_payload_input(payload_input, extra_payload, payload_function):
-    payload = payload_function(payload_input)
-    payload = payload[0] if isinstance(payload, list) else payload
-    payload.update({"extra_payload": extra_payload})
-    return payload
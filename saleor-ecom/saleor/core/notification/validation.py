@@ -1,23 +1,23 @@
 from django.core.exceptions import ValidationError
 
 from ...account.models import User
-from ...account.notifications import get_user_custom_payload
+from ...account.notifications import get_users_custom_payload
 from ...graphql.channel.utils import validate_channel
 from ...graphql.core.enums import ExternalNotificationTriggerErrorCode
 from ...graphql.utils import resolve_global_ids_to_primary_keys
 from ...order.models import Order
-from ...order.notifications import get_custom_order_payload
+from ...order.notifications import get_custom_orders_payload
 from ...permission.enums import AccountPermissions, OrderPermissions
 
 PAYLOAD_MAPPING_FOR_CUSTOM_NOTIFICATION = {
     "User": (
         User,
-        get_user_custom_payload,
+        get_users_custom_payload,
         AccountPermissions.MANAGE_USERS,
     ),
     "Order": (
         Order,
-        get_custom_order_payload,
+        get_custom_orders_payload,
         OrderPermissions.MANAGE_ORDERS,
     ),
 }
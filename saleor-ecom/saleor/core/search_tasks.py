@@ -1,16 +1,23 @@
+from collections.abc import Callable
+from typing import NamedTuple
+
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.db.models import Max, Min, Model
 
 from ..account.models import User
 from ..account.search import prepare_user_search_document_value
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
+from ..giftcard.models import GiftCard
+from ..giftcard.search import update_gift_cards_search_vector
 from ..order.models import Order
 from ..order.search import prepare_order_search_vector_value
 from ..product.models import Product
 from ..product.search import (
     PRODUCT_FIELDS_TO_PREFETCH,
     prepare_product_search_vector_value,
+    update_products_search_vector,
 )
 from .postgres import FlatConcatSearchVector
 
@@ -143,3 +150,131 @@ def set_search_vector_values(
     Model.objects.bulk_update(instances, ["search_vector"])
 
     return len(instances)
+
+
+ORDER_FIELDS_TO_PREFETCH = [
+    "user",
+    "billing_address",
+    "shipping_address",
+    "payments",
+    "discounts",
+    "lines",
+    "payment_transactions__events",
+]
+
+
+def _update_products_search_vector(products: list[Product]):
+    update_products_search_vector([product.pk for product in products])
+
+
+def _update_users_search_document(users: list[User]):
+    set_search_document_values(users, prepare_user_search_document_value)
+
+
+def _update_orders_search_vector(orders: list[Order]):
+    set_search_vector_values(orders, prepare_order_search_vector_value)
+
+
+class SearchIndex(NamedTuple):
+    model: type[Model]
+    # Integer field used to split the table into the ranges.
+    partition_field: str
+    # Fields to load, all fields are loaded when empty.
+    only: tuple[str, ...]
+    prefetch: tuple[str, ...]
+    update: Callable[[list], None]
+
+
+SEARCH_INDEXES = {
+    "product": SearchIndex(
+        model=Product,
+        partition_field="id",
+        # the products are loaded with the related objects by the update function
+        only=("id",),
+        prefetch=(),
+        update=_update_products_search_vector,
+    ),
+    "order": SearchIndex(
+        model=Order,
+        partition_field="number",
+        only=(),
+        prefetch=tuple(ORDER_FIELDS_TO_PREFETCH),
+        update=_update_orders_search_vector,
+    ),
+    "user": SearchIndex(
+        model=User,
+        partition_field="id",
+        only=(),
+        prefetch=("addresses",),
+        update=_update_users_search_document,
+    ),
+    "gift_card": SearchIndex(
+        model=GiftCard,
+        partition_field="id",
+        only=(),
+        # the gift card prefetches are done by the update function
+        prefetch=(),
+        update=update_gift_cards_search_vector,
+    ),
+}
+
+
+def get_search_index_partitions(
+    index_name: str, partition_size: int
+) -> list[tuple[int, int]]:
+    """Split the indexed table into `[start, end)` ranges of the partition field.
+
+    The ranges are aligned to the multiples of `partition_size`, so the same
+    ranges are returned when the rows at the table edges are deleted.
+    """
+    index = SEARCH_INDEXES[index_name]
+    bounds = index.model.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).aggregate(
+        start=Min(index.partition_field),
+        end=Max(index.partition_field),
+    )
+    if bounds["start"] is None:
+        return []
+    first = bounds["start"] - bounds["start"] % partition_size
+    return [
+        (start, start + partition_size)
+        for start in range(first, bounds["end"] + 1, partition_size)
+    ]
+
+
+def update_search_index_in_range(index_name: str, start: int, end: int) -> int:
+    """Rebuild the search data of all instances in the `[start, end)` range.
+
+    The instances are processed in batches of `BATCH_SIZE`, the search data is
+    recalculated regardless of its current state. Return the number of updated
+    instances.
+    """
+    index = SEARCH_INDEXES[index_name]
+    field = index.partition_field
+    queryset = (
+        index.model.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(**{f"{field}__gte": start, f"{field}__lt": end})
+        .order_by(field)
+    )
+    if index.only:
+        queryset = queryset.only(*index.only)
+    if index.prefetch:
+        queryset = queryset.prefetch_related(*index.prefetch)
+
+    updated_count = 0
+    last_value = None
+    while True:
+        batch_qs = queryset
+        if last_value is not None:
+            batch_qs = batch_qs.filter(**{f"{field}__gt": last_value})
+        instances = list(batch_qs[:BATCH_SIZE])
+        if not instances:
+            break
+        with allow_writer():
+            index.update(instances)
+        updated_count += len(instances)
+        if len(instances) < BATCH_SIZE:
+            break
+        last_value = getattr(instances[-1], field)
+    return updated_count
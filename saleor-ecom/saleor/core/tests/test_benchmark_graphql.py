@@ -0,0 +1,80 @@
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from ..management.commands.benchmark_graphql import OPERATIONS, get_regressions
+
+
+def test_benchmark_graphql_saves_results(
+    admin_user, product, channel_USD, order_line, tmp_path
+):
+    # given
+    output = tmp_path / "results.json"
+
+    # when
+    call_command(
+        "benchmark_graphql",
+        channel=channel_USD.slug,
+        repeat=2,
+        warmup=0,
+        output=str(output),
+    )
+
+    # then
+    results = json.loads(output.read_text())
+    assert set(results) == set(OPERATIONS)
+    for result in results.values():
+        assert result["queries"] > 0
+        assert result["p95_ms"] >= result["p50_ms"] > 0
+        assert result["memory_kb"] > 0
+
+
+def test_benchmark_graphql_fails_on_regression(
+    admin_user, product, channel_USD, tmp_path
+):
+    # given
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            {
+                "storefront_product_list": {
+                    "queries": 1,
+                    "p50_ms": 10_000,
+                    "p95_ms": 10_000,
+                    "memory_kb": 1_000_000,
+                }
+            }
+        )
+    )
+
+    # when
+    with pytest.raises(CommandError) as exc_info:
+        call_command(
+            "benchmark_graphql",
+            operation=["storefront_product_list"],
+            repeat=2,
+            warmup=0,
+            baseline=str(baseline),
+        )
+
+    # then
+    assert "storefront_product_list: " in str(exc_info.value)
+    assert "baseline 1" in str(exc_info.value)
+
+
+def test_get_regressions_within_tolerance():
+    # given
+    baseline = {
+        "operation": {"queries": 5, "p50_ms": 10.0, "p95_ms": 20.0, "memory_kb": 100}
+    }
+    results = {
+        "operation": {"queries": 5, "p50_ms": 11.0, "p95_ms": 30.0, "memory_kb": 90},
+        "new_operation": {"queries": 50, "p50_ms": 1, "p95_ms": 1, "memory_kb": 1},
+    }
+
+    # when
+    regressions = get_regressions(results, baseline, tolerance=20)
+
+    # then
+    assert regressions == ["operation: p95_ms 30.0, baseline 20.0"]
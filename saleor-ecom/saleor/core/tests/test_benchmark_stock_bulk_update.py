@@ -0,0 +1,20 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from ...warehouse.models import Stock
+
+
+def test_benchmark_stock_bulk_update(variant_with_many_stocks):
+    # given
+    quantities = dict(Stock.objects.values_list("pk", "quantity"))
+    out = StringIO()
+
+    # when
+    call_command("benchmark_stock_bulk_update", stocks=10, stdout=out)
+
+    # then
+    lines = out.getvalue().splitlines()
+    assert [line.split(":")[0] for line in lines] == ["values", "case"]
+    assert all(f"{len(quantities)} stocks" in line for line in lines)
+    assert dict(Stock.objects.values_list("pk", "quantity")) == quantities
@@ -22,8 +22,9 @@ from ...giftcard.models import GiftCard, GiftCardEvent
 from ...order.models import Order
 from ...payment.models import TransactionItem
 from ...product import ProductTypeKind
-from ...product.models import ProductType
+from ...product.models import Product, ProductChannelListing, ProductType
 from ...shipping.models import ShippingZone
+from ...warehouse.models import Stock, Warehouse
 from ..storages import S3MediaStorage
 from ..utils import (
     build_absolute_uri,
@@ -148,6 +149,38 @@ def test_create_fake_order(db, monkeypatch, image, media_root, warehouse):
     assert Order.objects.all().count() == how_many_orders
 
 
+def test_create_data_in_bulk(
+    channel_USD, channel_PLN, product_type, category, warehouse, shipping_method
+):
+    # given
+    scale = 3
+
+    # when
+    for _ in random_data.create_data_in_bulk(scale, "password", batch_size=2):
+        pass
+
+    # then
+    products = Product.objects.filter(slug__startswith="bulk-")
+    assert products.count() == scale
+    assert ProductChannelListing.objects.filter(product__in=products).count() == (
+        scale * 2
+    )
+    assert Stock.objects.filter(product_variant__product__in=products).count() == (
+        scale * Warehouse.objects.count()
+    )
+    customers = User.objects.filter(email__startswith="bulk-")
+    assert customers.count() == scale
+    assert all(customer.default_billing_address_id for customer in customers)
+    orders = Order.objects.filter(user__in=customers)
+    assert orders.count() == scale * 10
+    for order in orders.prefetch_related("lines"):
+        lines = order.lines.all()
+        assert lines
+        assert order.total_gross_amount == order.shipping_price_gross_amount + sum(
+            line.total_price_gross_amount for line in lines
+        )
+
+
 def test_create_catalogue_promotions(db):
     how_many = 5
     channel_count = 0
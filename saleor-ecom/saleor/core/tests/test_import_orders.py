@@ -0,0 +1,195 @@
+import json
+from unittest import mock
+
+import graphene
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from ...order import OrderStatus
+from ...order.models import Fulfillment, Order
+from ...payment.models import TransactionItem
+
+
+def _write_lines(path, lines):
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+
+def _read_errors(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def order_import_line(
+    channel_PLN,
+    customer_user,
+    default_tax_class,
+    graphql_address_data,
+    shipping_method_channel_PLN,
+    stock,
+):
+    variant = stock.product_variant
+    warehouse = stock.warehouse
+    created_at = timezone.now().isoformat()
+    return {
+        "channel": channel_PLN.slug,
+        "createdAt": created_at,
+        "status": "PARTIALLY_FULFILLED",
+        "user": {"id": graphene.Node.to_global_id("User", customer_user.pk)},
+        "billingAddress": graphql_address_data,
+        "shippingAddress": graphql_address_data,
+        "currency": "PLN",
+        "languageCode": "PL",
+        "deliveryMethod": {
+            "shippingMethodId": graphene.Node.to_global_id(
+                "ShippingMethod", shipping_method_channel_PLN.pk
+            ),
+            "shippingTaxClassId": graphene.Node.to_global_id(
+                "TaxClass", default_tax_class.pk
+            ),
+            "shippingPrice": {"gross": 60, "net": 50},
+            "shippingTaxRate": 0.2,
+        },
+        "lines": [
+            {
+                "variantId": graphene.Node.to_global_id("ProductVariant", variant.pk),
+                "createdAt": created_at,
+                "productName": "Product Name",
+                "variantName": "Variant Name",
+                "isShippingRequired": True,
+                "isGiftCard": False,
+                "quantity": 2,
+                "totalPrice": {"gross": 48, "net": 40},
+                "undiscountedTotalPrice": {"gross": 48, "net": 40},
+                "warehouse": graphene.Node.to_global_id("Warehouse", warehouse.pk),
+                "metadata": [{"key": "md key", "value": "md value"}],
+                "taxRate": 0.2,
+                "taxClassId": graphene.Node.to_global_id(
+                    "TaxClass", default_tax_class.pk
+                ),
+            }
+        ],
+        "fulfillments": [
+            {
+                "trackingCode": "abc-123",
+                "lines": [
+                    {
+                        "variantId": graphene.Node.to_global_id(
+                            "ProductVariant", variant.pk
+                        ),
+                        "quantity": 1,
+                        "warehouse": graphene.Node.to_global_id(
+                            "Warehouse", warehouse.pk
+                        ),
+                        "orderLineIndex": 0,
+                    }
+                ],
+            }
+        ],
+        "transactions": [
+            {
+                "name": "Credit card",
+                "pspReference": "PSP reference",
+                "availableActions": ["REFUND"],
+                "amountCharged": {"amount": 108, "currency": "PLN"},
+            }
+        ],
+        "metadata": [{"key": "md key", "value": "md value"}],
+    }
+
+
+def test_import_orders(order_import_line, stock, tmp_path):
+    # given
+    second_line = {**order_import_line, "externalReference": "ext-ref"}
+    path = tmp_path / "orders.ndjson"
+    _write_lines(path, [order_import_line, second_line])
+
+    # when
+    call_command("import_orders", str(path), stdout=mock.MagicMock())
+
+    # then
+    orders = list(Order.objects.order_by("number"))
+    assert len(orders) == 2
+    order = orders[1]
+    assert order.external_reference == "ext-ref"
+    assert order.status == OrderStatus.PARTIALLY_FULFILLED
+    assert order.metadata == {"md key": "md value"}
+    assert order.lines_count == 1
+    assert order.total_charged_amount == 108
+    assert order.billing_address.first_name == "John Saleor"
+    assert order.shipping_address_id != order.billing_address_id
+    line = order.lines.get()
+    assert line.quantity == 2
+    assert line.quantity_fulfilled == 1
+    assert line.metadata == {"md key": "md value"}
+    assert Fulfillment.objects.get(order=order).lines.get().order_line == line
+    transaction = TransactionItem.objects.get(order_id=order.pk)
+    assert transaction.available_actions == ["refund"]
+    assert transaction.events.exists()
+
+    quantity = stock.quantity
+    stock.refresh_from_db()
+    assert stock.quantity == quantity - 2
+    assert _read_errors(tmp_path / "orders.ndjson.errors") == []
+    assert (tmp_path / "orders.ndjson.checkpoint").read_text() == "2"
+
+
+def test_import_orders_rejects_invalid_lines(order_import_line, tmp_path):
+    # given
+    missing_channel = {**order_import_line, "channel": "missing"}
+    invalid_input = {**order_import_line, "lines": "invalid"}
+    path = tmp_path / "orders.ndjson"
+    path.write_text(
+        "not json\n"
+        + json.dumps(invalid_input)
+        + "\n"
+        + json.dumps(missing_channel)
+        + "\n"
+        + json.dumps(order_import_line)
+        + "\n"
+    )
+
+    # when
+    call_command("import_orders", str(path), stdout=mock.MagicMock())
+
+    # then
+    assert Order.objects.count() == 1
+    errors = _read_errors(tmp_path / "orders.ndjson.errors")
+    assert [error["line"] for error in errors] == [1, 2, 3]
+    assert errors[0]["errors"] == [
+        {"path": None, "message": "Invalid line.", "code": "invalid"}
+    ]
+    assert errors[1]["errors"][0]["code"] == "invalid"
+    assert errors[2]["errors"][0]["path"] == "channel"
+    assert errors[2]["errors"][0]["code"] == "not_found"
+
+
+def test_import_orders_resume(order_import_line, tmp_path):
+    # given
+    path = tmp_path / "orders.ndjson"
+    _write_lines(
+        path,
+        [
+            {**order_import_line, "externalReference": external_reference}
+            for external_reference in ["first", "second", "third"]
+        ],
+    )
+    checkpoint = tmp_path / "checkpoint"
+    checkpoint.write_text("1")
+
+    # when
+    call_command(
+        "import_orders",
+        str(path),
+        checkpoint=str(checkpoint),
+        resume=True,
+        chunk_size=1,
+        stdout=mock.MagicMock(),
+    )
+
+    # then
+    assert set(Order.objects.values_list("external_reference", flat=True)) == {
+        "second",
+        "third",
+    }
+    assert checkpoint.read_text() == "3"
@@ -0,0 +1,181 @@
+import json
+from unittest import mock
+
+import graphene
+from django.core.management import call_command
+
+from ...warehouse.models import Stock
+
+
+def _write_lines(path, lines):
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+
+def _read_errors(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@mock.patch(
+    "saleor.core.management.commands.import_stocks."
+    "schedule_products_stock_availability_update"
+)
+def test_import_stocks(mocked_schedule, variant_with_many_stocks, tmp_path):
+    # given
+    variant = variant_with_many_stocks
+    first_stock, second_stock = variant.stocks.order_by("pk")
+    variant.external_reference = "variant-ref"
+    variant.save(update_fields=["external_reference"])
+    second_stock.warehouse.external_reference = "warehouse-ref"
+    second_stock.warehouse.save(update_fields=["external_reference"])
+
+    path = tmp_path / "stocks.ndjson"
+    _write_lines(
+        path,
+        [
+            {
+                "variantId": graphene.Node.to_global_id("ProductVariant", variant.pk),
+                "warehouseId": graphene.Node.to_global_id(
+                    "Warehouse", first_stock.warehouse_id
+                ),
+                "quantity": 100,
+            },
+            {
+                "variantExternalReference": "variant-ref",
+                "warehouseExternalReference": "warehouse-ref",
+                "quantity": 200,
+            },
+        ],
+    )
+
+    # when
+    call_command("import_stocks", str(path), stdout=mock.MagicMock())
+
+    # then
+    first_stock.refresh_from_db()
+    second_stock.refresh_from_db()
+    assert first_stock.quantity == 100
+    assert second_stock.quantity == 200
+    mocked_schedule.assert_called_once_with([variant.pk, variant.pk])
+    assert _read_errors(tmp_path / "stocks.ndjson.errors") == []
+    assert (tmp_path / "stocks.ndjson.checkpoint").read_text() == "2"
+
+
+def test_import_stocks_rejects_invalid_lines(variant_with_many_stocks, tmp_path):
+    # given
+    variant = variant_with_many_stocks
+    stock = variant.stocks.order_by("pk").first()
+    variant_id = graphene.Node.to_global_id("ProductVariant", variant.pk)
+    warehouse_id = graphene.Node.to_global_id("Warehouse", stock.warehouse_id)
+
+    path = tmp_path / "stocks.ndjson"
+    path.write_text(
+        "not json\n"
+        + json.dumps({"variantId": variant_id, "quantity": 1})
+        + "\n"
+        + json.dumps(
+            {"variantId": variant_id, "warehouseId": warehouse_id, "quantity": -1}
+        )
+        + "\n"
+        + json.dumps(
+            {
+                "variantId": graphene.Node.to_global_id("ProductVariant", "abc"),
+                "warehouseId": warehouse_id,
+                "quantity": 1,
+            }
+        )
+        + "\n"
+        + json.dumps(
+            {
+                "variantExternalReference": "missing",
+                "warehouseId": warehouse_id,
+                "quantity": 1,
+            }
+        )
+        + "\n"
+        + json.dumps(
+            {"variantId": variant_id, "warehouseId": warehouse_id, "quantity": 50}
+        )
+        + "\n"
+    )
+
+    # when
+    call_command("import_stocks", str(path), stdout=mock.MagicMock())
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity == 50
+    errors = _read_errors(tmp_path / "stocks.ndjson.errors")
+    assert [error["line"] for error in errors] == [1, 2, 3, 4, 5]
+    assert errors[2]["errors"][0]["field"] == "quantity"
+    assert errors[3]["errors"][0]["field"] == "variantId"
+    assert errors[4]["errors"] == [
+        {"field": None, "message": "Stock was not found.", "code": "not_found"}
+    ]
+
+
+def test_import_stocks_resume(variant_with_many_stocks, tmp_path):
+    # given
+    variant = variant_with_many_stocks
+    first_stock, second_stock = variant.stocks.order_by("pk")
+    variant_id = graphene.Node.to_global_id("ProductVariant", variant.pk)
+
+    path = tmp_path / "stocks.ndjson"
+    _write_lines(
+        path,
+        [
+            {
+                "variantId": variant_id,
+                "warehouseId": graphene.Node.to_global_id(
+                    "Warehouse", stock.warehouse_id
+                ),
+                "quantity": quantity,
+            }
+            for stock, quantity in [(first_stock, 100), (second_stock, 200)]
+        ],
+    )
+    checkpoint = tmp_path / "checkpoint"
+    checkpoint.write_text("1")
+
+    # when
+    call_command(
+        "import_stocks",
+        str(path),
+        checkpoint=str(checkpoint),
+        resume=True,
+        stdout=mock.MagicMock(),
+    )
+
+    # then
+    first_stock.refresh_from_db()
+    second_stock.refresh_from_db()
+    assert first_stock.quantity == 4
+    assert second_stock.quantity == 200
+    assert checkpoint.read_text() == "2"
+
+
+def test_import_stocks_in_chunks(variant_with_many_stocks, tmp_path):
+    # given
+    variant = variant_with_many_stocks
+    stocks = list(variant.stocks.order_by("pk"))
+    variant_id = graphene.Node.to_global_id("ProductVariant", variant.pk)
+
+    path = tmp_path / "stocks.ndjson"
+    _write_lines(
+        path,
+        [
+            {
+                "variantId": variant_id,
+                "warehouseId": graphene.Node.to_global_id(
+                    "Warehouse", stock.warehouse_id
+                ),
+                "quantity": 0,
+            }
+            for stock in stocks
+        ],
+    )
+
+    # when
+    call_command("import_stocks", str(path), chunk_size=1, stdout=mock.MagicMock())
+
+    # then
+    assert not Stock.objects.filter(product_variant=variant, quantity__gt=0).exists()
@@ -1,8 +1,19 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from django.core.management import CommandError, call_command
+
 from ...core.postgres import FlatConcatSearchVector
 from ...core.search_tasks import (
+    get_search_index_partitions,
     set_order_search_document_values,
     set_user_search_document_values,
+    update_search_index_in_range,
 )
+from ...giftcard.models import GiftCard
+from ...order.models import Order
+from ...product.models import Product
 
 
 def test_set_user_search_document_values(customer_user, customer_user2):
@@ -48,3 +59,137 @@ def test_set_order_search_document_values_no_vector(order):
     # then
     order.refresh_from_db()
     assert order.user.email in order.search_vector
+
+
+def test_get_search_index_partitions(product_list):
+    # given
+    ids = sorted(product.id for product in product_list)
+    partition_size = 2
+
+    # when
+    partitions = get_search_index_partitions("product", partition_size)
+
+    # then
+    assert partitions[0][0] % partition_size == 0
+    assert partitions[0][0] <= ids[0] < partitions[0][1]
+    assert partitions[-1][0] <= ids[-1] < partitions[-1][1]
+    for (_, end), (next_start, _) in zip(partitions, partitions[1:], strict=False):
+        assert end == next_start
+
+
+def test_get_search_index_partitions_no_rows():
+    # when
+    partitions = get_search_index_partitions("gift_card", 10)
+
+    # then
+    assert partitions == []
+
+
+def test_update_search_index_in_range_products(product_list):
+    # given
+    product_list[0].refresh_from_db()
+    Product.objects.update(search_vector=None, search_index_dirty=True)
+    ids = sorted(product.id for product in product_list)
+
+    # when
+    with patch("saleor.core.search_tasks.BATCH_SIZE", 1):
+        updated_count = update_search_index_in_range("product", ids[0], ids[1] + 1)
+
+    # then
+    assert updated_count == 2
+    products = Product.objects.order_by("id")
+    assert [product.search_index_dirty for product in products] == [
+        False,
+        False,
+        True,
+    ]
+    assert products[0].search_vector
+    assert products[2].search_vector is None
+
+
+def test_update_search_index_in_range_rebuilds_existing_vectors(order):
+    # given
+    Order.objects.filter(pk=order.pk).update(search_vector="outdated")
+
+    # when
+    updated_count = update_search_index_in_range(
+        "order", order.number, order.number + 1
+    )
+
+    # then
+    assert updated_count == 1
+    order.refresh_from_db()
+    assert order.user.email in order.search_vector
+    assert "outdated" not in order.search_vector
+
+
+def test_rebuild_search_indexes_command(
+    product_list, order, customer_user, gift_card, tmp_path
+):
+    # given
+    Product.objects.update(search_vector=None)
+    Order.objects.update(search_vector=None)
+    GiftCard.objects.update(search_vector=None)
+    customer_user.search_document = ""
+    customer_user.save(update_fields=["search_document"])
+    checkpoint = tmp_path / "checkpoint.json"
+
+    # when
+    call_command(
+        "rebuild_search_indexes",
+        workers=1,
+        partition_size=2,
+        checkpoint=str(checkpoint),
+    )
+
+    # then
+    assert not Product.objects.filter(search_vector=None).exists()
+    order.refresh_from_db()
+    assert order.search_vector
+    gift_card.refresh_from_db()
+    assert customer_user.email in gift_card.search_vector
+    customer_user.refresh_from_db()
+    assert customer_user.email in customer_user.search_document
+    assert not checkpoint.exists()
+
+
+def test_rebuild_search_indexes_command_resume(product_list, tmp_path):
+    # given
+    Product.objects.update(search_vector=None)
+    ids = sorted(product.id for product in product_list)
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text(
+        json.dumps({"partition_size": 1, "done": {"product": [ids[0]]}})
+    )
+
+    # when
+    call_command(
+        "rebuild_search_indexes",
+        index=["product"],
+        workers=1,
+        partition_size=1,
+        checkpoint=str(checkpoint),
+        resume=True,
+    )
+
+    # then
+    assert list(
+        Product.objects.filter(search_vector=None).values_list("id", flat=True)
+    ) == [ids[0]]
+    assert not checkpoint.exists()
+
+
+def test_rebuild_search_indexes_command_resume_partition_size_mismatch(tmp_path):
+    # given
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text(json.dumps({"partition_size": 1000, "done": {}}))
+
+    # when & then
+    with pytest.raises(CommandError):
+        call_command(
+            "rebuild_search_indexes",
+            workers=1,
+            partition_size=10,
+            checkpoint=str(checkpoint),
+            resume=True,
+        )
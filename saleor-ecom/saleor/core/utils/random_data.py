@@ -1,20 +1,23 @@
 import datetime
 import itertools
 import json
+import multiprocessing
 import os
 import random
 import unicodedata
 import uuid
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
-from functools import lru_cache
+from functools import lru_cache, partial
 from typing import Any, cast
 from unittest.mock import patch
 
 import graphene
 from django.conf import settings
+from django.contrib.auth.hashers import make_password
 from django.core.files import File
-from django.db import connection
+from django.db import connection, connections
 from django.db.models import F
 from django.utils import timezone
 from django.utils.text import slugify
@@ -39,11 +42,13 @@ from ...attribute.models import (
     AttributeValue,
     AttributeVariant,
 )
+from ...attribute.utils import update_product_attribute_filter_values
 from ...channel.models import Channel
 from ...checkout import AddressType
 from ...checkout.fetch import fetch_checkout_info
 from ...checkout.models import Checkout
 from ...checkout.utils import add_variant_to_checkout
+from ...core.taxes import zero_money
 from ...core.weight import zero_weight
 from ...discount import DiscountValueType, RewardValueType, VoucherType
 from ...discount.models import (
@@ -102,6 +107,7 @@ from ...tax.utils import get_tax_class_kwargs_for_order_line
 from ...warehouse import WarehouseClickAndCollectOption
 from ...warehouse.management import increase_stock
 from ...warehouse.models import PreorderAllocation, Stock, Warehouse
+from ...warehouse.stock_availability import update_products_stock_availability
 from ..postgres import FlatConcatSearchVector
 
 fake = cast(Any, Factory.create())
@@ -455,7 +461,12 @@ def create_products_by_schema(placeholder_dir, create_images):
     assign_products_to_collections(associations=types["product.collectionproduct"])
 
     all_products_qs = Product.objects.all()
+    update_product_attribute_filter_values(
+        product_ids=all_products_qs.values_list("id", flat=True),
+        variant_ids=ProductVariant.objects.values_list("id", flat=True),
+    )
     update_products_search_vector(all_products_qs.values_list("id", flat=True))
+    update_products_stock_availability()
 
 
 class SaleorProvider(BaseProvider):
@@ -1691,3 +1702,265 @@ def create_tax_classes():
         tax_classes.append(TaxClass(name=name))
     TaxClass.objects.bulk_create(tax_classes)
     yield f"Created tax classes: {names}"
+
+
+def create_objects_in_bulk(create_batch, how_many, batch_size=1000, workers=1):
+    """Call `create_batch` with consecutive ranges of indexes of the new objects.
+
+    The batches are split between worker processes when `workers` is greater
+    than 1. `create_batch` has to be a module level function, as it's passed to
+    the workers.
+    """
+    batches = [
+        range(start, min(start + batch_size, how_many))
+        for start in range(0, how_many, batch_size)
+    ]
+    if workers <= 1:
+        for batch in batches:
+            create_batch(batch)
+        return
+
+    # The forked workers can't share the database connections of the parent.
+    connections.close_all()
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        for _ in executor.map(create_batch, batches):
+            pass
+
+
+def create_products_batch(prefix, indexes):
+    """Create single variant products listed and stocked in all channels."""
+    product_types = list(ProductType.objects.filter(has_variants=False)) or list(
+        ProductType.objects.all()
+    )
+    categories = list(Category.objects.all())
+    channels = list(Channel.objects.all())
+    warehouses = list(Warehouse.objects.all())
+    now = timezone.now()
+
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name=f"{fake.word().title()} {index}",
+                slug=f"{prefix}-product-{index}",
+                product_type=random.choice(product_types),
+                category=random.choice(categories),
+                search_index_dirty=True,
+            )
+            for index in indexes
+        ]
+    )
+    variants = ProductVariant.objects.bulk_create(
+        [
+            ProductVariant(product=product, sku=f"{prefix}-{index}", name=str(index))
+            for index, product in zip(indexes, products, strict=True)
+        ]
+    )
+    product_listings = []
+    variant_listings = []
+    for variant in variants:
+        price = fake.pydecimal(2, 2, positive=True)
+        for channel in channels:
+            product_listings.append(
+                ProductChannelListing(
+                    product_id=variant.product_id,
+                    channel=channel,
+                    currency=channel.currency_code,
+                    is_published=True,
+                    published_at=now,
+                    visible_in_listings=True,
+                    available_for_purchase_at=now,
+                    discounted_price_amount=price,
+                )
+            )
+            variant_listings.append(
+                ProductVariantChannelListing(
+                    variant=variant,
+                    channel=channel,
+                    currency=channel.currency_code,
+                    price_amount=price,
+                    cost_price_amount=price,
+                    discounted_price_amount=price,
+                )
+            )
+    ProductChannelListing.objects.bulk_create(product_listings)
+    ProductVariantChannelListing.objects.bulk_create(variant_listings)
+    Stock.objects.bulk_create(
+        [
+            Stock(
+                warehouse=warehouse,
+                product_variant=variant,
+                quantity=random.randrange(0, 100),
+            )
+            for variant in variants
+            for warehouse in warehouses
+        ]
+    )
+    update_products_stock_availability([product.pk for product in products])
+
+
+@lru_cache
+def _get_bulk_user_password(password):
+    # Hashing the password is slow by design, so all bulk users share the hash.
+    return make_password(password)
+
+
+def create_users_batch(prefix, user_password, indexes):
+    """Create customers with a default address."""
+    addresses = Address.objects.bulk_create(
+        [create_address(save=False) for _ in indexes]
+    )
+    users = []
+    for index, address in zip(indexes, addresses, strict=True):
+        user = User(
+            first_name=address.first_name,
+            last_name=address.last_name,
+            email=f"{prefix}.customer{index}@example.com",
+            password=_get_bulk_user_password(user_password),
+            default_billing_address=address,
+            default_shipping_address=address,
+            is_active=True,
+        )
+        user.search_document = _prepare_search_document_value(user, address)
+        users.append(user)
+    users = User.objects.bulk_create(users)
+    User.addresses.through.objects.bulk_create(
+        [
+            User.addresses.through(user_id=user.pk, address_id=address.pk)
+            for user, address in zip(users, addresses, strict=True)
+        ]
+    )
+
+
+def create_orders_batch(prefix, indexes):
+    """Create unfulfilled orders of the customers and products created in bulk."""
+    customers = list(
+        User.objects.filter(email__startswith=f"{prefix}.")
+        .select_related("default_billing_address")
+        .order_by("-pk")[:500]
+    )
+    channels = list(Channel.objects.all())
+    variant_listings = {
+        channel.pk: list(
+            ProductVariantChannelListing.objects.filter(
+                channel=channel, variant__sku__startswith=f"{prefix}-"
+            )
+            .select_related("variant__product")
+            .order_by("-pk")[:500]
+        )
+        for channel in channels
+    }
+    shipping_listings = {
+        channel.pk: list(
+            ShippingMethodChannelListing.objects.filter(channel=channel).select_related(
+                "shipping_method"
+            )
+        )
+        for channel in channels
+    }
+    channels = [channel for channel in channels if variant_listings[channel.pk]]
+    if not channels:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval('order_order_number_seq') FROM generate_series(1, %s)",
+            [len(indexes)],
+        )
+        numbers = [row[0] for row in cursor.fetchall()]
+
+    orders = []
+    addresses = []
+    lines = []
+    for number in numbers:
+        channel = random.choice(channels)
+        customer = random.choice(customers) if customers else None
+        if customer:
+            address = Address(**customer.default_billing_address.as_data())
+        else:
+            address = create_address(save=False)
+        addresses.append(address)
+        order = Order(
+            number=number,
+            channel=channel,
+            currency=channel.currency_code,
+            user=customer,
+            user_email=(
+                customer.email
+                if customer
+                else get_email(address.first_name, address.last_name)
+            ),
+            billing_address=address,
+            shipping_address=address,
+            status=OrderStatus.UNFULFILLED,
+            should_refresh_prices=False,
+            undiscounted_base_shipping_price_amount=Decimal(0),
+        )
+        shipping_price = zero_money(channel.currency_code)
+        if shipping_listing := random.choice(shipping_listings[channel.pk] or [None]):
+            shipping_price = shipping_listing.price
+            order.shipping_method = shipping_listing.shipping_method
+            order.shipping_method_name = shipping_listing.shipping_method.name
+            order.base_shipping_price = shipping_price
+            order.undiscounted_base_shipping_price = shipping_price
+            order.shipping_price = TaxedMoney(net=shipping_price, gross=shipping_price)
+        total = shipping_price
+        for listing in random.sample(
+            variant_listings[channel.pk],
+            min(random.randrange(1, 6), len(variant_listings[channel.pk])),
+        ):
+            line = _get_bulk_order_line(order, listing)
+            total += line.total_price.gross
+            lines.append(line)
+        order.total = TaxedMoney(net=total, gross=total)
+        order.undiscounted_total = order.total
+        orders.append(order)
+
+    Address.objects.bulk_create(addresses)
+    Order.objects.bulk_create(orders)
+    OrderLine.objects.bulk_create(lines)
+
+
+def _get_bulk_order_line(order, variant_listing):
+    variant = variant_listing.variant
+    quantity = random.randrange(1, 5)
+    unit_price = TaxedMoney(net=variant_listing.price, gross=variant_listing.price)
+    return OrderLine(
+        order=order,
+        variant=variant,
+        product_name=str(variant.product),
+        variant_name=str(variant),
+        product_sku=variant.sku,
+        product_variant_id=variant.get_global_id(),
+        is_shipping_required=True,
+        is_gift_card=False,
+        quantity=quantity,
+        currency=order.currency,
+        unit_price=unit_price,
+        total_price=unit_price * quantity,
+        undiscounted_unit_price=unit_price,
+        undiscounted_total_price=unit_price * quantity,
+        base_unit_price=variant_listing.price,
+        undiscounted_base_unit_price=variant_listing.price,
+        tax_rate=Decimal(0),
+    )
+
+
+def create_data_in_bulk(scale, user_password, batch_size=1000, workers=1):
+    """Create `scale` products and customers and ten times more orders.
+
+    The objects are built in memory and saved with `bulk_create`, products and
+    customers first, as the orders refer to them.
+    """
+    prefix = f"bulk-{uuid.uuid4().hex[:8]}"
+    create_objects_in_bulk(
+        partial(create_products_batch, prefix), scale, batch_size, workers
+    )
+    yield f"Created {scale} products in bulk"
+    create_objects_in_bulk(
+        partial(create_users_batch, prefix, user_password), scale, batch_size, workers
+    )
+    yield f"Created {scale} customers in bulk"
+    create_objects_in_bulk(
+        partial(create_orders_batch, prefix), scale * 10, batch_size, workers
+    )
+    yield f"Created {scale * 10} orders in bulk"
@@ -0,0 +1,28 @@
+from django.apps import AppConfig as DjangoAppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class AppConfig(DjangoAppConfig):
+    name = "saleor.discount"
+
+    def ready(self):
+        from .models import Promotion, PromotionRule
+        from .signals import invalidate_order_promotion_rules
+
+        # preventing duplicate signals
+        for model in [Promotion, PromotionRule]:
+            post_save.connect(
+                invalidate_order_promotion_rules,
+                sender=model,
+                dispatch_uid=f"invalidate_order_promotion_rules_{model.__name__}_save",
+            )
+            post_delete.connect(
+                invalidate_order_promotion_rules,
+                sender=model,
+                dispatch_uid=f"invalidate_order_promotion_rules_{model.__name__}_delete",
+            )
+        m2m_changed.connect(
+            invalidate_order_promotion_rules,
+            sender=PromotionRule.channels.through,
+            dispatch_uid="invalidate_order_promotion_rules_channels",
+        )
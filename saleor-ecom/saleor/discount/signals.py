@@ -0,0 +1,5 @@
+from .utils.order_predicate import invalidate_order_promotion_rules_cache
+
+
+def invalidate_order_promotion_rules(sender, **kwargs):
+    invalidate_order_promotion_rules_cache()
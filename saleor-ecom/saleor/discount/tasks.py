@@ -337,7 +337,7 @@ def set_promotion_rule_variants_task(start_id=None):
     # discounted prices for promotions.
 
     # Results in update time ~0.4s and consumes ~20MB memory at peak
-    from ..product.utils.variants import fetch_variants_for_promotion_rules
+    from ..product.utils.variants import update_variants_for_promotion_rules
 
     PROMOTION_RULE_BATCH_SIZE = 250
 
@@ -354,5 +354,5 @@ def set_promotion_rule_variants_task(start_id=None):
     )
     if ids := list(rules.values_list("pk", flat=True)):
         qs = PromotionRule.objects.filter(pk__in=ids)
-        fetch_variants_for_promotion_rules(rules=qs)
+        update_variants_for_promotion_rules(rules=qs, mark_products_as_dirty=False)
         set_promotion_rule_variants_task.delay(ids[-1])
@@ -5,7 +5,7 @@ import graphene
 import pytest
 from django.utils import timezone
 
-from ....product.utils.variants import fetch_variants_for_promotion_rules
+from ....product.utils.variants import update_variants_for_promotion_rules
 from ....tests.utils import dummy_editorjs
 from ... import PromotionType, RewardType, RewardValueType
 from ...models import Promotion, PromotionRule
@@ -53,7 +53,9 @@ def catalogue_promotion(channel_USD, product, collection):
     )
     for rule in rules:
         rule.channels.add(channel_USD)
-    fetch_variants_for_promotion_rules(promotion.rules.all())
+    update_variants_for_promotion_rules(
+        promotion.rules.all(), mark_products_as_dirty=False
+    )
     return promotion
 
 
@@ -204,7 +206,9 @@ def promotion_list(channel_USD, product, collection):
     )
     for rule in rules:
         rule.channels.add(channel_USD)
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     return promotions
 
 
@@ -245,7 +249,9 @@ def promotion_converted_from_sale(catalogue_predicate, channel_USD):
         old_channel_listing_id=PromotionRule.get_old_channel_listing_ids(1)[0][0],
     )
     rule.channels.add(channel_USD)
-    fetch_variants_for_promotion_rules(promotion.rules.all())
+    update_variants_for_promotion_rules(
+        promotion.rules.all(), mark_products_as_dirty=False
+    )
     return promotion
 
 
@@ -263,7 +269,9 @@ def promotion_converted_from_sale_with_many_channels(
         old_channel_listing_id=PromotionRule.get_old_channel_listing_ids(1)[0][0],
     )
     rule.channels.add(channel_PLN)
-    fetch_variants_for_promotion_rules(promotion.rules.all())
+    update_variants_for_promotion_rules(
+        promotion.rules.all(), mark_products_as_dirty=False
+    )
     return promotion
 
 
@@ -8,7 +8,7 @@ from ...discount.models import PromotionRule
 from ...plugins.manager import get_plugins_manager
 from ...product.models import Product, ProductVariantChannelListing
 from ...product.utils.variant_prices import update_discounted_prices_for_promotion
-from ...product.utils.variants import fetch_variants_for_promotion_rules
+from ...product.utils.variants import update_variants_for_promotion_rules
 from .. import DiscountValueType
 from ..utils.checkout import (
     create_or_update_discount_objects_from_promotion_for_checkout,
@@ -76,7 +76,9 @@ def test_rounding_issue_with_percentage_promotion(
         variant_channel_listings, ["price_amount"]
     )
 
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     update_discounted_prices_for_promotion(Product.objects.all())
 
     checkout_info = fetch_checkout_info(
@@ -3,7 +3,7 @@ from decimal import Decimal
 import graphene
 
 from ....product.models import ProductVariant
-from ....product.utils.variants import fetch_variants_for_promotion_rules
+from ....product.utils.variants import update_variants_for_promotion_rules
 from ... import PromotionRuleInfo, RewardValueType
 from ...models import Promotion, PromotionRule
 from ...utils.promotion import get_variants_to_promotion_rules_map
@@ -118,7 +118,9 @@ def test_get_variants_to_promotions_map_from_different_promotions(
 def test_get_variants_to_promotions_map_no_active_rules(product):
     # given
     variants = ProductVariant.objects.all()
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
 
     # when
     rules_info_per_variant = get_variants_to_promotion_rules_map(variants)
@@ -0,0 +1,204 @@
+from copy import deepcopy
+from decimal import Decimal
+
+import pytest
+
+from ....checkout.models import Checkout
+from ....graphql.discount.utils import PredicateObjectType, filter_qs_by_predicate
+from ...utils.order_predicate import (
+    DiscountedObjectPrices,
+    UnsupportedOrderPredicate,
+    compile_order_predicate,
+)
+from ...utils.promotion import fetch_promotion_rules_for_checkout_or_order
+
+
+@pytest.mark.parametrize(
+    "predicate",
+    [
+        {},
+        {"discountedObjectPredicate": {"baseSubtotalPrice": {"range": {"gte": 20}}}},
+        {"discountedObjectPredicate": {"baseSubtotalPrice": {"range": {"gte": 200}}}},
+        {"discountedObjectPredicate": {"baseTotalPrice": {"range": {"lte": "100"}}}},
+        {"discountedObjectPredicate": {"baseTotalPrice": {"range": {}}}},
+        {"discountedObjectPredicate": {"baseSubtotalPrice": {"eq": 50.5}}},
+        {"discountedObjectPredicate": {"baseSubtotalPrice": {"eq": None}}},
+        {"discountedObjectPredicate": {"baseSubtotalPrice": {"oneOf": [50.5]}}},
+        {"discountedObjectPredicate": {"baseSubtotalPrice": {"one_of": [50.5, 1]}}},
+        {
+            "discountedObjectPredicate": {
+                "baseSubtotalPrice": {"range": {"gte": 10}},
+                "baseTotalPrice": {"range": {"gte": 80}},
+            }
+        },
+        {
+            "discountedObjectPredicate": {
+                "OR": [
+                    {"baseSubtotalPrice": {"range": {"gte": 100}}},
+                    {"baseTotalPrice": {"range": {"gte": 60}}},
+                ]
+            }
+        },
+        {
+            "discountedObjectPredicate": {
+                "AND": [
+                    {"baseSubtotalPrice": {"range": {"gte": 10}}},
+                    {"OR": [{"baseTotalPrice": {"eq": 1}}, {}]},
+                ]
+            }
+        },
+        {
+            "AND": [
+                {
+                    "discountedObjectPredicate": {
+                        "baseTotalPrice": {"range": {"gte": 1}}
+                    }
+                },
+                {"OR": [{"discountedObjectPredicate": {}}]},
+            ]
+        },
+        {
+            "OR": [
+                {
+                    "discountedObjectPredicate": {
+                        "baseTotalPrice": {"range": {"gte": 90}}
+                    }
+                },
+                {
+                    "AND": [
+                        {
+                            "discountedObjectPredicate": {
+                                "baseSubtotalPrice": {"range": {"lte": 60}}
+                            }
+                        }
+                    ]
+                },
+            ]
+        },
+        {"OR": [{"discountedObjectPredicate": {}}]},
+    ],
+)
+def test_compile_order_predicate_matches_database_filtering(checkout, predicate):
+    # given
+    checkout.base_subtotal_amount = Decimal("50.5")
+    checkout.base_total_amount = Decimal("70")
+    checkout.save(update_fields=["base_subtotal_amount", "base_total_amount"])
+    currency = checkout.channel.currency_code
+    prices = DiscountedObjectPrices(
+        currency=checkout.currency,
+        base_subtotal_price=checkout.base_subtotal_amount,
+        base_total_price=checkout.base_total_amount,
+    )
+
+    # when
+    evaluator = compile_order_predicate(deepcopy(predicate))
+
+    # then
+    expected = filter_qs_by_predicate(
+        deepcopy(predicate),
+        Checkout.objects.filter(pk=checkout.pk),
+        PredicateObjectType.CHECKOUT,
+        currency,
+    ).exists()
+    assert evaluator(prices, currency) is expected
+
+
+def test_compile_order_predicate_currency_mismatch():
+    # given
+    predicate = {
+        "discountedObjectPredicate": {"baseSubtotalPrice": {"range": {"gte": 20}}}
+    }
+    prices = DiscountedObjectPrices(
+        currency="JPY",
+        base_subtotal_price=Decimal(100),
+        base_total_price=Decimal(100),
+    )
+
+    # when
+    evaluator = compile_order_predicate(predicate)
+
+    # then
+    assert evaluator(prices, "USD") is False
+    assert evaluator(prices, "JPY") is True
+
+
+def test_compile_order_predicate_unsupported_field():
+    # given
+    predicate = {"discountedObjectPredicate": {"shippingPrice": {"eq": 10}}}
+
+    # when & then
+    with pytest.raises(UnsupportedOrderPredicate):
+        compile_order_predicate(predicate)
+
+
+def test_fetch_promotion_rules_for_checkout_unsupported_predicate_fallback(
+    checkout, order_promotion_rule
+):
+    # given
+    order_promotion_rule.order_predicate = {
+        "discountedObjectPredicate": {"shippingPrice": {"eq": 10}}
+    }
+    order_promotion_rule.save(update_fields=["order_predicate"])
+
+    # when
+    rules = fetch_promotion_rules_for_checkout_or_order(checkout)
+
+    # then
+    assert rules == [order_promotion_rule]
+
+
+def test_fetch_promotion_rules_for_checkout_cached_rules(
+    checkout,
+    order_promotion_rule,
+    settings,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.ORDER_PROMOTION_RULES_CACHE_TIMEOUT = 60
+    with django_capture_on_commit_callbacks(execute=True):
+        order_promotion_rule.save(update_fields=["order_predicate"])
+
+    checkout.base_subtotal_amount = Decimal(100)
+    checkout.base_total_amount = Decimal(100)
+    checkout.save(update_fields=["base_subtotal_amount", "base_total_amount"])
+    assert fetch_promotion_rules_for_checkout_or_order(checkout) == [
+        order_promotion_rule
+    ]
+
+    # when
+    with django_assert_num_queries(0):
+        rules = fetch_promotion_rules_for_checkout_or_order(checkout)
+
+    # then
+    assert rules == [order_promotion_rule]
+
+
+def test_fetch_promotion_rules_for_checkout_cache_invalidated_on_rule_change(
+    checkout,
+    order_promotion_rule,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.ORDER_PROMOTION_RULES_CACHE_TIMEOUT = 60
+    with django_capture_on_commit_callbacks(execute=True):
+        order_promotion_rule.save(update_fields=["order_predicate"])
+
+    checkout.base_subtotal_amount = Decimal(100)
+    checkout.base_total_amount = Decimal(100)
+    checkout.save(update_fields=["base_subtotal_amount", "base_total_amount"])
+    assert fetch_promotion_rules_for_checkout_or_order(checkout) == [
+        order_promotion_rule
+    ]
+
+    # when
+    order_promotion_rule.order_predicate = {
+        "discountedObjectPredicate": {"baseSubtotalPrice": {"range": {"gte": 200}}}
+    }
+    with django_capture_on_commit_callbacks(execute=True):
+        order_promotion_rule.save(update_fields=["order_predicate"])
+    rules = fetch_promotion_rules_for_checkout_or_order(checkout)
+
+    # then
+    assert rules == []
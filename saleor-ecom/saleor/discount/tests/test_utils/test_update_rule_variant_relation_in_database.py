@@ -0,0 +1,142 @@
+from decimal import Decimal
+
+import graphene
+
+from ....graphql.discount.utils import get_variants_for_catalogue_predicate
+from ....product.models import ProductVariant
+from ... import RewardValueType
+from ...models import PromotionRule
+from ...utils.promotion import update_rule_variant_relation_in_database
+
+
+def _create_rule(promotion, channel, variants):
+    rule = promotion.rules.create(
+        name="Percentage promotion rule",
+        catalogue_predicate={
+            "variantPredicate": {
+                "ids": [
+                    graphene.Node.to_global_id("ProductVariant", variant.id)
+                    for variant in variants
+                ]
+            }
+        },
+        reward_value_type=RewardValueType.PERCENTAGE,
+        reward_value=Decimal("10"),
+    )
+    rule.channels.add(channel)
+    return rule
+
+
+def test_update_rule_variant_relation_in_database(
+    catalogue_promotion_without_rules, channel_USD, product_variant_list
+):
+    # given
+    existing_variant, kept_variant, new_variant = product_variant_list[:3]
+    rule = _create_rule(
+        catalogue_promotion_without_rules,
+        channel_USD,
+        [kept_variant, new_variant],
+    )
+    rule.variants.add(existing_variant, kept_variant)
+    variants = get_variants_for_catalogue_predicate(rule.catalogue_predicate)
+
+    # when
+    added_count, deleted_count = update_rule_variant_relation_in_database(
+        rule.pk, variants
+    )
+
+    # then
+    assert added_count == 1
+    assert deleted_count == 1
+    assert set(rule.variants.values_list("id", flat=True)) == {
+        kept_variant.id,
+        new_variant.id,
+    }
+
+
+def test_update_rule_variant_relation_in_database_no_changes(
+    catalogue_promotion_without_rules, channel_USD, product_variant_list
+):
+    # given
+    rule = _create_rule(
+        catalogue_promotion_without_rules, channel_USD, product_variant_list
+    )
+    rule.variants.add(*product_variant_list)
+    variants = get_variants_for_catalogue_predicate(rule.catalogue_predicate)
+
+    # when
+    added_count, deleted_count = update_rule_variant_relation_in_database(
+        rule.pk, variants
+    )
+
+    # then
+    assert added_count == 0
+    assert deleted_count == 0
+    assert rule.variants.count() == len(product_variant_list)
+
+
+def test_update_rule_variant_relation_in_database_rule_deleted(
+    catalogue_promotion_without_rules, channel_USD, product_variant_list
+):
+    # given
+    rule = _create_rule(
+        catalogue_promotion_without_rules, channel_USD, product_variant_list
+    )
+    variants = get_variants_for_catalogue_predicate(rule.catalogue_predicate)
+    rule_id = rule.pk
+    rule.delete()
+
+    # when
+    added_count, deleted_count = update_rule_variant_relation_in_database(
+        rule_id, variants
+    )
+
+    # then
+    assert added_count == 0
+    assert deleted_count == 0
+    assert not PromotionRule.variants.through.objects.filter(
+        promotionrule_id=rule_id
+    ).exists()
+
+
+def test_update_rule_variant_relation_in_database_no_variants(
+    catalogue_promotion_without_rules, channel_USD, product_variant_list
+):
+    # given
+    rule = _create_rule(
+        catalogue_promotion_without_rules, channel_USD, product_variant_list[:2]
+    )
+    rule.variants.add(*product_variant_list[:2])
+
+    # when
+    added_count, deleted_count = update_rule_variant_relation_in_database(
+        rule.pk, ProductVariant.objects.none()
+    )
+
+    # then
+    assert added_count == 0
+    assert deleted_count == 2
+    assert not rule.variants.exists()
+
+
+def test_update_rule_variant_relation_in_database_partially_overlapping_variants(
+    catalogue_promotion_without_rules, channel_USD, product_variant_list
+):
+    # given
+    promotion = catalogue_promotion_without_rules
+    variants = product_variant_list
+
+    for i in range(len(variants)):
+        existing_variants = variants[:i]
+        new_variants = variants[-i:]
+        rule = _create_rule(promotion, channel_USD, new_variants)
+        rule.variants.add(*existing_variants)
+        variants_qs = get_variants_for_catalogue_predicate(rule.catalogue_predicate)
+
+        # when
+        update_rule_variant_relation_in_database(rule.pk, variants_qs)
+
+        # then
+        assert set(rule.variants.values_list("id", flat=True)) == {
+            variant.id for variant in new_variants
+        }
@@ -0,0 +1,281 @@
+"""Evaluate order predicates of promotion rules without querying the database.
+
+The order predicates are compiled into functions that check the prices already
+loaded on the checkout or order. The semantics follow `filter_qs_by_predicate`
+for the order predicate types; the predicates that cannot be compiled are
+evaluated with the database query.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from decimal import Decimal, InvalidOperation
+from typing import NamedTuple
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from graphene.utils.str_converters import to_snake_case
+
+from ..models import Promotion, PromotionRule
+
+ORDER_PROMOTION_RULES_VERSION_CACHE_KEY = "order_promotion_rules_version"
+
+PRICE_FIELDS = ("base_subtotal_price", "base_total_price")
+OPERATORS = ("AND", "OR", "NOT")
+
+
+class DiscountedObjectPrices(NamedTuple):
+    currency: str
+    base_subtotal_price: Decimal
+    base_total_price: Decimal
+
+
+OrderPredicateEvaluator = Callable[[DiscountedObjectPrices, str], bool]
+
+
+class UnsupportedOrderPredicate(Exception):
+    """The order predicate must be evaluated with the database query."""
+
+
+class CachedOrderPromotionRule(NamedTuple):
+    rule: PromotionRule
+    channel_ids: frozenset[int]
+    evaluator: OrderPredicateEvaluator | None
+
+    def is_active(self, date) -> bool:
+        promotion = self.rule.promotion
+        if promotion.start_date > date:
+            return False
+        return promotion.end_date is None or promotion.end_date >= date
+
+
+def _always(result: bool) -> OrderPredicateEvaluator:
+    return lambda prices, currency: result
+
+
+def _all(evaluators: list[OrderPredicateEvaluator]) -> OrderPredicateEvaluator:
+    return lambda prices, currency: all(
+        evaluator(prices, currency) for evaluator in evaluators
+    )
+
+
+def _any(evaluators: list[OrderPredicateEvaluator]) -> OrderPredicateEvaluator:
+    return lambda prices, currency: any(
+        evaluator(prices, currency) for evaluator in evaluators
+    )
+
+
+def _contains_operator(data: dict) -> bool:
+    return any(operator in data for operator in OPERATORS)
+
+
+def compile_order_predicate(predicate: dict) -> OrderPredicateEvaluator:
+    """Compile the order predicate into the function checking the prices.
+
+    Raise `UnsupportedOrderPredicate` when the predicate contains an input
+    that is not handled in memory.
+    """
+    if not predicate:
+        return _always(False)
+
+    predicate = dict(predicate)
+    and_data = predicate.pop("AND", None)
+    or_data = predicate.pop("OR", None)
+
+    evaluators = []
+    if and_data:
+        evaluators.extend(
+            compile_order_predicate(data)
+            if _contains_operator(data)
+            else _compile_discounted_object_input(data, default=True)
+            for data in and_data
+        )
+    if or_data:
+        evaluators.append(
+            _any(
+                [
+                    compile_order_predicate(data)
+                    if _contains_operator(data)
+                    else _compile_discounted_object_input(data, default=False)
+                    for data in or_data
+                ]
+            )
+        )
+    if predicate:
+        evaluators.append(_compile_discounted_object_input(predicate, default=True))
+    return _all(evaluators)
+
+
+def _compile_discounted_object_input(
+    data: dict, default: bool
+) -> OrderPredicateEvaluator:
+    for key, value in data.items():
+        if to_snake_case(key) == "discounted_object_predicate" and value:
+            return _compile_where_input(value)
+    return _always(default)
+
+
+def _compile_where_input(where_input: dict) -> OrderPredicateEvaluator:
+    if not isinstance(where_input, dict):
+        raise UnsupportedOrderPredicate()
+    if _contains_operator(where_input) and len(where_input) > 1:
+        raise UnsupportedOrderPredicate()
+
+    where_input = dict(where_input)
+    and_input = where_input.pop("AND", None)
+    or_input = where_input.pop("OR", None)
+
+    evaluators = []
+    if and_input:
+        evaluators.extend(_compile_where_input(data) for data in and_input)
+    if or_input:
+        evaluators.append(_any([_compile_where_input(data) for data in or_input]))
+    if where_input:
+        evaluators.extend(
+            _compile_price_input(to_snake_case(field), value)
+            for field, value in where_input.items()
+        )
+    return _all(evaluators)
+
+
+def _compile_price_input(field: str, value: dict) -> OrderPredicateEvaluator:
+    if field not in PRICE_FIELDS or not isinstance(value, dict) or len(value) > 1:
+        raise UnsupportedOrderPredicate()
+
+    check = _compile_numeric_input(value)
+
+    def evaluate(prices: DiscountedObjectPrices, currency: str) -> bool:
+        # the price conditions match only objects in the channel currency
+        return prices.currency == currency and check(getattr(prices, field))
+
+    return evaluate
+
+
+def _compile_numeric_input(value: dict) -> Callable[[Decimal], bool]:
+    one_of = value.get("one_of")
+    range = value.get("range")
+
+    if "eq" in value:
+        if value["eq"] is None:
+            return lambda amount: False
+        eq = _to_decimal(value["eq"])
+        return lambda amount: amount == eq
+    if one_of:
+        values = {_to_decimal(item) for item in one_of}
+        return lambda amount: amount in values
+    if range and isinstance(range, dict):
+        lte = range.get("lte")
+        gte = range.get("gte")
+        if lte is None and gte is None:
+            return lambda amount: False
+        lte = _to_decimal(lte) if lte is not None else None
+        gte = _to_decimal(gte) if gte is not None else None
+        return lambda amount: (
+            (lte is None or amount <= lte) and (gte is None or amount >= gte)
+        )
+    return lambda amount: False
+
+
+def _to_decimal(value) -> Decimal:
+    if isinstance(value, bool):
+        raise UnsupportedOrderPredicate()
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, TypeError, ValueError) as e:
+        raise UnsupportedOrderPredicate() from e
+
+
+class _OrderPromotionRulesCache(threading.local):
+    version: str | None = None
+    expires_at: float = 0.0
+    rules: list[CachedOrderPromotionRule] | None = None
+
+
+_rules_cache = _OrderPromotionRulesCache()
+
+
+def get_cached_order_promotion_rules(
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[CachedOrderPromotionRule]:
+    """Return the rules with order predicates of the currently active promotions.
+
+    The rules are loaded with the compiled predicates once and kept in memory
+    for `ORDER_PROMOTION_RULES_CACHE_TIMEOUT` seconds, or until any promotion
+    changes.
+    """
+    timeout = settings.ORDER_PROMOTION_RULES_CACHE_TIMEOUT
+    if timeout <= 0:
+        return _filter_active(_load_order_promotion_rules(database_connection_name))
+
+    version = cache.get(ORDER_PROMOTION_RULES_VERSION_CACHE_KEY)
+    if (
+        _rules_cache.rules is None
+        or _rules_cache.version != version
+        or _rules_cache.expires_at < time.monotonic()
+    ):
+        _rules_cache.rules = _load_order_promotion_rules(database_connection_name)
+        _rules_cache.version = version
+        _rules_cache.expires_at = time.monotonic() + timeout
+    return _filter_active(_rules_cache.rules)
+
+
+def _filter_active(
+    rules: list[CachedOrderPromotionRule],
+) -> list[CachedOrderPromotionRule]:
+    now = timezone.now()
+    return [rule for rule in rules if rule.is_active(now)]
+
+
+def _load_order_promotion_rules(
+    database_connection_name: str,
+) -> list[CachedOrderPromotionRule]:
+    # Promotions that are not yet started are loaded as well, the cached rules
+    # are filtered by the promotion dates on each use.
+    promotions = Promotion.objects.using(database_connection_name).exclude(
+        end_date__lt=timezone.now()
+    )
+    rules = (
+        PromotionRule.objects.using(database_connection_name)
+        .filter(Exists(promotions.filter(id=OuterRef("promotion_id"))))
+        .exclude(order_predicate={})
+        .select_related("promotion")
+        .order_by("pk")
+    )
+    PromotionRuleChannel = PromotionRule.channels.through
+    rule_channels = PromotionRuleChannel.objects.using(database_connection_name).filter(
+        Exists(rules.filter(id=OuterRef("promotionrule_id")))
+    )
+    rule_to_channel_ids: dict = {}
+    for rule_id, channel_id in rule_channels.values_list(
+        "promotionrule_id", "channel_id"
+    ):
+        rule_to_channel_ids.setdefault(rule_id, set()).add(channel_id)
+
+    cached_rules = []
+    for rule in rules:
+        try:
+            evaluator = compile_order_predicate(rule.order_predicate)
+        except UnsupportedOrderPredicate:
+            evaluator = None
+        cached_rules.append(
+            CachedOrderPromotionRule(
+                rule=rule,
+                channel_ids=frozenset(rule_to_channel_ids.get(rule.id, ())),
+                evaluator=evaluator,
+            )
+        )
+    return cached_rules
+
+
+def invalidate_order_promotion_rules_cache():
+    """Drop the cached rules in all processes once the transaction is committed."""
+
+    def invalidate():
+        cache.set(ORDER_PROMOTION_RULES_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        _rules_cache.rules = None
+
+    transaction.on_commit(invalidate)
@@ -1,15 +1,16 @@
 import datetime
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Iterator
+from copy import deepcopy
 from decimal import Decimal
-from itertools import chain
 from typing import TYPE_CHECKING, NamedTuple, Union
 from uuid import UUID
 
 import graphene
 from django.conf import settings
-from django.db import transaction
-from django.db.models import Exists, OuterRef, QuerySet
+from django.core.exceptions import EmptyResultSet
+from django.db import connections, transaction
+from django.db.models import Exists, OuterRef, QuerySet, UUIDField, Value
 from prices import Money
 
 from ...channel.models import Channel
@@ -408,6 +409,10 @@ def delete_gift_line(
         order_or_checkout.lines.filter(is_gift=True).delete()  # type: ignore[misc]
         for gift_line_info in gift_line_infos:
             lines_info.remove(gift_line_info)  # type: ignore[arg-type]
+        if isinstance(order_or_checkout, Order):
+            from ...order.utils import update_order_lines_count
+
+            update_order_lines_count(order_or_checkout)
 
 
 def create_gift_line(
@@ -418,6 +423,10 @@ def create_gift_line(
     line, created = order_or_checkout.lines.get_or_create(
         is_gift=True, defaults=defaults
     )
+    if created and isinstance(order_or_checkout, Order):
+        from ...order.utils import update_order_lines_count
+
+        update_order_lines_count(order_or_checkout)
     if not created:
         fields_to_update = []
         for field, value in defaults.items():
@@ -465,9 +474,13 @@ def _get_defaults_for_gift_line(
 
 def get_variants_to_promotion_rules_map(
     variant_qs: "ProductVariantQueryset",
+    channel_ids: Iterable[int] | None = None,
 ) -> dict[int, list[PromotionRuleInfo]]:
     """Return map of variant ids to the list of promotion rules that can be applied.
 
+    When `channel_ids` are provided, only the rules assigned to any of the given
+    channels are returned.
+
     The data is returned in the following shape:
     {
         variant_id_1: [PromotionRuleInfo_1, PromotionRuleInfo_2, PromotionRuleInfo_3],
@@ -491,6 +504,17 @@ def get_variants_to_promotion_rules_map(
         Exists(promotions.filter(id=OuterRef("promotion_id"))),
         Exists(promotion_rule_variants.filter(promotionrule_id=OuterRef("pk"))),
     )
+    if channel_ids is not None:
+        PromotionRuleChannel = PromotionRule.channels.through
+        rule_channels = PromotionRuleChannel.objects.using(
+            settings.DATABASE_CONNECTION_REPLICA_NAME
+        ).filter(channel_id__in=channel_ids)
+        rules = rules.filter(
+            Exists(rule_channels.filter(promotionrule_id=OuterRef("pk")))
+        )
+        promotion_rule_variants = promotion_rule_variants.filter(
+            Exists(rules.filter(pk=OuterRef("promotionrule_id")))
+        )
     rule_to_channel_ids_map = _get_rule_to_channel_ids_map(rules)
     rules_in_bulk = rules.in_bulk()
 
@@ -515,43 +539,55 @@ def fetch_promotion_rules_for_checkout_or_order(
     instance: Union["Checkout", "Order"],
     database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
 ):
+    """Return the order promotion rules applicable for the checkout or order.
+
+    The order predicates are evaluated in memory against the checkout or order
+    prices, only the predicates that cannot be compiled are checked in the database.
+    """
     from ...graphql.discount.utils import PredicateObjectType, filter_qs_by_predicate
+    from .order_predicate import (
+        DiscountedObjectPrices,
+        get_cached_order_promotion_rules,
+    )
 
     with allow_writer():
         # TODO: channel should be loaded using dataloader
         currency = instance.channel.currency_code
 
-    applicable_rules = []
-    promotions = Promotion.objects.active()
-    rules = (
-        PromotionRule.objects.using(database_connection_name)
-        .filter(Exists(promotions.filter(id=OuterRef("promotion_id"))))
-        .exclude(order_predicate={})
-        .prefetch_related("channels")
-    )
-    rule_to_channel_ids_map = _get_rule_to_channel_ids_map(rules)
+    if isinstance(instance, Checkout):
+        predicate_type = PredicateObjectType.CHECKOUT
+        prices = DiscountedObjectPrices(
+            currency=instance.currency,
+            base_subtotal_price=instance.base_subtotal_amount,
+            base_total_price=instance.base_total_amount,
+        )
+    else:
+        predicate_type = PredicateObjectType.ORDER
+        prices = DiscountedObjectPrices(
+            currency=instance.currency,
+            base_subtotal_price=instance.subtotal_net_amount,
+            base_total_price=instance.total_net_amount,
+        )
 
+    applicable_rules = []
     channel_id = instance.channel_id
-    qs = instance._meta.model.objects.using(database_connection_name).filter(  # type: ignore[attr-defined] # noqa: E501
-        pk=instance.pk
-    )
-    for rule in rules.iterator():
-        rule_channel_ids = rule_to_channel_ids_map.get(rule.id, [])
-        if channel_id not in rule_channel_ids:
+    for cached_rule in get_cached_order_promotion_rules(database_connection_name):
+        if channel_id not in cached_rule.channel_ids:
             continue
-        predicate_type = (
-            PredicateObjectType.CHECKOUT
-            if isinstance(instance, Checkout)
-            else PredicateObjectType.ORDER
-        )
-        objects = filter_qs_by_predicate(
-            rule.order_predicate,
-            qs,
-            predicate_type,
-            currency,
-        )
-        if objects.exists():
-            applicable_rules.append(rule)
+        if cached_rule.evaluator is not None:
+            is_applicable = cached_rule.evaluator(prices, currency)
+        else:
+            qs = instance._meta.model.objects.using(database_connection_name).filter(  # type: ignore[attr-defined] # noqa: E501
+                pk=instance.pk
+            )
+            is_applicable = filter_qs_by_predicate(
+                deepcopy(cached_rule.rule.order_predicate),
+                qs,
+                predicate_type,
+                currency,
+            ).exists()
+        if is_applicable:
+            applicable_rules.append(cached_rule.rule)
 
     return applicable_rules
 
@@ -584,83 +620,59 @@ def get_current_products_for_rules(rules: "QuerySet[PromotionRule]"):
     return Product.objects.filter(Exists(variants.filter(product_id=OuterRef("id"))))
 
 
-def _create_new_rules(rules_to_add, variants_lock, rules_lock):
-    # base on what locks returned, filter out rules and variants that weren't locked
-    rules_to_add_batch = [
-        rv
-        for rv in rules_to_add
-        if rv.promotionrule_id in rules_lock and rv.productvariant_id in variants_lock
-    ]
-
-    return PromotionRule.variants.through.objects.bulk_create(
-        rules_to_add_batch, ignore_conflicts=True
-    )
-
-
-def update_rule_variant_relation(
-    rules: QuerySet[PromotionRule], new_rules_variants: list
-):
-    """Update PromotionRule - ProductVariant relation.
+def update_rule_variant_relation_in_database(
+    rule_pk: UUID, variants: "ProductVariantQueryset"
+) -> tuple[int, int]:
+    """Update PromotionRule - ProductVariant relation with set-based statements.
 
-    Deletes relations, which are not valid anymore.
-    Adds new relations, if they don't exist already.
-    `new_rules_variants` is a list of PromotionRuleVariant objects.
+    The relation is updated to match the `variants` queryset without fetching
+    the variants and the existing relations: the relations that are not valid
+    anymore are removed with a single `DELETE` statement and the missing
+    relations are added with a single `INSERT ... SELECT` statement.
+    Only the rule is locked; the variants are protected by the foreign key
+    checks of the insert statement.
 
-    It is important to lock the variants and rules before deleting and adding new
-    relations to avoid integrity errors. It is also important to lock the rules and
-    variants in the same order to avoid deadlocks.
+    Return the number of added and deleted relations.
     """
     PromotionRuleVariant = PromotionRule.variants.through
-    existing_rules_variants = PromotionRuleVariant.objects.filter(
-        Exists(rules.filter(pk=OuterRef("promotionrule_id")))
-    ).all()
-    new_rule_variant_set = {
-        (rv.promotionrule_id, rv.productvariant_id) for rv in new_rules_variants
-    }
-    existing_rule_variant_set = {
-        (rv.promotionrule_id, rv.productvariant_id) for rv in existing_rules_variants
-    }
-    # Assign new variants to promotion rules
-    rules_variants_to_add = [
-        rv
-        for rv in new_rules_variants
-        if (rv.promotionrule_id, rv.productvariant_id) not in existing_rule_variant_set
-    ]
-
-    # Clear invalid variants assigned to promotion rules
-    rule_variant_to_delete_ids = [
-        rv
-        for rv in existing_rules_variants
-        if (rv.promotionrule_id, rv.productvariant_id) not in new_rule_variant_set
-    ]
+    rule_variants = PromotionRuleVariant.objects.filter(promotionrule_id=rule_pk)
+    variants = variants.using(settings.DATABASE_CONNECTION_DEFAULT_NAME).order_by()
     with transaction.atomic():
-        variants_lock = tuple(
-            ProductVariant.objects.order_by("pk")
-            .select_for_update(of=("self",))
-            .filter(
-                id__in={
-                    rv.productvariant_id
-                    for rv in chain(rule_variant_to_delete_ids, rules_variants_to_add)
-                }
-            )
-            .values_list("id", flat=True)
-        )
-        rules_lock = tuple(
-            PromotionRule.objects.order_by("pk")
-            .select_for_update(of=("self",))
-            .filter(
-                id__in={
-                    rv.promotionrule_id
-                    for rv in chain(rule_variant_to_delete_ids, rules_variants_to_add)
-                }
-            )
+        rule_lock = list(
+            PromotionRule.objects.select_for_update(of=("self",))
+            .filter(pk=rule_pk)
             .values_list("pk", flat=True)
         )
-        PromotionRuleVariant.objects.order_by("pk").select_for_update(
-            of=("self",)
-        ).filter(id__in={rv.id for rv in rule_variant_to_delete_ids}).delete()
+        if not rule_lock:
+            return 0, 0
+
+        deleted_count, _ = rule_variants.exclude(
+            Exists(variants.filter(pk=OuterRef("productvariant_id")))
+        ).delete()
 
-        return _create_new_rules(rules_variants_to_add, variants_lock, rules_lock)
+        new_variants = (
+            variants.exclude(
+                Exists(rule_variants.filter(productvariant_id=OuterRef("pk")))
+            )
+            .annotate(rule_id=Value(rule_pk, output_field=UUIDField()))
+            .values_list("pk", "rule_id")
+        )
+        try:
+            sql, params = new_variants.query.sql_with_params()
+        except EmptyResultSet:
+            # no variants match the rule, e.g. the catalogue predicate is empty
+            return 0, deleted_count
+        meta = PromotionRuleVariant._meta
+        with connections[settings.DATABASE_CONNECTION_DEFAULT_NAME].cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {meta.db_table} "
+                f"({meta.get_field('productvariant').column}, "
+                f"{meta.get_field('promotionrule').column}) "
+                f"{sql} ON CONFLICT DO NOTHING",
+                params,
+            )
+            added_count = cursor.rowcount
+    return added_count, deleted_count
 
 
 def create_discount_objects_for_order_promotions(
@@ -566,12 +566,12 @@ class CustomerBulkUpdate(BaseMutation, I18nMixin):
         webhooks_updated = get_webhooks_for_event(
             WebhookEventAsyncType.CUSTOMER_UPDATED
         )
+        cls.call_event(
+            manager.customers_updated, list(instances), webhooks=webhooks_updated
+        )
         for updated_instance, old_instance in zip(
             instances, old_instances, strict=False
         ):
-            cls.call_event(
-                manager.customer_updated, updated_instance, webhooks=webhooks_updated
-            )
             new_email = updated_instance.email
             new_fullname = updated_instance.get_full_name()
 
@@ -37,6 +37,19 @@ from .promotion_rule_infos import VariantPromotionRuleInfoByCheckoutLineIdLoader
 class CheckoutInfoByCheckoutTokenLoader(DataLoader[str, CheckoutInfo]):
     context_key = "checkoutinfo_by_checkout"
 
+    def __init__(self, context):
+        if getattr(self, "context", None) != context:
+            self.shipping_methods_requested_keys: set[str] = set()
+        super().__init__(context)
+
+    def mark_shipping_methods_requested(self, key):
+        """Mark that the shipping methods of the checkout are resolved.
+
+        Call it before the checkout info is loaded, so the flag is set on the
+        created `CheckoutInfo`.
+        """
+        self.shipping_methods_requested_keys.add(key)
+
     def batch_load(self, keys):
         def with_checkout(data):
             (
@@ -184,6 +197,9 @@ class CheckoutInfoByCheckoutTokenLoader(DataLoader[str, CheckoutInfo]):
                             voucher=voucher_code.voucher if voucher_code else None,
                             voucher_code=voucher_code,
                             database_connection_name=self.database_connection_name,
+                            shipping_methods_requested=(
+                                key in self.shipping_methods_requested_keys
+                            ),
                         )
                         checkout_info_map[key] = checkout_info
 
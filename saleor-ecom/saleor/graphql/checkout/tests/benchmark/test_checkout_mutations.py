@@ -18,7 +18,7 @@ from .....discount.models import CheckoutLineDiscount, PromotionRule
 from .....plugins.manager import get_plugins_manager
 from .....product.models import Product, ProductVariant, ProductVariantChannelListing
 from .....product.utils.variant_prices import update_discounted_prices_for_promotion
-from .....product.utils.variants import fetch_variants_for_promotion_rules
+from .....product.utils.variants import update_variants_for_promotion_rules
 from .....shipping.interface import ShippingMethodData
 from .....warehouse.models import Stock
 from ....core.utils import to_global_id_or_none
@@ -422,7 +422,7 @@ def test_create_checkout_with_reservations(
         }
     }
 
-    with django_assert_num_queries(83):
+    with django_assert_num_queries(88):
         response = api_client.post_graphql(query, variables)
         assert get_graphql_content(response)["data"]["checkoutCreate"]
         assert Checkout.objects.first().lines.count() == 1
@@ -440,7 +440,7 @@ def test_create_checkout_with_reservations(
         }
     }
 
-    with django_assert_num_queries(83):
+    with django_assert_num_queries(88):
         response = api_client.post_graphql(query, variables)
         assert get_graphql_content(response)["data"]["checkoutCreate"]
         assert Checkout.objects.first().lines.count() == 10
@@ -572,7 +572,7 @@ def test_create_checkout_with_order_promotion(
 
     # when
     user_api_client.ensure_access_token()
-    with django_assert_num_queries(88):
+    with django_assert_num_queries(86):
         response = user_api_client.post_graphql(MUTATION_CHECKOUT_CREATE, variables)
 
     # then
@@ -828,7 +828,7 @@ def test_update_checkout_lines_with_reservations(
     )
 
     user_api_client.ensure_access_token()
-    with django_assert_num_queries(105):
+    with django_assert_num_queries(110):
         variant_id = graphene.Node.to_global_id("ProductVariant", variants[0].pk)
         variables = {
             "id": to_global_id_or_none(checkout),
@@ -842,7 +842,7 @@ def test_update_checkout_lines_with_reservations(
         assert not data["errors"]
 
     # Updating multiple lines in checkout has same query count as updating one
-    with django_assert_num_queries(105):
+    with django_assert_num_queries(110):
         variables = {
             "id": to_global_id_or_none(checkout),
             "lines": [],
@@ -1103,7 +1103,7 @@ def test_add_checkout_lines_with_reservations(
 
     user_api_client.ensure_access_token()
     # Adding multiple lines to checkout has same query count as adding one
-    with django_assert_num_queries(102):
+    with django_assert_num_queries(107):
         variables = {
             "id": Node.to_global_id("Checkout", checkout.pk),
             "lines": [new_lines[0]],
@@ -1116,7 +1116,7 @@ def test_add_checkout_lines_with_reservations(
 
     checkout.lines.exclude(id=line.id).delete()
 
-    with django_assert_num_queries(102):
+    with django_assert_num_queries(107):
         variables = {
             "id": Node.to_global_id("Checkout", checkout.pk),
             "lines": new_lines,
@@ -1154,7 +1154,9 @@ def test_add_checkout_lines_catalogue_discount_applies(
         reward_value=Decimal(50),
     )
     rule.channels.add(channel_USD)
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
 
     # update prices
     update_discounted_prices_for_promotion(Product.objects.all())
@@ -1235,7 +1237,9 @@ def test_add_checkout_lines_multiple_catalogue_discount_applies(
     rules = PromotionRule.objects.bulk_create(rules)
     for rule in rules:
         rule.channels.add(channel_USD)
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
 
     # update prices
     update_discounted_prices_for_promotion(Product.objects.all())
@@ -1289,7 +1293,7 @@ def test_add_checkout_lines_order_discount_applies(
 
     # when
     user_api_client.ensure_access_token()
-    with django_assert_num_queries(97):
+    with django_assert_num_queries(93):
         response = user_api_client.post_graphql(MUTATION_CHECKOUT_LINES_ADD, variables)
 
     # then
@@ -1324,7 +1328,7 @@ def test_add_checkout_lines_gift_discount_applies(
 
     # when
     user_api_client.ensure_access_token()
-    with django_assert_num_queries(123):
+    with django_assert_num_queries(121):
         response = user_api_client.post_graphql(MUTATION_CHECKOUT_LINES_ADD, variables)
 
     # then
@@ -528,6 +528,55 @@ def test_checkout_available_shipping_methods(
     assert data[field][0]["translation"]["name"] == translated_name
 
 
+GET_CHECKOUT_TOTAL_PRICE_AND_SHIPPING_METHODS_TEMPLATE = """
+query getCheckout($id: ID) {
+    checkout(id: $id) {
+        totalPrice {
+            gross {
+                amount
+            }
+        }
+        %s
+    }
+}
+"""
+
+
+@pytest.mark.parametrize(
+    ("fields", "shipping_methods_requested"),
+    [
+        ("shippingMethods { id }", True),
+        ("availableShippingMethods { id }", True),
+        ("", False),
+    ],
+)
+@mock.patch(
+    "saleor.graphql.checkout.types.calculations.calculate_checkout_total_with_gift_cards",
+    wraps=calculations.calculate_checkout_total_with_gift_cards,
+)
+def test_checkout_total_price_shipping_methods_requested(
+    mocked_calculate_total,
+    fields,
+    shipping_methods_requested,
+    api_client,
+    checkout_with_item,
+    address,
+):
+    # given
+    checkout_with_item.shipping_address = address
+    checkout_with_item.save(update_fields=["shipping_address"])
+    query = GET_CHECKOUT_TOTAL_PRICE_AND_SHIPPING_METHODS_TEMPLATE % fields
+    variables = {"id": to_global_id_or_none(checkout_with_item)}
+
+    # when
+    response = api_client.post_graphql(query, variables)
+
+    # then
+    get_graphql_content(response)
+    checkout_info = mocked_calculate_total.call_args.kwargs["checkout_info"]
+    assert checkout_info.shipping_methods_requested is shipping_methods_requested
+
+
 GET_CHECKOUT_SHIPPING_METHODS_QUERY = """
 query getCheckout($id: ID) {
     checkout(id: $id) {
@@ -1030,9 +1030,9 @@ class Checkout(SyncWebhookControlContextModelObjectType[models.Checkout]):
                 ).load(root.node.token)
             )
 
-        checkout_info_dataloader = CheckoutInfoByCheckoutTokenLoader(info.context).load(
-            root.node.token
-        )
+        checkout_info_loader = CheckoutInfoByCheckoutTokenLoader(info.context)
+        checkout_info_loader.mark_shipping_methods_requested(root.node.token)
+        checkout_info_dataloader = checkout_info_loader.load(root.node.token)
         return Promise.all(
             [checkout_info_dataloader, excluded_shipping_methods_payloads_dataloader]
         ).then(with_checkout_info)
@@ -1208,9 +1208,9 @@ class Checkout(SyncWebhookControlContextModelObjectType[models.Checkout]):
                 ).load(root.node.token)
             )
 
-        checkout_info_dataloader = CheckoutInfoByCheckoutTokenLoader(info.context).load(
-            root.node.token
-        )
+        checkout_info_loader = CheckoutInfoByCheckoutTokenLoader(info.context)
+        checkout_info_loader.mark_shipping_methods_requested(root.node.token)
+        checkout_info_dataloader = checkout_info_loader.load(root.node.token)
         return Promise.all(
             [checkout_info_dataloader, excluded_shipping_methods_payloads_dataloader]
         ).then(with_checkout_info)
@@ -1,12 +1,18 @@
 import json
+import logging
 from collections.abc import Callable, Iterable
 from decimal import Decimal, InvalidOperation
-from typing import TYPE_CHECKING, Any
+from functools import cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import graphene
 from django.conf import settings
+from django.contrib.postgres.indexes import BTreeIndex
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import F, Field, Index, Q, QuerySet, UniqueConstraint, Value
 from django.db.models import Model as DjangoModel
-from django.db.models import Q, QuerySet
+from django.db.models.lookups import GreaterThan, LessThan
 from graphene.relay import Connection
 from graphql import GraphQLError
 from graphql.language.ast import FragmentSpread, InlineFragment, SelectionSet
@@ -15,8 +21,10 @@ from graphql_relay.connection.connectiontypes import Edge, PageInfo
 from graphql_relay.utils import base64, unbase64
 
 from ...channel.exceptions import ChannelNotDefined, NoDefaultChannel
+from ...core.db.expressions import RowValue
 from ..channel import ChannelContext, ChannelQsContext
 from ..channel.utils import get_default_channel_slug_or_graphql_error
+from ..core.descriptions import ADDED_IN_321
 from ..core.enums import OrderDirection
 from ..core.types import BaseConnection, NonNullList
 from ..utils.sorting import sort_queryset_for_connection
@@ -25,6 +33,8 @@ from .context import SyncWebhookControlContext
 if TYPE_CHECKING:
     from ..core import ResolveInfo
 
+logger = logging.getLogger(__name__)
+
 ConnectionArguments = dict[str, Any]
 
 EPSILON = Decimal("0.000001")
@@ -142,6 +152,92 @@ def _prepare_filter(
     return filter_kwargs
 
 
+def _get_keyset_fields(
+    model: type[DjangoModel], sorting_fields: list[str]
+) -> list[Field] | None:
+    """Return the model fields used for sorting if the cursor is comparable as a row.
+
+    Rows with NULL values can't be compared, so the keyset filter is used only
+    when all sorting fields are non-nullable columns of the model.
+    """
+    fields = []
+    for field_name in sorting_fields:
+        try:
+            field = (
+                model._meta.pk
+                if field_name == "pk"
+                else model._meta.get_field(field_name)
+            )
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.is_relation or field.null:
+            return None
+        fields.append(field)
+    return fields
+
+
+def _prepare_keyset_filter(
+    cursor: list[str],
+    sorting_fields: list[str],
+    keyset_fields: list[Field],
+    sorting_direction: str,
+) -> Q:
+    """Create a row value comparison of the sorting fields with the cursor.
+
+    The filter matches the same records as the one created by `_prepare_filter`,
+    but is resolved by a single range scan of the index on the sorting fields.
+    """
+    try:
+        values = [
+            Value(field.to_python(value), output_field=field)
+            for field, value in zip(keyset_fields, cursor, strict=True)
+        ]
+    except ValidationError as e:
+        raise GraphQLError("Received cursor is invalid.") from e
+    lookup = GreaterThan if sorting_direction == "gt" else LessThan
+    return Q(
+        lookup(
+            RowValue(*[F(field_name) for field_name in sorting_fields]),
+            RowValue(*values),
+        )
+    )
+
+
+@cache
+def _has_supporting_index(model: type[DjangoModel], field_names: tuple[str, ...]):
+    """Check if the model has a B-tree index which can be used for the sorting.
+
+    The sorting is supported by the index starting with the sorting fields, or by
+    the unique index on the leading sorting fields.
+    """
+    opts = model._meta
+    indexes: list[tuple[list[str], bool]] = [
+        ([field.name], field.unique)
+        for field in opts.concrete_fields
+        if field.primary_key or field.unique or field.db_index
+    ]
+    indexes += [
+        ([field_name.lstrip("-") for field_name in index.fields], False)
+        for index in opts.indexes
+        if index.fields and (type(index) is Index or isinstance(index, BTreeIndex))
+    ]
+    indexes += [(list(fields), True) for fields in opts.unique_together]
+    indexes += [
+        (list(constraint.fields), True)
+        for constraint in opts.constraints
+        if isinstance(constraint, UniqueConstraint)
+        and constraint.fields
+        and not constraint.condition
+    ]
+    sorting = [opts.pk.name if name == "pk" else name for name in field_names]
+    for index_fields, unique in indexes:
+        if index_fields[: len(sorting)] == sorting:
+            return True
+        if unique and sorting[: len(index_fields)] == index_fields:
+            return True
+    return False
+
+
 def _validate_connection_args(args):
     first = args.get("first")
     last = args.get("last")
@@ -240,6 +336,39 @@ def _get_edges_for_connection(edge_type, qs, args, sorting_fields):
     return edges, page_info
 
 
+class TotalCount(NamedTuple):
+    count: int
+    is_exact: bool
+
+
+def get_total_count(qs: QuerySet) -> TotalCount:
+    """Return the number of items in the queryset.
+
+    The items are counted up to `GRAPHQL_TOTAL_COUNT_EXACT_LIMIT`. Above the limit,
+    the number is estimated by the query planner, which doesn't require scanning
+    all the matching rows.
+    """
+    limit = settings.GRAPHQL_TOTAL_COUNT_EXACT_LIMIT
+    if not limit:
+        return TotalCount(count=qs.count(), is_exact=True)
+
+    qs = qs.order_by()
+    count = qs[: limit + 1].count()
+    if count <= limit:
+        return TotalCount(count=count, is_exact=True)
+    return TotalCount(count=max(_estimate_count(qs), count), is_exact=False)
+
+
+def _estimate_count(qs: QuerySet) -> int:
+    sql, params = qs.query.sql_with_params()
+    with connections[qs.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 def _get_id_coercion(qs: QuerySet) -> Callable[[str], Any]:
     return qs.model.id.field.to_python if hasattr(qs.model, "id") else int
 
@@ -273,16 +402,31 @@ def connection_from_queryset_slice(
     sorting_direction = _get_sorting_direction(sort_by, last)
     if cursor and len(cursor) != len(sorting_fields):
         raise GraphQLError("Received cursor is invalid.")
-    filter_kwargs = (
-        _prepare_filter(
+    keyset_fields = _get_keyset_fields(qs.model, sorting_fields)
+    if (
+        settings.DEBUG
+        and keyset_fields
+        and not _has_supporting_index(qs.model, tuple(sorting_fields))
+    ):
+        logger.warning(
+            "No index supports sorting %s by %s; the connection pages are sorted "
+            "by scanning all matching rows.",
+            qs.model.__name__,
+            ", ".join(sorting_fields),
+        )
+    if not cursor:
+        filter_kwargs = Q()
+    elif keyset_fields and None not in cursor:
+        filter_kwargs = _prepare_keyset_filter(
+            cursor, sorting_fields, keyset_fields, sorting_direction
+        )
+    else:
+        filter_kwargs = _prepare_filter(
             cursor,
             sorting_fields,
             sorting_direction,
             _get_id_coercion(qs),
         )
-        if cursor
-        else Q()
-    )
     try:
         filtered_qs = qs.filter(filter_kwargs)
     except ValueError as e:
@@ -294,13 +438,15 @@ def connection_from_queryset_slice(
 
     if "total_count" in connection_type._meta.fields:
 
-        def get_total_count():
-            return qs.count()
+        @cache
+        def get_connection_total_count() -> TotalCount:
+            return get_total_count(qs)
 
         return connection_type(
             edges=edges,
             page_info=pageinfo_type(**page_info),
-            total_count=get_total_count,
+            total_count=lambda: get_connection_total_count().count,
+            is_total_count_exact=lambda: get_connection_total_count().is_exact,
         )
 
     return connection_type(
@@ -711,6 +857,13 @@ class CountableConnection(NonNullConnection):
         abstract = True
 
     total_count = graphene.Int(description="A total count of items in the collection.")
+    is_total_count_exact = graphene.Boolean(
+        description=(
+            "Determine if `totalCount` is the exact number of items. When `false`, "
+            "`totalCount` is an estimate of the number of items, which is greater "
+            "than the limit of exactly counted items." + ADDED_IN_321
+        )
+    )
 
     @staticmethod
     def resolve_total_count(root, _info):
@@ -726,3 +879,15 @@ class CountableConnection(NonNullConnection):
             return total_count()
 
         return total_count
+
+    @staticmethod
+    def resolve_is_total_count_exact(root, _info):
+        if isinstance(root, dict):
+            is_exact = root.get("is_total_count_exact", True)
+        else:
+            is_exact = getattr(root, "is_total_count_exact", True)
+
+        if callable(is_exact):
+            return is_exact()
+
+        return is_exact
@@ -5,7 +5,11 @@ import graphene
 import pytest
 
 from ....tests.models import Book
-from ..connection import CountableConnection, create_connection_slice
+from ..connection import (
+    CountableConnection,
+    connection_from_queryset_slice,
+    create_connection_slice,
+)
 from ..fields import ConnectionField
 
 
@@ -353,3 +357,119 @@ def test_query_with_pagination_and_inline_fragments(books):
     assert not result.errors
     content = result.data
     assert len(content["books"]["edges"]) == page_size
+
+
+QUERY_PAGINATION_WITH_TOTAL_COUNT = """
+    query BooksPaginationTest($first: Int) {
+        books(first: $first) {
+            totalCount
+            isTotalCountExact
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+def test_pagination_total_count(books):
+    # when
+    result = schema.execute(QUERY_PAGINATION_WITH_TOTAL_COUNT, variables={"first": 5})
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == len(books)
+    assert result.data["books"]["isTotalCountExact"] is True
+
+
+def test_pagination_total_count_below_exact_limit(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_EXACT_LIMIT = len(books)
+
+    # when
+    result = schema.execute(QUERY_PAGINATION_WITH_TOTAL_COUNT, variables={"first": 5})
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == len(books)
+    assert result.data["books"]["isTotalCountExact"] is True
+
+
+def test_pagination_total_count_above_exact_limit(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_EXACT_LIMIT = 10
+
+    # when
+    result = schema.execute(QUERY_PAGINATION_WITH_TOTAL_COUNT, variables={"first": 5})
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] > 10
+    assert result.data["books"]["isTotalCountExact"] is False
+    assert len(result.data["books"]["edges"]) == 5
+
+
+def test_pagination_uses_row_value_comparison(books, django_assert_num_queries):
+    # given
+    cursor = base64.b64encode(str.encode(f'["{books[4].pk}"]')).decode("utf-8")
+    variables = {"first": 5, "after": cursor}
+
+    # when
+    with django_assert_num_queries(1) as captured:
+        result = schema.execute(QUERY_PAGINATION_TEST, variables=variables)
+
+    # then
+    assert not result.errors
+    assert [edge["node"]["name"] for edge in result.data["books"]["edges"]] == [
+        book.name for book in books[5:10]
+    ]
+    assert "ROW(" in captured.captured_queries[0]["sql"]
+
+
+def test_pagination_cursor_with_invalid_value(books):
+    # given
+    cursor = base64.b64encode(str.encode('["Test"]')).decode("utf-8")
+    variables = {"first": 5, "after": cursor}
+
+    # when
+    result = schema.execute(QUERY_PAGINATION_TEST, variables=variables)
+
+    # then
+    assert len(result.errors) == 1
+    assert str(result.errors[0]) == "Received cursor is invalid."
+
+
+def test_pagination_warns_about_sorting_without_index(books, settings, caplog):
+    # given
+    settings.DEBUG = True
+
+    # when
+    qs = Book.objects.order_by("name")
+    connection_from_queryset_slice(
+        qs,
+        {"first": 5, "sort_by": {"field": ["name"]}},
+        BookTypeCountableConnection,
+        BookTypeCountableConnection.Edge,
+    )
+
+    # then
+    assert "No index supports sorting Book by name" in caplog.text
+
+
+def test_pagination_sorting_by_pk_does_not_warn(books, settings, caplog):
+    # given
+    settings.DEBUG = True
+
+    # when
+    qs = Book.objects.order_by("pk")
+    connection_from_queryset_slice(
+        qs,
+        {"first": 5, "sort_by": {"field": ["pk"]}},
+        BookTypeCountableConnection,
+        BookTypeCountableConnection.Edge,
+    )
+
+    # then
+    assert "No index supports sorting" not in caplog.text
@@ -5,7 +5,10 @@ from django.db.models import QuerySet
 
 from ....discount import PromotionType
 from ....discount.models import Promotion, PromotionRule
-from ....discount.utils.promotion import CatalogueInfo, update_rule_variant_relation
+from ....discount.utils.promotion import (
+    CatalogueInfo,
+    update_rule_variant_relation_in_database,
+)
 from ....product.models import ProductVariant
 
 CATALOGUE_FIELD_TO_TYPE_NAME = {
@@ -40,19 +43,8 @@ def clear_promotion_old_sale_id(promotion: Promotion, *, save=False):
 def update_variants_for_promotion(
     variants: QuerySet["ProductVariant"], promotion: "Promotion"
 ):
-    PromotionRuleVariant = PromotionRule.variants.through
-    rules = PromotionRule.objects.filter(promotion_id=promotion.id)
-    promotion_rule_variants = []
     for rule_id in promotion.rules.values_list("id", flat=True):
-        promotion_rule_variants.extend(
-            [
-                PromotionRuleVariant(
-                    promotionrule_id=rule_id, productvariant_id=variant.pk
-                )
-                for variant in variants
-            ]
-        )
-    update_rule_variant_relation(rules, promotion_rule_variants)
+        update_rule_variant_relation_in_database(rule_id, variants)
 
 
 def promotion_rule_should_be_marked_with_dirty_variants(
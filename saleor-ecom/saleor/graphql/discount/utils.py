@@ -10,7 +10,7 @@ from graphene.utils.str_converters import to_snake_case
 
 from ...checkout.models import Checkout
 from ...discount.models import Promotion, PromotionRule
-from ...discount.utils.promotion import update_rule_variant_relation
+from ...discount.utils.promotion import update_rule_variant_relation_in_database
 from ...order.models import Order
 from ...product.managers import ProductsQueryset, ProductVariantQueryset
 from ...product.models import (
@@ -69,23 +69,11 @@ def get_variants_for_promotion(
 ) -> ProductVariantQueryset:
     """Get variants that are included in the promotion based on catalogue predicate."""
     queryset = ProductVariant.objects.none()
-    promotion_rule_variants = []
-    PromotionRuleVariant = PromotionRule.variants.through
-    rules = promotion.rules.all()
-    for rule in rules:
+    for rule in promotion.rules.all():
         variants = get_variants_for_catalogue_predicate(rule.catalogue_predicate)
         queryset |= variants
         if update_rule_variants:
-            promotion_rule_variants.extend(
-                [
-                    PromotionRuleVariant(
-                        promotionrule_id=rule.pk, productvariant_id=variant.pk
-                    )
-                    for variant in variants
-                ]
-            )
-    if promotion_rule_variants:
-        update_rule_variant_relation(rules, promotion_rule_variants)
+            update_rule_variant_relation_in_database(rule.pk, variants)
 
     return queryset
 
@@ -1,6 +1,7 @@
 import copy
 import datetime
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from dataclasses import fields as dataclass_fields
@@ -80,6 +81,11 @@ MAX_ORDERS = 50
 MAX_NOTE_LENGTH = 255
 
 
+def bulk_create_instances(instances: list[Any]):
+    if instances:
+        type(instances[0]).objects.bulk_create(instances)
+
+
 @dataclass
 class OrderBulkError:
     message: str
@@ -159,6 +165,7 @@ class OrderBulkCreateData:
         if self.order:
             updates_amounts_for_order(self.order, save=False)
             update_order_search_vector(self.order, save=False)
+            self.order.lines_count = len(self.lines)
 
     @property
     def all_order_lines(self) -> list[OrderLine]:
@@ -2212,7 +2219,17 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         return orders_data
 
     @classmethod
-    def save_data(cls, orders_data: list[OrderBulkCreateData], stocks: list[Stock]):
+    def save_data(
+        cls,
+        orders_data: list[OrderBulkCreateData],
+        stocks: list[Stock],
+        create_instances: Callable[[list[Any]], Any] = bulk_create_instances,
+    ):
+        """Save the orders with their related objects.
+
+        The instances of each model are written with `create_instances`,
+        which defaults to `bulk_create`.
+        """
         for order_data in orders_data:
             order_data.set_quantity_fulfilled()
             order_data.set_fulfillment_order()
@@ -2226,10 +2243,10 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                     addresses.append(billing_address)
                 if shipping_address := order_data.order.shipping_address:
                     addresses.append(shipping_address)
-        Address.objects.bulk_create(addresses)
+        create_instances(addresses)
 
         orders = [order_data.order for order_data in orders_data if order_data.order]
-        Order.objects.bulk_create(orders)
+        create_instances(orders)
 
         order_lines: list[OrderLine] = sum(
             [
@@ -2239,7 +2256,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             ],
             [],
         )
-        OrderLine.objects.bulk_create(order_lines)
+        create_instances(order_lines)
 
         notes = [
             note
@@ -2247,7 +2264,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             for note in order_data.notes
             if order_data.order
         ]
-        OrderEvent.objects.bulk_create(notes)
+        create_instances(notes)
 
         fulfillments = [
             fulfillment.fulfillment
@@ -2255,7 +2272,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             for fulfillment in order_data.fulfillments
             if order_data.order
         ]
-        Fulfillment.objects.bulk_create(fulfillments)
+        create_instances(fulfillments)
         for order_data in orders_data:
             order_data.set_fulfillment_id()
         fulfillment_lines: list[FulfillmentLine] = sum(
@@ -2266,7 +2283,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             ],
             [],
         )
-        FulfillmentLine.objects.bulk_create(fulfillment_lines)
+        create_instances(fulfillment_lines)
 
         stock_bulk_update(stocks, ["quantity"])
 
@@ -2278,7 +2295,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             ],
             [],
         )
-        TransactionItem.objects.bulk_create(transactions)
+        create_instances(transactions)
         for order_data in orders_data:
             order_data.set_transaction_id()
         transaction_events: list[TransactionEvent] = sum(
@@ -2289,13 +2306,13 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             ],
             [],
         )
-        TransactionEvent.objects.bulk_create(transaction_events)
+        create_instances(transaction_events)
 
         invoices: list[Invoice] = sum(
             [order_data.all_invoices for order_data in orders_data if order_data.order],
             [],
         )
-        Invoice.objects.bulk_create(invoices)
+        create_instances(invoices)
 
         discounts: list[OrderDiscount] = sum(
             [
@@ -2305,7 +2322,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             ],
             [],
         )
-        OrderDiscount.objects.bulk_create(discounts)
+        create_instances(discounts)
 
         for order_data in orders_data:
             order_data.link_gift_cards()
@@ -2316,6 +2333,8 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             [
                 "total_charged_amount",
                 "charge_status",
+                "payment_status",
+                "lines_count",
                 "updated_at",
                 "total_authorized_amount",
                 "authorize_status",
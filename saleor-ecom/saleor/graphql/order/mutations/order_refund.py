@@ -5,6 +5,7 @@ from ....giftcard.utils import order_has_gift_card_lines
 from ....order import FulfillmentStatus, models
 from ....order.actions import order_refunded
 from ....order.error_codes import OrderErrorCode
+from ....order.utils import update_order_payment_status
 from ....payment import TransactionKind, gateway
 from ....payment import models as payment_models
 from ....permission.enums import OrderPermissions
@@ -114,4 +115,5 @@ class OrderRefund(BaseMutation):
         order.fulfillments.create(
             status=FulfillmentStatus.REFUNDED, total_refund_amount=amount
         )
+        update_order_payment_status(order)
         return OrderRefund(order=SyncWebhookControlContext(order))
@@ -1,6 +1,3 @@
-from django.db.models import CharField, ExpressionWrapper, OuterRef, QuerySet, Subquery
-
-from ...payment.models import Payment
 from ..core.descriptions import DEPRECATED_IN_3X_INPUT
 from ..core.doc_category import DOC_CATEGORY_ORDERS
 from ..core.types import BaseEnum, SortInputObjectType
@@ -13,7 +10,7 @@ class OrderSortField(BaseEnum):
     CREATED_AT = ["created_at", "status", "pk"]
     LAST_MODIFIED_AT = ["updated_at", "status", "pk"]
     CUSTOMER = ["billing_address__last_name", "billing_address__first_name", "pk"]
-    PAYMENT = ["last_charge_status", "status", "pk"]
+    PAYMENT = ["last_payment_charge_status", "status", "pk"]
     FULFILLMENT_STATUS = ["status", "user_email", "pk"]
 
     class Meta:
@@ -39,17 +36,6 @@ class OrderSortField(BaseEnum):
 
         raise ValueError(f"Unsupported enum value: {self.value}")
 
-    @staticmethod
-    def qs_with_payment(queryset: QuerySet, **_kwargs) -> QuerySet:
-        subquery = Subquery(
-            Payment.objects.filter(order_id=OuterRef("pk"))
-            .order_by("-pk")
-            .values_list("charge_status")[:1]
-        )
-        return queryset.annotate(
-            last_charge_status=ExpressionWrapper(subquery, output_field=CharField())
-        )
-
 
 class OrderSortingInput(SortInputObjectType):
     class Meta:
@@ -26,7 +26,7 @@ from .....order.error_codes import OrderErrorCode
 from .....order.models import OrderEvent, OrderLine
 from .....product.models import Product, ProductVariant
 from .....product.utils.variant_prices import update_discounted_prices_for_promotion
-from .....product.utils.variants import fetch_variants_for_promotion_rules
+from .....product.utils.variants import update_variants_for_promotion_rules
 from .....warehouse.models import Allocation, Stock
 from .....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ....tests.utils import assert_no_permission, get_graphql_content
@@ -1393,7 +1393,9 @@ def test_order_lines_create_with_catalogue_discount_existing_variant(
     new_reward_value = reward_value + Decimal(10)
     rule.reward_value = new_reward_value
     rule.save(update_fields=["reward_value"])
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     update_discounted_prices_for_promotion(Product.objects.all())
 
     quantity = 1
@@ -1906,3 +1906,79 @@ def test_order_payment_status_with_transaction_and_without_granted_refunds(
     assert data["paymentStatusDisplay"] == dict(ChargeStatus.CHOICES).get(
         expected_payment_status.value
     )
+
+
+QUERY_ORDERS_PAYMENT_STATUS_AND_LINES_COUNT = """
+    query OrdersQuery {
+        orders(first: 10) {
+            edges {
+                node {
+                    paymentStatus
+                    linesCount
+                }
+            }
+        }
+    }
+"""
+
+
+def test_orders_query_payment_status_and_lines_count_from_order(
+    staff_api_client, permission_group_manage_orders, order_with_lines
+):
+    # given
+    order_with_lines.payment_status = ChargeStatus.FULLY_CHARGED
+    order_with_lines.lines_count = 5
+    order_with_lines.save(update_fields=["payment_status", "lines_count"])
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_ORDERS_PAYMENT_STATUS_AND_LINES_COUNT
+    )
+    content = get_graphql_content(response)
+
+    # then
+    order_data = content["data"]["orders"]["edges"][0]["node"]
+    assert order_data["paymentStatus"] == PaymentChargeStatusEnum.FULLY_CHARGED.name
+    assert order_data["linesCount"] == 5
+
+
+def test_orders_query_payment_status_and_lines_count_not_stored(
+    staff_api_client, permission_group_manage_orders, order_with_lines
+):
+    # given
+    order_with_lines.payment_status = None
+    order_with_lines.lines_count = None
+    order_with_lines.save(update_fields=["payment_status", "lines_count"])
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_ORDERS_PAYMENT_STATUS_AND_LINES_COUNT
+    )
+    content = get_graphql_content(response)
+
+    # then
+    order_data = content["data"]["orders"]["edges"][0]["node"]
+    assert order_data["paymentStatus"] == PaymentChargeStatusEnum.NOT_CHARGED.name
+    assert order_data["linesCount"] == order_with_lines.lines.count()
+
+
+def test_orders_query_payment_status_of_unconfirmed_order_not_from_order(
+    staff_api_client, permission_group_manage_orders, order_with_lines
+):
+    # given
+    order_with_lines.status = OrderStatus.UNCONFIRMED
+    order_with_lines.payment_status = ChargeStatus.FULLY_CHARGED
+    order_with_lines.save(update_fields=["status", "payment_status"])
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_ORDERS_PAYMENT_STATUS_AND_LINES_COUNT
+    )
+    content = get_graphql_content(response)
+
+    # then
+    order_data = content["data"]["orders"]["edges"][0]["node"]
+    assert order_data["paymentStatus"] == PaymentChargeStatusEnum.NOT_CHARGED.name
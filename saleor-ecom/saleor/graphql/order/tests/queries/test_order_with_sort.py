@@ -4,6 +4,9 @@ from prices import Money, TaxedMoney
 
 from .....order import OrderStatus
 from .....order.models import Order
+from .....order.utils import update_order_charge_data
+from .....payment import ChargeStatus
+from .....payment.models import Payment
 from ....tests.utils import get_graphql_content
 
 QUERY_ORDER_WITH_SORT = """
@@ -93,6 +96,51 @@ def test_query_orders_with_sort(
         )
 
 
+@pytest.mark.parametrize(
+    ("direction", "result_order"),
+    [("ASC", [1, 0, 2]), ("DESC", [2, 0, 1])],
+)
+def test_query_orders_with_sort_by_payment(
+    direction,
+    result_order,
+    staff_api_client,
+    permission_group_manage_orders,
+    order_generator,
+):
+    # given
+    created_orders = [order_generator() for _ in range(3)]
+    for order, charge_statuses in zip(
+        created_orders[:2],
+        [
+            [ChargeStatus.PARTIALLY_CHARGED, ChargeStatus.NOT_CHARGED],
+            [ChargeStatus.NOT_CHARGED, ChargeStatus.FULLY_CHARGED],
+        ],
+        strict=True,
+    ):
+        for charge_status in charge_statuses:
+            Payment.objects.create(
+                gateway="mirumee.payments.dummy",
+                order=order,
+                total=order.total.gross.amount,
+                currency=order.currency,
+                charge_status=charge_status,
+            )
+        update_order_charge_data(order)
+
+    variables = {"sort_by": {"field": "PAYMENT", "direction": direction}}
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_ORDER_WITH_SORT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    orders = content["data"]["orders"]["edges"]
+    assert [order["node"]["number"] for order in orders] == [
+        str(created_orders[index].number) for index in result_order
+    ]
+
+
 SEARCH_ORDERS_QUERY = """
     query Orders(
         $filters: OrderFilterInput,
@@ -26,7 +26,7 @@ from ...graphql.core.federation.resolvers import resolve_federation_references
 from ...graphql.order.resolvers import resolve_orders
 from ...graphql.utils import get_user_or_app_from_context
 from ...graphql.warehouse.dataloaders import StockByIdLoader, WarehouseByIdLoader
-from ...order import OrderStatus, calculations, models
+from ...order import ORDER_EDITABLE_STATUS, OrderStatus, calculations, models
 from ...order.calculations import fetch_order_prices_if_expired
 from ...order.models import FulfillmentStatus
 from ...order.utils import (
@@ -72,6 +72,7 @@ from ..core.descriptions import (
     ADDED_IN_318,
     ADDED_IN_319,
     ADDED_IN_320,
+    ADDED_IN_321,
     DEPRECATED_IN_3X_FIELD,
     PREVIEW_FEATURE,
 )
@@ -1479,6 +1480,9 @@ class Order(SyncWebhookControlContextModelObjectType[ModelObjectType[models.Orde
     lines = NonNullList(
         lambda: OrderLine, required=True, description="List of order lines."
     )
+    lines_count = graphene.Int(
+        description="Number of order lines." + ADDED_IN_321, required=True
+    )
     actions = NonNullList(
         OrderAction,
         description=(
@@ -2214,6 +2218,12 @@ class Order(SyncWebhookControlContextModelObjectType[ModelObjectType[models.Orde
             .then(_wrap_with_sync_webhook_control_context)
         )
 
+    @staticmethod
+    def resolve_lines_count(root: SyncWebhookControlContext[models.Order], info):
+        if root.node.lines_count is not None:
+            return root.node.lines_count
+        return OrderLinesByOrderIdLoader(info.context).load(root.node.id).then(len)
+
     @staticmethod
     def resolve_events(root: SyncWebhookControlContext[models.Order], _info):
         def _wrap_with_sync_webhook_control_context(events):
@@ -2256,6 +2266,10 @@ class Order(SyncWebhookControlContextModelObjectType[ModelObjectType[models.Orde
     @traced_resolver
     def resolve_payment_status(root: SyncWebhookControlContext[models.Order], info):
         order = root.node
+        # The totals of editable orders are recalculated lazily, without updating
+        # the stored payment status.
+        if order.payment_status and order.status not in ORDER_EDITABLE_STATUS:
+            return order.payment_status
 
         def _resolve_payment_status(data):
             transactions, payments, fulfillments, granted_refunds = data
@@ -315,6 +315,7 @@ class TransactionCreate(BaseMutation):
                     "total_charged_amount",
                     "authorize_status",
                     "charge_status",
+                    "payment_status",
                 ]
             )
         if (
@@ -416,6 +416,7 @@ class TransactionEventReport(ModelMutation):
                     update_fields=[
                         "total_charged_amount",
                         "charge_status",
+                        "payment_status",
                         "updated_at",
                         "total_authorized_amount",
                         "authorize_status",
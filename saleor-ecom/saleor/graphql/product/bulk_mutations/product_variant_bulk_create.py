@@ -14,6 +14,7 @@ from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductVariantBulkErrorCode
 from ....warehouse import models as warehouse_models
+from ....warehouse.stock_availability import schedule_products_stock_availability_update
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...attribute.types import (
@@ -893,6 +894,9 @@ class ProductVariantBulkCreate(BaseMutation):
             AttributeAssignmentMixin.save(variant, attributes)
 
         warehouse_models.Stock.objects.bulk_create(stocks_to_create)
+        schedule_products_stock_availability_update(
+            stock.product_variant_id for stock in stocks_to_create
+        )
         models.ProductVariantChannelListing.objects.bulk_create(listings_to_create)
 
         if product and not product.default_variant and variants_to_create:
@@ -928,10 +932,11 @@ class ProductVariantBulkCreate(BaseMutation):
 
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_VARIANT_CREATED)
         manager = get_plugin_manager_promise(info.context).get()
-        for instance in instances:
-            cls.call_event(
-                manager.product_variant_created, instance.node, webhooks=webhooks
-            )
+        cls.call_event(
+            manager.product_variants_created,
+            [instance.node for instance in instances],
+            webhooks=webhooks,
+        )
 
     @classmethod
     @traced_atomic_transaction()
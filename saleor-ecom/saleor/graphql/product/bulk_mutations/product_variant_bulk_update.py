@@ -14,6 +14,7 @@ from ....product import models
 from ....product.error_codes import ProductErrorCode, ProductVariantBulkErrorCode
 from ....warehouse import models as warehouse_models
 from ....warehouse.management import delete_stocks, stock_bulk_update
+from ....warehouse.stock_availability import schedule_products_stock_availability_update
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...attribute.utils import AttributeAssignmentMixin
@@ -712,6 +713,9 @@ class ProductVariantBulkUpdate(BaseMutation):
             warehouse_models.Stock.objects.bulk_create(
                 stocks_to_create, ignore_conflicts=True
             )
+        schedule_products_stock_availability_update(
+            stock.product_variant_id for stock in stocks_to_create
+        )
         if stocks_to_update:
             stock_bulk_update(stocks_to_update, ["quantity"])
 
@@ -759,14 +763,13 @@ class ProductVariantBulkUpdate(BaseMutation):
         product.search_index_dirty = True
         product.save(update_fields=["search_index_dirty"])
 
-        for instance in instances:
-            cls.call_event(
-                manager.product_variant_updated,
-                instance.node,
-                webhooks=webhooks,
-                pre_save_payloads=pre_save_payloads,
-                request_time=request_time,
-            )
+        cls.call_event(
+            manager.product_variants_updated,
+            [instance.node for instance in instances],
+            webhooks=webhooks,
+            pre_save_payloads=pre_save_payloads,
+            request_time=request_time,
+        )
 
     @classmethod
     def _get_impacted_channels(cls, cleaned_inputs_map):
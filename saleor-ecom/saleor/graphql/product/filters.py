@@ -8,16 +8,14 @@ import graphene
 from django.db.models import Exists, FloatField, OuterRef, Q, Subquery, Sum
 from django.db.models.expressions import ExpressionWrapper
 from django.db.models.fields import IntegerField
-from django.db.models.functions import Cast, Coalesce
+from django.db.models.functions import Cast
 from django.utils import timezone
 
 from ...attribute import AttributeInputType
 from ...attribute.models import (
-    AssignedProductAttributeValue,
-    AssignedVariantAttribute,
-    AssignedVariantAttributeValue,
     Attribute,
     AttributeValue,
+    ProductAttributeFilterValue,
 )
 from ...channel.models import Channel
 from ...product import ProductTypeKind
@@ -32,7 +30,7 @@ from ...product.models import (
     ProductVariantChannelListing,
 )
 from ...product.search import search_products
-from ...warehouse.models import Allocation, Reservation, Stock, Warehouse
+from ...warehouse.models import Stock, Warehouse
 from ..channel.filters import get_channel_slug_from_filter_data
 from ..core.doc_category import DOC_CATEGORY_PRODUCTS
 from ..core.filters import (
@@ -233,57 +231,19 @@ def _clean_product_attributes_boolean_filter_input(
 def filter_products_by_attributes_values(qs, queries: T_PRODUCT_FILTER_QUERIES):
     filters = []
     for values in queries.values():
-        assigned_product_attribute_values = AssignedProductAttributeValue.objects.using(
-            qs.db
-        ).filter(value_id__in=values)
-        product_attribute_filter = Q(
-            Exists(assigned_product_attribute_values.filter(product_id=OuterRef("pk")))
+        filter_values = ProductAttributeFilterValue.objects.using(qs.db).filter(
+            value_id__in=values
         )
-
-        assigned_variant_attribute_values = AssignedVariantAttributeValue.objects.using(
-            qs.db
-        ).filter(value_id__in=values)
-        assigned_variant_attributes = AssignedVariantAttribute.objects.using(
-            qs.db
-        ).filter(
-            Exists(
-                assigned_variant_attribute_values.filter(assignment_id=OuterRef("pk"))
-            )
-        )
-        product_variants = ProductVariant.objects.using(qs.db).filter(
-            Exists(assigned_variant_attributes.filter(variant_id=OuterRef("pk")))
-        )
-        variant_attribute_filter = Q(
-            Exists(product_variants.filter(product_id=OuterRef("pk")))
-        )
-
-        filters.append(product_attribute_filter | variant_attribute_filter)
+        filters.append(Exists(filter_values.filter(product_id=OuterRef("pk"))))
 
     return qs.filter(*filters)
 
 
 def filter_products_by_attributes_values_qs(qs, values_qs):
-    assigned_product_attribute_values = AssignedProductAttributeValue.objects.using(
-        qs.db
-    ).filter(value__in=values_qs)
-    product_attribute_filter = Q(
-        Exists(assigned_product_attribute_values.filter(product_id=OuterRef("pk")))
+    filter_values = ProductAttributeFilterValue.objects.using(qs.db).filter(
+        value__in=values_qs
     )
-
-    assigned_variant_attribute_values = AssignedVariantAttributeValue.objects.using(
-        qs.db
-    ).filter(value__in=values_qs)
-    assigned_variant_attributes = AssignedVariantAttribute.objects.using(qs.db).filter(
-        Exists(assigned_variant_attribute_values.filter(assignment_id=OuterRef("pk")))
-    )
-    product_variants = ProductVariant.objects.using(qs.db).filter(
-        Exists(assigned_variant_attributes.filter(variant_id=OuterRef("pk")))
-    )
-    variant_attribute_filter = Q(
-        Exists(product_variants.filter(product_id=OuterRef("pk")))
-    )
-
-    return qs.filter(product_attribute_filter | variant_attribute_filter)
+    return qs.filter(Exists(filter_values.filter(product_id=OuterRef("pk"))))
 
 
 def filter_products_by_attributes(
@@ -387,50 +347,18 @@ def filter_products_by_collections(qs, collection_pks):
     return qs.filter(Exists(collection_products.filter(product_id=OuterRef("pk"))))
 
 
-def filter_products_by_stock_availability(qs, stock_availability, channel_slug):
-    allocations = (
-        Allocation.objects.using(qs.db)
-        .values("stock_id")
-        .filter(quantity_allocated__gt=0, stock_id=OuterRef("pk"))
-        .values_list(Sum("quantity_allocated"))
+def get_products_in_stock(database_connection_name: str, channel_slug):
+    return ProductChannelListing.objects.using(database_connection_name).filter(
+        channel__slug=channel_slug, is_in_stock=True
     )
-    allocated_subquery = Subquery(queryset=allocations, output_field=IntegerField())
 
-    reservations = (
-        Reservation.objects.using(qs.db)
-        .values("stock_id")
-        .filter(
-            quantity_reserved__gt=0,
-            stock_id=OuterRef("pk"),
-            reserved_until__gt=timezone.now(),
-        )
-        .values_list(Sum("quantity_reserved"))
-    )
-    reservation_subquery = Subquery(queryset=reservations, output_field=IntegerField())
-    warehouse_pks = list(
-        Warehouse.objects.using(qs.db)
-        .for_channel_with_active_shipping_zone_or_cc(channel_slug)
-        .values_list("pk", flat=True)
-    )
-    stocks = (
-        Stock.objects.using(qs.db)
-        .filter(
-            warehouse_id__in=warehouse_pks,
-            quantity__gt=Coalesce(allocated_subquery, 0)
-            + Coalesce(reservation_subquery, 0),
-        )
-        .values("product_variant_id")
-    )
 
-    variants = (
-        ProductVariant.objects.using(qs.db)
-        .filter(Exists(stocks.filter(product_variant_id=OuterRef("pk"))))
-        .values("product_id")
-    )
+def filter_products_by_stock_availability(qs, stock_availability, channel_slug):
+    listings = get_products_in_stock(qs.db, channel_slug)
     if stock_availability == StockAvailability.IN_STOCK:
-        qs = qs.filter(Exists(variants.filter(product_id=OuterRef("pk"))))
+        qs = qs.filter(Exists(listings.filter(product_id=OuterRef("pk"))))
     if stock_availability == StockAvailability.OUT_OF_STOCK:
-        qs = qs.filter(~Exists(variants.filter(product_id=OuterRef("pk"))))
+        qs = qs.filter(~Exists(listings.filter(product_id=OuterRef("pk"))))
     return qs
 
 
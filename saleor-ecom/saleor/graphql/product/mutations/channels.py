@@ -18,6 +18,7 @@ from ....product.models import (
 from ....product.models import Product as ProductModel
 from ....product.models import ProductVariant as ProductVariantModel
 from ....product.utils.product import mark_products_in_channels_as_dirty
+from ....warehouse.stock_availability import schedule_products_stock_availability_update
 from ...channel import ChannelContext
 from ...channel.mutations import BaseChannelListingMutation
 from ...channel.types import Channel
@@ -329,8 +330,11 @@ class ProductChannelListingUpdate(BaseChannelListingMutation):
     @classmethod
     def save(cls, info: ResolveInfo, product: "ProductModel", cleaned_input: dict):
         with traced_atomic_transaction():
-            cls.update_channels(product, cleaned_input.get("update_channels", []))
+            update_channels = cleaned_input.get("update_channels", [])
+            cls.update_channels(product, update_channels)
             cls.remove_channels(product, cleaned_input.get("remove_channels", []))
+            if update_channels:
+                schedule_products_stock_availability_update(product_ids=[product.pk])
 
     @classmethod
     def post_save_actions(
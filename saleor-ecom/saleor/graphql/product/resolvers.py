@@ -1,5 +1,8 @@
-from django.db.models import Exists, OuterRef, Sum
+from collections import defaultdict
 
+from django.db.models import Count, Exists, OuterRef, Q, Sum
+
+from ...attribute.models import Attribute, AttributeValue, ProductAttributeFilterValue
 from ...channel.models import Channel
 from ...order import OrderStatus
 from ...order.models import Order
@@ -13,6 +16,8 @@ from ..core.tracing import traced_resolver
 from ..core.utils import from_global_id_or_error
 from ..utils import get_user_or_app_from_context
 from ..utils.filters import filter_by_period
+from .enums import StockAvailability
+from .filters import get_products_in_stock
 
 
 def resolve_categories(info: ResolveInfo, level=None):
@@ -138,6 +143,110 @@ def resolve_products(
     return ChannelQsContext(qs=qs, channel_slug=channel_slug)
 
 
+def resolve_product_facets(
+    info: ResolveInfo,
+    requestor,
+    qs,
+    channel: Channel | None,
+    attribute_slugs: list[str],
+    price_ranges: list[dict],
+) -> dict:
+    connection_name = get_database_connection_name(info.context)
+    qs = qs.order_by()
+
+    # The total, stock and price counts are computed in a single aggregation.
+    aggregates = {"total_count": Count("pk")}
+    if channel:
+        products_in_stock = get_products_in_stock(connection_name, channel.slug)
+        aggregates["in_stock_count"] = Count(
+            "pk", filter=Q(Exists(products_in_stock.filter(product_id=OuterRef("pk"))))
+        )
+        for index, price_range in enumerate(price_ranges):
+            listings = models.ProductChannelListing.objects.using(
+                connection_name
+            ).filter(channel_id=channel.id)
+            if (gte := price_range.get("gte")) is not None:
+                listings = listings.filter(discounted_price_amount__gte=gte)
+            if (lte := price_range.get("lte")) is not None:
+                listings = listings.filter(discounted_price_amount__lte=lte)
+            aggregates[f"price_range_{index}"] = Count(
+                "pk", filter=Q(Exists(listings.filter(product_id=OuterRef("pk"))))
+            )
+    counts = qs.aggregate(**aggregates)
+
+    price_range_facets = []
+    stock_availability_facets = []
+    if channel:
+        price_range_facets = [
+            {
+                "gte": price_range.get("gte"),
+                "lte": price_range.get("lte"),
+                "count": counts[f"price_range_{index}"],
+            }
+            for index, price_range in enumerate(price_ranges)
+        ]
+        stock_availability_facets = [
+            {
+                "stock_availability": StockAvailability.IN_STOCK.value,
+                "count": counts["in_stock_count"],
+            },
+            {
+                "stock_availability": StockAvailability.OUT_OF_STOCK.value,
+                "count": counts["total_count"] - counts["in_stock_count"],
+            },
+        ]
+
+    return {
+        "total_count": counts["total_count"],
+        "attributes": _resolve_attribute_facets(
+            connection_name, requestor, qs, attribute_slugs
+        ),
+        "price_ranges": price_range_facets,
+        "stock_availability": stock_availability_facets,
+    }
+
+
+def _resolve_attribute_facets(connection_name, requestor, qs, attribute_slugs):
+    if not attribute_slugs:
+        return []
+    attributes = {
+        attribute.slug: attribute
+        for attribute in Attribute.objects.using(connection_name)
+        .get_visible_to_user(requestor)
+        .filter(slug__in=attribute_slugs)
+    }
+    if not attributes:
+        return []
+
+    # The values of all requested attributes are counted in a single grouped query.
+    value_counts = dict(
+        ProductAttributeFilterValue.objects.using(connection_name)
+        .filter(
+            Exists(qs.filter(pk=OuterRef("product_id"))),
+            value__attribute_id__in=[attribute.pk for attribute in attributes.values()],
+        )
+        .values("value_id")
+        .annotate(count=Count("product_id", distinct=True))
+        .values_list("value_id", "count")
+    )
+    attribute_values = defaultdict(list)
+    for value in AttributeValue.objects.using(connection_name).filter(
+        pk__in=value_counts.keys()
+    ):
+        attribute_values[value.attribute_id].append(
+            {"value": value, "count": value_counts[value.pk]}
+        )
+
+    return [
+        {
+            "attribute": attributes[slug],
+            "values": attribute_values[attributes[slug].pk],
+        }
+        for slug in dict.fromkeys(attribute_slugs)
+        if slug in attributes
+    ]
+
+
 def resolve_product_type_by_id(info, id):
     return (
         models.ProductType.objects.using(get_database_connection_name(info.context))
@@ -4,12 +4,19 @@ from promise import Promise
 from ...permission.enums import ProductPermissions
 from ...permission.utils import has_one_of_permissions
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
-from ...product.search import search_products
+from ...product.search import search_products, search_products_typeahead
 from ..channel import ChannelContext, ChannelQsContext
 from ..channel.dataloaders import ChannelBySlugLoader
 from ..channel.utils import get_default_channel_slug_or_graphql_error
 from ..core import ResolveInfo
-from ..core.connection import create_connection_slice, filter_connection_queryset
+from ..core.connection import (
+    FILTERS_NAME,
+    FILTERSET_CLASS,
+    WHERE_FILTERSET_CLASS,
+    WHERE_NAME,
+    create_connection_slice,
+    filter_connection_queryset,
+)
 from ..core.descriptions import (
     ADDED_IN_321,
     DEPRECATED_IN_3X_FIELD,
@@ -23,7 +30,7 @@ from ..core.fields import (
     PermissionsField,
 )
 from ..core.tracing import traced_resolver
-from ..core.types import NonNullList
+from ..core.types import NonNullList, PriceRangeInput
 from ..core.utils import from_global_id_or_error
 from ..core.validators import validate_one_of_args_is_in_query
 from ..translations.mutations import (
@@ -55,10 +62,12 @@ from .filters import (
     CategoryWhereInput,
     CollectionFilterInput,
     CollectionWhereInput,
+    ProductFilter,
     ProductFilterInput,
     ProductTypeFilterInput,
     ProductVariantFilterInput,
     ProductVariantWhereInput,
+    ProductWhere,
     ProductWhereInput,
 )
 from .mutations import (
@@ -119,6 +128,7 @@ from .resolvers import (
     resolve_digital_content_by_id,
     resolve_digital_contents,
     resolve_product,
+    resolve_product_facets,
     resolve_product_type_by_id,
     resolve_product_types,
     resolve_product_variants,
@@ -147,6 +157,7 @@ from .types import (
     ProductVariant,
     ProductVariantCountableConnection,
 )
+from .types.facets import ProductFacets
 from .utils import check_for_sorting_by_rank
 
 
@@ -273,6 +284,61 @@ class ProductQueries(graphene.ObjectType):
         ),
         doc_category=DOC_CATEGORY_PRODUCTS,
     )
+    product_typeahead = BaseField(
+        NonNullList(Product),
+        search=graphene.String(
+            required=True,
+            description=(
+                "Search phrase. Products are matched by the beginnings of the words, "
+                "with a fallback to the similar names and the fragments of SKUs."
+            ),
+        ),
+        first=graphene.Int(
+            description=(
+                "Number of products to return. Limited by the "
+                "`PRODUCT_TYPEAHEAD_MAX_RESULTS` setting."
+            ),
+        ),
+        channel=graphene.String(
+            description="Slug of a channel for which the data should be returned."
+        ),
+        description=(
+            "List of the shop's products matching the search phrase typed so far, "
+            "without pagination. Requires one of the following permissions to "
+            "include the unpublished items: "
+            f"{', '.join([p.name for p in ALL_PRODUCTS_PERMISSIONS])}." + ADDED_IN_321
+        ),
+        required=True,
+        doc_category=DOC_CATEGORY_PRODUCTS,
+    )
+    product_facets = BaseField(
+        graphene.NonNull(ProductFacets),
+        filter=ProductFilterInput(description="Filtering options for products."),
+        where=ProductWhereInput(description="Where filtering options."),
+        search=graphene.String(description="Search products."),
+        channel=graphene.String(
+            description="Slug of a channel for which the data should be returned."
+        ),
+        attributes=NonNullList(
+            graphene.String,
+            description="Slugs of the attributes to count the products by values of.",
+        ),
+        price_ranges=NonNullList(
+            PriceRangeInput,
+            description=(
+                "Ranges of the minimal variant price in the channel to count the "
+                "products in."
+            ),
+        ),
+        description=(
+            "Counts of the shop's products matching the given filters, grouped by "
+            "the attribute values, price ranges and stock availability. Accepts the "
+            "same filters as the `products` query. Requires one of the following "
+            "permissions to include the unpublished items: "
+            f"{', '.join([p.name for p in ALL_PRODUCTS_PERMISSIONS])}." + ADDED_IN_321
+        ),
+        doc_category=DOC_CATEGORY_PRODUCTS,
+    )
     product_type = BaseField(
         ProductType,
         id=graphene.Argument(
@@ -542,6 +608,94 @@ class ProductQueries(graphene.ObjectType):
             )
         return _resolve_products(None)
 
+    @staticmethod
+    @traced_resolver
+    def resolve_product_typeahead(
+        _root, info: ResolveInfo, *, search, first=None, channel=None
+    ):
+        requestor = get_user_or_app_from_context(info.context)
+        has_required_permissions = has_one_of_permissions(
+            requestor, ALL_PRODUCTS_PERMISSIONS
+        )
+        limited_channel_access = False if channel is None else True
+        if channel is None and not has_required_permissions:
+            channel = get_default_channel_slug_or_graphql_error(
+                allow_replica=info.context.allow_replica
+            )
+
+        def _resolve_products(channel_obj):
+            qs = resolve_products(info, requestor, channel_obj, limited_channel_access)
+            products = search_products_typeahead(qs.qs, search, first)
+            return [
+                ChannelContext(node=product, channel_slug=channel)
+                for product in products
+            ]
+
+        if channel:
+            return (
+                ChannelBySlugLoader(info.context)
+                .load(str(channel))
+                .then(_resolve_products)
+            )
+        return _resolve_products(None)
+
+    @staticmethod
+    @traced_resolver
+    def resolve_product_facets(
+        _root,
+        info: ResolveInfo,
+        *,
+        channel=None,
+        search=None,
+        attributes=None,
+        price_ranges=None,
+        **kwargs,
+    ):
+        requestor = get_user_or_app_from_context(info.context)
+        has_required_permissions = has_one_of_permissions(
+            requestor, ALL_PRODUCTS_PERMISSIONS
+        )
+        limited_channel_access = False if channel is None else True
+        if channel is None and not has_required_permissions:
+            channel = get_default_channel_slug_or_graphql_error(
+                allow_replica=info.context.allow_replica
+            )
+
+        def _resolve_product_facets(channel_obj):
+            qs = resolve_products(info, requestor, channel_obj, limited_channel_access)
+            if search:
+                qs = ChannelQsContext(
+                    qs=search_products(qs.qs, search), channel_slug=channel
+                )
+            kwargs.update(
+                {
+                    "channel": channel,
+                    FILTERSET_CLASS: ProductFilter,
+                    FILTERS_NAME: "filter",
+                    WHERE_FILTERSET_CLASS: ProductWhere,
+                    WHERE_NAME: "where",
+                }
+            )
+            qs = filter_connection_queryset(
+                qs, kwargs, allow_replica=info.context.allow_replica
+            )
+            return resolve_product_facets(
+                info,
+                requestor,
+                qs.qs,
+                channel_obj,
+                attributes or [],
+                price_ranges or [],
+            )
+
+        if channel:
+            return (
+                ChannelBySlugLoader(info.context)
+                .load(str(channel))
+                .then(_resolve_product_facets)
+            )
+        return _resolve_product_facets(None)
+
     @staticmethod
     def resolve_product_type(_root, info: ResolveInfo, *, id):
         _, id = from_global_id_or_error(id, ProductType)
@@ -23,7 +23,11 @@ from ...product.models import (
     Product,
     ProductChannelListing,
 )
-from ..core.descriptions import CHANNEL_REQUIRED, DEPRECATED_IN_3X_INPUT
+from ..core.descriptions import (
+    ADDED_IN_321,
+    CHANNEL_REQUIRED,
+    DEPRECATED_IN_3X_INPUT,
+)
 from ..core.doc_category import DOC_CATEGORY_PRODUCTS
 from ..core.types import BaseEnum, ChannelSortInputObjectType, SortInputObjectType
 
@@ -157,6 +161,7 @@ class ProductOrderField(BaseEnum):
     COLLECTION = ["sort_order", "pk"]
     RATING = ["rating", "name", "slug"]
     CREATED_AT = ["created_at", "name", "slug"]
+    STOCK_AVAILABILITY = ["is_in_stock", "name", "slug"]
 
     class Meta:
         doc_category = DOC_CATEGORY_PRODUCTS
@@ -195,6 +200,9 @@ class ProductOrderField(BaseEnum):
             ProductOrderField.LAST_MODIFIED_AT.name: "update date.",  # type: ignore[attr-defined] # graphene.Enum is not typed # noqa: E501
             ProductOrderField.RATING.name: "rating.",  # type: ignore[attr-defined] # graphene.Enum is not typed # noqa: E501
             ProductOrderField.CREATED_AT.name: "creation date.",  # type: ignore[attr-defined] # graphene.Enum is not typed # noqa: E501
+            ProductOrderField.STOCK_AVAILABILITY.name: (  # type: ignore[attr-defined] # graphene.Enum is not typed # noqa: E501
+                "stock availability." + CHANNEL_REQUIRED + ADDED_IN_321
+            ),
         }
         if self.name in descriptions:
             return f"Sort products by {descriptions[self.name]}"
@@ -230,6 +238,17 @@ class ProductOrderField(BaseEnum):
             is_published=ExpressionWrapper(subquery, output_field=BooleanField())
         )
 
+    @staticmethod
+    def qs_with_stock_availability(queryset: QuerySet, channel_slug: str) -> QuerySet:
+        subquery = Subquery(
+            ProductChannelListing.objects.filter(
+                product_id=OuterRef("pk"), channel__slug=str(channel_slug)
+            ).values_list("is_in_stock")[:1]
+        )
+        return queryset.annotate(
+            is_in_stock=ExpressionWrapper(subquery, output_field=BooleanField())
+        )
+
     @staticmethod
     def qs_with_publication_date(queryset: QuerySet, channel_slug: str) -> QuerySet:
         return ProductOrderField.qs_with_published_at(queryset, channel_slug)
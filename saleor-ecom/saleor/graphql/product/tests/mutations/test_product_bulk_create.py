@@ -269,7 +269,7 @@ def test_product_bulk_create_with_no_slug_and_name_with_unslugify_characters(
     assert len(products) == 2
 
 
-@patch("saleor.plugins.manager.PluginsManager.product_created")
+@patch("saleor.plugins.manager.PluginsManager.products_created")
 def test_product_bulk_create_send_product_created_webhook(
     created_webhook_mock,
     staff_api_client,
@@ -324,9 +324,11 @@ def test_product_bulk_create_send_product_created_webhook(
     assert not data["results"][0]["errors"]
     assert not data["results"][1]["errors"]
     assert data["count"] == 2
-    assert created_webhook_mock.call_count == 2
-    for call in created_webhook_mock.call_args_list:
-        assert isinstance(call.args[0], Product)
+    created_webhook_mock.assert_called_once()
+    created_products = created_webhook_mock.call_args.args[0]
+    assert len(created_products) == 2
+    for product in created_products:
+        assert isinstance(product, Product)
 
 
 def test_product_bulk_create_with_same_name_and_no_slug(
@@ -1372,8 +1374,8 @@ def test_product_bulk_create_with_variants_with_duplicated_sku(
 @patch(
     "saleor.graphql.product.bulk_mutations.product_bulk_create.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
-@patch("saleor.plugins.manager.PluginsManager.product_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_created")
+@patch("saleor.plugins.manager.PluginsManager.products_created")
 def test_product_bulk_create_with_variants_send_product_variant_created_event(
     product_created_webhook_mock,
     variant_created_webhook_mock,
@@ -1478,8 +1480,10 @@ def test_product_bulk_create_with_variants_send_product_variant_created_event(
     assert not data["results"][0]["errors"]
     assert not data["results"][1]["errors"]
     assert data["count"] == 2
-    assert product_created_webhook_mock.call_count == 2
-    assert variant_created_webhook_mock.call_count == 3
+    product_created_webhook_mock.assert_called_once()
+    assert len(product_created_webhook_mock.call_args.args[0]) == 2
+    variant_created_webhook_mock.assert_called_once()
+    assert len(variant_created_webhook_mock.call_args.args[0]) == 3
 
 
 def test_product_bulk_create_with_variants_and_stocks(
@@ -1689,8 +1693,8 @@ def test_product_bulk_create_with_variants_and_invalid_stock(
 @patch(
     "saleor.graphql.product.bulk_mutations.product_bulk_create.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_created")
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
+@patch("saleor.plugins.manager.PluginsManager.products_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_created")
 def test_product_bulk_create_with_variants_and_channel_listings(
     product_variant_created_mock,
     product_created_mock,
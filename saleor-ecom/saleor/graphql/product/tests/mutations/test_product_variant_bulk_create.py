@@ -103,7 +103,7 @@ PRODUCT_VARIANT_BULK_CREATE_MUTATION = """
     "saleor.graphql.product.bulk_mutations."
     "product_variant_bulk_create.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_created")
 def test_product_variant_bulk_create_by_name(
     product_variant_created_webhook_mock,
     mocked_get_webhooks_for_event,
@@ -169,7 +169,8 @@ def test_product_variant_bulk_create_by_name(
     product_variant = ProductVariant.objects.get(sku=sku1)
     product.refresh_from_db()
     assert product.default_variant == product_variant
-    assert product_variant_created_webhook_mock.call_count == data["count"]
+    product_variant_created_webhook_mock.assert_called_once()
+    assert len(product_variant_created_webhook_mock.call_args.args[0]) == data["count"]
     for rule in get_active_catalogue_promotion_rules():
         assert rule.variants_dirty
 
@@ -178,7 +179,7 @@ def test_product_variant_bulk_create_by_name(
     "saleor.graphql.product.bulk_mutations."
     "product_variant_bulk_create.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_created")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_created")
 def test_product_variant_bulk_create_by_attribute_id(
     product_variant_created_webhook_mock,
     mocked_get_webhooks_for_event,
@@ -227,7 +228,8 @@ def test_product_variant_bulk_create_by_attribute_id(
     product_variant = ProductVariant.objects.get(sku=sku)
     product.refresh_from_db()
     assert product.default_variant == product_variant
-    assert product_variant_created_webhook_mock.call_count == data["count"]
+    product_variant_created_webhook_mock.assert_called_once()
+    assert len(product_variant_created_webhook_mock.call_args.args[0]) == data["count"]
     for rule in get_active_catalogue_promotion_rules():
         assert rule.variants_dirty
 
@@ -92,7 +92,7 @@ PRODUCT_VARIANT_BULK_UPDATE_MUTATION = """
     "saleor.graphql.product.bulk_mutations."
     "product_variant_bulk_update.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_updated")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_updated")
 def test_product_variant_bulk_update(
     product_variant_created_webhook_mock,
     mocked_get_webhooks_for_event,
@@ -148,7 +148,8 @@ def test_product_variant_bulk_update(
     assert variant_data["metadata"][0]["value"] == metadata_value
     assert product_with_single_variant.variants.count() == 1
     assert old_name != new_name
-    assert product_variant_created_webhook_mock.call_count == data["count"]
+    product_variant_created_webhook_mock.assert_called_once()
+    assert len(product_variant_created_webhook_mock.call_args.args[0]) == data["count"]
     for rule in get_active_catalogue_promotion_rules():
         assert rule.variants_dirty
 
@@ -0,0 +1,172 @@
+import graphene
+
+from .....attribute.utils import associate_attribute_values_to_instance
+from .....warehouse.models import Stock
+from .....warehouse.stock_availability import update_products_stock_availability
+from ....tests.utils import get_graphql_content
+
+QUERY_PRODUCT_FACETS = """
+    query (
+        $channel: String
+        $filter: ProductFilterInput
+        $where: ProductWhereInput
+        $attributes: [String!]
+        $priceRanges: [PriceRangeInput!]
+    ) {
+        productFacets(
+            channel: $channel
+            filter: $filter
+            where: $where
+            attributes: $attributes
+            priceRanges: $priceRanges
+        ) {
+            totalCount
+            attributes {
+                attribute {
+                    slug
+                }
+                values {
+                    value {
+                        slug
+                    }
+                    count
+                }
+            }
+            priceRanges {
+                gte
+                lte
+                count
+            }
+            stockAvailability {
+                stockAvailability
+                count
+            }
+        }
+    }
+"""
+
+
+def test_product_facets_attributes(
+    user_api_client, product_list, channel_USD, attribute_value_generator
+):
+    # given
+    attribute = product_list[0].product_type.product_attributes.first()
+    value = attribute.values.first()
+    other_value = attribute_value_generator(attribute=attribute, slug="other-value")
+    associate_attribute_values_to_instance(
+        product_list[2], {attribute.pk: [other_value]}
+    )
+    variables = {
+        "channel": channel_USD.slug,
+        "attributes": [attribute.slug, "non-existing"],
+    }
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["totalCount"] == 3
+    assert data["attributes"] == [
+        {
+            "attribute": {"slug": attribute.slug},
+            "values": [
+                {"value": {"slug": value.slug}, "count": 2},
+                {"value": {"slug": other_value.slug}, "count": 1},
+            ],
+        }
+    ]
+
+
+def test_product_facets_with_filter(
+    user_api_client, product_list, channel_USD, attribute_value_generator
+):
+    # given
+    attribute = product_list[0].product_type.product_attributes.first()
+    other_value = attribute_value_generator(attribute=attribute, slug="other-value")
+    associate_attribute_values_to_instance(
+        product_list[2], {attribute.pk: [other_value]}
+    )
+    variables = {
+        "channel": channel_USD.slug,
+        "filter": {"minimalPrice": {"gte": 15}},
+        "attributes": [attribute.slug],
+    }
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["totalCount"] == 2
+    assert [
+        (facet["value"]["slug"], facet["count"])
+        for facet in data["attributes"][0]["values"]
+    ] == [(attribute.values.first().slug, 1), (other_value.slug, 1)]
+
+
+def test_product_facets_with_where(user_api_client, product_list, channel_USD):
+    # given
+    ids = [
+        graphene.Node.to_global_id("Product", product.pk)
+        for product in product_list[:2]
+    ]
+    variables = {"channel": channel_USD.slug, "where": {"ids": ids}}
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["totalCount"] == 2
+    assert data["attributes"] == []
+
+
+def test_product_facets_price_ranges_and_stock_availability(
+    user_api_client, product_list, channel_USD
+):
+    # given
+    Stock.objects.filter(product_variant__product=product_list[0]).update(quantity=0)
+    variables = {
+        "channel": channel_USD.slug,
+        "priceRanges": [{"lte": 15}, {"gte": 15, "lte": 30}, {"gte": 100}],
+    }
+
+    update_products_stock_availability()
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["priceRanges"] == [
+        {"gte": None, "lte": 15, "count": 1},
+        {"gte": 15, "lte": 30, "count": 2},
+        {"gte": 100, "lte": None, "count": 0},
+    ]
+    assert data["stockAvailability"] == [
+        {"stockAvailability": "IN_STOCK", "count": 2},
+        {"stockAvailability": "OUT_OF_STOCK", "count": 1},
+    ]
+
+
+def test_product_facets_without_channel_as_staff(
+    staff_api_client, product_list, permission_manage_products
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"priceRanges": [{"lte": 15}]}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT_FACETS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productFacets"]
+    assert data["totalCount"] == 3
+    assert data["priceRanges"] == []
+    assert data["stockAvailability"] == []
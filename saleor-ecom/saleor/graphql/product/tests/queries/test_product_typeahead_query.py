@@ -0,0 +1,96 @@
+import graphene
+
+from .....product.models import Product, ProductChannelListing
+from .....product.search import update_products_search_vector
+from ....tests.utils import get_graphql_content
+
+QUERY_PRODUCT_TYPEAHEAD = """
+    query ($search: String!, $first: Int, $channel: String) {
+        productTypeahead(search: $search, first: $first, channel: $channel) {
+            id
+            name
+            channel
+        }
+    }
+"""
+
+
+def _set_product_names(products, names):
+    for product, name in zip(products, names, strict=True):
+        product.name = name
+    Product.objects.bulk_update(products, ["name"])
+    update_products_search_vector([product.id for product in products])
+
+
+def test_product_typeahead(user_api_client, product_list, channel_USD):
+    # given
+    _set_product_names(product_list, ["Blue Sneakers", "Sneaker Socks", "Sandals"])
+    variables = {"search": "sneak", "channel": channel_USD.slug}
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_TYPEAHEAD, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productTypeahead"]
+    assert {product["name"] for product in data} == {"Blue Sneakers", "Sneaker Socks"}
+    assert {product["channel"] for product in data} == {channel_USD.slug}
+
+
+def test_product_typeahead_first(user_api_client, product_list, channel_USD):
+    # given
+    _set_product_names(product_list, ["Blue Sneakers", "Sneaker Socks", "Sandals"])
+    variables = {"search": "s", "first": 2, "channel": channel_USD.slug}
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_TYPEAHEAD, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["productTypeahead"]) == 2
+
+
+def test_product_typeahead_hides_products_not_visible_in_listings(
+    user_api_client, product_list, channel_USD
+):
+    # given
+    _set_product_names(product_list, ["Blue Sneakers", "Sneaker Socks", "Sandals"])
+    ProductChannelListing.objects.filter(
+        product=product_list[0], channel=channel_USD
+    ).update(visible_in_listings=False)
+    variables = {"search": "sneak", "channel": channel_USD.slug}
+
+    # when
+    response = user_api_client.post_graphql(QUERY_PRODUCT_TYPEAHEAD, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productTypeahead"] == [
+        {
+            "id": graphene.Node.to_global_id("Product", product_list[1].pk),
+            "name": "Sneaker Socks",
+            "channel": channel_USD.slug,
+        }
+    ]
+
+
+def test_product_typeahead_as_staff_without_channel(
+    staff_api_client, permission_manage_products, product_list
+):
+    # given
+    _set_product_names(product_list, ["Blue Sneakers", "Sneaker Socks", "Sandals"])
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"search": "sandal"}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT_TYPEAHEAD, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productTypeahead"] == [
+        {
+            "id": graphene.Node.to_global_id("Product", product_list[2].pk),
+            "name": "Sandals",
+            "channel": None,
+        }
+    ]
@@ -25,6 +25,7 @@ from .....product.models import (
 from .....product.search import prepare_product_search_vector_value
 from .....tests.utils import dummy_editorjs
 from .....warehouse.models import Allocation, Reservation, Stock, Warehouse
+from .....warehouse.stock_availability import update_products_stock_availability
 from ....tests.utils import get_graphql_content
 
 QUERY_PRODUCTS_WITH_FILTER = """
@@ -1635,6 +1636,8 @@ def test_products_query_with_filter_stock_availability_as_staff(
     }
     staff_api_client.user.user_permissions.add(permission_manage_products)
 
+    update_products_stock_availability()
+
     # when
     response = staff_api_client.post_graphql(QUERY_PRODUCTS_WITH_FILTER, variables)
     content = get_graphql_content(response)
@@ -1693,6 +1696,8 @@ def test_products_query_with_filter_stock_availability_including_reservations(
     }
     staff_api_client.user.user_permissions.add(permission_manage_products)
 
+    update_products_stock_availability()
+
     # when
     response = staff_api_client.post_graphql(QUERY_PRODUCTS_WITH_FILTER, variables)
 
@@ -1727,6 +1732,8 @@ def test_products_query_with_filter_stock_availability_as_user(
         "channel": channel_USD.slug,
     }
 
+    update_products_stock_availability()
+
     # when
     response = user_api_client.post_graphql(QUERY_PRODUCTS_WITH_FILTER, variables)
     content = get_graphql_content(response)
@@ -1790,6 +1797,8 @@ def test_products_query_with_filter_stock_availability_only_stock_in_cc_warehous
         "channel": channel_USD.slug,
     }
 
+    update_products_stock_availability()
+
     # when
     response = user_api_client.post_graphql(QUERY_PRODUCTS_WITH_FILTER, variables)
 
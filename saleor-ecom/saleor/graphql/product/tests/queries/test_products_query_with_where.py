@@ -13,6 +13,7 @@ from .....attribute.utils import associate_attribute_values_to_instance
 from .....product import ProductTypeKind
 from .....product.models import Product, ProductChannelListing, ProductType
 from .....warehouse.models import Allocation, Reservation, Stock, Warehouse
+from .....warehouse.stock_availability import update_products_stock_availability
 from ....tests.utils import get_graphql_content
 
 PRODUCTS_WHERE_QUERY = """
@@ -1326,6 +1327,8 @@ def test_products_filter_by_stock_availability(
         "where": where,
     }
 
+    update_products_stock_availability()
+
     # when
     response = api_client.post_graphql(PRODUCTS_WHERE_QUERY, variables)
     data = get_graphql_content(response)
@@ -1383,6 +1386,8 @@ def test_products_filter_by_stock_availability_including_reservations(
         "channel": channel_USD.slug,
     }
 
+    update_products_stock_availability()
+
     # when
     response = api_client.post_graphql(PRODUCTS_WHERE_QUERY, variables)
 
@@ -1416,6 +1421,8 @@ def test_products_filter_by_stock_availability_as_user(
         "channel": channel_USD.slug,
     }
 
+    update_products_stock_availability()
+
     # when
     response = user_api_client.post_graphql(PRODUCTS_WHERE_QUERY, variables)
     content = get_graphql_content(response)
@@ -1477,6 +1484,8 @@ def test_products_filter_by_stock_availability_only_stock_in_cc_warehouse(
         "channel": channel_USD.slug,
     }
 
+    update_products_stock_availability()
+
     # when
     response = api_client.post_graphql(PRODUCTS_WHERE_QUERY, variables)
 
@@ -9,6 +9,7 @@ from ....product.models import (
     ProductVariantChannelListing,
 )
 from ....warehouse.models import Stock, Warehouse
+from ....warehouse.stock_availability import update_products_stock_availability
 from ...tests.utils import get_graphql_content
 
 
@@ -369,6 +370,8 @@ def test_category_filter_products_by_stock_availability(
         "filters": {"stockAvailability": stock_availability},
     }
 
+    update_products_stock_availability()
+
     # when
     response = user_api_client.post_graphql(
         GET_FILTERED_PRODUCTS_CATEGORY_QUERY,
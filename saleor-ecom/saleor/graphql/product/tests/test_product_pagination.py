@@ -18,6 +18,7 @@ from ....product.models import (
 )
 from ....tests.utils import dummy_editorjs
 from ....warehouse.models import Stock
+from ....warehouse.stock_availability import update_products_stock_availability
 from ...tests.utils import get_graphql_content
 
 
@@ -447,6 +448,7 @@ def products_for_pagination(
             Stock(warehouse=warehouse, product_variant=variants[2], quantity=0),
         ]
     )
+    update_products_stock_availability()
 
     return products
 
@@ -847,3 +847,31 @@ def test_query_products_sorted_by_collection_when_items_when_null_as_sorting(
         str(-1),
         str(mid_collection_prod.product.pk),
     ]
+
+
+@pytest.mark.parametrize(
+    ("direction", "expected_in_stock"), [("ASC", False), ("DESC", True)]
+)
+def test_sort_products_by_stock_availability(
+    direction, expected_in_stock, api_client, channel_USD, product_list
+):
+    # given
+    in_stock_product = product_list[1]
+    ProductChannelListing.objects.filter(
+        channel_id=channel_USD.id, product=in_stock_product
+    ).update(is_in_stock=True)
+    variables = {
+        "sortBy": {"direction": direction, "field": "STOCK_AVAILABILITY"},
+        "channel": channel_USD.slug,
+        "first": 10,
+    }
+
+    # when
+    response = api_client.post_graphql(QUERY_PAGINATED_SORTED_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    slugs = [edge["node"]["slug"] for edge in content["data"]["products"]["edges"]]
+    assert len(slugs) == len(product_list)
+    assert (slugs[0] == in_stock_product.slug) is expected_in_stock
+    assert (slugs[-1] == in_stock_product.slug) is not expected_in_stock
@@ -0,0 +1,103 @@
+import graphene
+
+from ...attribute.types import Attribute, AttributeValue
+from ...core.descriptions import ADDED_IN_321
+from ...core.doc_category import DOC_CATEGORY_PRODUCTS
+from ...core.types import BaseObjectType, NonNullList
+from ..enums import StockAvailability
+
+
+class AttributeValueFacet(BaseObjectType):
+    value = graphene.Field(
+        AttributeValue, required=True, description="The attribute value."
+    )
+    count = graphene.Int(
+        required=True, description="Number of the matching products with the value."
+    )
+
+    class Meta:
+        description = (
+            "Number of the matching products with the attribute value." + ADDED_IN_321
+        )
+        doc_category = DOC_CATEGORY_PRODUCTS
+
+
+class AttributeFacet(BaseObjectType):
+    attribute = graphene.Field(
+        Attribute, required=True, description="The counted attribute."
+    )
+    values = NonNullList(
+        AttributeValueFacet,
+        required=True,
+        description="Values assigned to any of the matching products.",
+    )
+
+    class Meta:
+        description = (
+            "Numbers of the matching products by the attribute values." + ADDED_IN_321
+        )
+        doc_category = DOC_CATEGORY_PRODUCTS
+
+
+class PriceRangeFacet(BaseObjectType):
+    gte = graphene.Float(description="Price greater than or equal to.")
+    lte = graphene.Float(description="Price less than or equal to.")
+    count = graphene.Int(
+        required=True,
+        description="Number of the matching products with the price in the range.",
+    )
+
+    class Meta:
+        description = (
+            "Number of the matching products with the minimal variant price in the "
+            "range." + ADDED_IN_321
+        )
+        doc_category = DOC_CATEGORY_PRODUCTS
+
+
+class StockAvailabilityFacet(BaseObjectType):
+    stock_availability = StockAvailability(
+        required=True, description="The stock availability."
+    )
+    count = graphene.Int(
+        required=True,
+        description="Number of the matching products with the stock availability.",
+    )
+
+    class Meta:
+        description = (
+            "Number of the matching products with the stock availability."
+            + ADDED_IN_321
+        )
+        doc_category = DOC_CATEGORY_PRODUCTS
+
+
+class ProductFacets(BaseObjectType):
+    total_count = graphene.Int(
+        required=True, description="Number of the matching products."
+    )
+    attributes = NonNullList(
+        AttributeFacet,
+        required=True,
+        description="Counts of the requested attributes, in the requested order.",
+    )
+    price_ranges = NonNullList(
+        PriceRangeFacet,
+        required=True,
+        description=(
+            "Counts of the requested price ranges, in the requested order. "
+            "Empty when the channel is not known."
+        ),
+    )
+    stock_availability = NonNullList(
+        StockAvailabilityFacet,
+        required=True,
+        description=(
+            "Counts of the products in and out of stock. "
+            "Empty when the channel is not known."
+        ),
+    )
+
+    class Meta:
+        description = "Facet counts of the filtered product list." + ADDED_IN_321
+        doc_category = DOC_CATEGORY_PRODUCTS
@@ -13,6 +13,7 @@ from ...core.tracing import traced_atomic_transaction
 from ...order import OrderStatus
 from ...order import models as order_models
 from ...warehouse.models import Stock
+from ...warehouse.stock_availability import schedule_products_stock_availability_update
 from ..core.enums import ProductErrorCode
 from .sorters import ProductOrderField
 
@@ -95,6 +96,7 @@ def create_stocks(
     except IntegrityError as e:
         msg = "Stock for one of warehouses already exists for this product variant."
         raise ValidationError(msg) from e
+    schedule_products_stock_availability_update([variant.pk])
     return new_stocks
 
 
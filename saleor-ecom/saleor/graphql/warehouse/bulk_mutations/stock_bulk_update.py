@@ -2,13 +2,16 @@ from collections import defaultdict
 
 import graphene
 from django.core.exceptions import ValidationError
-from django.db.models import F, Q
+from django.db.models import F
 
+from ....core.db.expressions import RowValue
+from ....core.db.update import bulk_update_from_values
 from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ProductPermissions
 from ....warehouse import models
 from ....warehouse.error_codes import StockBulkUpdateErrorCode
 from ....warehouse.management import stock_qs_select_for_update
+from ....warehouse.stock_availability import schedule_products_stock_availability_update
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...core.doc_category import DOC_CATEGORY_PRODUCTS
@@ -25,6 +28,8 @@ from ...core.validators import validate_one_of_args_is_in_mutation
 from ...plugins.dataloaders import get_plugin_manager_promise
 from ..types import Stock
 
+STOCK_UPDATE_BATCH_SIZE = 1000
+
 
 class StockBulkResult(BaseObjectType):
     stock = graphene.Field(Stock, required=False, description="Stock data.")
@@ -283,8 +288,8 @@ class StockBulkUpdate(BaseMutation):
     def _get_stock(
         cls, warehouse_selector, variant_selector, warehouse_value, variant_value
     ):
-        return (
-            lambda stock: str(getattr(stock, warehouse_selector)) == warehouse_value
+        return lambda stock: (
+            str(getattr(stock, warehouse_selector)) == warehouse_value
             and str(getattr(stock, variant_selector)) == variant_value
         )
 
@@ -336,38 +341,25 @@ class StockBulkUpdate(BaseMutation):
     def get_stocks(
         cls, cleaned_inputs_map: dict, warehouse_selector: str, variant_selector: str
     ) -> dict[str, models.Stock]:
-        warehouses = (
-            stock_input[warehouse_selector]
-            for stock_input in cleaned_inputs_map.values()
-            if stock_input
-        )
-
-        variants = (
-            stock_input[variant_selector]
+        # Stocks are looked up by the pairs of selectors, which unlike separate
+        # lookups by variants and by warehouses doesn't fetch the stocks of all
+        # the listed variants in all the listed warehouses.
+        keys = {
+            (stock_input[variant_selector], stock_input[warehouse_selector])
             for stock_input in cleaned_inputs_map.values()
             if stock_input
-        )
-
-        if not warehouses or not variants:
+        }
+        if not keys:
             return {}
 
-        if warehouse_selector == "warehouse_id":
-            warehouse_lookup = Q(warehouse_id__in=warehouses)
-        else:
-            warehouse_lookup = Q(warehouse__external_reference__in=warehouses)
-
-        if variant_selector == "product_variant_id":
-            variant_lookup = Q(product_variant_id__in=variants)
-        else:
-            variant_lookup = Q(product_variant__external_reference__in=variants)
-
         stocks = (
             stock_qs_select_for_update()
-            .filter(warehouse_lookup & variant_lookup)
             .annotate(
                 variant_external_reference=F("product_variant__external_reference"),
                 warehouse_external_reference=F("warehouse__external_reference"),
             )
+            .alias(key=RowValue(F(variant_selector), F(warehouse_selector)))
+            .filter(key__in=keys)
         )
 
         selectors_stock_map = {
@@ -385,7 +377,12 @@ class StockBulkUpdate(BaseMutation):
         ]
 
         # Stocks are locked in `get_stocks`
-        models.Stock.objects.bulk_update(stocks_to_update, fields=["quantity"])
+        bulk_update_from_values(
+            stocks_to_update, ["quantity"], batch_size=STOCK_UPDATE_BATCH_SIZE
+        )
+        schedule_products_stock_availability_update(
+            stock.product_variant_id for stock in stocks_to_update
+        )
 
         return stocks_to_update
 
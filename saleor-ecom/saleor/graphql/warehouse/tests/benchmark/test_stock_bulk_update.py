@@ -72,7 +72,7 @@ def test_stocks_bulk_update_queries_count(
 
     staff_api_client.ensure_access_token()
     # test number of queries when single object is updated
-    with django_assert_num_queries(11):
+    with django_assert_num_queries(16):
         staff_api_client.user.user_permissions.add(permission_manage_products)
         response = staff_api_client.post_graphql(
             STOCKS_BULK_UPDATE_MUTATION, {"stocks": stocks_input}
@@ -108,7 +108,7 @@ def test_stocks_bulk_update_queries_count(
     ]
 
     # Test number of queries when multiple objects are updated
-    with django_assert_num_queries(11):
+    with django_assert_num_queries(16):
         staff_api_client.user.user_permissions.add(permission_manage_products)
         response = staff_api_client.post_graphql(
             STOCKS_BULK_UPDATE_MUTATION, {"stocks": stocks_input}
@@ -78,6 +78,7 @@ from .utils import (
     restock_fulfillment_lines,
     update_order_authorize_data,
     update_order_charge_data,
+    update_order_payment_status,
     update_order_status,
     updates_amounts_for_order,
 )
@@ -160,6 +161,11 @@ ORDER_WEBHOOK_EVENT_MAP = {
     WebhookEventAsyncType.DRAFT_ORDER_UPDATED: PluginsManager.draft_order_updated.__name__,
 }
 
+ORDERS_WEBHOOK_EVENT_MAP = {
+    WebhookEventAsyncType.ORDER_UPDATED: PluginsManager.orders_updated.__name__,
+    WebhookEventAsyncType.ORDER_EXPIRED: PluginsManager.orders_expired.__name__,
+}
+
 
 def _trigger_order_sync_webhooks(
     manager: "PluginsManager",
@@ -235,6 +241,57 @@ def call_order_events(
         call_event_including_protected_events(event_func, order, webhooks=webhooks)
 
 
+def call_orders_events(
+    manager: "PluginsManager",
+    event_names: list[str],
+    orders: list["Order"],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+    webhook_event_map: dict[str, set["Webhook"]] | None = None,
+):
+    """Call the events for many orders, with the webhook deliveries created in bulk.
+
+    The plugin events are called once per channel of the orders.
+    """
+    missing_events = set(event_names).difference(ORDERS_WEBHOOK_EVENT_MAP.keys())
+    if missing_events:
+        raise ValueError(
+            f"Events {missing_events} not found in ORDERS_WEBHOOK_EVENT_MAP."
+        )
+
+    if webhook_event_map is None:
+        webhook_event_map = get_webhooks_for_multiple_events(
+            [*event_names, *WebhookEventSyncType.ORDER_EVENTS]
+        )
+
+    any_event_requires_sync_webhooks = any(
+        webhook_async_event_requires_sync_webhooks_to_trigger(
+            event_name,
+            webhook_event_map,
+            possible_sync_events=WebhookEventSyncType.ORDER_EVENTS,
+        )
+        for event_name in event_names
+    )
+    orders_per_channel: dict[str, list[Order]] = defaultdict(list)
+    for order in orders:
+        if any_event_requires_sync_webhooks and order.status in ORDER_EDITABLE_STATUS:
+            _trigger_order_sync_webhooks(
+                manager,
+                order,
+                database_connection_name=database_connection_name,
+                webhook_event_map=webhook_event_map,
+            )
+        orders_per_channel[order.channel.slug].append(order)
+
+    for event_name in event_names:
+        plugin_manager_method_name = ORDERS_WEBHOOK_EVENT_MAP[event_name]
+        webhooks = webhook_event_map.get(event_name, set())
+        event_func = getattr(manager, plugin_manager_method_name)
+        for channel_slug, channel_orders in orders_per_channel.items():
+            call_event_including_protected_events(
+                event_func, channel_orders, channel_slug, webhooks=webhooks
+            )
+
+
 def call_order_event(
     manager: "PluginsManager",
     event_name: str,
@@ -1571,6 +1628,7 @@ def create_refund_fulfillment(
             total_refund_amount=total_refund_amount,
             shipping_refund_amount=shipping_refund_amount,
         )
+        update_order_payment_status(order)
         created_fulfillment_lines = _move_order_lines_to_target_fulfillment(
             order_lines_to_move=order_lines_to_refund,
             target_fulfillment=refunded_fulfillment,
@@ -1680,6 +1738,8 @@ def create_replace_order(
 
         lines_to_create = list(order_line_to_create.values())
         OrderLine.objects.bulk_create(lines_to_create)
+        replace_order.lines_count = len(lines_to_create)
+        replace_order.save(update_fields=["lines_count", "updated_at"])
 
         draft_order_created_from_replace_event(
             draft_order=replace_order,
@@ -1706,6 +1766,8 @@ def _move_lines_to_return_fulfillment(
         total_refund_amount=total_refund_amount,
         shipping_refund_amount=shipping_refund_amount,
     )
+    if total_refund_amount is not None:
+        update_order_payment_status(order)
     lines_in_target_fulfillment = _move_order_lines_to_target_fulfillment(
         order_lines_to_move=order_lines,
         target_fulfillment=target_fulfillment,
@@ -5,10 +5,12 @@ from uuid import UUID
 
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
 from django.utils import timezone
 from prices import Money, TaxedMoney
 
 from ..core.db.connection import allow_writer
+from ..core.db.update import bulk_update_from_values
 from ..core.prices import quantize_price
 from ..core.taxes import (
     TaxData,
@@ -43,6 +45,7 @@ from ..tax.utils import (
 from . import ORDER_EDITABLE_STATUS, OrderStatus
 from .base_calculations import base_order_line_total, calculate_prices
 from .fetch import (
+    DRAFT_ORDER_LINES_PREFETCH,
     EditableOrderLineInfo,
     fetch_draft_order_lines_info,
     reattach_apply_once_per_order_voucher_info,
@@ -58,6 +61,39 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+ORDER_PRICE_FIELDS = [
+    "subtotal_net_amount",
+    "subtotal_gross_amount",
+    "total_net_amount",
+    "total_gross_amount",
+    "undiscounted_total_net_amount",
+    "undiscounted_total_gross_amount",
+    "shipping_price_net_amount",
+    "shipping_price_gross_amount",
+    "base_shipping_price_amount",
+    "shipping_tax_rate",
+    "should_refresh_prices",
+    "tax_error",
+]
+
+ORDER_LINE_PRICE_FIELDS = [
+    "unit_price_net_amount",
+    "unit_price_gross_amount",
+    "undiscounted_unit_price_net_amount",
+    "undiscounted_unit_price_gross_amount",
+    "total_price_net_amount",
+    "total_price_gross_amount",
+    "undiscounted_total_price_net_amount",
+    "undiscounted_total_price_gross_amount",
+    "tax_rate",
+    "unit_discount_amount",
+    "unit_discount_reason",
+    "unit_discount_type",
+    "unit_discount_value",
+    "base_unit_price_amount",
+]
+
+
 def fetch_order_prices_if_expired(
     order: Order,
     manager: PluginsManager,
@@ -73,16 +109,123 @@ def fetch_order_prices_if_expired(
     Prices will be updated if force_update is True
     or if order.should_refresh_prices is True.
     """
-    if order.status not in ORDER_EDITABLE_STATUS:
+    recalculated_lines = _recalculate_order_prices(
+        order,
+        manager,
+        lines,
+        force_update=force_update,
+        database_connection_name=database_connection_name,
+        allow_sync_webhooks=allow_sync_webhooks,
+    )
+    if recalculated_lines is None:
         return order, lines
 
+    with transaction.atomic(savepoint=False):
+        with allow_writer():
+            order.save(update_fields=ORDER_PRICE_FIELDS)
+            order.lines.bulk_update(recalculated_lines, ORDER_LINE_PRICE_FIELDS)
+
+        return order, recalculated_lines
+
+
+def fetch_orders_prices_if_expired(
+    orders: list[Order],
+    manager: PluginsManager,
+    force_update: bool = False,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+    allow_sync_webhooks: bool = True,
+    skip_changed_orders: bool = False,
+) -> list[Order]:
+    """Fetch prices with taxes of many orders at once.
+
+    Work as `fetch_order_prices_if_expired`, but the lines, addresses, vouchers
+    and tax configurations of all orders are loaded with a few queries and the
+    new prices are saved with a single update of orders and order lines.
+    The update overwrites the prices and `should_refresh_prices` without checking
+    their current values, so the orders should be locked by the caller. With
+    `skip_changed_orders`, the orders are locked only for the update instead,
+    and the ones which `updated_at` changed since they were fetched are not saved.
+    Return the orders which prices were saved.
+    """
+    prefetch_related_objects(
+        orders,
+        "channel__tax_configuration__country_exceptions",
+        "shipping_address",
+        "billing_address",
+        "voucher",
+        Prefetch(
+            "lines",
+            queryset=OrderLine.objects.using(database_connection_name)
+            .order_by("pk")
+            .prefetch_related(*DRAFT_ORDER_LINES_PREFETCH, "tax_class__country_rates"),
+        ),
+    )
+
+    recalculated_orders = []
+    recalculated_lines: list[OrderLine] = []
+    for order in orders:
+        lines = _recalculate_order_prices(
+            order,
+            manager,
+            list(order.lines.all()),
+            force_update=force_update,
+            database_connection_name=database_connection_name,
+            allow_sync_webhooks=allow_sync_webhooks,
+        )
+        if lines is not None:
+            recalculated_orders.append(order)
+            recalculated_lines.extend(lines)
+
+    with transaction.atomic(savepoint=False):
+        with allow_writer():
+            if skip_changed_orders:
+                recalculated_orders = _lock_unchanged_orders(recalculated_orders)
+                order_ids = {order.pk for order in recalculated_orders}
+                recalculated_lines = [
+                    line for line in recalculated_lines if line.order_id in order_ids
+                ]
+            bulk_update_from_values(recalculated_orders, ORDER_PRICE_FIELDS)
+            bulk_update_from_values(recalculated_lines, ORDER_LINE_PRICE_FIELDS)
+    return recalculated_orders
+
+
+def _lock_unchanged_orders(orders: list[Order]) -> list[Order]:
+    """Lock the orders and return the ones not changed since they were fetched."""
+    if not orders:
+        return []
+    updated_at_by_id = dict(
+        Order.objects.filter(pk__in=[order.pk for order in orders])
+        .select_for_update(of=("self",))
+        .order_by("pk")
+        .values_list("pk", "updated_at")
+    )
+    return [
+        order for order in orders if updated_at_by_id.get(order.pk) == order.updated_at
+    ]
+
+
+def _recalculate_order_prices(
+    order: Order,
+    manager: PluginsManager,
+    lines: Iterable[OrderLine] | None,
+    force_update: bool,
+    database_connection_name: str,
+    allow_sync_webhooks: bool,
+) -> list[OrderLine] | None:
+    """Recalculate the order prices without saving them.
+
+    Return the recalculated lines, or `None` when the prices are up to date.
+    """
+    if order.status not in ORDER_EDITABLE_STATUS:
+        return None
+
     expired_line_ids = get_expired_line_ids(order, lines)
     if not force_update and not order.should_refresh_prices and not expired_line_ids:
-        return order, lines
+        return None
 
     tax_strategy = get_tax_calculation_strategy_for_order(order)
     if tax_strategy == TaxCalculationStrategy.TAX_APP and not allow_sync_webhooks:
-        return order, lines
+        return None
 
     if expired_line_ids:
         # handle line base price expiration
@@ -99,61 +242,23 @@ def fetch_order_prices_if_expired(
     # update `OrderLine.unit_discount_...` fields
     update_unit_discount_data_on_order_line(lines_info)
 
-    lines = [line_info.line for line_info in lines_info]
+    recalculated_lines = [line_info.line for line_info in lines_info]
     calculate_prices(
         order,
-        lines,
+        recalculated_lines,
         database_connection_name=database_connection_name,
     )
 
     calculate_taxes(
         order,
         manager,
-        lines,
+        recalculated_lines,
         tax_calculation_strategy=tax_strategy,
         database_connection_name=database_connection_name,
     )
 
     order.should_refresh_prices = False
-    with transaction.atomic(savepoint=False):
-        with allow_writer():
-            order.save(
-                update_fields=[
-                    "subtotal_net_amount",
-                    "subtotal_gross_amount",
-                    "total_net_amount",
-                    "total_gross_amount",
-                    "undiscounted_total_net_amount",
-                    "undiscounted_total_gross_amount",
-                    "shipping_price_net_amount",
-                    "shipping_price_gross_amount",
-                    "base_shipping_price_amount",
-                    "shipping_tax_rate",
-                    "should_refresh_prices",
-                    "tax_error",
-                ]
-            )
-            order.lines.bulk_update(
-                lines,
-                [
-                    "unit_price_net_amount",
-                    "unit_price_gross_amount",
-                    "undiscounted_unit_price_net_amount",
-                    "undiscounted_unit_price_gross_amount",
-                    "total_price_net_amount",
-                    "total_price_gross_amount",
-                    "undiscounted_total_price_net_amount",
-                    "undiscounted_total_price_gross_amount",
-                    "tax_rate",
-                    "unit_discount_amount",
-                    "unit_discount_reason",
-                    "unit_discount_type",
-                    "unit_discount_value",
-                    "base_unit_price_amount",
-                ],
-            )
-
-        return order, lines
+    return recalculated_lines
 
 
 def get_expired_line_ids(order: Order, lines: Iterable[OrderLine] | None) -> list[UUID]:
@@ -115,6 +115,13 @@ class EditableOrderLineInfo(LineInfo):
         return None
 
 
+DRAFT_ORDER_LINES_PREFETCH = [
+    "discounts__promotion_rule__promotion",
+    "variant__product__collections",
+    "variant__product__product_type",
+]
+
+
 def fetch_draft_order_lines_info(
     order: "Order",
     lines: Iterable["OrderLine"] | None = None,
@@ -125,11 +132,7 @@ def fetch_draft_order_lines_info(
     `fetch_actual_prices` argument determines if the function should additionally
     retrieve the latest variant channel listing prices
     """
-    prefetch_related_fields = [
-        "discounts__promotion_rule__promotion",
-        "variant__product__collections",
-        "variant__product__product_type",
-    ]
+    prefetch_related_fields = list(DRAFT_ORDER_LINES_PREFETCH)
     if fetch_actual_prices:
         prefetch_related_fields.extend(
             [
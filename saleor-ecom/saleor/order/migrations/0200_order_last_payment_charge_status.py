@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-19 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("order", "0199_set_draft_base_price_expire_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="last_payment_charge_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("not-charged", "Not charged"),
+                    ("pending", "Pending"),
+                    ("partially-charged", "Partially charged"),
+                    ("fully-charged", "Fully charged"),
+                    ("partially-refunded", "Partially refunded"),
+                    ("fully-refunded", "Fully refunded"),
+                    ("refused", "Refused"),
+                    ("cancelled", "Cancelled"),
+                ],
+                max_length=20,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-19 14:05
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("order", "0200_order_last_payment_charge_status"),
+    ]
+
+    atomic = False
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["created_at", "status", "id"],
+                name="order_created_status_id_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["updated_at", "status", "id"],
+                name="order_updated_status_id_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["status", "user_email", "id"],
+                name="order_status_email_id_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["last_payment_charge_status", "status", "id"],
+                name="order_payment_status_id_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-19 14:05
+
+from django.apps import apps as registry
+from django.db import migrations
+from django.db.models.signals import post_migrate
+
+from .tasks.saleor3_21 import set_last_payment_charge_status_task
+
+
+def set_last_payment_charge_status(apps, _schema_editor):
+    def on_migrations_complete(sender=None, **kwargs):
+        set_last_payment_charge_status_task.delay()
+
+    sender = registry.get_app_config("order")
+    post_migrate.connect(on_migrations_complete, weak=False, sender=sender)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("order", "0201_order_list_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            set_last_payment_charge_status,
+            reverse_code=migrations.RunPython.noop,
+        )
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-19 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("order", "0202_set_last_payment_charge_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="payment_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("not-charged", "Not charged"),
+                    ("pending", "Pending"),
+                    ("partially-charged", "Partially charged"),
+                    ("fully-charged", "Fully charged"),
+                    ("partially-refunded", "Partially refunded"),
+                    ("fully-refunded", "Fully refunded"),
+                    ("refused", "Refused"),
+                    ("cancelled", "Cancelled"),
+                ],
+                max_length=20,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="lines_count",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-19 15:40
+
+from django.apps import apps as registry
+from django.db import migrations
+from django.db.models.signals import post_migrate
+
+from .tasks.saleor3_21 import set_order_lines_count_task, set_order_payment_status_task
+
+
+def set_order_payment_status_and_lines_count(apps, _schema_editor):
+    def on_migrations_complete(sender=None, **kwargs):
+        set_order_lines_count_task.delay()
+        set_order_payment_status_task.delay()
+
+    sender = registry.get_app_config("order")
+    post_migrate.connect(on_migrations_complete, weak=False, sender=sender)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("order", "0203_order_payment_status_lines_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            set_order_payment_status_and_lines_count,
+            reverse_code=migrations.RunPython.noop,
+        )
+    ]
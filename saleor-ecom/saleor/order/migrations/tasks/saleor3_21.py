@@ -1,12 +1,17 @@
 from datetime import timedelta
+from decimal import Decimal
 
 from django.db import transaction
-from django.db.models import Exists, OuterRef
+from django.db.models import Count, Exists, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ....celeryconf import app
 from ....core.db.connection import allow_writer
-from ...models import Order, OrderLine
+from ....payment.model_helpers import get_last_payment
+from ....payment.models import Payment, TransactionItem
+from ...models import Fulfillment, Order, OrderGrantedRefund, OrderLine
+from ...utils import get_order_payment_status
 
 # The batch of size 250 takes ~0.2 second and consumes ~20MB memory at peak
 BATCH_SIZE = 250
@@ -32,3 +37,95 @@ def set_base_price_expire_time_task():
             order_lines.update(draft_base_price_expire_at=expire_time)
 
         set_base_price_expire_time_task.delay()
+
+
+@app.task
+@allow_writer()
+def set_last_payment_charge_status_task():
+    payments = Payment.objects.filter(order_id=OuterRef("pk"))
+    qs = (
+        Order.objects.filter(last_payment_charge_status__isnull=True)
+        .filter(Exists(payments))
+        .order_by("pk")
+    )
+    order_ids = list(qs.values_list("pk", flat=True)[:BATCH_SIZE])
+    if order_ids:
+        orders = Order.objects.filter(pk__in=order_ids).order_by("pk")
+        with transaction.atomic():
+            _orders_lock = list(orders.select_for_update(of=(["self"])))
+            orders.update(
+                last_payment_charge_status=Subquery(
+                    payments.order_by("-pk").values("charge_status")[:1]
+                )
+            )
+
+        set_last_payment_charge_status_task.delay()
+
+
+@app.task
+@allow_writer()
+def set_order_lines_count_task():
+    qs = Order.objects.filter(lines_count__isnull=True).order_by("pk")
+    order_ids = list(qs.values_list("pk", flat=True)[:BATCH_SIZE])
+    if order_ids:
+        orders = Order.objects.filter(pk__in=order_ids).order_by("pk")
+        lines_count = (
+            OrderLine.objects.filter(order_id=OuterRef("pk"))
+            .values("order_id")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        with transaction.atomic():
+            _orders_lock = list(orders.select_for_update(of=(["self"])))
+            orders.update(lines_count=Coalesce(Subquery(lines_count), 0))
+
+        set_order_lines_count_task.delay()
+
+
+@app.task
+@allow_writer()
+def set_order_payment_status_task():
+    qs = Order.objects.filter(payment_status__isnull=True).order_by("pk")
+    order_ids = list(qs.values_list("pk", flat=True)[:BATCH_SIZE])
+    if order_ids:
+        granted_refund_amount = (
+            OrderGrantedRefund.objects.filter(order_id=OuterRef("pk"))
+            .values("order_id")
+            .annotate(total=Sum("amount_value"))
+            .values("total")
+        )
+        fulfillment_refund_amount = (
+            Fulfillment.objects.filter(order_id=OuterRef("pk"))
+            .values("order_id")
+            .annotate(total=Sum("total_refund_amount"))
+            .values("total")
+        )
+        with transaction.atomic():
+            orders = list(
+                Order.objects.filter(pk__in=order_ids)
+                .order_by("pk")
+                .select_for_update(of=(["self"]))
+                .annotate(
+                    has_transactions=Exists(
+                        TransactionItem.objects.filter(order_id=OuterRef("pk"))
+                    ),
+                    granted_refund_amount=Coalesce(
+                        Subquery(granted_refund_amount), Decimal(0)
+                    ),
+                    fulfillment_refund_amount=Coalesce(
+                        Subquery(fulfillment_refund_amount), Decimal(0)
+                    ),
+                )
+                .prefetch_related("payments")
+            )
+            for order in orders:
+                order.payment_status = get_order_payment_status(
+                    order,
+                    last_payment=get_last_payment(order.payments.all()),
+                    has_transactions=order.has_transactions,
+                    granted_refund_amount=order.granted_refund_amount,
+                    fulfillment_refund_amount=order.fulfillment_refund_amount,
+                )
+            Order.objects.bulk_update(orders, ["payment_status"])
+
+        set_order_payment_status_task.delay()
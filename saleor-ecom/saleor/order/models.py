@@ -128,6 +128,17 @@ class Order(ModelWithMetadata, ModelWithExternalReference):
         choices=OrderChargeStatus.CHOICES,
         db_index=True,
     )
+    # The charge status of the most recent payment, stored on the order so that
+    # the order list can be sorted by it without a subquery for every row.
+    last_payment_charge_status = models.CharField(
+        max_length=20, choices=ChargeStatus.CHOICES, blank=True, null=True
+    )
+    # The payment status and the number of lines exposed by the order list,
+    # stored on the order so that the list resolves them from the order row.
+    payment_status = models.CharField(
+        max_length=20, choices=ChargeStatus.CHOICES, blank=True, null=True
+    )
+    lines_count = models.PositiveIntegerField(blank=True, null=True)
     user = models.ForeignKey(
         "account.User",
         blank=True,
@@ -390,6 +401,23 @@ class Order(ModelWithMetadata, ModelWithExternalReference):
                 name="order_user_email_user_id_idx",
             ),
             BTreeIndex(fields=["checkout_token"], name="checkout_token_btree_idx"),
+            # The indexes below match the sort options of the order list.
+            BTreeIndex(
+                fields=["created_at", "status", "id"],
+                name="order_created_status_id_idx",
+            ),
+            BTreeIndex(
+                fields=["updated_at", "status", "id"],
+                name="order_updated_status_id_idx",
+            ),
+            BTreeIndex(
+                fields=["status", "user_email", "id"],
+                name="order_status_email_id_idx",
+            ),
+            BTreeIndex(
+                fields=["last_payment_charge_status", "status", "id"],
+                name="order_payment_status_id_idx",
+            ),
         ]
 
     def is_fully_paid(self):
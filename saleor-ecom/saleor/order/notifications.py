@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlencode
 
 from django.conf import settings
+from django.db.models import Prefetch, prefetch_related_objects
 from django.forms import model_to_dict
 
 from ..account.models import StaffNotificationRecipient
@@ -31,6 +32,15 @@ from .models import FulfillmentLine, Order, OrderLine
 if TYPE_CHECKING:
     from ..account.models import User  # noqa: F401
     from ..app.models import App
+    from .models import OrderDiscount
+
+ORDER_LINE_PAYLOAD_PREFETCH = [
+    "variant__media",
+    "variant__product__media",
+    "variant__product__product_type",
+    "variant__digital_content",
+    "digital_content_url",
+]
 
 
 @dataclass
@@ -183,8 +193,10 @@ def get_product_variant_payload(variant: ProductVariant):
 def get_order_line_payload(line: "OrderLine", attribute_data: AttributeData):
     digital_url: str | None = None
     if line.is_digital:
-        content = DigitalContentUrl.objects.filter(line=line).first()
-        digital_url = content.get_absolute_url() if content else None
+        try:
+            digital_url = line.digital_content_url.get_absolute_url()
+        except DigitalContentUrl.DoesNotExist:
+            pass
     variant_dependent_fields = {}
     if line.variant:
         variant_dependent_fields = {
@@ -259,8 +271,11 @@ def get_address_payload(address):
     return address
 
 
-def get_discounts_payload(order):
-    order_discounts = order.discounts.all()
+def get_discounts_payload(
+    order, order_discounts: Iterable["OrderDiscount"] | None = None
+):
+    if order_discounts is None:
+        order_discounts = order.discounts.all()
     voucher_discount = None
     all_discounts = []
     discount_amount = 0
@@ -309,12 +324,59 @@ ORDER_PRICE_FIELDS = [
 
 
 def get_custom_order_payload(order: Order):
-    payload = {
-        "order": get_default_order_payload(order),
-        "recipient_email": order.get_customer_email(),
-        **get_site_context(),
-    }
-    return payload
+    return get_custom_orders_payload([order])[0]
+
+
+def get_custom_orders_payload(orders: Iterable[Order]):
+    site_context = get_site_context()
+    orders = list(orders)
+    return [
+        {
+            "order": order_payload,
+            "recipient_email": order.get_customer_email(),
+            **site_context,
+        }
+        for order, order_payload in zip(
+            orders, get_default_orders_payload(orders), strict=True
+        )
+    ]
+
+
+def get_default_orders_payload(orders: Iterable["Order"], redirect_url: str = ""):
+    """Return the default notification payloads of the orders.
+
+    The related objects of all the orders are fetched at once, so the number of
+    queries doesn't grow with the number of the orders and their lines.
+    """
+    orders = list(orders)
+    # The lines and discounts are stored in separate attributes, to not leave stale
+    # results in the cache of the related managers of the given orders.
+    prefetch_related_objects(
+        orders,
+        "channel",
+        "user",
+        "billing_address",
+        "shipping_address",
+        Prefetch(
+            "lines",
+            queryset=OrderLine.objects.prefetch_related(*ORDER_LINE_PAYLOAD_PREFETCH),
+            to_attr="payload_lines",
+        ),
+        Prefetch("discounts", to_attr="payload_discounts"),
+    )
+    attribute_data = get_attribute_data_from_order_lines(
+        [line for order in orders for line in order.payload_lines]  # type: ignore[attr-defined]
+    )
+    return [
+        get_default_order_payload(
+            order,
+            redirect_url,
+            lines=order.payload_lines,  # type: ignore[attr-defined]
+            attribute_data=attribute_data,
+            discounts=order.payload_discounts,  # type: ignore[attr-defined]
+        )
+        for order in orders
+    ]
 
 
 def get_default_order_payload(
@@ -322,7 +384,11 @@ def get_default_order_payload(
     redirect_url: str = "",
     lines: Iterable["OrderLine"] | None = None,
     attribute_data: AttributeData | None = None,
+    discounts: Iterable["OrderDiscount"] | None = None,
 ):
+    if lines is None and attribute_data is None:
+        return get_default_orders_payload([order], redirect_url)[0]
+
     order_details_url = ""
     if redirect_url:
         order_details_url = prepare_order_details_url(order, redirect_url)
@@ -330,11 +396,7 @@ def get_default_order_payload(
     tax = order.total_gross_amount - order.total_net_amount or Decimal(0)
 
     if lines is None:
-        lines = order.lines.prefetch_related(
-            "variant__media",
-            "variant__product__media",
-            "variant__product__product_type",
-        ).all()
+        lines = order.lines.prefetch_related(*ORDER_LINE_PAYLOAD_PREFETCH).all()
     if attribute_data is None:
         attribute_data = get_attribute_data_from_order_lines(lines)
 
@@ -360,7 +422,7 @@ def get_default_order_payload(
             "shipping_address": get_address_payload(order.shipping_address),
             "shipping_method_name": order.shipping_method_name,
             "collection_point_name": order.collection_point_name,
-            **get_discounts_payload(order),
+            **get_discounts_payload(order, discounts),
         }
     )
     # Deprecated: override private_metadata with empty dict as it shouldn't be returned
@@ -381,9 +443,7 @@ def get_default_fulfillment_line_payload(
 
 def get_default_fulfillment_payload(order, fulfillment):
     lines = fulfillment.lines.prefetch_related(
-        "order_line__variant__media",
-        "order_line__variant__product__media",
-        "order_line__variant__product__product_type",
+        *[f"order_line__{lookup}" for lookup in ORDER_LINE_PAYLOAD_PREFETCH]
     ).all()
     attribute_data = get_attribute_data_from_order_lines(
         [line.order_line for line in lines]
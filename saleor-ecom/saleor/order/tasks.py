@@ -1,5 +1,6 @@
 import datetime
 import logging
+import time
 
 from django.conf import settings
 from django.db.models import Exists, F, Func, OuterRef, Subquery, Value
@@ -16,8 +17,9 @@ from ..plugins.manager import get_plugins_manager
 from ..warehouse.management import deallocate_stock_for_orders
 from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..webhook.utils import get_webhooks_for_multiple_events
-from . import OrderEvents, OrderStatus
-from .actions import call_order_event, call_order_events
+from . import ORDER_EDITABLE_STATUS, OrderEvents, OrderStatus
+from .actions import call_order_event, call_orders_events
+from .calculations import fetch_orders_prices_if_expired
 from .models import Order, OrderEvent
 from .utils import invalidate_order_prices
 
@@ -26,6 +28,9 @@ logger = logging.getLogger(__name__)
 # Batch size of 100 is about ~1MB of memory usage in task
 EXPIRE_ORDER_BATCH_SIZE = 100
 
+# Batch size of 100 keeps the single update of the recalculated lines fast
+RECALCULATE_ORDER_BATCH_SIZE = 100
+
 # Batch size of 5000 is about ~5MB of memory usage in task
 # It takes +/- 8 secs to delete 5000 orders
 DELETE_EXPIRED_ORDER_BATCH_SIZE = 5000
@@ -40,6 +45,45 @@ def recalculate_orders_task(order_ids: list[int]):
         invalidate_order_prices(order)
 
     Order.objects.bulk_update(orders, ["should_refresh_prices"])
+    recalculate_orders_prices_task.delay(order_ids)
+
+
+@app.task
+@allow_writer()
+def recalculate_orders_prices_task(order_ids: list[int] | None = None):
+    """Recalculate the prices of the editable orders marked to be refreshed.
+
+    The orders are processed in batches, the task re-queues itself until no
+    order is left. All marked orders are processed when `order_ids` is not given.
+    The prices, including the taxes from the tax app, are calculated without
+    locking the orders. The orders are locked only to save the prices, and the
+    ones changed in the meantime are skipped, so a concurrent change of an
+    order is not overwritten with outdated prices.
+    """
+    qs = Order.objects.filter(
+        status__in=ORDER_EDITABLE_STATUS, should_refresh_prices=True
+    )
+    if order_ids is not None:
+        qs = qs.filter(id__in=order_ids)
+
+    start = time.monotonic()
+    manager = get_plugins_manager(allow_replica=False)
+    orders = list(qs.order_by("pk")[:RECALCULATE_ORDER_BATCH_SIZE])
+    if not orders:
+        return
+    recalculated_orders = fetch_orders_prices_if_expired(
+        orders, manager, skip_changed_orders=True
+    )
+    duration = time.monotonic() - start
+    logger.info(
+        "Recalculated prices of %s orders in %.2fs (%.1f orders/s).",
+        len(recalculated_orders),
+        duration,
+        len(recalculated_orders) / max(duration, 1e-6),
+    )
+
+    if len(orders) == RECALCULATE_ORDER_BATCH_SIZE:
+        recalculate_orders_prices_task.delay(order_ids)
 
 
 @app.task
@@ -100,7 +144,7 @@ def _bulk_release_voucher_usage(order_ids):
 
 
 def _call_expired_order_events(order_ids, manager):
-    orders = (
+    orders = list(
         Order.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
         .filter(id__in=order_ids)
         .select_related("channel")
@@ -112,16 +156,15 @@ def _call_expired_order_events(order_ids, manager):
             *WebhookEventSyncType.ORDER_EVENTS,
         ]
     )
-    for order in orders:
-        call_order_events(
-            manager,
-            [
-                WebhookEventAsyncType.ORDER_EXPIRED,
-                WebhookEventAsyncType.ORDER_UPDATED,
-            ],
-            order,
-            webhook_event_map=webhook_event_map,
-        )
+    call_orders_events(
+        manager,
+        [
+            WebhookEventAsyncType.ORDER_EXPIRED,
+            WebhookEventAsyncType.ORDER_UPDATED,
+        ],
+        orders,
+        webhook_event_map=webhook_event_map,
+    )
 
 
 def _order_expired_events(order_ids):
@@ -156,22 +199,38 @@ def _expire_orders(manager, now):
         status=OrderStatus.UNCONFIRMED,
     )
 
-    ids_batch = list(qs.values_list("pk", flat=True)[:EXPIRE_ORDER_BATCH_SIZE])
+    candidate_ids = list(qs.values_list("pk", flat=True)[:EXPIRE_ORDER_BATCH_SIZE])
+    if not candidate_ids:
+        return False
+
     with traced_atomic_transaction():
+        # Orders locked by a concurrent run are skipped, so the voucher usage of an
+        # order is never released twice.
+        ids_batch = list(
+            Order.objects.select_for_update(of=("self",), skip_locked=True)
+            .filter(id__in=candidate_ids, status=OrderStatus.UNCONFIRMED)
+            .values_list("pk", flat=True)
+        )
         Order.objects.filter(id__in=ids_batch).update(
             status=OrderStatus.EXPIRED, expired_at=now
         )
         _bulk_release_voucher_usage(ids_batch)
         _order_expired_events(ids_batch)
         deallocate_stock_for_orders(ids_batch, manager)
+
+    if ids_batch:
         _call_expired_order_events(ids_batch, manager)
+    return len(candidate_ids) == EXPIRE_ORDER_BATCH_SIZE
 
 
 @app.task
 def expire_orders_task():
     now = timezone.now()
     manager = get_plugins_manager(allow_replica=True)
-    _expire_orders(manager, now)
+    if _expire_orders(manager, now):
+        # Continue with the next batch right away, instead of waiting for the next
+        # scheduled run.
+        expire_orders_task.delay()
 
 
 @app.task
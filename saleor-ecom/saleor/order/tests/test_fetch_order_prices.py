@@ -16,7 +16,7 @@ from ...discount.utils.voucher import (
 )
 from ...product.models import Product
 from ...product.utils.variant_prices import update_discounted_prices_for_promotion
-from ...product.utils.variants import fetch_variants_for_promotion_rules
+from ...product.utils.variants import update_variants_for_promotion_rules
 from ...tests import race_condition
 from ...tests.utils import round_down, round_up
 from .. import OrderStatus, calculations
@@ -1992,7 +1992,9 @@ def test_fetch_order_prices_removing_catalogue_promotion_doesnt_remove_discount(
 
     # when
     promotion.delete()
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     update_discounted_prices_for_promotion(Product.objects.all())
     order, lines = calculations.fetch_order_prices_if_expired(
         order, plugins_manager, None, True
@@ -18,7 +18,7 @@ from ...discount.utils.voucher import (
 )
 from ...product.models import Product
 from ...product.utils.variant_prices import update_discounted_prices_for_promotion
-from ...product.utils.variants import fetch_variants_for_promotion_rules
+from ...product.utils.variants import update_variants_for_promotion_rules
 from .. import OrderStatus
 from ..calculations import fetch_order_prices_if_expired
 from ..models import OrderLine
@@ -290,7 +290,9 @@ def test_fetch_order_prices_lines_expired_catalogue_discount(
     rule_2.reward_value_type = new_reward_value_type_2
     rule_2.save(update_fields=["reward_value", "reward_value_type"])
 
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     update_discounted_prices_for_promotion(Product.objects.all())
 
     # both lines should have price refreshed
@@ -461,7 +463,9 @@ def test_fetch_order_prices_single_line_expired_catalogue_discount(
     rule_2.reward_value_type = new_reward_value_type_2
     rule_2.save(update_fields=["reward_value", "reward_value_type"])
 
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     update_discounted_prices_for_promotion(Product.objects.all())
 
     undiscounted_unit_price_1 = line_1.undiscounted_base_unit_price_amount
@@ -589,7 +593,9 @@ def test_fetch_order_prices_lines_expired_new_catalogue_discount(
         discount_amount=reward_value,
         currency=currency,
     )
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     update_discounted_prices_for_promotion(Product.objects.all())
 
     # expire order lines
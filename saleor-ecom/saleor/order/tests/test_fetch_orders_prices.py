@@ -0,0 +1,128 @@
+import datetime
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .. import OrderStatus, calculations
+from ..models import Order, OrderLine
+
+
+def _prepare_orders(order_with_lines, order_list):
+    lines = list(order_with_lines.lines.all())
+    for order in order_list:
+        for line in lines:
+            line.pk = None
+            line.order = order
+            line.save()
+    order_ids = [order_with_lines.pk, *(order.pk for order in order_list)]
+    Order.objects.filter(pk__in=order_ids).update(
+        status=OrderStatus.UNCONFIRMED,
+        currency=order_with_lines.currency,
+        should_refresh_prices=True,
+    )
+    return list(Order.objects.filter(pk__in=order_ids).order_by("pk"))
+
+
+def _get_prices(orders):
+    order_prices = list(
+        Order.objects.filter(pk__in=[order.pk for order in orders])
+        .order_by("pk")
+        .values_list("pk", *calculations.ORDER_PRICE_FIELDS)
+    )
+    line_prices = list(
+        OrderLine.objects.filter(order__in=orders)
+        .order_by("pk")
+        .values_list("pk", *calculations.ORDER_LINE_PRICE_FIELDS)
+    )
+    return order_prices, line_prices
+
+
+def test_fetch_orders_prices_if_expired(
+    order_with_lines, order_list, plugins_manager, tax_configuration_flat_rates
+):
+    # given
+    orders = _prepare_orders(order_with_lines, order_list)
+
+    # when
+    recalculated_orders = calculations.fetch_orders_prices_if_expired(
+        orders, plugins_manager
+    )
+
+    # then
+    assert recalculated_orders == orders
+    prices = _get_prices(orders)
+    Order.objects.filter(pk__in=[order.pk for order in orders]).update(
+        should_refresh_prices=True
+    )
+    for order in Order.objects.filter(pk__in=[order.pk for order in orders]):
+        calculations.fetch_order_prices_if_expired(order, plugins_manager)
+    assert _get_prices(orders) == prices
+    assert not Order.objects.filter(should_refresh_prices=True).exists()
+
+
+def test_fetch_orders_prices_if_expired_skips_up_to_date_orders(
+    order_with_lines, order_list, plugins_manager, tax_configuration_flat_rates
+):
+    # given
+    orders = _prepare_orders(order_with_lines, order_list)
+    fulfilled_order, up_to_date_order, *orders_to_recalculate = orders
+    fulfilled_order.status = OrderStatus.FULFILLED
+    up_to_date_order.should_refresh_prices = False
+
+    # when
+    recalculated_orders = calculations.fetch_orders_prices_if_expired(
+        orders, plugins_manager
+    )
+
+    # then
+    assert recalculated_orders == orders_to_recalculate
+    fulfilled_order.refresh_from_db()
+    up_to_date_order.refresh_from_db()
+    assert fulfilled_order.should_refresh_prices is True
+    assert up_to_date_order.should_refresh_prices is True
+
+
+def test_fetch_orders_prices_if_expired_queries_count(
+    order_with_lines, order_list, plugins_manager, tax_configuration_flat_rates
+):
+    # given
+    orders = _prepare_orders(order_with_lines, order_list)
+    with CaptureQueriesContext(connection) as ctx:
+        for order in Order.objects.filter(pk__in=[order.pk for order in orders]):
+            calculations.fetch_order_prices_if_expired(
+                order, plugins_manager, force_update=True
+            )
+    queries_count_one_by_one = len(ctx.captured_queries)
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        calculations.fetch_orders_prices_if_expired(
+            orders, plugins_manager, force_update=True
+        )
+
+    # then
+    assert len(ctx.captured_queries) < queries_count_one_by_one
+
+
+def test_fetch_orders_prices_if_expired_skips_changed_orders(
+    order_with_lines, order_list, plugins_manager, tax_configuration_flat_rates
+):
+    # given
+    orders = _prepare_orders(order_with_lines, order_list)
+    changed_order, *unchanged_orders = orders
+    Order.objects.filter(pk=changed_order.pk).update(
+        updated_at=changed_order.updated_at + datetime.timedelta(seconds=1)
+    )
+
+    # when
+    recalculated_orders = calculations.fetch_orders_prices_if_expired(
+        orders, plugins_manager, skip_changed_orders=True
+    )
+
+    # then
+    assert recalculated_orders == unchanged_orders
+    changed_order.refresh_from_db()
+    assert changed_order.should_refresh_prices is True
+    assert not Order.objects.filter(
+        pk__in=[order.pk for order in unchanged_orders], should_refresh_prices=True
+    ).exists()
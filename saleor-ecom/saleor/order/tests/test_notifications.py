@@ -4,6 +4,8 @@ from unittest import mock
 
 import graphene
 from django.core.files import File
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from measurement.measures import Weight
 from prices import Money, fixed_discount
 
@@ -24,6 +26,7 @@ from ...plugins.manager import get_plugins_manager
 from ...product.models import DigitalContentUrl
 from ...thumbnail import THUMBNAIL_SIZES
 from ...thumbnail.models import Thumbnail
+from ..models import Order
 from ..notifications import (
     get_address_payload,
     get_attribute_data_from_order_lines,
@@ -32,6 +35,7 @@ from ..notifications import (
     get_default_fulfillment_payload,
     get_default_images_payload,
     get_default_order_payload,
+    get_default_orders_payload,
     get_order_line_payload,
 )
 from ..utils import add_variant_to_order
@@ -339,6 +343,62 @@ def test_get_default_fulfillment_payload(fulfillment, digital_content, site_sett
     }
 
 
+def _copy_line_to_orders(line, orders):
+    for order in orders:
+        line.pk = None
+        line.order = order
+        line.save()
+
+
+def test_get_default_orders_payload(order_list, order_line, digital_content):
+    # given
+    _copy_line_to_orders(order_line, order_list)
+    product_type = digital_content.product_variant.product.product_type
+    product_type.is_digital = True
+    product_type.is_shipping_required = False
+    product_type.save(update_fields=["is_digital", "is_shipping_required"])
+    digital_line = order_list[0].lines.get()
+    digital_line.variant = digital_content.product_variant
+    digital_line.save(update_fields=["variant"])
+    DigitalContentUrl.objects.create(content=digital_content, line=digital_line)
+    order_ids = [order.pk for order in order_list]
+    redirect_url = "http://redirect.com/path"
+    expected_payloads = [
+        get_default_order_payload(order, redirect_url)
+        for order in Order.objects.filter(pk__in=order_ids).order_by("number")
+    ]
+
+    # when
+    payloads = get_default_orders_payload(
+        Order.objects.filter(pk__in=order_ids).order_by("number"), redirect_url
+    )
+
+    # then
+    assert payloads == expected_payloads
+    assert payloads[0]["lines"][0]["digital_url"]
+
+
+def test_get_default_orders_payload_queries_count(
+    order_list, order_line, product_with_image, site_settings
+):
+    # given
+    order_line.variant = product_with_image.variants.first()
+    _copy_line_to_orders(order_line, order_list)
+    order_ids = [order.pk for order in order_list]
+    # the first call caches the current site
+    get_default_orders_payload(Order.objects.filter(pk=order_ids[0]))
+
+    # when
+    with CaptureQueriesContext(connection) as single_order_queries:
+        get_default_orders_payload(Order.objects.filter(pk=order_ids[0]))
+    with CaptureQueriesContext(connection) as all_orders_queries:
+        payloads = get_default_orders_payload(Order.objects.filter(pk__in=order_ids))
+
+    # then
+    assert len(payloads) == len(order_list)
+    assert len(all_orders_queries) == len(single_order_queries)
+
+
 @mock.patch("saleor.plugins.manager.PluginsManager.notify")
 def test_send_email_payment_confirmation(mocked_notify, site_settings, payment_dummy):
     # given
@@ -9,7 +9,7 @@ from ...discount import DiscountType, DiscountValueType
 from ...giftcard import GiftCardEvents
 from ...giftcard.models import GiftCardEvent
 from ...graphql.order.utils import OrderLineData
-from ...payment import TransactionEventType
+from ...payment import ChargeStatus, TransactionEventType
 from ...plugins.manager import get_plugins_manager
 from .. import OrderGrantedRefundStatus, OrderStatus
 from ..events import OrderEvents
@@ -26,7 +26,9 @@ from ..utils import (
     match_orders_with_new_user,
     order_info_for_logs,
     store_user_addresses_from_draft_order,
+    update_order_charge_data,
     update_order_display_gross_prices,
+    update_order_payment_status,
 )
 
 
@@ -848,3 +850,102 @@ def test_store_user_addresses_from_draft_order_only_draft_save_billing_address_t
     order.refresh_from_db()
     assert order.draft_save_shipping_address is None
     assert order.draft_save_billing_address is None
+
+
+def test_update_order_charge_data_sets_last_payment_charge_status(order, payment_dummy):
+    # given
+    payment_dummy.charge_status = ChargeStatus.FULLY_REFUNDED
+    payment_dummy.save(update_fields=["charge_status"])
+    last_payment = payment_dummy
+    last_payment.pk = None
+    last_payment.charge_status = ChargeStatus.FULLY_CHARGED
+    last_payment.captured_amount = last_payment.total
+    last_payment.save()
+    order = last_payment.order
+
+    # when
+    update_order_charge_data(order)
+
+    # then
+    order.refresh_from_db()
+    assert order.last_payment_charge_status == ChargeStatus.FULLY_CHARGED
+
+
+def test_update_order_charge_data_without_payments(order):
+    # given
+    order.last_payment_charge_status = ChargeStatus.FULLY_CHARGED
+    order.save(update_fields=["last_payment_charge_status"])
+
+    # when
+    update_order_charge_data(order)
+
+    # then
+    order.refresh_from_db()
+    assert order.last_payment_charge_status is None
+
+
+def test_update_order_charge_data_sets_payment_status(order_with_lines):
+    # given
+    order = order_with_lines
+    order.payment_transactions.create(
+        charged_value=order.total_gross_amount / 2, currency=order.currency
+    )
+
+    # when
+    update_order_charge_data(order)
+
+    # then
+    order.refresh_from_db()
+    assert order.payment_status == ChargeStatus.PARTIALLY_CHARGED
+
+
+def test_update_order_payment_status_with_total_fulfillment_refund(fulfilled_order):
+    # given
+    order = fulfilled_order
+    order.fulfillments.create(total_refund_amount=order.total_gross_amount)
+
+    # when
+    update_order_payment_status(order)
+
+    # then
+    order.refresh_from_db()
+    assert order.payment_status == ChargeStatus.FULLY_REFUNDED
+
+
+def test_add_variant_to_order_updates_lines_count(order_with_lines, variant):
+    # given
+    order = order_with_lines
+    lines_count = order.lines.count()
+    line_data = OrderLineData(variant_id=str(variant.id), variant=variant, quantity=1)
+
+    # when
+    add_variant_to_order(
+        order, line_data, None, None, get_plugins_manager(allow_replica=False)
+    )
+
+    # then
+    order.refresh_from_db()
+    assert order.lines_count == lines_count + 1
+
+
+def test_change_quantity_to_zero_updates_lines_count(order_with_lines, staff_user):
+    # given
+    order = order_with_lines
+    lines_count = order.lines.count()
+    line = order.lines.last()
+    line_info = OrderLineInfo(line=line, quantity=line.quantity, variant=line.variant)
+
+    # when
+    change_order_line_quantity(
+        staff_user,
+        None,
+        line_info,
+        line.quantity,
+        0,
+        order,
+        get_plugins_manager(allow_replica=False),
+    )
+
+    # then
+    order.refresh_from_db()
+    assert order.lines_count == lines_count - 1
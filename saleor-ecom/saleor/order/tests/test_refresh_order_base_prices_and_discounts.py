@@ -15,7 +15,7 @@ from ...discount.utils.voucher import (
 )
 from ...product.models import Product
 from ...product.utils.variant_prices import update_discounted_prices_for_promotion
-from ...product.utils.variants import fetch_variants_for_promotion_rules
+from ...product.utils.variants import update_variants_for_promotion_rules
 from .. import OrderStatus
 from ..calculations import refresh_order_base_prices_and_discounts
 
@@ -148,7 +148,9 @@ def test_refresh_order_base_prices_catalogue_discount(
     rule_2.reward_value_type = new_reward_value_type_2
     rule_2.save(update_fields=["reward_value", "reward_value_type"])
 
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     update_discounted_prices_for_promotion(Product.objects.all())
 
     undiscounted_unit_price_1 = line_1.undiscounted_base_unit_price_amount
@@ -13,12 +13,14 @@ from ...discount.models import VoucherCustomer
 from ...warehouse.models import Allocation
 from ...webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .. import OrderEvents, OrderStatus
-from ..actions import call_order_event, call_order_events
+from ..actions import call_order_event, call_orders_events
 from ..models import Order, OrderEvent, get_order_number
 from ..tasks import (
     _bulk_release_voucher_usage,
     delete_expired_orders_task,
     expire_orders_task,
+    recalculate_orders_prices_task,
+    recalculate_orders_task,
     send_order_updated,
 )
 
@@ -382,8 +384,8 @@ def test_expire_orders_task_after(order_list, allocations, channel_USD):
 
 
 @patch(
-    "saleor.order.tasks.call_order_events",
-    wraps=call_order_events,
+    "saleor.order.tasks.call_orders_events",
+    wraps=call_orders_events,
 )
 @patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
 @patch(
@@ -393,7 +395,7 @@ def test_expire_orders_task_after(order_list, allocations, channel_USD):
 def test_expire_orders_task_do_not_call_sync_webhooks(
     mocked_send_webhook_request_async,
     mocked_send_webhook_request_sync,
-    wrapped_call_order_events,
+    wrapped_call_orders_events,
     setup_order_webhooks,
     order_list,
     channel_USD,
@@ -461,7 +463,30 @@ def test_expire_orders_task_do_not_call_sync_webhooks(
     )
 
     assert not mocked_send_webhook_request_sync.called
-    assert wrapped_call_order_events.called
+    assert wrapped_call_orders_events.called
+
+
+@patch("saleor.order.tasks.EXPIRE_ORDER_BATCH_SIZE", 1)
+@patch("saleor.order.tasks.expire_orders_task.delay")
+def test_expire_orders_task_requeues_next_batch(
+    mocked_delay, order_list, allocations, channel_USD
+):
+    # given
+    channel_USD.expire_orders_after = 60
+    channel_USD.save()
+
+    created_at = timezone.now() - datetime.timedelta(minutes=120)
+    for order in order_list:
+        order.created_at = created_at
+        order.status = OrderStatus.UNCONFIRMED
+    Order.objects.bulk_update(order_list, ["created_at", "status"])
+
+    # when
+    expire_orders_task()
+
+    # then
+    assert Order.objects.filter(status=OrderStatus.EXPIRED).count() == 1
+    mocked_delay.assert_called_once_with()
 
 
 @freeze_time("2020-03-18 12:00:00")
@@ -852,3 +877,67 @@ def test_send_order_updated(
     )
 
     assert wrapped_call_order_event.called
+
+
+@patch("saleor.order.tasks.recalculate_orders_prices_task.delay")
+def test_recalculate_orders_prices_task(
+    mocked_delay, order_with_lines, order_list, tax_configuration_flat_rates
+):
+    # given
+    for order in order_list:
+        order.currency = order_with_lines.currency
+    Order.objects.bulk_update(order_list, ["currency"])
+    orders = [order_with_lines, *order_list]
+    Order.objects.filter(pk__in=[order.pk for order in orders]).update(
+        status=OrderStatus.UNCONFIRMED, should_refresh_prices=True
+    )
+    order_ids = [order.pk for order in orders[:3]]
+
+    # when
+    recalculate_orders_prices_task(order_ids)
+
+    # then
+    assert not Order.objects.filter(
+        pk__in=order_ids, should_refresh_prices=True
+    ).exists()
+    assert Order.objects.get(pk=orders[3].pk).should_refresh_prices is True
+    mocked_delay.assert_not_called()
+
+
+@patch("saleor.order.tasks.RECALCULATE_ORDER_BATCH_SIZE", 1)
+@patch("saleor.order.tasks.recalculate_orders_prices_task.delay")
+def test_recalculate_orders_prices_task_requeues_next_batch(
+    mocked_delay, order_with_lines, order_list, tax_configuration_flat_rates
+):
+    # given
+    for order in order_list:
+        order.currency = order_with_lines.currency
+    Order.objects.bulk_update(order_list, ["currency"])
+    Order.objects.filter(pk__in=[order.pk for order in order_list]).update(
+        status=OrderStatus.UNCONFIRMED, should_refresh_prices=True
+    )
+
+    # when
+    recalculate_orders_prices_task()
+
+    # then
+    assert Order.objects.filter(should_refresh_prices=True).count() == 2
+    mocked_delay.assert_called_once_with(None)
+
+
+@patch("saleor.order.tasks.recalculate_orders_prices_task.delay")
+def test_recalculate_orders_task(mocked_delay, draft_order, order_list):
+    # given
+    order = order_list[0]
+    order_ids = [draft_order.pk, order.pk]
+    Order.objects.filter(pk__in=order_ids).update(should_refresh_prices=False)
+
+    # when
+    recalculate_orders_task(order_ids)
+
+    # then
+    draft_order.refresh_from_db()
+    order.refresh_from_db()
+    assert draft_order.should_refresh_prices is True
+    assert order.should_refresh_prices is False
+    mocked_delay.assert_called_once_with(order_ids)
@@ -2,6 +2,7 @@ import logging
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 from decimal import Decimal
+from operator import attrgetter
 from typing import TYPE_CHECKING, Optional, cast
 
 import graphene
@@ -44,8 +45,8 @@ from ..discount.utils.voucher import (
 from ..giftcard import events as gift_card_events
 from ..giftcard.models import GiftCard
 from ..giftcard.search import mark_gift_cards_search_index_as_dirty
-from ..payment import TransactionEventType
-from ..payment.model_helpers import get_total_authorized
+from ..payment import ChargeStatus, TransactionEventType
+from ..payment.model_helpers import get_last_payment, get_total_authorized
 from ..product.utils.digital_products import get_default_digital_content_settings
 from ..shipping.interface import ShippingMethodData
 from ..shipping.models import ShippingMethod, ShippingMethodChannelListing
@@ -319,6 +320,7 @@ def create_order_line(
         draft_base_price_expire_at=price_expiration_date,
         **get_tax_class_kwargs_for_order_line(tax_class),
     )
+    update_order_lines_count(order)
 
     unit_discount = line.undiscounted_unit_price - line.unit_price
     if unit_discount.gross:
@@ -674,6 +676,13 @@ def delete_order_line(line_info, manager):
     if line_info.line.order.is_unconfirmed():
         decrease_allocations([line_info], manager)
     line_info.line.delete()
+    update_order_lines_count(line_info.line.order)
+
+
+def update_order_lines_count(order: Order, with_save=True):
+    order.lines_count = order.lines.count()
+    if with_save:
+        order.save(update_fields=["lines_count", "updated_at"])
 
 
 def restock_fulfillment_lines(fulfillment, warehouse):
@@ -1086,6 +1095,95 @@ def _update_order_total_charged(
     order.total_charged_amount += sum([tr.charged_value for tr in order_transactions])
 
 
+def update_order_last_payment_charge_status(
+    order: Order,
+    order_payments: Iterable["Payment"] | None = None,
+    with_save=True,
+):
+    if order_payments is None:
+        order_payments = order.payments.all()
+    last_payment = max(order_payments, default=None, key=attrgetter("pk"))
+    order.last_payment_charge_status = (
+        last_payment.charge_status if last_payment else None
+    )
+    if with_save:
+        update_order_payment_status(order, order_payments, with_save=False)
+        order.save(
+            update_fields=["last_payment_charge_status", "payment_status", "updated_at"]
+        )
+
+
+def get_order_payment_status(
+    order: Order,
+    last_payment: Optional["Payment"],
+    has_transactions: bool,
+    granted_refund_amount: Decimal,
+    fulfillment_refund_amount: Decimal,
+) -> str:
+    """Return the payment status of the order.
+
+    The status is fully refunded when the refund fulfillments cover the order total.
+    Otherwise, for orders with transactions, it is based on the charged amount
+    and the order total reduced by the granted refunds, and for the others
+    it is the charge status of the last payment.
+    """
+    if (
+        fulfillment_refund_amount
+        and fulfillment_refund_amount == order.total_gross_amount
+    ):
+        return ChargeStatus.FULLY_REFUNDED
+
+    if has_transactions:
+        total_charged = quantize_price(
+            order.total_charged_amount or Decimal(0), order.currency
+        )
+        current_total_gross = quantize_price(
+            order.total_gross_amount - granted_refund_amount, order.currency
+        )
+        if total_charged == 0 and current_total_gross <= 0:
+            return ChargeStatus.FULLY_CHARGED
+        if total_charged >= current_total_gross:
+            return ChargeStatus.FULLY_CHARGED
+        if total_charged > 0:
+            return ChargeStatus.PARTIALLY_CHARGED
+        return ChargeStatus.NOT_CHARGED
+
+    if last_payment:
+        return last_payment.charge_status
+    if order.total_gross_amount == 0:
+        return ChargeStatus.FULLY_CHARGED
+    return ChargeStatus.NOT_CHARGED
+
+
+def update_order_payment_status(
+    order: Order,
+    order_payments: Iterable["Payment"] | None = None,
+    order_transactions: Iterable["TransactionItem"] | None = None,
+    granted_refund_amount: Decimal | None = None,
+    with_save=True,
+):
+    if order_payments is None:
+        order_payments = order.payments.all()
+    if order_transactions is None:
+        order_transactions = order.payment_transactions.all()
+    if granted_refund_amount is None:
+        granted_refund_amount = order.granted_refunds.aggregate(
+            total=Sum("amount_value")
+        )["total"] or Decimal(0)
+    fulfillment_refund_amount = order.fulfillments.aggregate(
+        total=Sum("total_refund_amount")
+    )["total"] or Decimal(0)
+    order.payment_status = get_order_payment_status(
+        order,
+        last_payment=get_last_payment(order_payments),
+        has_transactions=bool(order_transactions),
+        granted_refund_amount=granted_refund_amount,
+        fulfillment_refund_amount=fulfillment_refund_amount,
+    )
+    if with_save:
+        order.save(update_fields=["payment_status", "updated_at"])
+
+
 def update_order_charge_data(
     order: Order,
     order_payments: QuerySet["Payment"] | None = None,
@@ -1105,10 +1203,24 @@ def update_order_charge_data(
     _update_order_total_charged(
         order, order_payments=order_payments, order_transactions=order_transactions
     )
+    update_order_last_payment_charge_status(order, order_payments, with_save=False)
     update_order_charge_status(order, granted_refund_amount)
+    update_order_payment_status(
+        order,
+        order_payments=order_payments,
+        order_transactions=order_transactions,
+        granted_refund_amount=granted_refund_amount,
+        with_save=False,
+    )
     if with_save:
         order.save(
-            update_fields=["total_charged_amount", "charge_status", "updated_at"]
+            update_fields=[
+                "total_charged_amount",
+                "charge_status",
+                "last_payment_charge_status",
+                "payment_status",
+                "updated_at",
+            ]
         )
 
 
@@ -1171,10 +1283,16 @@ def update_order_authorize_data(
     _update_order_total_authorized(
         order, order_payments=order_payments, order_transactions=order_transactions
     )
+    update_order_last_payment_charge_status(order, order_payments, with_save=False)
     update_order_authorize_status(order, granted_refund_amount)
     if with_save:
         order.save(
-            update_fields=["total_authorized_amount", "authorize_status", "updated_at"]
+            update_fields=[
+                "total_authorized_amount",
+                "authorize_status",
+                "last_payment_charge_status",
+                "updated_at",
+            ]
         )
 
 
@@ -1201,6 +1319,8 @@ def updates_amounts_for_order(order: Order, save: bool = True):
             update_fields=[
                 "total_charged_amount",
                 "charge_status",
+                "last_payment_charge_status",
+                "payment_status",
                 "updated_at",
                 "total_authorized_amount",
                 "authorize_status",
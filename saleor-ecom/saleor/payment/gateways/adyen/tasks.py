@@ -0,0 +1,79 @@
+import logging
+from datetime import timedelta
+
+from django.utils import timezone
+
+from ....celeryconf import app
+from ....core.db.connection import allow_writer
+from ....core.transactions import transaction_with_commit_on_errors
+from ....plugins.manager import get_plugins_manager
+from ...models import PaymentNotification
+from .plugin import AdyenGatewayPlugin
+from .webhooks import process_notification
+
+logger = logging.getLogger(__name__)
+
+CELERY_RETRY_BACKOFF = 60
+CELERY_RETRY_MAX = 5
+
+# Time after which the unprocessed notification is queued again. It is longer
+# than the retries of the task, so the notification which is still retried
+# is not queued twice.
+UNPROCESSED_NOTIFICATION_DELAY = timedelta(minutes=30)
+# Time after which the unprocessed notification is not queued again.
+UNPROCESSED_NOTIFICATION_MAX_AGE = timedelta(days=1)
+UNPROCESSED_NOTIFICATIONS_BATCH_SIZE = 1000
+
+
+@app.task(
+    autoretry_for=(Exception,),
+    retry_backoff=CELERY_RETRY_BACKOFF,
+    retry_kwargs={"max_retries": CELERY_RETRY_MAX},
+)
+@allow_writer()
+def process_notification_task(notification_id: int):
+    with transaction_with_commit_on_errors():
+        # Skip the notification locked by another worker. The error raised by
+        # the handler leaves the notification unprocessed and retries the task.
+        notification = (
+            PaymentNotification.objects.select_for_update(skip_locked=True)
+            .filter(pk=notification_id, processed_at__isnull=True)
+            .first()
+        )
+        if not notification:
+            return
+
+        manager = get_plugins_manager(allow_replica=False)
+        plugin = manager.get_plugin(
+            AdyenGatewayPlugin.PLUGIN_ID, notification.channel_slug
+        )
+        if not plugin or not plugin.active:
+            logger.warning(
+                "Adyen plugin is not active, notification %s skipped.",
+                notification_id,
+                extra={"channel_slug": notification.channel_slug},
+            )
+            return
+        process_notification(notification, plugin.config)
+
+
+@app.task
+@allow_writer()
+def queue_unprocessed_notifications_task():
+    """Queue again the notifications which processing has not succeeded."""
+    now = timezone.now()
+    notification_ids = list(
+        PaymentNotification.objects.filter(
+            processed_at__isnull=True,
+            created_at__lt=now - UNPROCESSED_NOTIFICATION_DELAY,
+            created_at__gte=now - UNPROCESSED_NOTIFICATION_MAX_AGE,
+        )
+        .order_by("created_at")
+        .values_list("pk", flat=True)[:UNPROCESSED_NOTIFICATIONS_BATCH_SIZE]
+    )
+    for notification_id in notification_ids:
+        process_notification_task.delay(notification_id)
+    if notification_ids:
+        logger.warning(
+            "Queued %s unprocessed Adyen notifications.", len(notification_ids)
+        )
@@ -0,0 +1,278 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+import graphene
+import pytest
+from celery.exceptions import Retry
+from django.utils import timezone
+
+from ..... import TransactionKind
+from .....models import PaymentNotification
+from .....utils import price_to_minor_unit
+from ...tasks import (
+    UNPROCESSED_NOTIFICATION_DELAY,
+    process_notification_task,
+    queue_unprocessed_notifications_task,
+)
+from ...webhooks import handle_webhook
+
+
+def _webhook_request(rf, notification):
+    return rf.post(
+        "/webhooks",
+        data=json.dumps(
+            {"notificationItems": [{"NotificationRequestItem": notification}]}
+        ),
+        content_type="application/json",
+    )
+
+
+@mock.patch("saleor.payment.gateways.adyen.tasks.process_notification_task.delay")
+def test_handle_webhook_stores_notification(
+    mocked_task,
+    rf,
+    notification,
+    adyen_plugin,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    plugin = adyen_plugin()
+    notification = notification()
+    request = _webhook_request(rf, notification)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        response = handle_webhook(request, plugin.config, channel_USD.slug)
+
+    # then
+    assert response.content == b"[accepted]"
+    payment_notification = PaymentNotification.objects.get()
+    assert payment_notification.psp_reference == notification["pspReference"]
+    assert payment_notification.event_kind == "AUTHORISATION:true"
+    assert payment_notification.channel_slug == channel_USD.slug
+    assert payment_notification.payload == notification
+    assert payment_notification.processed_at is None
+    mocked_task.assert_called_once_with(payment_notification.pk)
+
+
+@mock.patch("saleor.payment.gateways.adyen.tasks.process_notification_task.delay")
+def test_handle_webhook_skips_processed_notification(
+    mocked_task,
+    rf,
+    notification,
+    adyen_plugin,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    plugin = adyen_plugin()
+    notification = notification()
+    PaymentNotification.objects.create(
+        gateway=plugin.config.gateway_name,
+        psp_reference=notification["pspReference"],
+        event_kind="AUTHORISATION:true",
+        channel_slug=channel_USD.slug,
+        payload=notification,
+        processed_at=timezone.now(),
+    )
+    request = _webhook_request(rf, notification)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        response = handle_webhook(request, plugin.config, channel_USD.slug)
+
+    # then
+    assert response.content == b"[accepted]"
+    assert PaymentNotification.objects.count() == 1
+    mocked_task.assert_not_called()
+
+
+@mock.patch("saleor.payment.gateways.adyen.tasks.process_notification_task.delay")
+def test_handle_webhook_retried_unprocessed_notification(
+    mocked_task,
+    rf,
+    notification,
+    adyen_plugin,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    plugin = adyen_plugin()
+    notification = notification()
+    payment_notification = PaymentNotification.objects.create(
+        gateway=plugin.config.gateway_name,
+        psp_reference=notification["pspReference"],
+        event_kind="AUTHORISATION:true",
+        channel_slug=channel_USD.slug,
+        payload=notification,
+    )
+    request = _webhook_request(rf, notification)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        handle_webhook(request, plugin.config, channel_USD.slug)
+
+    # then
+    assert PaymentNotification.objects.count() == 1
+    mocked_task.assert_called_once_with(payment_notification.pk)
+
+
+@mock.patch("saleor.payment.gateways.adyen.webhooks.handle_authorization")
+@mock.patch("saleor.payment.gateways.adyen.tasks.process_notification_task.delay")
+def test_handle_webhook_without_psp_reference(
+    mocked_task, mocked_handler, rf, notification, adyen_plugin, channel_USD
+):
+    # given
+    plugin = adyen_plugin()
+    notification = notification()
+    notification["pspReference"] = None
+    request = _webhook_request(rf, notification)
+
+    # when
+    with mock.patch.dict(
+        "saleor.payment.gateways.adyen.webhooks.EVENT_MAP",
+        {"AUTHORISATION": mocked_handler},
+    ):
+        response = handle_webhook(request, plugin.config, channel_USD.slug)
+
+    # then
+    assert response.content == b"[accepted]"
+    mocked_handler.assert_called_once_with(notification, plugin.config)
+    assert not PaymentNotification.objects.exists()
+    mocked_task.assert_not_called()
+
+
+def test_process_notification_task(
+    notification, adyen_plugin, payment_adyen_for_order, channel_USD
+):
+    # given
+    plugin = adyen_plugin()
+    payment = payment_adyen_for_order
+    notification = notification(
+        merchant_reference=graphene.Node.to_global_id("Payment", payment.pk),
+        value=price_to_minor_unit(payment.total, payment.currency),
+    )
+    payment_notification = PaymentNotification.objects.create(
+        gateway=plugin.config.gateway_name,
+        psp_reference=notification["pspReference"],
+        event_kind="AUTHORISATION:true",
+        channel_slug=channel_USD.slug,
+        payload=notification,
+    )
+
+    # when
+    process_notification_task(payment_notification.pk)
+
+    # then
+    payment_notification.refresh_from_db()
+    assert payment_notification.processed_at
+    transaction = payment.transactions.last()
+    assert transaction.kind == TransactionKind.AUTH
+    assert transaction.is_success is True
+
+
+@mock.patch("saleor.payment.gateways.adyen.webhooks.handle_authorization")
+def test_process_notification_task_already_processed(
+    mocked_handler, notification, adyen_plugin, channel_USD
+):
+    # given
+    plugin = adyen_plugin()
+    notification = notification()
+    processed_at = timezone.now()
+    payment_notification = PaymentNotification.objects.create(
+        gateway=plugin.config.gateway_name,
+        psp_reference=notification["pspReference"],
+        event_kind="AUTHORISATION:true",
+        channel_slug=channel_USD.slug,
+        payload=notification,
+        processed_at=processed_at,
+    )
+
+    # when
+    with mock.patch.dict(
+        "saleor.payment.gateways.adyen.webhooks.EVENT_MAP",
+        {"AUTHORISATION": mocked_handler},
+    ):
+        process_notification_task(payment_notification.pk)
+
+    # then
+    mocked_handler.assert_not_called()
+    payment_notification.refresh_from_db()
+    assert payment_notification.processed_at == processed_at
+
+
+@mock.patch("saleor.payment.gateways.adyen.webhooks.handle_authorization")
+def test_process_notification_task_handler_failed(
+    mocked_handler, notification, adyen_plugin, channel_USD
+):
+    # given
+    plugin = adyen_plugin()
+    notification = notification()
+    payment_notification = PaymentNotification.objects.create(
+        gateway=plugin.config.gateway_name,
+        psp_reference=notification["pspReference"],
+        event_kind="AUTHORISATION:true",
+        channel_slug=channel_USD.slug,
+        payload=notification,
+    )
+    error = ValueError("Handler failed")
+    mocked_handler.side_effect = error
+
+    # when
+    with (
+        mock.patch.dict(
+            "saleor.payment.gateways.adyen.webhooks.EVENT_MAP",
+            {"AUTHORISATION": mocked_handler},
+        ),
+        mock.patch.object(
+            process_notification_task, "retry", side_effect=Retry
+        ) as mocked_retry,
+        pytest.raises(Retry),
+    ):
+        process_notification_task(payment_notification.pk)
+
+    # then
+    mocked_retry.assert_called_once()
+    assert mocked_retry.call_args.kwargs["exc"] is error
+    payment_notification.refresh_from_db()
+    assert payment_notification.processed_at is None
+
+
+@mock.patch("saleor.payment.gateways.adyen.tasks.process_notification_task.delay")
+def test_queue_unprocessed_notifications_task(mocked_task, notification, channel_USD):
+    # given
+    notification = notification()
+    now = timezone.now()
+    notifications = PaymentNotification.objects.bulk_create(
+        [
+            PaymentNotification(
+                gateway="adyen",
+                psp_reference=notification["pspReference"],
+                event_kind=event_kind,
+                channel_slug=channel_USD.slug,
+                payload=notification,
+                processed_at=processed_at,
+            )
+            for event_kind, processed_at in [
+                ("AUTHORISATION:true", None),
+                ("CAPTURE:true", None),
+                ("REFUND:true", now),
+                ("CANCELLATION:true", None),
+            ]
+        ]
+    )
+    unprocessed, recent, processed, expired = notifications
+    PaymentNotification.objects.filter(pk__in=[unprocessed.pk, processed.pk]).update(
+        created_at=now - UNPROCESSED_NOTIFICATION_DELAY - timedelta(minutes=1)
+    )
+    PaymentNotification.objects.filter(pk=expired.pk).update(
+        created_at=now - timedelta(days=2)
+    )
+
+    # when
+    queue_unprocessed_notifications_task()
+
+    # then
+    mocked_task.assert_called_once_with(unprocessed.pk)
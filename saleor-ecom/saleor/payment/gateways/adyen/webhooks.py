@@ -14,6 +14,7 @@ import Adyen
 import graphene
 from django.contrib.auth.hashers import check_password
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.forms.models import model_to_dict
 from django.http import (
     HttpResponse,
@@ -23,6 +24,7 @@ from django.http import (
 )
 from django.http.request import HttpHeaders
 from django.http.response import HttpResponseRedirect
+from django.utils import timezone
 from graphql import GraphQLError
 
 from ....checkout.calculations import calculate_checkout_total_with_gift_cards
@@ -42,7 +44,7 @@ from ....order.actions import (
 )
 from ....order.events import external_notification_event
 from ....order.fetch import fetch_order_info
-from ....payment.models import Payment, Transaction
+from ....payment.models import Payment, PaymentNotification, Transaction
 from ....plugins.manager import get_plugins_manager
 from ... import ChargeStatus, PaymentError, TransactionKind, gateway
 from ...gateway import payment_refund_or_void
@@ -984,7 +986,15 @@ def validate_merchant_account(
 
 
 @transaction_with_commit_on_errors()
-def handle_webhook(request: SaleorContext, gateway_config: "GatewayConfig"):
+def handle_webhook(
+    request: SaleorContext, gateway_config: "GatewayConfig", channel_slug: str
+):
+    """Validate the notification received from Adyen and accept it.
+
+    The notifications with a PSP reference are stored, unique per PSP reference and
+    event kind, and processed by a Celery task, so the retried deliveries are
+    accepted without locking the payment again.
+    """
     try:
         json_data = json.loads(request.body)
     except JSONDecodeError:
@@ -1005,12 +1015,43 @@ def handle_webhook(request: SaleorContext, gateway_config: "GatewayConfig"):
         return HttpResponseBadRequest("Invalid or missing basic auth.")
 
     event_handler = EVENT_MAP.get(notification.get("eventCode", ""))
-    if event_handler:
+    if not event_handler:
+        return HttpResponse("[accepted]")
+    psp_reference = notification.get("pspReference")
+    if not psp_reference:
         event_handler(notification, gateway_config)
         return HttpResponse("[accepted]")
+
+    payment_notification, _ = PaymentNotification.objects.get_or_create(
+        gateway=gateway_config.gateway_name,
+        psp_reference=psp_reference,
+        event_kind=get_notification_event_kind(notification),
+        defaults={"channel_slug": channel_slug, "payload": notification},
+    )
+    if payment_notification.processed_at is None:
+        # Local import to avoid circular import between the plugin and webhooks.
+        from .tasks import process_notification_task
+
+        transaction.on_commit(
+            lambda: process_notification_task.delay(payment_notification.pk)
+        )
     return HttpResponse("[accepted]")
 
 
+def get_notification_event_kind(notification: dict[str, Any]) -> str:
+    return f"{notification.get('eventCode')}:{notification.get('success')}"
+
+
+def process_notification(
+    payment_notification: PaymentNotification, gateway_config: "GatewayConfig"
+):
+    notification = payment_notification.payload
+    event_handler = EVENT_MAP[notification["eventCode"]]
+    event_handler(notification, gateway_config)
+    payment_notification.processed_at = timezone.now()
+    payment_notification.save(update_fields=["processed_at"])
+
+
 class HttpResponseRedirectWithTrustedProtocol(HttpResponseRedirect):
     def __init__(self, redirect_to: str, *args, **kwargs) -> None:
         parsed = urlparse(redirect_to)
@@ -0,0 +1,49 @@
+# Generated by Django 4.2.30 on 2026-10-19 12:35
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payment", "0059_merge_20240802_1125"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PaymentNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("gateway", models.CharField(max_length=255)),
+                ("psp_reference", models.CharField(max_length=512)),
+                ("event_kind", models.CharField(max_length=255)),
+                ("channel_slug", models.CharField(max_length=255)),
+                (
+                    "payload",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ("pk",),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="paymentnotification",
+            constraint=models.UniqueConstraint(
+                fields=("gateway", "psp_reference", "event_kind"),
+                name="unique_payment_notification",
+            ),
+        ),
+    ]
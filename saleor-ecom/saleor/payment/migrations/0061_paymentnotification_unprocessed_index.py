@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-19 13:39
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("payment", "0060_paymentnotification"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="paymentnotification",
+            index=models.Index(
+                condition=models.Q(("processed_at__isnull", True)),
+                fields=["created_at"],
+                name="payment_notification_unproc",
+            ),
+        ),
+    ]
@@ -459,3 +459,35 @@ class Transaction(models.Model):
 
     def get_amount(self):
         return Money(self.amount, self.currency)
+
+
+class PaymentNotification(models.Model):
+    """Notification received from a payment gateway.
+
+    The notifications are unique per gateway, PSP reference and event kind, so
+    the retried deliveries of the same notification are not processed again.
+    """
+
+    gateway = models.CharField(max_length=255)
+    psp_reference = models.CharField(max_length=512)
+    event_kind = models.CharField(max_length=255)
+    channel_slug = models.CharField(max_length=255)
+    payload = JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("pk",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["gateway", "psp_reference", "event_kind"],
+                name="unique_payment_notification",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                name="payment_notification_unproc",
+                condition=models.Q(processed_at__isnull=True),
+            ),
+        ]
@@ -1,5 +1,6 @@
 import datetime
 import logging
+import time
 import uuid
 
 import graphene
@@ -7,6 +8,7 @@ from django.conf import settings
 from django.db import transaction
 from django.db.models import Exists, OuterRef, Q
 
+from ..app.models import App
 from ..celeryconf import app
 from ..channel.models import Channel
 from ..checkout import CheckoutAuthorizeStatus
@@ -14,6 +16,8 @@ from ..checkout.models import Checkout
 from ..core.db.connection import allow_writer
 from ..payment.models import TransactionEvent, TransactionItem
 from ..plugins.manager import get_plugins_manager
+from ..webhook.event_types import WebhookEventSyncType
+from ..webhook.transport.synchronous.transport import breaker_board
 from . import PaymentError, TransactionAction, TransactionEventType
 from .gateway import request_cancelation_action, request_refund_action
 
@@ -58,18 +62,83 @@ def transactions_to_release_funds():
     return transactions
 
 
+# The batch size of the next run of the funds release task is adjusted to keep
+# the run close to the target duration (in seconds).
+RELEASE_FUNDS_TARGET_DURATION = 30
+RELEASE_FUNDS_MAX_BATCH_SIZE = 1000
+
+
+def _get_apps_with_blocked_release_funds_webhooks(app_ids: set[int]) -> set[int]:
+    """Return IDs of the apps which release funds webhooks are blocked.
+
+    The webhooks are blocked by the circuit breaker, so the release requests for
+    the transactions of the apps are postponed until the breaker is closed.
+    """
+    if not breaker_board or not app_ids:
+        return set()
+    apps = App.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME).filter(
+        pk__in=app_ids
+    )
+    return {
+        app.pk
+        for app in apps
+        if breaker_board.is_webhook_blocked(
+            app, WebhookEventSyncType.TRANSACTION_CANCELATION_REQUESTED
+        )
+        or breaker_board.is_webhook_blocked(
+            app, WebhookEventSyncType.TRANSACTION_REFUND_REQUESTED
+        )
+    }
+
+
+def _get_transactions_data_to_release_funds(batch_size: int):
+    """Return pk, checkout ID and app ID of the transactions to release funds.
+
+    The transactions of the apps with the blocked webhooks are skipped.
+    """
+    blocked_app_ids: set[int] = set()
+    while True:
+        transactions = transactions_to_release_funds().order_by("modified_at")
+        if blocked_app_ids:
+            transactions = transactions.exclude(app_id__in=blocked_app_ids)
+        transactions_data = list(
+            transactions.values_list("pk", "checkout_id", "app_id")[:batch_size]
+        )
+        app_ids = {app_id for _, _, app_id in transactions_data if app_id}
+        new_blocked_app_ids = _get_apps_with_blocked_release_funds_webhooks(
+            app_ids - blocked_app_ids
+        )
+        if not new_blocked_app_ids:
+            return transactions_data
+        blocked_app_ids |= new_blocked_app_ids
+
+
+def _get_next_release_funds_batch_size(batch_size: int, duration: float) -> int:
+    estimated_size = int(
+        batch_size * RELEASE_FUNDS_TARGET_DURATION / max(duration, 1e-6)
+    )
+    # Change the batch size at most by a factor of two between the runs.
+    next_size = min(max(estimated_size, batch_size // 2), batch_size * 2)
+    return min(max(next_size, 1), RELEASE_FUNDS_MAX_BATCH_SIZE)
+
+
 @app.task
 @allow_writer()
-def transaction_release_funds_for_checkout_task():
-    TRANSACTION_BATCH_SIZE = int(settings.TRANSACTION_BATCH_FOR_RELEASING_FUNDS)
+def transaction_release_funds_for_checkout_task(batch_size: int | None = None):
+    """Release funds of the transactions for the abandoned checkouts.
+
+    The task re-queues itself with the batch size adjusted to the duration of the
+    run, until no transaction is left.
+    """
+    batch_size = batch_size or int(settings.TRANSACTION_BATCH_FOR_RELEASING_FUNDS)
+    start = time.monotonic()
 
     # Fetch transactions that are ready to release funds
-    transactions = transactions_to_release_funds().order_by("modified_at")
-    transactions_data = list(
-        transactions.values_list("pk", "checkout_id")[:TRANSACTION_BATCH_SIZE]
-    )
-    transaction_pks = [pk for pk, _checkout_id in transactions_data]
-    checkout_ids = [checkout_id for _, checkout_id in transactions_data]
+    transactions_data = _get_transactions_data_to_release_funds(batch_size)
+    if not transactions_data:
+        return
+    transaction_pks = [pk for pk, _checkout_id, _app_id in transactions_data]
+    checkout_ids = [checkout_id for _, checkout_id, _app_id in transactions_data]
 
     checkouts_data = Checkout.objects.filter(pk__in=checkout_ids).values_list(
         "pk", "channel_id"
@@ -84,15 +153,22 @@ def transaction_release_funds_for_checkout_task():
         checkout_id: channels_in_bulk[channel_id]
         for checkout_id, channel_id in checkouts_data
     }
-    if transaction_pks:
-        # Select_related app as, this will be used to trigger the proper webhook.
-        transactions = TransactionItem.objects.filter(
-            pk__in=transaction_pks,
-            order_id=None,  # type: ignore[misc]
-        ).select_related("app")
-        transactions_with_cancel_request_events = []
-        transactions_with_charge_request_events = []
 
+    transactions_with_cancel_request_events = []
+    transactions_with_charge_request_events = []
+    with transaction.atomic():
+        # Lock the transactions to avoid multiple automatic refund requests when
+        # the next run starts before the current one is finished. Select_related
+        # app as, this will be used to trigger the proper webhook.
+        transactions = (
+            TransactionItem.objects.select_for_update(of=("self",), skip_locked=True)
+            .filter(
+                pk__in=transaction_pks,
+                order_id=None,  # type: ignore[misc]
+                last_refund_success=True,
+            )
+            .select_related("app")
+        )
         for transaction_item in transactions:
             # If transaction is authorized we need to trigger the cancel event
             if transaction_item.authorized_value:
@@ -124,70 +200,105 @@ def transaction_release_funds_for_checkout_task():
             transactions_with_charge_request_events
             or transactions_with_cancel_request_events
         ):
-            with transaction.atomic():
-                TransactionEvent.objects.bulk_create(
-                    [event for _tr, event in transactions_with_cancel_request_events]
-                    + [event for _tr, event in transactions_with_charge_request_events]
-                )
-                # Mark transactions as not refundable to avoid multiple automatic
-                # refund requests
-                transactions.update(last_refund_success=False)
-
-            manager = get_plugins_manager(allow_replica=True)
-            for transaction_item, event in transactions_with_cancel_request_events:
-                channel = checkout_id_to_channel[transaction_item.checkout_id]
-                logger.info(
-                    "Releasing funds for transaction %s - canceling",
-                    transaction_item.token,
-                    extra={
-                        "transactionId": graphene.Node.to_global_id(
-                            "TransactionItem", transaction_item.pk
-                        )
-                    },
-                )
-                try:
-                    request_cancelation_action(
-                        request_event=event,
-                        cancel_value=event.amount_value,
-                        action=TransactionAction.CANCEL,
-                        channel_slug=channel.slug,
-                        user=None,
-                        app=None,
-                        transaction=transaction_item,
-                        manager=manager,
-                    )
-                except PaymentError as e:
-                    logger.warning(
-                        "Unable to cancel transaction %s. %s",
-                        transaction_item.token,
-                        str(e),
+            TransactionEvent.objects.bulk_create(
+                [event for _tr, event in transactions_with_cancel_request_events]
+                + [event for _tr, event in transactions_with_charge_request_events]
+            )
+            # Mark transactions as not refundable to avoid multiple automatic
+            # refund requests
+            TransactionItem.objects.filter(
+                pk__in={
+                    transaction_item.pk
+                    for transaction_item, _event in (
+                        transactions_with_cancel_request_events
+                        + transactions_with_charge_request_events
                     )
-            for transaction_item, event in transactions_with_charge_request_events:
-                channel = checkout_id_to_channel[transaction_item.checkout_id]
-                logger.info(
-                    "Releasing funds for transaction %s - refunding",
-                    transaction_item.token,
-                    extra={
-                        "transactionId": graphene.Node.to_global_id(
-                            "TransactionItem", transaction_item.pk
-                        )
-                    },
+                }
+            ).update(last_refund_success=False)
+
+    if not (
+        transactions_with_charge_request_events
+        or transactions_with_cancel_request_events
+    ):
+        logger.warning("No transactions to release funds.")
+        return
+
+    # The requests are sent to the apps by separate Celery tasks, so the apps
+    # receive them concurrently.
+    manager = get_plugins_manager(allow_replica=True)
+    for transaction_item, event in transactions_with_cancel_request_events:
+        channel = checkout_id_to_channel[transaction_item.checkout_id]
+        logger.info(
+            "Releasing funds for transaction %s - canceling",
+            transaction_item.token,
+            extra={
+                "transactionId": graphene.Node.to_global_id(
+                    "TransactionItem", transaction_item.pk
                 )
-                try:
-                    request_refund_action(
-                        request_event=event,
-                        refund_value=event.amount_value,
-                        channel_slug=channel.slug,
-                        user=None,
-                        app=None,
-                        transaction=transaction_item,
-                        manager=manager,
-                    )
-                except PaymentError as e:
-                    logger.warning(
-                        "Unable to refund transaction %s. %s",
-                        transaction_item.token,
-                        str(e),
-                    )
-        else:
-            logger.warning("No transactions to release funds.")
+            },
+        )
+        try:
+            request_cancelation_action(
+                request_event=event,
+                cancel_value=event.amount_value,
+                action=TransactionAction.CANCEL,
+                channel_slug=channel.slug,
+                user=None,
+                app=None,
+                transaction=transaction_item,
+                manager=manager,
+            )
+        except PaymentError as e:
+            logger.warning(
+                "Unable to cancel transaction %s. %s",
+                transaction_item.token,
+                str(e),
+            )
+    for transaction_item, event in transactions_with_charge_request_events:
+        channel = checkout_id_to_channel[transaction_item.checkout_id]
+        logger.info(
+            "Releasing funds for transaction %s - refunding",
+            transaction_item.token,
+            extra={
+                "transactionId": graphene.Node.to_global_id(
+                    "TransactionItem", transaction_item.pk
+                )
+            },
+        )
+        try:
+            request_refund_action(
+                request_event=event,
+                refund_value=event.amount_value,
+                channel_slug=channel.slug,
+                user=None,
+                app=None,
+                transaction=transaction_item,
+                manager=manager,
+            )
+        except PaymentError as e:
+            logger.warning(
+                "Unable to refund transaction %s. %s",
+                transaction_item.token,
+                str(e),
+            )
+
+    duration = time.monotonic() - start
+    if len(transactions_data) < batch_size:
+        logger.info(
+            "Released funds of %s transactions in %.2fs.",
+            len(transactions_data),
+            duration,
+        )
+        return
+
+    next_batch_size = _get_next_release_funds_batch_size(batch_size, duration)
+    logger.info(
+        "Released funds of %s transactions in %.2fs (%.1f transactions/s), "
+        "%s transactions left.",
+        len(transactions_data),
+        duration,
+        len(transactions_data) / max(duration, 1e-6),
+        transactions_to_release_funds().count(),
+        extra={"batch_size": batch_size, "next_batch_size": next_batch_size},
+    )
+    transaction_release_funds_for_checkout_task.delay(batch_size=next_batch_size)
@@ -7,7 +7,12 @@ from freezegun import freeze_time
 from ...checkout import CheckoutAuthorizeStatus, CheckoutChargeStatus
 from ...checkout.actions import transaction_amounts_for_checkout_updated
 from .. import TransactionAction, TransactionEventType
-from ..tasks import transaction_release_funds_for_checkout_task
+from ..models import TransactionItem
+from ..tasks import (
+    RELEASE_FUNDS_MAX_BATCH_SIZE,
+    _get_next_release_funds_batch_size,
+    transaction_release_funds_for_checkout_task,
+)
 
 
 @mock.patch("saleor.payment.tasks.request_cancelation_action")
@@ -447,3 +452,127 @@ def test_transaction_release_funds_for_checkout_task_transaction_with_charge(
     )
     transaction_item.refresh_from_db()
     assert transaction_item.last_refund_success is False
+
+
+@mock.patch("saleor.payment.tasks.transaction_release_funds_for_checkout_task.delay")
+@mock.patch("saleor.payment.tasks.request_cancelation_action")
+@mock.patch("saleor.payment.tasks.request_refund_action")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_for_checkout_task_requeues_next_batch(
+    mocked_refund_action,
+    mocked_cancel_action,
+    mocked_task_delay,
+    checkouts_list,
+    settings,
+    transaction_item_generator,
+    plugins_manager,
+):
+    # given
+    settings.TRANSACTION_BATCH_FOR_RELEASING_FUNDS = 1
+    ttl_time = (
+        datetime.datetime.now(tz=datetime.UTC)
+        - settings.CHECKOUT_TTL_BEFORE_RELEASING_FUNDS
+    )
+    time_after_ttl = ttl_time - datetime.timedelta(seconds=1)
+    transaction_items = []
+    with freeze_time(time_after_ttl):
+        for checkout in checkouts_list[-2:]:
+            transaction_item = transaction_item_generator(
+                checkout_id=checkout.pk,
+                charged_value=Decimal(100),
+            )
+            transaction_amounts_for_checkout_updated(
+                transaction_item, plugins_manager, user=None, app=None
+            )
+            checkout.automatically_refundable = True
+            checkout.save(update_fields=["automatically_refundable", "last_change"])
+            transaction_items.append(transaction_item)
+
+    # when
+    transaction_release_funds_for_checkout_task()
+
+    # then
+    assert mocked_refund_action.call_count == 1
+    assert not mocked_cancel_action.called
+    mocked_task_delay.assert_called_once_with(batch_size=2)
+    last_refund_success = {
+        transaction_item.pk: transaction_item.last_refund_success
+        for transaction_item in TransactionItem.objects.filter(
+            pk__in=[transaction_item.pk for transaction_item in transaction_items]
+        )
+    }
+    assert sorted(last_refund_success.values()) == [False, True]
+
+
+@mock.patch("saleor.payment.tasks.breaker_board")
+@mock.patch("saleor.payment.tasks.request_cancelation_action")
+@mock.patch("saleor.payment.tasks.request_refund_action")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_for_checkout_task_app_with_open_breaker(
+    mocked_refund_action,
+    mocked_cancel_action,
+    mocked_breaker_board,
+    checkouts_list,
+    settings,
+    transaction_item_generator,
+    plugins_manager,
+    app,
+):
+    # given
+    mocked_breaker_board.is_webhook_blocked.return_value = True
+    ttl_time = (
+        datetime.datetime.now(tz=datetime.UTC)
+        - settings.CHECKOUT_TTL_BEFORE_RELEASING_FUNDS
+    )
+    time_after_ttl = ttl_time - datetime.timedelta(seconds=1)
+    blocked_checkout, checkout = checkouts_list[-2:]
+    with freeze_time(time_after_ttl):
+        blocked_transaction_item = transaction_item_generator(
+            checkout_id=blocked_checkout.pk,
+            charged_value=Decimal(100),
+            app=app,
+        )
+        transaction_item = transaction_item_generator(
+            checkout_id=checkout.pk,
+            charged_value=Decimal(100),
+        )
+        for item, item_checkout in [
+            (blocked_transaction_item, blocked_checkout),
+            (transaction_item, checkout),
+        ]:
+            transaction_amounts_for_checkout_updated(
+                item, plugins_manager, user=None, app=None
+            )
+            item_checkout.automatically_refundable = True
+            item_checkout.save(
+                update_fields=["automatically_refundable", "last_change"]
+            )
+
+    # when
+    transaction_release_funds_for_checkout_task()
+
+    # then
+    assert not mocked_cancel_action.called
+    mocked_refund_action.assert_called_once()
+    assert mocked_refund_action.call_args.kwargs["transaction"] == transaction_item
+    blocked_transaction_item.refresh_from_db()
+    assert blocked_transaction_item.last_refund_success is True
+    assert not blocked_transaction_item.events.filter(
+        type=TransactionEventType.REFUND_REQUEST
+    ).exists()
+    transaction_item.refresh_from_db()
+    assert transaction_item.last_refund_success is False
+
+
+def test_get_next_release_funds_batch_size():
+    # when
+    fast_run_size = _get_next_release_funds_batch_size(100, 1)
+    slow_run_size = _get_next_release_funds_batch_size(100, 600)
+    target_run_size = _get_next_release_funds_batch_size(100, 40)
+    max_size = _get_next_release_funds_batch_size(RELEASE_FUNDS_MAX_BATCH_SIZE, 1)
+
+    # then
+    assert fast_run_size == 200
+    assert slow_run_size == 50
+    assert target_run_size == 75
+    assert max_size == RELEASE_FUNDS_MAX_BATCH_SIZE
@@ -10,7 +10,7 @@ from ...checkout import CheckoutAuthorizeStatus
 from ...checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ...order import OrderAuthorizeStatus, OrderChargeStatus, OrderGrantedRefundStatus
 from ...plugins.manager import get_plugins_manager
-from .. import TransactionEventType
+from .. import ChargeStatus, TransactionEventType, TransactionKind
 from ..interface import (
     PaymentLineData,
     PaymentLinesData,
@@ -31,6 +31,7 @@ from ..utils import (
     parse_transaction_action_data,
     recalculate_refundable_for_checkout,
     try_void_or_refund_inactive_payment,
+    update_payment_charge_status,
 )
 
 
@@ -234,6 +235,27 @@ def test_try_void_or_refund_inactive_payment_transaction_success(
     assert refund_or_void_mock.called
 
 
+def test_update_payment_charge_status_pending_updates_order(payment_dummy):
+    # given
+    order = payment_dummy.order
+    order.last_payment_charge_status = ChargeStatus.NOT_CHARGED
+    order.save(update_fields=["last_payment_charge_status"])
+    transaction = payment_dummy.transactions.create(
+        amount=payment_dummy.total,
+        currency=payment_dummy.currency,
+        kind=TransactionKind.PENDING,
+        gateway_response={},
+        is_success=True,
+    )
+
+    # when
+    update_payment_charge_status(payment_dummy, transaction)
+
+    # then
+    order.refresh_from_db()
+    assert order.last_payment_charge_status == ChargeStatus.PENDING
+
+
 def test_parse_transaction_action_data_with_only_psp_reference():
     # given
     expected_psp_reference = "psp:122:222"
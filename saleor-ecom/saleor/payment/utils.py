@@ -33,6 +33,7 @@ from ..order.search import update_order_search_vector
 from ..order.utils import (
     calculate_order_granted_refund_status,
     update_order_authorize_data,
+    update_order_last_payment_charge_status,
     updates_amounts_for_order,
 )
 from ..plugins.manager import PluginsManager, get_plugins_manager
@@ -620,6 +621,8 @@ def update_payment_charge_status(payment, transaction, changed_fields=None):
     transaction.save(update_fields=["already_processed"])
     if "captured_amount" in changed_fields and payment.order_id:
         updates_amounts_for_order(payment.order)
+    elif "charge_status" in changed_fields and payment.order_id:
+        update_order_last_payment_charge_status(payment.order)
     if transaction_kind == TransactionKind.AUTH and payment.order_id:
         update_order_authorize_data(payment.order)
 
@@ -1206,6 +1209,7 @@ def update_order_with_transaction_details(transaction: TransactionItem):
             update_fields=[
                 "total_charged_amount",
                 "charge_status",
+                "payment_status",
                 "updated_at",
                 "total_authorized_amount",
                 "authorize_status",
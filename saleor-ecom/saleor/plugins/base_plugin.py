@@ -623,6 +623,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     customer_updated: Callable[["User", Any, None], Any]
 
+    # Trigger when users are updated in bulk.
+    #
+    # Overwrite this method if you need to trigger specific logic after users are
+    # updated with a single bulk mutation.
+    #
+    # Note: This method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    customers_updated: Callable[[list["User"], Any, None], Any]
+
     # Trigger when user metadata is updated.
     #
     # Overwrite this method if you need to trigger specific logic after a user
@@ -1001,6 +1010,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     order_expired: Callable[["Order", Any, None], Any]
 
+    # Trigger when orders are expired in bulk.
+    #
+    # Overwrite this method if you need to trigger specific logic when many orders
+    # of the same channel are expired at once.
+    #
+    # Note: This method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    orders_expired: Callable[[list["Order"], Any, None], Any]
+
     # Trigger when order is confirmed by staff.
     #
     # Overwrite this method if you need to trigger specific logic after an order is
@@ -1070,6 +1088,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     order_updated: Callable[["Order", Any, None], Any]
 
+    # Trigger when orders are updated in bulk.
+    #
+    # Overwrite this method if you need to trigger specific logic when many orders
+    # of the same channel are changed at once.
+    #
+    # Note: This method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    orders_updated: Callable[[list["Order"], Any, None], Any]
+
     # Trigger when order metadata is updated.
     #
     # Overwrite this method if you need to trigger specific logic when an order
@@ -1256,6 +1283,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     product_created: Callable[["Product", Any, None], Any]
 
+    # Trigger when products are created in bulk.
+    #
+    # Overwrite this method if you need to trigger specific logic after products are
+    # created with a single bulk mutation.
+    #
+    # Note: This method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    products_created: Callable[[list["Product"], Any, None], Any]
+
     # Trigger when product is deleted.
     #
     # Overwrite this method if you need to trigger specific logic after a product is
@@ -1319,6 +1355,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     product_variant_created: Callable[["ProductVariant", Any, None], Any]
 
+    # Trigger when product variants are created in bulk.
+    #
+    # Overwrite this method if you need to trigger specific logic after product
+    # variants are created with a single bulk mutation.
+    #
+    # Note: This method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    product_variants_created: Callable[[list["ProductVariant"], Any, None], Any]
+
     # Trigger when product variant is deleted.
     #
     # Overwrite this method if you need to trigger specific logic after a product
@@ -1337,6 +1382,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     product_variant_updated: Callable[["ProductVariant", Any, None], Any]
 
+    # Trigger when product variants are updated in bulk.
+    #
+    # Overwrite this method if you need to trigger specific logic after product
+    # variants are updated with a single bulk mutation.
+    #
+    # Note: This method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    product_variants_updated: Callable[[list["ProductVariant"], Any, None], Any]
+
     # Trigger when product variant metadata is updated.
     #
     # Overwrite this method if you need to trigger specific logic after a product
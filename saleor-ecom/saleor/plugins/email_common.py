@@ -2,10 +2,15 @@ import logging
 import operator
 import os
 import re
-from collections.abc import Callable
-from dataclasses import asdict, dataclass
+import smtplib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, astuple, dataclass
 from decimal import Decimal, InvalidOperation
 from email.headerregistry import Address
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import dateutil.parser
@@ -13,7 +18,7 @@ import i18naddress
 import pybars
 from babel.numbers import format_currency
 from django.core.exceptions import ValidationError
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, send_mail
 from django.core.mail.backends.smtp import EmailBackend
 from django.core.validators import EmailValidator
 from django_prices.utils.locale import get_locale_data
@@ -40,6 +45,11 @@ DEFAULT_TEMPLATE_HELP_TEXT = (
 DEFAULT_SUBJECT_HELP_TEXT = "An email subject built with Handlebars template language."
 DEFAULT_EMAIL_VALUE = "DEFAULT"
 DEFAULT_EMAIL_TIMEOUT = 5
+# Seconds after which an unused SMTP connection is opened again before sending.
+SMTP_CONNECTION_MAX_IDLE_TIME = 60
+COMPILED_TEMPLATES_CACHE_SIZE = 128
+# Maximum number of SMTP connections kept open by the worker process.
+EMAIL_BACKENDS_CACHE_SIZE = 32
 
 
 @dataclass
@@ -203,26 +213,91 @@ def get_plain_text_message_for_email(message: str) -> str:
     return plain_text
 
 
-def send_email(
-    config: EmailConfig, recipient_list, context, subject="", template_str=""
-):
-    sender_name = config.sender_name or ""
-    sender_address = config.sender_address
+class PooledEmailBackend(EmailBackend):
+    """SMTP email backend keeping the connection open between the sends.
+
+    Opening a connection requires the TCP and TLS handshakes and logging in, which
+    takes longer than sending a message. The connection is checked before it is
+    reused and opened again when it was idle for too long or the server closed it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_used = 0.0
+
+    def send_messages(self, email_messages):
+        if not email_messages:
+            return 0
+        with self._lock:
+            self.ensure_connection()
+            sent = super().send_messages(email_messages)
+            self.last_used = time.monotonic()
+            return sent
+
+    def ensure_connection(self):
+        if self.connection:
+            if time.monotonic() - self.last_used > SMTP_CONNECTION_MAX_IDLE_TIME:
+                self.close()
+            else:
+                try:
+                    self.connection.noop()
+                except smtplib.SMTPException:
+                    self.close()
+        # The connection is opened before sending, so `send_messages` doesn't close
+        # it after the messages are sent.
+        self.open()
+
+    def close(self):
+        with self._lock:
+            super().close()
+
+
+_email_backends: OrderedDict[tuple, PooledEmailBackend] = OrderedDict()
+_email_backends_lock = threading.Lock()
+
+
+def get_email_backend(config: EmailConfig) -> PooledEmailBackend:
+    """Return the email backend of the worker process for the given config.
+
+    The backends are kept for the most recently used configs; the connection of
+    the evicted backend is closed.
+    """
+    key = astuple(config)
+    evicted_email_backend = None
+    with _email_backends_lock:
+        email_backend = _email_backends.get(key)
+        if email_backend is None:
+            email_backend = PooledEmailBackend(
+                host=config.host,
+                port=config.port,
+                username=config.username,
+                password=config.password,
+                use_ssl=config.use_ssl,
+                use_tls=config.use_tls,
+                timeout=DEFAULT_EMAIL_TIMEOUT,
+            )
+            _email_backends[key] = email_backend
+            if len(_email_backends) > EMAIL_BACKENDS_CACHE_SIZE:
+                _, evicted_email_backend = _email_backends.popitem(last=False)
+        else:
+            _email_backends.move_to_end(key)
+    if evicted_email_backend:
+        evicted_email_backend.close()
+    return email_backend
 
-    from_email = str(Address(sender_name, addr_spec=sender_address))
 
-    email_backend = EmailBackend(
-        host=config.host,
-        port=config.port,
-        username=config.username,
-        password=config.password,
-        use_ssl=config.use_ssl,
-        use_tls=config.use_tls,
-        timeout=DEFAULT_EMAIL_TIMEOUT,
-    )
-    compiler = pybars.Compiler()
-    template = compiler.compile(template_str)
-    subject_template = compiler.compile(subject)
+@lru_cache(maxsize=COMPILED_TEMPLATES_CACHE_SIZE)
+def compile_template(template_str: str):
+    """Return the compiled Handlebars template.
+
+    The templates are compiled to Python code, which is much slower than rendering
+    them, so the compiled templates are cached for the worker process.
+    """
+    return pybars.Compiler().compile(template_str)
+
+
+def render_email(context, subject="", template_str=""):
+    """Return the rendered subject and HTML message of the email."""
     helpers = {
         "format_address": format_address,
         "price": price,
@@ -230,18 +305,58 @@ def send_email(
         "get_product_image_thumbnail": get_product_image_thumbnail,
         "compare": compare,
     }
-    message = template(context, helpers=helpers)
-    subject_message = subject_template(context, helpers)
+    message = compile_template(template_str)(context, helpers=helpers)
+    subject_message = compile_template(subject)(context, helpers)
+    return subject_message, message
+
+
+def get_from_email(config: EmailConfig) -> str:
+    sender_name = config.sender_name or ""
+    return str(Address(sender_name, addr_spec=config.sender_address))
+
+
+def send_email(
+    config: EmailConfig, recipient_list, context, subject="", template_str=""
+):
+    subject_message, message = render_email(context, subject, template_str)
     send_mail(
         subject_message,
         get_plain_text_message_for_email(message),
-        from_email,
+        get_from_email(config),
         recipient_list,
         html_message=message,
-        connection=email_backend,
+        connection=get_email_backend(config),
     )
 
 
+def send_emails(
+    config: EmailConfig,
+    emails: Iterable[tuple[list[str], Any]],
+    subject="",
+    template_str="",
+) -> int:
+    """Send the emails rendered from the same template over a single connection.
+
+    `emails` is an iterable of the recipient lists and contexts of the emails.
+    Return the number of sent emails.
+    """
+    from_email = get_from_email(config)
+    email_backend = get_email_backend(config)
+    email_messages = []
+    for recipient_list, context in emails:
+        subject_message, message = render_email(context, subject, template_str)
+        email_message = EmailMultiAlternatives(
+            subject_message,
+            get_plain_text_message_for_email(message),
+            from_email,
+            recipient_list,
+            connection=email_backend,
+        )
+        email_message.attach_alternative(message, "text/html")
+        email_messages.append(email_message)
+    return email_backend.send_messages(email_messages)
+
+
 def validate_email_config(config: EmailConfig):
     email_backend = EmailBackend(
         host=config.host,
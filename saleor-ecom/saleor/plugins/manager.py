@@ -722,6 +722,18 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def customers_updated(self, customers: list["User"], webhooks=None):
+        default_value = None
+        return self.__run_method_on_plugins(
+            "customers_updated",
+            default_value,
+            customers,
+            webhooks=webhooks,
+            channel_slug=None,
+        )
+
     # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
     # Webhook-related functionality will be moved from plugin to core modules.
     def customer_metadata_updated(self, customer: "User", webhooks=None):
@@ -782,6 +794,18 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def products_created(self, products: list["Product"], webhooks=None):
+        default_value = None
+        return self.__run_method_on_plugins(
+            "products_created",
+            default_value,
+            products,
+            webhooks=webhooks,
+            channel_slug=None,
+        )
+
     # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
     # Webhook-related functionality will be moved from plugin to core modules.
     def product_updated(self, product: "Product", webhooks=None):
@@ -851,6 +875,20 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def product_variants_created(
+        self, product_variants: list["ProductVariant"], webhooks=None
+    ):
+        default_value = None
+        return self.__run_method_on_plugins(
+            "product_variants_created",
+            default_value,
+            product_variants,
+            webhooks=webhooks,
+            channel_slug=None,
+        )
+
     # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
     # Webhook-related functionality will be moved from plugin to core modules.
     def product_variant_updated(
@@ -866,6 +904,21 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def product_variants_updated(
+        self, product_variants: list["ProductVariant"], webhooks=None, **kwargs
+    ):
+        default_value = None
+        return self.__run_method_on_plugins(
+            "product_variants_updated",
+            default_value,
+            product_variants,
+            webhooks=webhooks,
+            **kwargs,
+            channel_slug=None,
+        )
+
     # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
     # Webhook-related functionality will be moved from plugin to core modules.
     def product_variant_deleted(self, product_variant: "ProductVariant", webhooks=None):
@@ -1216,6 +1269,18 @@ class PluginsManager(PaymentInterface):
             webhooks=webhooks,
         )
 
+    # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def orders_updated(self, orders: list["Order"], channel_slug: str, webhooks=None):
+        default_value = None
+        return self.__run_method_on_plugins(
+            "orders_updated",
+            default_value,
+            orders,
+            channel_slug=channel_slug,
+            webhooks=webhooks,
+        )
+
     # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
     # Webhook-related functionality will be moved from plugin to core modules.
     def order_cancelled(self, order: "Order", webhooks=None):
@@ -1240,6 +1305,18 @@ class PluginsManager(PaymentInterface):
             webhooks=webhooks,
         )
 
+    # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def orders_expired(self, orders: list["Order"], channel_slug: str, webhooks=None):
+        default_value = None
+        return self.__run_method_on_plugins(
+            "orders_expired",
+            default_value,
+            orders,
+            channel_slug=channel_slug,
+            webhooks=webhooks,
+        )
+
     # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
     # Webhook-related functionality will be moved from plugin to core modules.
     def order_fulfilled(self, order: "Order", webhooks=None):
@@ -1,16 +1,23 @@
 import json
+import smtplib
+from collections import OrderedDict
+from dataclasses import astuple
 from unittest.mock import ANY, patch
 
+import pybars
 import pytest
 from django.core.exceptions import ValidationError
 
 from ...order.notifications import get_image_payload
+from .. import email_common
 from ..email_common import (
     DEFAULT_EMAIL_CONFIGURATION,
     EmailConfig,
+    compile_template,
     get_plain_text_message_for_email,
     get_product_image_thumbnail,
     send_email,
+    send_emails,
     validate_default_email_configuration,
 )
 from ..error_codes import PluginErrorCode
@@ -188,3 +195,126 @@ def test_send_email(mocked_send_mail, mocked_get_plain_text):
         html_message=email_content,
         connection=ANY,
     )
+
+
+@pytest.fixture
+def mocked_smtp(monkeypatch):
+    monkeypatch.setattr(email_common, "_email_backends", OrderedDict())
+    with patch("django.core.mail.backends.smtp.smtplib.SMTP") as mocked_smtp:
+        yield mocked_smtp
+
+
+def test_send_email_reuses_connection(mocked_smtp):
+    # given
+    config = EmailConfig(host="localhost", sender_address="dummy@localhost.com")
+
+    # when
+    send_email(config, ["dummy2@localhost.com"], {}, "Subject", "<html>1</html>")
+    send_email(config, ["dummy3@localhost.com"], {}, "Subject", "<html>2</html>")
+
+    # then
+    mocked_smtp.assert_called_once()
+    connection = mocked_smtp.return_value
+    assert connection.sendmail.call_count == 2
+    connection.noop.assert_called_once()
+    connection.quit.assert_not_called()
+
+
+def test_send_email_reopens_idle_connection(mocked_smtp, monkeypatch):
+    # given
+    monkeypatch.setattr(email_common, "SMTP_CONNECTION_MAX_IDLE_TIME", -1)
+    config = EmailConfig(host="localhost", sender_address="dummy@localhost.com")
+
+    # when
+    send_email(config, ["dummy2@localhost.com"], {}, "Subject", "<html>1</html>")
+    send_email(config, ["dummy3@localhost.com"], {}, "Subject", "<html>2</html>")
+
+    # then
+    assert mocked_smtp.call_count == 2
+    mocked_smtp.return_value.quit.assert_called_once()
+
+
+def test_send_email_reopens_connection_closed_by_server(mocked_smtp):
+    # given
+    config = EmailConfig(host="localhost", sender_address="dummy@localhost.com")
+    send_email(config, ["dummy2@localhost.com"], {}, "Subject", "<html>1</html>")
+    mocked_smtp.return_value.noop.side_effect = smtplib.SMTPServerDisconnected
+
+    # when
+    send_email(config, ["dummy3@localhost.com"], {}, "Subject", "<html>2</html>")
+
+    # then
+    assert mocked_smtp.call_count == 2
+    assert mocked_smtp.return_value.sendmail.call_count == 2
+
+
+def test_send_email_uses_connection_per_config(mocked_smtp):
+    # given
+    config = EmailConfig(host="localhost", sender_address="dummy@localhost.com")
+    other_config = EmailConfig(host="other", sender_address="dummy@localhost.com")
+
+    # when
+    send_email(config, ["dummy2@localhost.com"], {}, "Subject", "<html>1</html>")
+    send_email(other_config, ["dummy2@localhost.com"], {}, "Subject", "<html>1</html>")
+
+    # then
+    assert [call.args[0] for call in mocked_smtp.call_args_list] == [
+        "localhost",
+        "other",
+    ]
+
+
+def test_send_email_closes_evicted_connection(mocked_smtp, monkeypatch):
+    # given
+    monkeypatch.setattr(email_common, "EMAIL_BACKENDS_CACHE_SIZE", 1)
+    config = EmailConfig(host="localhost", sender_address="dummy@localhost.com")
+    other_config = EmailConfig(host="other", sender_address="dummy@localhost.com")
+    send_email(config, ["dummy2@localhost.com"], {}, "Subject", "<html>1</html>")
+
+    # when
+    send_email(other_config, ["dummy2@localhost.com"], {}, "Subject", "<html>1</html>")
+
+    # then
+    assert list(email_common._email_backends) == [astuple(other_config)]
+    assert mocked_smtp.call_count == 2
+    mocked_smtp.return_value.quit.assert_called_once()
+
+
+def test_send_emails(mocked_smtp):
+    # given
+    config = EmailConfig(host="localhost", sender_address="dummy@localhost.com")
+    emails = [
+        (["dummy2@localhost.com"], {"name": "First"}),
+        (["dummy3@localhost.com"], {"name": "Second"}),
+    ]
+
+    # when
+    sent = send_emails(config, emails, "Hello {{name}}", "<html>{{name}}</html>")
+
+    # then
+    assert sent == 2
+    mocked_smtp.assert_called_once()
+    sendmail_calls = mocked_smtp.return_value.sendmail.call_args_list
+    assert [call.args[1] for call in sendmail_calls] == [
+        ["dummy2@localhost.com"],
+        ["dummy3@localhost.com"],
+    ]
+    assert "Subject: Hello First" in sendmail_calls[0].args[2].decode()
+    assert "Subject: Hello Second" in sendmail_calls[1].args[2].decode()
+
+
+def test_compile_template_is_cached():
+    # given
+    template_str = "<html>{{name}} compile_template_is_cached</html>"
+
+    # when
+    with patch(
+        "saleor.plugins.email_common.pybars.Compiler", wraps=pybars.Compiler
+    ) as mocked_compiler:
+        first = compile_template(template_str)
+        second = compile_template(template_str)
+
+    # then
+    assert first is second
+    mocked_compiler.assert_called_once()
+    assert first({"name": "Test"}) == "<html>Test compile_template_is_cached</html>"
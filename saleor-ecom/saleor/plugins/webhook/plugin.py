@@ -4,7 +4,7 @@ from collections import defaultdict
 from collections.abc import Callable, Iterable
 from decimal import Decimal
 from functools import partial
-from typing import TYPE_CHECKING, Any, Final, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import graphene
 from django.conf import settings
@@ -102,9 +102,8 @@ from ...webhook.transport.list_stored_payment_methods import (
     invalidate_cache_for_stored_payment_methods,
 )
 from ...webhook.transport.shipping import (
-    get_cache_data_for_shipping_list_methods_for_checkout,
     get_excluded_shipping_data,
-    parse_list_shipping_methods_response,
+    request_shipping_methods_for_checkout,
 )
 from ...webhook.transport.synchronous.transport import (
     trigger_all_webhooks_sync,
@@ -154,12 +153,6 @@ if TYPE_CHECKING:
     from ...webhook.models import Webhook
 
 
-# Set the timeout for the shipping methods cache to 12 hours as it was the lowest
-# time labels were valid for when checking documentation for the carriers
-# (FedEx, UPS, TNT, DHL).
-CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT: Final[int] = 3600 * 12
-
-
 logger = logging.getLogger(__name__)
 
 
@@ -256,6 +249,47 @@ class WebhookPlugin(BasePlugin):
     def trigger_webhooks_async(self, *args, **kwargs):
         return trigger_webhooks_async(*args, **kwargs, allow_replica=self.allow_replica)  # type: ignore[misc]
 
+    def _trigger_webhooks_for_multiple_objects(
+        self, event_type, objects, payload_generator, webhooks=None, **kwargs
+    ):
+        """Trigger the event for all objects with the deliveries created in bulk."""
+        if not objects:
+            return
+        if webhooks := self._get_webhooks_for_event(event_type, webhooks):
+            trigger_webhooks_async_for_multiple_objects(
+                event_type,
+                webhooks,
+                webhook_payloads_data=[
+                    WebhookPayloadData(
+                        subscribable_object=obj,
+                        legacy_data_generator=partial(
+                            payload_generator, obj, self.requestor
+                        ),
+                    )
+                    for obj in objects
+                ],
+                requestor=self.requestor,
+                allow_replica=self.allow_replica,
+                **kwargs,
+            )
+
+    def _trigger_order_webhooks_for_multiple_objects(
+        self, event_type, orders, webhooks=None
+    ):
+        """Trigger the event for orders of the same channel in bulk."""
+        if not orders:
+            return
+        if webhooks := self._get_webhooks_for_order_events(
+            event_type, orders[0], webhooks
+        ):
+            self._trigger_webhooks_for_multiple_objects(
+                event_type,
+                orders,
+                generate_order_payload,
+                webhooks=webhooks,
+                queue=settings.ORDER_WEBHOOK_EVENTS_CELERY_QUEUE_NAME,
+            )
+
     def account_confirmed(self, user: "User", previous_value: None) -> None:
         if not self.active:
             return previous_value
@@ -1024,6 +1058,16 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def orders_updated(
+        self, orders: list["Order"], previous_value: None, webhooks=None
+    ) -> None:
+        if not self.active:
+            return previous_value
+        self._trigger_order_webhooks_for_multiple_objects(
+            WebhookEventAsyncType.ORDER_UPDATED, orders, webhooks=webhooks
+        )
+        return previous_value
+
     def order_expired(
         self, order: "Order", previous_value: None, webhooks=None
     ) -> None:
@@ -1045,6 +1089,16 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def orders_expired(
+        self, orders: list["Order"], previous_value: None, webhooks=None
+    ) -> None:
+        if not self.active:
+            return previous_value
+        self._trigger_order_webhooks_for_multiple_objects(
+            WebhookEventAsyncType.ORDER_EXPIRED, orders, webhooks=webhooks
+        )
+        return previous_value
+
     def sale_created(
         self,
         sale: "Promotion",
@@ -1651,6 +1705,19 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def customers_updated(
+        self, customers: list["User"], previous_value: None, webhooks=None
+    ) -> None:
+        if not self.active:
+            return previous_value
+        self._trigger_webhooks_for_multiple_objects(
+            WebhookEventAsyncType.CUSTOMER_UPDATED,
+            customers,
+            generate_customer_payload,
+            webhooks=webhooks,
+        )
+        return previous_value
+
     def customer_deleted(
         self, customer: "User", previous_value: None, webhooks=None
     ) -> None:
@@ -1771,6 +1838,19 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def products_created(
+        self, products: list["Product"], previous_value: None, webhooks=None
+    ) -> None:
+        if not self.active:
+            return previous_value
+        self._trigger_webhooks_for_multiple_objects(
+            WebhookEventAsyncType.PRODUCT_CREATED,
+            products,
+            generate_product_payload,
+            webhooks=webhooks,
+        )
+        return previous_value
+
     def product_updated(
         self, product: "Product", previous_value: None, webhooks=None
     ) -> None:
@@ -1911,6 +1991,24 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def product_variants_created(
+        self,
+        product_variants: list["ProductVariant"],
+        previous_value: None,
+        webhooks=None,
+    ) -> None:
+        if not self.active:
+            return previous_value
+        self._trigger_webhooks_for_multiple_objects(
+            WebhookEventAsyncType.PRODUCT_VARIANT_CREATED,
+            product_variants,
+            lambda variant, requestor: generate_product_variant_payload(
+                [variant], requestor
+            ),
+            webhooks=webhooks,
+        )
+        return previous_value
+
     def product_variant_updated(
         self,
         product_variant: "ProductVariant",
@@ -1936,6 +2034,26 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def product_variants_updated(
+        self,
+        product_variants: list["ProductVariant"],
+        previous_value: None,
+        webhooks=None,
+        **kwargs,
+    ) -> None:
+        if not self.active:
+            return previous_value
+        self._trigger_webhooks_for_multiple_objects(
+            WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED,
+            product_variants,
+            lambda variant, requestor: generate_product_variant_payload(
+                [variant], requestor
+            ),
+            webhooks=webhooks,
+            **kwargs,
+        )
+        return previous_value
+
     def product_variant_deleted(
         self, product_variant: "ProductVariant", previous_value: None, webhooks=None
     ) -> None:
@@ -3488,31 +3606,18 @@ class WebhookPlugin(BasePlugin):
     def get_shipping_methods_for_checkout(
         self, checkout: "Checkout", previous_value: Any
     ) -> list["ShippingMethodData"]:
-        methods = []
         event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
         webhooks = get_webhooks_for_event(event_type)
-        if webhooks:
-            payload = generate_checkout_payload(checkout, self.requestor)
-            cache_data = get_cache_data_for_shipping_list_methods_for_checkout(payload)
-            for webhook in webhooks:
-                response_data = trigger_webhook_sync_if_not_cached(
-                    event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    payload=payload,
-                    webhook=webhook,
-                    cache_data=cache_data,
-                    allow_replica=self.allow_replica,
-                    subscribable_object=checkout,
-                    request_timeout=WEBHOOK_SYNC_TIMEOUT,
-                    cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    requestor=self.requestor,
-                )
-
-                if response_data:
-                    shipping_methods = parse_list_shipping_methods_response(
-                        response_data, webhook.app
-                    )
-                    methods.extend(shipping_methods)
-        return methods
+        if not webhooks:
+            return []
+        get_shipping_methods = request_shipping_methods_for_checkout(
+            checkout,
+            webhooks,
+            allow_replica=self.allow_replica,
+            requestor=self.requestor,
+            in_background=len(webhooks) > 1,
+        )
+        return get_shipping_methods()
 
     def get_tax_code_from_object_meta(
         self,
@@ -4,13 +4,13 @@ from unittest import mock
 
 from django.utils import timezone
 
+from ....webhook.const import CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.payloads import generate_checkout_payload
 from ....webhook.transport.shipping import (
     get_cache_data_for_shipping_list_methods_for_checkout,
 )
 from ....webhook.transport.utils import generate_cache_key_for_webhook
-from ..plugin import CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT
 
 
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
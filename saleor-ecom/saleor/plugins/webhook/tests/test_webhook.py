@@ -334,6 +334,33 @@ def test_customer_updated(
     )
 
 
+@mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
+@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async_for_multiple_objects")
+def test_customers_updated(
+    mocked_webhook_trigger,
+    mocked_get_webhooks_for_event,
+    any_webhook,
+    settings,
+    customer_users,
+):
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    manager = get_plugins_manager(allow_replica=False)
+    manager.customers_updated(customer_users)
+
+    mocked_webhook_trigger.assert_called_once_with(
+        WebhookEventAsyncType.CUSTOMER_UPDATED,
+        [any_webhook],
+        webhook_payloads_data=ANY,
+        requestor=None,
+        allow_replica=False,
+    )
+    payloads_data = mocked_webhook_trigger.call_args.kwargs["webhook_payloads_data"]
+    assert [data.subscribable_object for data in payloads_data] == customer_users
+    for data in payloads_data:
+        assert isinstance(data.legacy_data_generator, partial)
+
+
 @mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
 @mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async")
 def test_customer_metadata_updated(
@@ -630,6 +657,82 @@ def test_product_created(
     )
 
 
+@mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
+@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async_for_multiple_objects")
+def test_products_created(
+    mocked_webhook_trigger,
+    mocked_get_webhooks_for_event,
+    any_webhook,
+    settings,
+    product_list,
+):
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    manager = get_plugins_manager(allow_replica=False)
+    manager.products_created(product_list)
+
+    mocked_webhook_trigger.assert_called_once_with(
+        WebhookEventAsyncType.PRODUCT_CREATED,
+        [any_webhook],
+        webhook_payloads_data=ANY,
+        requestor=None,
+        allow_replica=False,
+    )
+    payloads_data = mocked_webhook_trigger.call_args.kwargs["webhook_payloads_data"]
+    assert [data.subscribable_object for data in payloads_data] == product_list
+
+
+@mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
+@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async_for_multiple_objects")
+def test_products_created_without_products(
+    mocked_webhook_trigger,
+    mocked_get_webhooks_for_event,
+    any_webhook,
+    settings,
+):
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    manager = get_plugins_manager(allow_replica=False)
+    manager.products_created([])
+
+    mocked_webhook_trigger.assert_not_called()
+
+
+@mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
+@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async_for_multiple_objects")
+def test_product_variants_updated(
+    mocked_webhook_trigger,
+    mocked_get_webhooks_for_event,
+    any_webhook,
+    settings,
+    product_variant_list,
+):
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    manager = get_plugins_manager(allow_replica=False)
+    request_time = datetime.datetime.now(tz=datetime.UTC)
+    pre_save_payloads = {"key": "payload"}
+    manager.product_variants_updated(
+        product_variant_list,
+        pre_save_payloads=pre_save_payloads,
+        request_time=request_time,
+    )
+
+    mocked_webhook_trigger.assert_called_once_with(
+        WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED,
+        [any_webhook],
+        webhook_payloads_data=ANY,
+        requestor=None,
+        allow_replica=False,
+        pre_save_payloads=pre_save_payloads,
+        request_time=request_time,
+    )
+    payloads_data = mocked_webhook_trigger.call_args.kwargs["webhook_payloads_data"]
+    assert [data.subscribable_object for data in payloads_data] == (
+        product_variant_list
+    )
+
+
 @mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
 @mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async")
 def test_product_updated(
@@ -1031,6 +1134,35 @@ def test_order_expired(
     )
 
 
+@mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
+@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async_for_multiple_objects")
+def test_orders_expired(
+    mocked_webhook_trigger,
+    mocked_get_webhooks_for_event,
+    any_webhook,
+    settings,
+    order_list,
+    channel_USD,
+):
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    manager = get_plugins_manager(allow_replica=False)
+    manager.orders_expired(order_list, channel_USD.slug)
+
+    mocked_webhook_trigger.assert_called_once_with(
+        WebhookEventAsyncType.ORDER_EXPIRED,
+        [any_webhook],
+        webhook_payloads_data=ANY,
+        requestor=None,
+        allow_replica=False,
+        queue=settings.ORDER_WEBHOOK_EVENTS_CELERY_QUEUE_NAME,
+    )
+    payloads_data = mocked_webhook_trigger.call_args.kwargs["webhook_payloads_data"]
+    assert [data.subscribable_object for data in payloads_data] == order_list
+    for data in payloads_data:
+        assert isinstance(data.legacy_data_generator, partial)
+
+
 @mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
 @mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async")
 def test_order_metadata_updated(
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:12
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0197_productvariantchannellisting_prior_price_amount"),
+    ]
+
+    atomic = False
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="productvariant",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("sku"), name="gin_trgm_ops"
+                ),
+                name="variant_upper_sku_gin",
+            ),
+        ),
+    ]
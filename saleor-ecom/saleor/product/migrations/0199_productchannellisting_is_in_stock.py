@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:41
+
+from django.apps import apps as registry
+from django.db import migrations, models
+from django.db.models.signals import post_migrate
+
+from ...warehouse.tasks import update_products_stock_availability_task
+
+
+def update_products_stock_availability(apps, _schema_editor):
+    def on_migrations_complete(sender=None, **kwargs):
+        update_products_stock_availability_task.delay()
+
+    sender = registry.get_app_config("product")
+    post_migrate.connect(on_migrations_complete, weak=False, sender=sender)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0198_variant_sku_gin_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productchannellisting",
+            name="is_in_stock",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(
+            update_products_stock_availability,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -7,11 +7,12 @@ from uuid import uuid4
 
 import graphene
 from django.conf import settings
-from django.contrib.postgres.indexes import BTreeIndex, GinIndex
+from django.contrib.postgres.indexes import BTreeIndex, GinIndex, OpClass
 from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator
 from django.db import models, transaction
 from django.db.models import JSONField, TextField
+from django.db.models.functions import Upper
 from django.forms.models import model_to_dict
 from django.urls import reverse
 from django.utils import timezone
@@ -331,6 +332,9 @@ class ProductChannelListing(PublishableModel):
         amount_field="discounted_price_amount", currency_field="currency"
     )
     discounted_price_dirty = models.BooleanField(default=False)
+    # Maintained asynchronously from the variants stocks, allocations
+    # and reservations, see `warehouse.stock_availability`.
+    is_in_stock = models.BooleanField(default=False)
 
     class Meta:
         unique_together = [["product", "channel"]]
@@ -378,6 +382,14 @@ class ProductVariant(SortableModel, ModelWithMetadata, ModelWithExternalReferenc
     class Meta(ModelWithMetadata.Meta):
         ordering = ("sort_order", "sku")
         app_label = "product"
+        indexes = [
+            *ModelWithMetadata.Meta.indexes,
+            # matches the `sku__icontains` lookup, which compares the uppercased SKU
+            GinIndex(
+                OpClass(Upper("sku"), name="gin_trgm_ops"),
+                name="variant_upper_sku_gin",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name or self.sku or f"ID:{self.pk}"
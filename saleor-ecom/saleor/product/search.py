@@ -1,16 +1,28 @@
+import re
 from collections import defaultdict
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Union
 
 from django.conf import settings
-from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import F, Q, Value, prefetch_related_objects
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, Prefetch, Q, Value, prefetch_related_objects
 
 from ..attribute import AttributeInputType
-from ..attribute.models import Attribute
+from ..attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttribute,
+    Attribute,
+    AttributeProduct,
+    AttributeValue,
+    AttributeVariant,
+)
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
 from ..core.utils.editorjs import clean_editor_js
-from ..product.models import Product
+from ..product.models import Product, ProductType, ProductVariant
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -23,14 +35,69 @@ PRODUCT_FIELDS_TO_PREFETCH = [
     "product_type__attributeproduct__attribute",
 ]
 
+# Product fields loaded for updating the search vector
+PRODUCT_FIELDS_TO_INDEX = [
+    "id",
+    "name",
+    "description_plaintext",
+    "product_type_id",
+    "updated_at",
+]
+
 PRODUCTS_BATCH_SIZE = 100
 # Setting threshold to 100 results in about 766.98MB of memory usage
 # when testing locally with multiple attributes of different types assigned to product
 # and product variants.
 
 
+def get_product_search_vector_prefetches() -> list[Prefetch]:
+    """Return the lookups prefetching only the fields used in the search vector.
+
+    The lookups are equivalent to `PRODUCT_FIELDS_TO_PREFETCH`, but don't load
+    the unused columns, like descriptions or metadata, of the related objects.
+    Use them only for the products that are not used after indexing.
+    """
+    attributes = Attribute.objects.only("id", "input_type", "unit")
+    values = AttributeValue.objects.only(
+        "id", "attribute_id", "name", "rich_text", "plain_text", "date_time"
+    )
+    return [
+        Prefetch(
+            "variants",
+            queryset=ProductVariant.objects.only("id", "product_id", "sku", "name"),
+        ),
+        Prefetch(
+            "variants__attributes",
+            queryset=AssignedVariantAttribute.objects.only(
+                "id", "variant_id", "assignment_id"
+            ),
+        ),
+        Prefetch("variants__attributes__values", queryset=values),
+        Prefetch(
+            "variants__attributes__assignment",
+            queryset=AttributeVariant.objects.only("id", "attribute_id"),
+        ),
+        Prefetch("variants__attributes__assignment__attribute", queryset=attributes),
+        Prefetch(
+            "attributevalues",
+            queryset=AssignedProductAttributeValue.objects.only(
+                "id", "product_id", "value_id"
+            ),
+        ),
+        Prefetch("attributevalues__value", queryset=values),
+        Prefetch("product_type", queryset=ProductType.objects.only("id")),
+        Prefetch(
+            "product_type__attributeproduct",
+            queryset=AttributeProduct.objects.only(
+                "id", "product_type_id", "attribute_id"
+            ),
+        ),
+        Prefetch("product_type__attributeproduct__attribute", queryset=attributes),
+    ]
+
+
 def _prep_product_search_vector_index(products):
-    prefetch_related_objects(products, *PRODUCT_FIELDS_TO_PREFETCH)
+    prefetch_related_objects(products, *get_product_search_vector_prefetches())
 
     for product in products:
         product.search_vector = FlatConcatSearchVector(
@@ -71,9 +138,9 @@ def update_products_search_vector(product_ids: Iterable[int]):
     )
     for product_pks in queryset_in_batches(products):
         products_batch = list(
-            Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME).filter(
-                id__in=product_pks
-            )
+            Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+            .filter(id__in=product_pks)
+            .only(*PRODUCT_FIELDS_TO_INDEX)
         )
         _prep_product_search_vector_index(products_batch)
 
@@ -225,3 +292,82 @@ def search_products(qs, value):
             search_rank=SearchRank(F("search_vector"), query)
         )
     return qs
+
+
+# Trigram matching requires at least one full trigram of the searched value.
+TYPEAHEAD_TRIGRAM_MIN_LENGTH = 3
+
+
+def prepare_typeahead_search_query(value: str) -> SearchQuery | None:
+    """Return the query matching the products with words starting with each word.
+
+    The words are extracted the same way as from the indexed documents, so the
+    SKU fragments like `ABC-12` match the indexed `ABC-123`.
+    """
+    words = re.findall(r"[^\W_]+", value.lower())
+    if not words:
+        return None
+    raw_query = " & ".join(f"{word}:*" for word in words)
+    return SearchQuery(raw_query, search_type="raw", config="simple")
+
+
+def search_products_typeahead(
+    qs: "QuerySet[Product]", value: str, limit: int | None = None
+) -> list[Product]:
+    """Return the products for the search-as-you-type.
+
+    The products are matched by the prefixes of the words indexed in
+    `search_vector`. When there are not enough of them, the products with
+    a similar name or with the SKU containing the searched value are added.
+    The result size is limited by `PRODUCT_TYPEAHEAD_MAX_RESULTS`.
+    """
+    value = value.strip()
+    max_results = settings.PRODUCT_TYPEAHEAD_MAX_RESULTS
+    limit = max_results if limit is None else min(limit, max_results)
+    if not value or limit <= 0:
+        return []
+
+    product_ids = _search_product_ids_by_prefix(qs, value, limit)
+    if len(product_ids) < limit and len(value) >= TYPEAHEAD_TRIGRAM_MIN_LENGTH:
+        product_ids += _search_product_ids_by_trigram(
+            qs.exclude(id__in=product_ids), value, limit - len(product_ids)
+        )
+    products = Product.objects.using(qs.db).in_bulk(product_ids)
+    return [products[product_id] for product_id in product_ids]
+
+
+def _search_product_ids_by_prefix(qs, value: str, limit: int) -> list[int]:
+    query = prepare_typeahead_search_query(value)
+    if query is None:
+        return []
+    # no ordering, so the candidates are taken straight from the index scan
+    candidates = (
+        qs.filter(search_vector=query)
+        .order_by()
+        .values("id")[: settings.PRODUCT_TYPEAHEAD_RANKED_CANDIDATES]
+    )
+    return list(
+        Product.objects.using(qs.db)
+        .filter(id__in=candidates)
+        .annotate(search_rank=SearchRank(F("search_vector"), query))
+        .order_by("-search_rank", "slug")
+        .values_list("id", flat=True)[:limit]
+    )
+
+
+def _search_product_ids_by_trigram(qs, value: str, limit: int) -> list[int]:
+    product_ids = list(
+        qs.filter(name__trigram_word_similar=value)
+        .annotate(similarity=TrigramWordSimilarity(value, "name"))
+        .order_by("-similarity", "slug")
+        .values_list("id", flat=True)[:limit]
+    )
+    if len(product_ids) < limit:
+        variants = ProductVariant.objects.using(qs.db).filter(sku__icontains=value)
+        product_ids += (
+            qs.filter(id__in=variants.values("product_id"))
+            .exclude(id__in=product_ids)
+            .order_by("slug")
+            .values_list("id", flat=True)[: limit - len(product_ids)]
+        )
+    return product_ids
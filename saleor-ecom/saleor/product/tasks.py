@@ -1,13 +1,14 @@
 import logging
-from collections import defaultdict
+import time
 from collections.abc import Iterable
 from uuid import UUID
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 
 from ..attribute.models import Attribute
@@ -22,17 +23,25 @@ from ..webhook.event_types import WebhookEventAsyncType
 from ..webhook.utils import get_webhooks_for_event
 from .models import Product, ProductChannelListing, ProductType, ProductVariant
 from .search import update_products_search_vector
-from .utils.product import mark_products_in_channels_as_dirty
 from .utils.variant_prices import update_discounted_prices_for_promotion
 from .utils.variants import (
-    fetch_variants_for_promotion_rules,
     generate_and_set_variant_name,
+    update_variants_for_promotion_rules,
 )
 
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(f"{__name__}.celery")
 
 PRODUCTS_BATCH_SIZE = 300
+# The search vector batch size is adjusted after each batch, so a single batch
+# takes about SEARCH_VECTOR_BATCH_TARGET_SEC.
+SEARCH_VECTOR_MIN_BATCH_SIZE = 50
+SEARCH_VECTOR_MAX_BATCH_SIZE = 2000
+SEARCH_VECTOR_BATCH_TARGET_SEC = 5
+# Set while the products search vectors are updated, from the first batch to the
+# last one of the chain of tasks re-scheduling themselves, so the periodic task
+# doesn't start another run on the same dirty products.
+SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY = "update_products_search_vector_in_progress"
 
 VARIANTS_UPDATE_BATCH = 500
 # Results in update time ~0.2s
@@ -108,64 +117,6 @@ def update_products_discounted_prices_of_promotion_task(promotion_pk: UUID):
     PromotionRule.objects.filter(promotion_id=promotion_pk).update(variants_dirty=True)
 
 
-def _get_channel_to_products_map(rule_to_variant_list):
-    variant_ids = {
-        rule_to_variant.productvariant_id for rule_to_variant in rule_to_variant_list
-    }
-    variant_id_with_product_id_qs = (
-        ProductVariant.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(id__in=variant_ids)
-        .values_list("id", "product_id")
-    )
-    variant_id_to_product_id_map = {}
-    for variant_id, product_id in variant_id_with_product_id_qs:
-        variant_id_to_product_id_map[variant_id] = product_id
-
-    rule_ids = {
-        rule_to_variant.promotionrule_id for rule_to_variant in rule_to_variant_list
-    }
-    PromotionChannel = PromotionRule.channels.through
-    promotion_channel_qs = (
-        PromotionChannel.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(promotionrule_id__in=rule_ids)
-        .values_list("promotionrule_id", "channel_id")
-    )
-
-    rule_to_channels_map = defaultdict(set)
-    for promotionrule_id, channel_id in promotion_channel_qs.iterator():
-        rule_to_channels_map[promotionrule_id].add(channel_id)
-    channel_to_products_map = defaultdict(set)
-    for rule_to_variant in rule_to_variant_list:
-        channel_ids = rule_to_channels_map[rule_to_variant.promotionrule_id]
-        for channel_id in channel_ids:
-            try:
-                product_id = variant_id_to_product_id_map[
-                    rule_to_variant.productvariant_id
-                ]
-            except KeyError:
-                continue
-            channel_to_products_map[channel_id].add(product_id)
-
-    return channel_to_products_map
-
-
-def _get_existing_rule_variant_list(rules: QuerySet[PromotionRule]):
-    PromotionRuleVariant = PromotionRule.variants.through
-    existing_rules_variants = (
-        PromotionRuleVariant.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(Exists(rules.filter(pk=OuterRef("promotionrule_id"))))
-        .all()
-        .values_list(
-            "promotionrule_id",
-            "productvariant_id",
-        )
-    )
-    return [
-        PromotionRuleVariant(promotionrule_id=rule_id, productvariant_id=variant_id)
-        for rule_id, variant_id in existing_rules_variants
-    ]
-
-
 @app.task
 @allow_writer()
 def update_variant_relations_for_active_promotion_rules_task():
@@ -187,18 +138,8 @@ def update_variant_relations_for_active_promotion_rules_task():
     )
     if ids := list(rules.values_list("pk", flat=True)):
         # fetch rules to get a qs without slicing
-        rules = PromotionRule.objects.using(
-            settings.DATABASE_CONNECTION_REPLICA_NAME
-        ).filter(pk__in=ids)
-
-        # Fetch existing variant relations to also mark products which are no longer
-        # in the promotion as dirty
-        existing_variant_relation = _get_existing_rule_variant_list(rules)
-
-        new_rule_to_variant_list = fetch_variants_for_promotion_rules(rules=rules)
-        channel_to_product_map = _get_channel_to_products_map(
-            existing_variant_relation + new_rule_to_variant_list
-        )
+        rules = PromotionRule.objects.filter(pk__in=ids)
+        update_variants_for_promotion_rules(rules)
         with transaction.atomic():
             promotion_rule_ids = list(
                 PromotionRule.objects.select_for_update(of=("self",))
@@ -210,7 +151,6 @@ def update_variant_relations_for_active_promotion_rules_task():
                 variants_dirty=False
             )
 
-        mark_products_in_channels_as_dirty(channel_to_product_map, allow_replica=True)
         update_variant_relations_for_active_promotion_rules_task.delay()
 
 
@@ -248,7 +188,19 @@ def recalculate_discounted_price_for_products_task():
         products = Product.objects.using(
             settings.DATABASE_CONNECTION_REPLICA_NAME
         ).filter(id__in=products_ids)
-        update_discounted_prices_for_promotion(products, only_dirty_products=True)
+        start = time.monotonic()
+        variant_listings_count = update_discounted_prices_for_promotion(
+            products, only_dirty_products=True
+        )
+        duration = time.monotonic() - start
+        task_logger.info(
+            "Recalculated discounted prices of %s variant listings for %s product "
+            "listings in %.2fs (%.1f listings/s).",
+            variant_listings_count,
+            len(listing_ids),
+            duration,
+            variant_listings_count / duration if duration else variant_listings_count,
+        )
         with transaction.atomic():
             channel_listings_ids = list(
                 ProductChannelListing.objects.select_for_update(of=("self",))
@@ -296,15 +248,76 @@ def _get_preorder_variants_to_clean():
     queue=settings.UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME,
     expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
 )
-def update_products_search_vector_task():
-    products = (
+def update_products_search_vector_task(
+    batch_size: int = PRODUCTS_BATCH_SIZE, scheduled_by_previous_batch=False
+):
+    """Update the search vectors of the dirty products.
+
+    The task is re-scheduled right after a full batch, until all dirty products
+    are indexed. The batch size is adjusted to the measured update time.
+    """
+    in_progress_timeout = (
+        settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC
+        + SEARCH_VECTOR_BATCH_TARGET_SEC * 2
+    )
+    if scheduled_by_previous_batch:
+        cache.set(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY, True, in_progress_timeout)
+    elif not cache.add(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY, True, in_progress_timeout):
+        return
+
+    product_ids = list(
         Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
         .filter(search_index_dirty=True)
-        .order_by("updated_at")[:PRODUCTS_BATCH_SIZE]
-        .values_list("id", flat=True)
+        .order_by("updated_at")
+        .values_list("id", flat=True)[:batch_size]
     )
+    if not product_ids:
+        cache.delete(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY)
+        return
+
+    start = time.monotonic()
     with allow_writer():
-        update_products_search_vector(products)
+        update_products_search_vector(product_ids)
+    duration = time.monotonic() - start
+
+    task_logger.info(
+        "Updated search vectors of %s products in %.2fs (%.1f products/s).",
+        len(product_ids),
+        duration,
+        len(product_ids) / duration if duration else len(product_ids),
+    )
+    if len(product_ids) < batch_size:
+        cache.delete(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY)
+        return
+
+    dirty_products_count = (
+        Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(search_index_dirty=True)
+        .count()
+    )
+    if not dirty_products_count:
+        cache.delete(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY)
+        return
+
+    next_batch_size = _get_next_search_vector_batch_size(batch_size, duration)
+    task_logger.info(
+        "%s products left to update the search vector, next batch size: %s.",
+        dirty_products_count,
+        next_batch_size,
+    )
+    update_products_search_vector_task.delay(
+        batch_size=next_batch_size, scheduled_by_previous_batch=True
+    )
+
+
+def _get_next_search_vector_batch_size(batch_size: int, duration: float) -> int:
+    ratio = SEARCH_VECTOR_BATCH_TARGET_SEC / duration if duration > 0 else 2
+    # limit the change, so a single slow or fast batch doesn't swing the size
+    ratio = min(max(ratio, 0.5), 2)
+    return min(
+        max(int(batch_size * ratio), SEARCH_VECTOR_MIN_BATCH_SIZE),
+        SEARCH_VECTOR_MAX_BATCH_SIZE,
+    )
 
 
 @app.task(queue=settings.COLLECTION_PRODUCT_UPDATED_QUEUE_NAME)
@@ -9,7 +9,11 @@ from prices import Money
 
 from ...discount import RewardValueType
 from ...discount.models import Promotion, PromotionRule
-from ...product.models import Product, VariantChannelListingPromotionRule
+from ...product.models import (
+    Product,
+    ProductVariantChannelListing,
+    VariantChannelListingPromotionRule,
+)
 from ...tests import race_condition
 from ..utils.variant_prices import update_discounted_prices_for_promotion
 
@@ -663,3 +667,53 @@ def test_update_discounted_prices_for_promotion_only_dirty_products(
     )
     second_listing.refresh_from_db()
     assert second_listing.discounted_price_amount == second_channel_discounted_price
+
+
+def test_update_discounted_prices_for_promotion_only_dirty_variant_listings(
+    product_available_in_many_channels, channel_USD, channel_PLN
+):
+    # given
+    product = product_available_in_many_channels
+    variant = product.variants.first()
+    product.channel_listings.filter(channel=channel_USD).update(
+        discounted_price_dirty=True
+    )
+    product.channel_listings.filter(channel=channel_PLN).update(
+        discounted_price_dirty=False
+    )
+    variant.channel_listings.update(discounted_price_amount=0)
+
+    # when
+    processed_listings_count = update_discounted_prices_for_promotion(
+        Product.objects.filter(id__in=[product.id]), only_dirty_products=True
+    )
+
+    # then
+    assert processed_listings_count == 1
+    usd_listing = variant.channel_listings.get(channel=channel_USD)
+    assert usd_listing.discounted_price_amount == usd_listing.price_amount
+    pln_listing = variant.channel_listings.get(channel=channel_PLN)
+    assert pln_listing.discounted_price_amount == 0
+
+
+@patch("saleor.product.utils.variant_prices.PRODUCTS_CHUNK_SIZE", 1)
+def test_update_discounted_prices_for_promotion_in_product_chunks(
+    product_list, channel_USD
+):
+    # given
+    ProductVariantChannelListing.objects.filter(
+        variant__product__in=product_list
+    ).update(discounted_price_amount=0)
+
+    # when
+    processed_listings_count = update_discounted_prices_for_promotion(
+        Product.objects.filter(id__in=[product.id for product in product_list])
+    )
+
+    # then
+    variant_listings = ProductVariantChannelListing.objects.filter(
+        variant__product__in=product_list
+    )
+    assert processed_listings_count == variant_listings.count()
+    for listing in variant_listings:
+        assert listing.discounted_price_amount == listing.price_amount
@@ -1,5 +1,5 @@
 from ..models import Product
-from ..search import update_products_search_vector
+from ..search import search_products_typeahead, update_products_search_vector
 
 
 def test_update_products_search_vector(product_list):
@@ -15,3 +15,105 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+def _prepare_typeahead_products(product_list):
+    names = ["Blue Sneakers", "Sneaker Socks", "Red Sandals"]
+    skus = ["BS-1001", "SS-2002", "RS-3003"]
+    for product, name, sku in zip(product_list, names, skus, strict=True):
+        product.name = name
+        product.variants.update(sku=sku)
+    Product.objects.bulk_update(product_list, ["name"])
+    update_products_search_vector([product.id for product in product_list])
+
+
+def test_search_products_typeahead_by_word_prefix(product_list):
+    # given
+    _prepare_typeahead_products(product_list)
+
+    # when
+    products = search_products_typeahead(Product.objects.all(), "sneak")
+
+    # then
+    assert {product.name for product in products} == {
+        "Blue Sneakers",
+        "Sneaker Socks",
+    }
+
+
+def test_search_products_typeahead_by_multiple_word_prefixes(product_list):
+    # given
+    _prepare_typeahead_products(product_list)
+
+    # when
+    products = search_products_typeahead(Product.objects.all(), "blu snea")
+
+    # then
+    assert [product.name for product in products] == ["Blue Sneakers"]
+
+
+def test_search_products_typeahead_by_sku_prefix(product_list):
+    # given
+    _prepare_typeahead_products(product_list)
+
+    # when
+    products = search_products_typeahead(Product.objects.all(), "SS-20")
+
+    # then
+    assert [product.name for product in products] == ["Sneaker Socks"]
+
+
+def test_search_products_typeahead_trigram_fallback_for_sku_fragment(product_list):
+    # given
+    _prepare_typeahead_products(product_list)
+
+    # when
+    products = search_products_typeahead(Product.objects.all(), "3003")
+
+    # then
+    assert [product.name for product in products] == ["Red Sandals"]
+
+
+def test_search_products_typeahead_trigram_fallback_for_misspelled_name(
+    product_list,
+):
+    # given
+    _prepare_typeahead_products(product_list)
+
+    # when
+    products = search_products_typeahead(Product.objects.all(), "sanddals")
+
+    # then
+    assert [product.name for product in products] == ["Red Sandals"]
+
+
+def test_search_products_typeahead_limit(product_list, settings):
+    # given
+    settings.PRODUCT_TYPEAHEAD_MAX_RESULTS = 1
+    _prepare_typeahead_products(product_list)
+
+    # when
+    products = search_products_typeahead(Product.objects.all(), "s", limit=10)
+
+    # then
+    assert len(products) == 1
+
+
+def test_search_products_typeahead_respects_queryset(product_list):
+    # given
+    _prepare_typeahead_products(product_list)
+    qs = Product.objects.exclude(name="Blue Sneakers")
+
+    # when
+    products = search_products_typeahead(qs, "sneak")
+
+    # then
+    assert [product.name for product in products] == ["Sneaker Socks"]
+
+
+def test_search_products_typeahead_no_words(product_list):
+    # when
+    products = search_products_typeahead(Product.objects.all(), " -&:* ")
+
+    # then
+    assert products == []
@@ -4,6 +4,7 @@ from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from faker import Faker
 
@@ -11,13 +12,23 @@ from ...discount import PromotionType, RewardValueType
 from ...discount.models import Promotion, PromotionRule
 from ..models import Product, ProductChannelListing, ProductVariantChannelListing
 from ..tasks import (
+    SEARCH_VECTOR_MAX_BATCH_SIZE,
+    SEARCH_VECTOR_MIN_BATCH_SIZE,
+    SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY,
+    _get_next_search_vector_batch_size,
     _get_preorder_variants_to_clean,
     recalculate_discounted_price_for_products_task,
     update_products_search_vector_task,
     update_variant_relations_for_active_promotion_rules_task,
     update_variants_names,
 )
-from ..utils.variants import fetch_variants_for_promotion_rules
+from ..utils.variants import update_variants_for_promotion_rules
+
+
+@pytest.fixture(autouse=True)
+def clear_search_vector_update_in_progress():
+    yield
+    cache.delete(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY)
 
 
 @patch(
@@ -84,7 +95,9 @@ def test_update_variant_relations_for_active_promotion_rules_task_when_not_valid
         },
     )
     rule.channels.add(channel_USD)
-    fetch_variants_for_promotion_rules(promotion.rules.all())
+    update_variants_for_promotion_rules(
+        promotion.rules.all(), mark_products_as_dirty=False
+    )
 
     PromotionRule.objects.update(variants_dirty=True)
     category.metadata = {}
@@ -120,9 +133,9 @@ def test_update_variant_relations_for_active_promotion_rules_task_with_order_pre
 @pytest.mark.parametrize("reward_value", [None, 0])
 @patch("saleor.product.tasks.PROMOTION_RULE_BATCH_SIZE", 1)
 @patch("saleor.product.tasks.recalculate_discounted_price_for_products_task.delay")
-@patch("saleor.product.utils.variants.fetch_variants_for_promotion_rules")
+@patch("saleor.product.tasks.update_variants_for_promotion_rules")
 def test_update_variant_relations_for_active_promotion_rules_with_empty_reward_value(
-    fetch_variants_for_promotion_rules_mock,
+    update_variants_for_promotion_rules_mock,
     recalculate_discounted_price_for_products_task_mock,
     reward_value,
     promotion_list,
@@ -145,7 +158,7 @@ def test_update_variant_relations_for_active_promotion_rules_with_empty_reward_v
     recalculate_discounted_price_for_products_task()
 
     # then
-    assert not fetch_variants_for_promotion_rules_mock.called
+    assert not update_variants_for_promotion_rules_mock.called
     assert not recalculate_discounted_price_for_products_task_mock.called
 
 
@@ -312,6 +325,97 @@ def test_update_products_search_vector_task_with_static_number_of_queries(
         update_products_search_vector_task()
 
 
+@patch("saleor.product.tasks.update_products_search_vector_task.delay")
+def test_update_products_search_vector_task_schedules_next_batch(
+    update_products_search_vector_task_mock, product_list
+):
+    # given
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    update_products_search_vector_task(batch_size=2)
+
+    # then
+    assert Product.objects.filter(search_index_dirty=True).count() == 1
+    update_products_search_vector_task_mock.assert_called_once()
+    assert update_products_search_vector_task_mock.call_args.kwargs[
+        "scheduled_by_previous_batch"
+    ]
+    assert cache.get(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY)
+
+
+@patch("saleor.product.tasks.update_products_search_vector_task.delay")
+def test_update_products_search_vector_task_last_batch(
+    update_products_search_vector_task_mock, product_list
+):
+    # given
+    Product.objects.update(search_index_dirty=True)
+    cache.set(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY, True)
+
+    # when
+    update_products_search_vector_task(
+        batch_size=len(product_list) + 1, scheduled_by_previous_batch=True
+    )
+
+    # then
+    assert not Product.objects.filter(search_index_dirty=True).exists()
+    update_products_search_vector_task_mock.assert_not_called()
+    assert cache.get(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY) is None
+
+
+def test_update_products_search_vector_task_skipped_when_in_progress(product):
+    # given
+    product.search_index_dirty = True
+    product.save(update_fields=["search_index_dirty"])
+    cache.set(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY, True)
+
+    # when
+    update_products_search_vector_task()
+
+    # then
+    product.refresh_from_db(fields=["search_index_dirty"])
+    assert product.search_index_dirty is True
+
+
+@patch("saleor.product.tasks.update_products_search_vector")
+def test_update_products_search_vector_task_marks_in_progress_first_batch(
+    update_products_search_vector_mock, product
+):
+    # given
+    product.search_index_dirty = True
+    product.save(update_fields=["search_index_dirty"])
+    in_progress = []
+    update_products_search_vector_mock.side_effect = lambda _: in_progress.append(
+        cache.get(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY)
+    )
+
+    # when
+    update_products_search_vector_task()
+
+    # then
+    assert in_progress == [True]
+    assert cache.get(SEARCH_VECTOR_UPDATE_IN_PROGRESS_KEY) is None
+
+
+@pytest.mark.parametrize(
+    ("batch_size", "duration", "expected_batch_size"),
+    [
+        (300, 5, 300),
+        (300, 10, 150),
+        (300, 2.5, 600),
+        (300, 0.1, 600),
+        (300, 100, 150),
+        (60, 100, SEARCH_VECTOR_MIN_BATCH_SIZE),
+        (1500, 0.1, SEARCH_VECTOR_MAX_BATCH_SIZE),
+        (300, 0, 600),
+    ],
+)
+def test_get_next_search_vector_batch_size(batch_size, duration, expected_batch_size):
+    assert (
+        _get_next_search_vector_batch_size(batch_size, duration) == expected_batch_size
+    )
+
+
 @pytest.mark.slow
 @pytest.mark.limit_memory("50 MB")
 def test_mem_usage_recalculate_discounted_price_for_products_task(
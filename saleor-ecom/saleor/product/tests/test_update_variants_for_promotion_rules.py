@@ -4,12 +4,13 @@ import graphene
 
 from ...discount import RewardValueType
 from ...discount.models import PromotionRule
-from ...discount.utils.promotion import update_rule_variant_relation
+from ...discount.utils.promotion import update_rule_variant_relation_in_database
 from ...tests import race_condition
-from ..utils.variants import fetch_variants_for_promotion_rules
+from ..models import ProductChannelListing
+from ..utils.variants import update_variants_for_promotion_rules
 
 
-def test_fetch_variants_for_promotion_rules_discount(
+def test_update_variants_for_promotion_rules_discount(
     catalogue_promotion_without_rules,
     product,
     product_with_two_variants,
@@ -20,8 +21,8 @@ def test_fetch_variants_for_promotion_rules_discount(
     variant = product.variants.first()
     promotion = catalogue_promotion_without_rules
 
-    percentage_reward_value = Decimal("10")
-    reward_value = Decimal("2")
+    percentage_reward_value = Decimal(10)
+    reward_value = Decimal(2)
     rule_1 = promotion.rules.create(
         name="Percentage promotion rule",
         catalogue_predicate={
@@ -57,7 +58,7 @@ def test_fetch_variants_for_promotion_rules_discount(
     rule_2.variants.add(*product_variant_list)
 
     # when
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(PromotionRule.objects.all())
 
     # then
     rule_1.refresh_from_db()
@@ -73,13 +74,13 @@ def test_fetch_variants_for_promotion_rules_discount(
     )
 
 
-def test_fetch_variants_for_promotion_rules_empty_catalogue_predicate(
+def test_update_variants_for_promotion_rules_empty_catalogue_predicate(
     catalogue_promotion_without_rules, product, product_with_two_variants, channel_USD
 ):
     # given
     promotion = catalogue_promotion_without_rules
 
-    percentage_reward_value = Decimal("10")
+    percentage_reward_value = Decimal(10)
     rule_1 = promotion.rules.create(
         name="Percentage promotion rule",
         catalogue_predicate={},
@@ -89,20 +90,20 @@ def test_fetch_variants_for_promotion_rules_empty_catalogue_predicate(
     rule_1.channels.add(channel_USD)
 
     # when
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(PromotionRule.objects.all())
 
     # then
     rule_1.refresh_from_db()
     assert rule_1.variants.count() == 0
 
 
-def test_fetch_variants_for_promotion_rules_no_applicable_variants(
+def test_update_variants_for_promotion_rules_no_applicable_variants(
     catalogue_promotion_without_rules, category, channel_USD
 ):
     # given
     category.products.clear()
 
-    reward_value = Decimal("2")
+    reward_value = Decimal(2)
     rule = catalogue_promotion_without_rules.rules.create(
         name="Percentage promotion rule",
         catalogue_predicate={
@@ -116,14 +117,14 @@ def test_fetch_variants_for_promotion_rules_no_applicable_variants(
     rule.channels.add(channel_USD)
 
     # when
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(PromotionRule.objects.all())
 
     # then
     rule.refresh_from_db()
     assert rule.variants.count() == 0
 
 
-def test_fetch_variants_for_promotion_rules_relation_already_exist(
+def test_update_variants_for_promotion_rules_relation_already_exist(
     catalogue_promotion,
 ):
     # given
@@ -132,14 +133,14 @@ def test_fetch_variants_for_promotion_rules_relation_already_exist(
     assert rule.variants.count() > 0
 
     # when
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(PromotionRule.objects.all())
 
     # then
     rule.refresh_from_db()
     assert rule.variants.count() > 0
 
 
-def test_fetch_variants_for_promotion_rules_discount_race_condition(
+def test_update_variants_for_promotion_rules_discount_race_condition(
     catalogue_promotion_without_rules,
     channel_USD,
     product_variant_list,
@@ -149,7 +150,7 @@ def test_fetch_variants_for_promotion_rules_discount_race_condition(
     existing_variant = product_variant_list[0]
     new_variant = product_variant_list[1]
 
-    percentage_reward_value = Decimal("10")
+    percentage_reward_value = Decimal(10)
     rule = promotion.rules.create(
         name="Percentage promotion rule",
         catalogue_predicate={
@@ -167,13 +168,53 @@ def test_fetch_variants_for_promotion_rules_discount_race_condition(
 
     # when
     with race_condition.RunAfter(
-        "saleor.product.utils.variants.update_rule_variant_relation",
-        update_rule_variant_relation,
+        "saleor.product.utils.variants.update_rule_variant_relation_in_database",
+        update_rule_variant_relation_in_database,
     ):
-        fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+        update_variants_for_promotion_rules(PromotionRule.objects.all())
 
     # then
     rule.refresh_from_db()
     rule_variants = rule.variants.all()
     assert len(rule_variants) == 1
     assert new_variant in rule_variants
+
+
+def test_update_variants_for_promotion_rules_marks_listings_as_dirty(
+    catalogue_promotion_without_rules,
+    channel_USD,
+    product,
+    product_with_two_variants,
+):
+    # given
+    promotion = catalogue_promotion_without_rules
+    old_variant = product.variants.first()
+    rule = promotion.rules.create(
+        name="Fixed promotion rule",
+        catalogue_predicate={
+            "productPredicate": {
+                "ids": [
+                    graphene.Node.to_global_id("Product", product_with_two_variants.id)
+                ]
+            }
+        },
+        reward_value_type=RewardValueType.FIXED,
+        reward_value=Decimal(2),
+    )
+    rule.channels.add(channel_USD)
+    rule.variants.add(old_variant)
+    ProductChannelListing.objects.update(discounted_price_dirty=False)
+
+    # when
+    update_variants_for_promotion_rules(PromotionRule.objects.all())
+
+    # then
+    assert set(rule.variants.values_list("id", flat=True)) == set(
+        product_with_two_variants.variants.values_list("id", flat=True)
+    )
+    dirty_listings = ProductChannelListing.objects.filter(discounted_price_dirty=True)
+    assert set(dirty_listings.values_list("product_id", flat=True)) == {
+        product.id,
+        product_with_two_variants.id,
+    }
+    assert set(dirty_listings.values_list("channel_id", flat=True)) == {channel_USD.id}
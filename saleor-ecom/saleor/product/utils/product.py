@@ -1,8 +1,9 @@
 from collections import defaultdict
+from uuid import UUID
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Exists, OuterRef, QuerySet
+from django.db.models import Exists, OuterRef, QuerySet, Subquery
 
 from ...discount.models import PromotionRule
 from ...product.models import ProductChannelListing
@@ -132,3 +133,32 @@ def mark_products_in_channels_as_dirty(
             ProductChannelListing.objects.filter(id__in=channel_listing_ids).update(
                 discounted_price_dirty=True
             )
+
+
+def mark_products_in_channels_as_dirty_for_rule(rule_pk: UUID):
+    """Mark products assigned to the promotion rule as dirty to recalculate prices.
+
+    Marks the discounted_price_dirty flag as True for the product channel listings
+    of the rule channels, for products with a variant assigned to the rule.
+    The listings are selected and updated in the database, without fetching
+    the rule variants.
+    """
+    PromotionRuleVariant = PromotionRule.variants.through
+    PromotionRuleChannel = PromotionRule.channels.through
+    rule_variants = PromotionRuleVariant.objects.filter(promotionrule_id=rule_pk)
+    rule_channels = PromotionRuleChannel.objects.filter(promotionrule_id=rule_pk)
+    variants = ProductVariant.objects.filter(
+        Exists(rule_variants.filter(productvariant_id=OuterRef("pk")))
+    )
+    listings = ProductChannelListing.objects.filter(
+        Exists(variants.filter(product_id=OuterRef("product_id"))),
+        Exists(rule_channels.filter(channel_id=OuterRef("channel_id"))),
+        discounted_price_dirty=False,
+    )
+    with transaction.atomic():
+        locked_listings = (
+            listings.select_for_update(of=("self",)).order_by("pk").values("pk")
+        )
+        ProductChannelListing.objects.filter(pk__in=Subquery(locked_listings)).update(
+            discounted_price_dirty=True
+        )
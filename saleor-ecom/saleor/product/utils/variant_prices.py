@@ -4,7 +4,7 @@ from uuid import UUID
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Exists, OuterRef
+from django.db.models import Exists, F, OuterRef, QuerySet
 from prices import Money
 
 from ...channel.models import Channel
@@ -15,7 +15,7 @@ from ...discount.utils.promotion import (
     calculate_discounted_price_for_promotions,
     get_variants_to_promotion_rules_map,
 )
-from ..managers import ProductsQueryset, ProductVariantQueryset
+from ..managers import ProductsQueryset
 from ..models import (
     ProductChannelListing,
     ProductVariant,
@@ -23,10 +23,13 @@ from ..models import (
     VariantChannelListingPromotionRule,
 )
 
+# The number of products which listings are recalculated and saved at once
+PRODUCTS_CHUNK_SIZE = 500
+
 
 def update_discounted_prices_for_promotion(
     products: ProductsQueryset, only_dirty_products: bool = False
-):
+) -> int:
     """Update Products and ProductVariants discounted prices.
 
     The discounted price is the minimal price of the product/variant based on active
@@ -36,17 +39,69 @@ def update_discounted_prices_for_promotion(
     to the variant price.
 
     When only_dirty_products set to True, the prices will be recalculated only for the
-    listings marked as dirty.
+    listings marked as dirty; the variant listings and promotion rules are fetched
+    only for the (product, channel) pairs of the dirty listings.
+
+    The products are processed in chunks of PRODUCTS_CHUNK_SIZE and the prices of
+    each chunk are saved before the next one is fetched, so the memory usage
+    doesn't grow with the number of products.
+
+    Return the number of processed variant channel listings.
     """
-    variant_qs = ProductVariant.objects.using(
+    product_channel_listings = ProductChannelListing.objects.using(
         settings.DATABASE_CONNECTION_REPLICA_NAME
     ).filter(Exists(products.filter(id=OuterRef("product_id"))))
-    rules_info_per_variant = get_variants_to_promotion_rules_map(variant_qs)
+    if only_dirty_products:
+        product_channel_listings = product_channel_listings.filter(
+            discounted_price_dirty=True
+        )
+
+    product_ids = sorted(
+        set(product_channel_listings.values_list("product_id", flat=True))
+    )
+    processed_variant_listings_count = 0
+    for start in range(0, len(product_ids), PRODUCTS_CHUNK_SIZE):
+        processed_variant_listings_count += _update_discounted_prices_for_listings(
+            product_channel_listings.filter(
+                product_id__in=product_ids[start : start + PRODUCTS_CHUNK_SIZE]
+            ),
+            only_dirty_products,
+        )
+    return processed_variant_listings_count
+
+
+def _update_discounted_prices_for_listings(
+    product_channel_listings: QuerySet[ProductChannelListing],
+    only_dirty_products: bool,
+) -> int:
+    variant_qs = ProductVariant.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).filter(Exists(product_channel_listings.filter(product_id=OuterRef("product_id"))))
+    variant_channel_listings = ProductVariantChannelListing.objects.filter(
+        Exists(variant_qs.filter(id=OuterRef("variant_id"))), price_amount__isnull=False
+    )
+    channel_ids = None
+    if only_dirty_products:
+        variant_channel_listings = variant_channel_listings.filter(
+            Exists(
+                product_channel_listings.filter(
+                    product_id=OuterRef("variant__product_id"),
+                    channel_id=OuterRef("channel_id"),
+                )
+            )
+        )
+        channel_ids = set(product_channel_listings.values_list("channel_id", flat=True))
+
+    rules_info_per_variant = get_variants_to_promotion_rules_map(
+        variant_qs, channel_ids=channel_ids
+    )
     product_to_variant_listings_per_channel_map = (
-        _get_product_to_variant_channel_listings_per_channel_map(variant_qs)
+        _get_product_to_variant_channel_listings_per_channel_map(
+            variant_channel_listings
+        )
     )
     variant_listing_to_listing_rule_per_rule_map = (
-        _get_variant_listings_to_listing_rule_per_rule_id_map(variant_qs)
+        _get_variant_listings_to_listing_rule_per_rule_id_map(variant_channel_listings)
     )
 
     changed_products_listings_to_update = []
@@ -55,15 +110,8 @@ def update_discounted_prices_for_promotion(
     changed_variant_listing_promotion_rule_to_create = []
     changed_variant_listing_promotion_rule_to_update = []
 
-    product_channel_listings = (
-        ProductChannelListing.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(Exists(products.filter(id=OuterRef("product_id"))))
-        .prefetch_related("channel")
-    )
-    if only_dirty_products:
-        product_channel_listings.filter(discounted_price_dirty=True)
-
-    for product_channel_listing in product_channel_listings:
+    processed_variant_listings_count = 0
+    for product_channel_listing in product_channel_listings.prefetch_related("channel"):
         product_id = product_channel_listing.product_id
         channel_id = product_channel_listing.channel_id
         variant_listings = product_to_variant_listings_per_channel_map[product_id][
@@ -71,6 +119,7 @@ def update_discounted_prices_for_promotion(
         ]
         if not variant_listings:
             continue
+        processed_variant_listings_count += len(variant_listings)
         (
             discounted_variants_price,
             variant_listings_to_update,
@@ -105,6 +154,7 @@ def update_discounted_prices_for_promotion(
         changed_variant_listing_promotion_rule_to_create,
         changed_variant_listing_promotion_rule_to_update,
     )
+    return processed_variant_listings_count
 
 
 def _update_or_create_listings(
@@ -185,29 +235,23 @@ def _create_variant_listing_promotion_rule(variant_listing_promotion_rule_to_cre
 
 
 def _get_product_to_variant_channel_listings_per_channel_map(
-    variants: ProductVariantQueryset,
+    variant_channel_listings: QuerySet[ProductVariantChannelListing],
 ):
-    variant_channel_listings = ProductVariantChannelListing.objects.filter(
-        Exists(variants.filter(id=OuterRef("variant_id"))), price_amount__isnull=False
-    )
-    variant_to_product_id = dict(variants.values_list("id", "product_id").iterator())
-
-    price_data: dict[int, dict[int, list[Money]]] = defaultdict(
+    price_data: dict[int, dict[int, list[ProductVariantChannelListing]]] = defaultdict(
         lambda: defaultdict(list)
     )
+    variant_channel_listings = variant_channel_listings.annotate(
+        product_id=F("variant__product_id")
+    )
     for variant_channel_listing in variant_channel_listings.iterator():
-        try:
-            product_id = variant_to_product_id[variant_channel_listing.variant_id]
-        except KeyError:
-            continue
-        price_data[product_id][variant_channel_listing.channel_id].append(
-            variant_channel_listing
-        )
+        price_data[variant_channel_listing.product_id][
+            variant_channel_listing.channel_id
+        ].append(variant_channel_listing)
     return price_data
 
 
 def _get_variant_listings_to_listing_rule_per_rule_id_map(
-    variants: ProductVariantQueryset,
+    variant_channel_listings: QuerySet[ProductVariantChannelListing],
 ):
     """Return map for fetching VariantChannelListingPromotionRule per listing per rule.
 
@@ -221,9 +265,6 @@ def _get_variant_listings_to_listing_rule_per_rule_id_map(
     variant_listing_rule_data: dict[
         int, dict[UUID, VariantChannelListingPromotionRule]
     ] = defaultdict(dict)
-    variant_channel_listings = ProductVariantChannelListing.objects.filter(
-        Exists(variants.filter(id=OuterRef("variant_id"))), price_amount__isnull=False
-    )
     variant_listing_promotion_rules = VariantChannelListingPromotionRule.objects.filter(
         Exists(
             variant_channel_listings.filter(id=OuterRef("variant_channel_listing_id"))
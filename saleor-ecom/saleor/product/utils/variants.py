@@ -1,13 +1,13 @@
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
-from django.conf import settings
 from django.db.models import QuerySet
 
 from ...attribute import AttributeType
 from ...discount.models import PromotionRule
-from ...discount.utils.promotion import update_rule_variant_relation
+from ...discount.utils.promotion import update_rule_variant_relation_in_database
 from ..models import ProductVariant
+from .product import mark_products_in_channels_as_dirty_for_rule
 
 if TYPE_CHECKING:
     from ...attribute.models import AssignedVariantAttribute, Attribute
@@ -53,22 +53,23 @@ def get_variant_selection_attributes(
     ]
 
 
-def fetch_variants_for_promotion_rules(rules: QuerySet[PromotionRule]):
+def update_variants_for_promotion_rules(
+    rules: QuerySet[PromotionRule], *, mark_products_as_dirty: bool = True
+):
+    """Update variants assigned to the rules based on the catalogue predicates.
+
+    The rule - variant relations are calculated in the database, so the variants
+    are not fetched. The listings of products of the variants that were and are
+    assigned to the rule are marked as dirty, unless `mark_products_as_dirty`
+    is False.
+    """
     from ...graphql.discount.utils import get_variants_for_catalogue_predicate
 
-    PromotionRuleVariant = PromotionRule.variants.through
-    new_rules_variants = []
     for rule in rules.iterator():
-        variants = get_variants_for_catalogue_predicate(
-            rule.catalogue_predicate,
-            database_connection_name=settings.DATABASE_CONNECTION_REPLICA_NAME,
-        )
-        new_rules_variants.extend(
-            [
-                PromotionRuleVariant(
-                    promotionrule_id=rule.pk, productvariant_id=variant_id
-                )
-                for variant_id in set(variants.values_list("pk", flat=True))
-            ]
-        )
-    return update_rule_variant_relation(rules, new_rules_variants)
+        variants = get_variants_for_catalogue_predicate(rule.catalogue_predicate)
+        if mark_products_as_dirty:
+            # the products of the variants removed from the rule need recalculation
+            mark_products_in_channels_as_dirty_for_rule(rule.pk)
+        update_rule_variant_relation_in_database(rule.pk, variants)
+        if mark_products_as_dirty:
+            mark_products_in_channels_as_dirty_for_rule(rule.pk)
@@ -662,6 +662,13 @@ BEAT_PRICE_RECALCULATION_SCHEDULE = parse(
 )
 BEAT_PRICE_RECALCULATION_SCHEDULE_EXPIRE_AFTER_SEC = BEAT_PRICE_RECALCULATION_SCHEDULE
 
+# The full refresh of the products stock availability, which covers the expired
+# reservations and the changes of the warehouses and shipping zones.
+BEAT_UPDATE_STOCK_AVAILABILITY_SEC = parse(
+    os.environ.get("BEAT_UPDATE_STOCK_AVAILABILITY_FREQUENCY", "1 minute")
+)
+BEAT_UPDATE_STOCK_AVAILABILITY_EXPIRE_AFTER_SEC = BEAT_UPDATE_STOCK_AVAILABILITY_SEC
+
 # Defines the Celery beat scheduler entries.
 #
 # Note: if a Celery task triggered by a Celery beat entry has an expiration
@@ -681,6 +688,11 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.warehouse.tasks.delete_expired_reservations_task",
         "schedule": datetime.timedelta(days=1),
     },
+    "update-products-stock-availability": {
+        "task": "saleor.warehouse.tasks.update_products_stock_availability_task",
+        "schedule": datetime.timedelta(seconds=BEAT_UPDATE_STOCK_AVAILABILITY_SEC),
+        "options": {"expires": BEAT_UPDATE_STOCK_AVAILABILITY_EXPIRE_AFTER_SEC},
+    },
     "delete-expired-checkouts": {
         "task": "saleor.checkout.tasks.delete_expired_checkouts",
         "schedule": crontab(hour=0, minute=0),
@@ -731,6 +743,12 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.payment.tasks.transaction_release_funds_for_checkout_task",
         "schedule": datetime.timedelta(minutes=10),
     },
+    "queue-unprocessed-adyen-notifications": {
+        "task": (
+            "saleor.payment.gateways.adyen.tasks.queue_unprocessed_notifications_task"
+        ),
+        "schedule": datetime.timedelta(minutes=10),
+    },
     "recalculate-promotion-rules": {
         "task": (
             "saleor.product.tasks"
@@ -839,6 +857,11 @@ else:
 
 
 GRAPHQL_PAGINATION_LIMIT = 100
+# Above this number of items, `totalCount` of the connections is estimated by the
+# query planner instead of counting all the items. Set to 0 to always count exactly.
+GRAPHQL_TOTAL_COUNT_EXACT_LIMIT = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_EXACT_LIMIT", 0)
+)
 GRAPHQL_MIDDLEWARE: list[str] = []
 
 # Set GRAPHQL_QUERY_MAX_COMPLEXITY=0 in env to disable (not recommended)
@@ -979,6 +1002,15 @@ PRODUCT_MAX_INDEXED_ATTRIBUTES = 1000
 PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES = 100
 PRODUCT_MAX_INDEXED_VARIANTS = 1000
 
+# The max number of products returned by the typeahead product search
+PRODUCT_TYPEAHEAD_MAX_RESULTS = int(os.environ.get("PRODUCT_TYPEAHEAD_MAX_RESULTS", 20))
+# The max number of products matching the typeahead search that are ranked. Short
+# prefixes can match a big part of the catalogue, so ranking is limited to keep
+# the latency independent of the catalogue size.
+PRODUCT_TYPEAHEAD_RANKED_CANDIDATES = int(
+    os.environ.get("PRODUCT_TYPEAHEAD_RANKED_CANDIDATES", 500)
+)
+
 
 # Patch SubscriberExecutionContext class from `graphql-core-legacy` package
 # to fix bug causing not returning errors for subscription queries.
@@ -1047,6 +1079,24 @@ TOKEN_UPDATE_LAST_LOGIN_THRESHOLD = parse(
     os.environ.get("TOKEN_UPDATE_LAST_LOGIN_THRESHOLD", "5 seconds")
 )
 
+# Allocate stocks with conditional `UPDATE` statements instead of locking all stocks
+# of the ordered variants for the whole order. Reduces the contention between
+# concurrent checkouts of the same variants, e.g. during flash sales.
+STOCK_ALLOCATION_CONDITIONAL_UPDATE = get_bool_from_env(
+    "STOCK_ALLOCATION_CONDITIONAL_UPDATE", False
+)
+
+# The max number of attempts to allocate the missing quantity from other stocks
+# when a concurrent checkout allocated the stock first.
+STOCK_ALLOCATION_MAX_RETRIES = int(os.environ.get("STOCK_ALLOCATION_MAX_RETRIES", 3))
+
+# Time (sec) for which the active order promotion rules, with the order predicates
+# compiled into in-memory evaluators, are kept in the process memory. The cache is
+# invalidated on any promotion change as well. Set to 0 to disable the cache.
+ORDER_PROMOTION_RULES_CACHE_TIMEOUT = int(
+    os.environ.get("ORDER_PROMOTION_RULES_CACHE_TIMEOUT", 60)
+)
+
 # Max lock time for checkout processing.
 # It prevents locking checkout when unhandled issue appears.
 CHECKOUT_COMPLETION_LOCK_TIME: int = cast(
@@ -1064,6 +1114,13 @@ WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT = 18
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 
+# The max number of synchronous webhook requests sent concurrently to multiple apps
+# subscribed to the same event, e.g. to the shipping apps listing shipping methods.
+# Set to 1 to send the requests one after another.
+WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS = int(
+    os.environ.get("WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS", 4)
+)
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
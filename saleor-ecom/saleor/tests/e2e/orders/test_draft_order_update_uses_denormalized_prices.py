@@ -6,7 +6,7 @@ from ....core.prices import quantize_price
 from ....discount.models import PromotionRule
 from ....product.models import Product
 from ....product.utils.variant_prices import update_discounted_prices_for_promotion
-from ....product.utils.variants import fetch_variants_for_promotion_rules
+from ....product.utils.variants import update_variants_for_promotion_rules
 from .. import DEFAULT_ADDRESS
 from ..product.utils import create_product_variant_channel_listing
 from ..product.utils.preparing_product import prepare_product
@@ -125,7 +125,9 @@ def test_draft_order_update_uses_denormalized_prices_CORE_0251(
     promotion_rule_id = promotion_rule["id"]
 
     # update prices
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     update_discounted_prices_for_promotion(Product.objects.all())
 
     # Step 1 - Create a draft order for a product with fixed promotion
@@ -203,7 +205,9 @@ def test_draft_order_update_uses_denormalized_prices_CORE_0251(
     input = {"rewardValue": new_discount_reward}
     update_promotion_rule(e2e_staff_api_client, promotion_rule_id, input)
 
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     update_discounted_prices_for_promotion(Product.objects.all())
 
     # Step 4 - Create new shipping method
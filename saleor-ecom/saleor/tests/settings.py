@@ -40,6 +40,9 @@ MEDIA_ROOT = ""
 MEDIA_URL = "/media/"
 MAX_CHECKOUT_LINE_QUANTITY = 50
 
+# The cached rules would outlive the test data rolled back after each test.
+ORDER_PROMOTION_RULES_CACHE_TIMEOUT = 0
+
 AUTH_PASSWORD_VALIDATORS = []
 
 PASSWORD_HASHERS = ["saleor.tests.dummy_password_hasher.DummyHasher"]
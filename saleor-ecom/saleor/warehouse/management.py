@@ -1,9 +1,11 @@
 import math
 from collections import defaultdict
 from collections.abc import Iterable
+from functools import partial
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
 from django.db.models import F, Sum
 from django.db.models.expressions import Exists, OuterRef
@@ -32,6 +34,7 @@ from .models import (
     Stock,
     Warehouse,
 )
+from .stock_availability import schedule_products_stock_availability_update
 
 if TYPE_CHECKING:
     from ..channel.models import Channel
@@ -53,12 +56,16 @@ def stock_qs_select_for_update():
 
 def delete_stocks(stock_pks_to_delete: list[int]):
     with transaction.atomic():
-        return Stock.objects.filter(
+        stocks = Stock.objects.filter(
             id__in=Stock.objects.order_by("pk")
             .select_for_update(of=["self"])
             .values_list("pk", flat=True)
             .filter(id__in=stock_pks_to_delete)
-        ).delete()
+        )
+        schedule_products_stock_availability_update(
+            stocks.values_list("product_variant_id", flat=True)
+        )
+        return stocks.delete()
 
 
 def stock_bulk_update(stocks: list[Stock], fields_to_update: list[str]):
@@ -69,6 +76,9 @@ def stock_bulk_update(stocks: list[Stock], fields_to_update: list[str]):
             .values_list("id", flat=True)
         )
         Stock.objects.bulk_update(stocks, fields_to_update)
+        schedule_products_stock_availability_update(
+            stock.product_variant_id for stock in stocks
+        )
 
 
 def allocation_with_stock_qs_select_for_update():
@@ -124,6 +134,7 @@ def allocate_stocks(
 
     variants = [line_info.variant for line_info in order_lines_info]
     filter_lookup = {"product_variant__in": variants}
+    schedule_products_stock_availability_update(variant.pk for variant in variants)
 
     if additional_filter_lookup is not None:
         filter_lookup.update(additional_filter_lookup)
@@ -136,6 +147,18 @@ def allocate_stocks(
         else Stock.objects.for_channel_and_country(channel_slug, country_code)
     )
 
+    if settings.STOCK_ALLOCATION_CONDITIONAL_UPDATE:
+        _allocate_stocks_with_conditional_update(
+            order_lines_info,
+            stocks.filter(**filter_lookup),
+            channel,
+            manager,
+            collection_point_pk=collection_point_pk,
+            check_reservations=check_reservations,
+            checkout_lines=checkout_lines,
+        )
+        return
+
     stocks = list(
         stock_select_for_update_for_existing_qs(stocks)
         .filter(**filter_lookup)
@@ -214,6 +237,209 @@ def allocate_stocks(
                 )
 
 
+def _allocate_stocks_with_conditional_update(
+    order_lines_info: list["OrderLineInfo"],
+    stocks_qs,
+    channel: "Channel",
+    manager: PluginsManager,
+    collection_point_pk: UUID | None = None,
+    check_reservations: bool = False,
+    checkout_lines: Iterable["CheckoutLine"] | None = None,
+):
+    """Allocate stocks with conditional updates instead of locking all stocks.
+
+    The stocks are read without locks and the allocations are planned in the order
+    returned by `sort_stocks`. The planned quantity is then applied to each stock
+    with a single conditional `UPDATE`, that increases `quantity_allocated` only
+    when the stock still has enough available quantity. The stocks are updated
+    in `pk` order, so only the rows that receive an allocation are locked and
+    concurrent checkouts acquire them in the same order.
+
+    When a concurrent checkout wins the race for the stock, the stock data
+    is fetched again and the missing quantity is planned for the remaining stocks,
+    up to `STOCK_ALLOCATION_MAX_RETRIES` times. If there is still not enough
+    quantity, raise InsufficientStock exception.
+    """
+    quantity_to_allocate_per_line = [
+        line_info.quantity for line_info in order_lines_info
+    ]
+    allocated_quantity_per_line_and_stock: dict[tuple[int, int], int] = defaultdict(int)
+    updated_stock_pks: set[int] = set()
+    # the quantity still available for the variants according to the last
+    # fetched stock data
+    available_quantity_per_variant: dict[int, int] = {}
+
+    for _attempt in range(settings.STOCK_ALLOCATION_MAX_RETRIES + 1):
+        variant_pks = {
+            cast(ProductVariant, line_info.variant).pk
+            for index, line_info in enumerate(order_lines_info)
+            if quantity_to_allocate_per_line[index]
+        }
+        if not variant_pks:
+            break
+
+        stocks = list(
+            stocks_qs.filter(product_variant_id__in=variant_pks).values(
+                "pk",
+                "product_variant",
+                "quantity",
+                "quantity_allocated",
+                "warehouse_id",
+            )
+        )
+        quantity_reservation_for_stocks: dict = _prepare_stock_to_reserved_quantity_map(
+            checkout_lines,
+            check_reservations,
+            [stock_data["pk"] for stock_data in stocks],
+        )
+        quantity_allocation_for_stocks: dict[int, int] = {
+            stock_data["pk"]: stock_data.pop("quantity_allocated")
+            for stock_data in stocks
+        }
+        stocks = sort_stocks(
+            channel.allocation_strategy,
+            stocks,
+            channel,
+            quantity_allocation_for_stocks,
+            collection_point_pk,
+        )
+        variant_to_stocks: dict[int, list[StockData]] = defaultdict(list)
+        for stock_data in stocks:
+            variant = stock_data.pop("product_variant")
+            variant_to_stocks[variant].append(StockData(**stock_data))
+        available_quantity_per_variant = {
+            variant_pk: sum(
+                max(
+                    stock_data.quantity
+                    - quantity_allocation_for_stocks.get(stock_data.pk, 0)
+                    - quantity_reservation_for_stocks.get(stock_data.pk, 0),
+                    0,
+                )
+                for stock_data in variant_stocks
+            )
+            for variant_pk, variant_stocks in variant_to_stocks.items()
+        }
+
+        stock_to_planned_allocations = _plan_allocations_for_conditional_update(
+            order_lines_info,
+            quantity_to_allocate_per_line,
+            variant_to_stocks,
+            quantity_allocation_for_stocks,
+            quantity_reservation_for_stocks,
+        )
+        if not stock_to_planned_allocations:
+            break
+
+        for stock_pk in sorted(stock_to_planned_allocations):
+            planned_allocations = stock_to_planned_allocations[stock_pk]
+            allocated = _increase_stock_quantity_allocated_if_available(
+                stock_pk,
+                sum(quantity for _, quantity in planned_allocations),
+                quantity_reservation_for_stocks.get(stock_pk, 0),
+            )
+            if not allocated:
+                # the stock was allocated by a concurrent checkout, the missing
+                # quantity will be planned again based on the refreshed stock data
+                continue
+            updated_stock_pks.add(stock_pk)
+            for line_index, quantity in planned_allocations:
+                quantity_to_allocate_per_line[line_index] -= quantity
+                variant_pk = cast(
+                    ProductVariant, order_lines_info[line_index].variant
+                ).pk
+                available_quantity_per_variant[variant_pk] -= quantity
+                allocated_quantity_per_line_and_stock[(line_index, stock_pk)] += (
+                    quantity
+                )
+
+    insufficient_stock = [
+        InsufficientStockData(
+            variant=line_info.variant,
+            order_line=line_info.line,
+            available_quantity=(
+                line_info.quantity
+                - quantity_to_allocate_per_line[index]
+                + available_quantity_per_variant.get(
+                    cast(ProductVariant, line_info.variant).pk, 0
+                )
+            ),
+        )
+        for index, line_info in enumerate(order_lines_info)
+        if quantity_to_allocate_per_line[index]
+    ]
+    if insufficient_stock:
+        raise InsufficientStock(insufficient_stock)
+
+    Allocation.objects.bulk_create(
+        [
+            Allocation(
+                order_line=order_lines_info[line_index].line,
+                stock_id=stock_pk,
+                quantity_allocated=quantity,
+            )
+            for (
+                line_index,
+                stock_pk,
+            ), quantity in allocated_quantity_per_line_and_stock.items()
+        ]
+    )
+
+    out_of_stock = Stock.objects.filter(
+        pk__in=updated_stock_pks, quantity__lte=F("quantity_allocated")
+    )
+    for stock in out_of_stock:
+        transaction.on_commit(partial(manager.product_variant_out_of_stock, stock))
+
+
+def _plan_allocations_for_conditional_update(
+    order_lines_info: list["OrderLineInfo"],
+    quantity_to_allocate_per_line: list[int],
+    variant_to_stocks: dict[int, list[StockData]],
+    stocks_allocations: dict[int, int],
+    stocks_reservations: dict,
+) -> dict[int, list[tuple[int, int]]]:
+    """Return the stock pk to the list of (line index, quantity) to allocate map."""
+    stocks_allocations = stocks_allocations.copy()
+    stock_to_planned_allocations: dict[int, list[tuple[int, int]]] = defaultdict(list)
+    for index, line_info in enumerate(order_lines_info):
+        quantity = quantity_to_allocate_per_line[index]
+        variant = cast(ProductVariant, line_info.variant)
+        for stock_data in variant_to_stocks[variant.pk]:
+            if not quantity:
+                break
+            quantity_available_in_stock = (
+                stock_data.quantity
+                - stocks_allocations.get(stock_data.pk, 0)
+                - stocks_reservations.get(stock_data.pk, 0)
+            )
+            quantity_to_allocate = min(quantity, quantity_available_in_stock)
+            if quantity_to_allocate > 0:
+                stock_to_planned_allocations[stock_data.pk].append(
+                    (index, quantity_to_allocate)
+                )
+                stocks_allocations[stock_data.pk] = (
+                    stocks_allocations.get(stock_data.pk, 0) + quantity_to_allocate
+                )
+                quantity -= quantity_to_allocate
+    return stock_to_planned_allocations
+
+
+def _increase_stock_quantity_allocated_if_available(
+    stock_pk: int, quantity: int, quantity_reserved: int
+) -> bool:
+    """Increase the allocated quantity only if the stock has enough quantity.
+
+    The check and the update are executed as a single
+    `UPDATE ... WHERE quantity >= quantity_allocated + n` statement.
+    """
+    return bool(
+        Stock.objects.filter(
+            pk=stock_pk,
+            quantity__gte=F("quantity_allocated") + quantity + quantity_reserved,
+        ).update(quantity_allocated=F("quantity_allocated") + quantity)
+    )
+
+
 def _prepare_stock_to_reserved_quantity_map(
     checkout_lines, check_reservations, stocks_id
 ):
@@ -399,6 +625,9 @@ def deallocate_stock(order_lines_data: list["OrderLineInfo"], manager: PluginsMa
             )
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    schedule_products_stock_availability_update(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
     if not_dellocated_lines:
         raise AllocationError(not_dellocated_lines)
@@ -444,6 +673,7 @@ def increase_stock(
             )
         stock.quantity_allocated = F("quantity_allocated") + quantity
         stock.save(update_fields=["quantity_allocated"])
+    schedule_products_stock_availability_update([stock.product_variant_id])
 
 
 @traced_atomic_transaction()
@@ -559,6 +789,9 @@ def decrease_stock(
             quantity_allocation_for_stocks,
             allow_stock_to_be_exceeded,
         )
+        schedule_products_stock_availability_update(
+            variant.pk for variant in variants if variant
+        )
 
         stock_ids = (s.id for s in stocks)
         for stock in Stock.objects.filter(
@@ -662,33 +895,49 @@ def deallocate_stock_for_order(order: "Order", manager: PluginsManager):
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    schedule_products_stock_availability_update(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
 
 @traced_atomic_transaction()
 def deallocate_stock_for_orders(orders_id, manager: PluginsManager):
-    """Remove all allocations for given order."""
+    """Remove all allocations for given orders.
+
+    The allocated quantities are summed up per stock, so each stock is updated once,
+    also when it is allocated by many of the orders.
+    """
     lines = OrderLine.objects.filter(order_id__in=orders_id)
-    allocations = allocation_with_stock_qs_select_for_update().filter(
-        Exists(lines.filter(id=OuterRef("order_line_id"))), quantity_allocated__gt=0
+    allocations = list(
+        allocation_with_stock_qs_select_for_update().filter(
+            Exists(lines.filter(id=OuterRef("order_line_id"))),
+            quantity_allocated__gt=0,
+        )
     )
+    if not allocations:
+        return
 
-    stocks_to_update = []
-    for alloc in allocations:
-        stock = alloc.stock
-        stock.quantity_allocated = F("quantity_allocated") - alloc.quantity_allocated
-        stocks_to_update.append(stock)
-
-    allocations_for_back_in_stock = Allocation.objects.filter(
-        id__in=[allocation.id for allocation in allocations]
-    )
-    for allocation in allocations_for_back_in_stock.annotate_stock_available_quantity():
-        if allocation.stock_available_quantity <= 0:
-            transaction.on_commit(
-                lambda: manager.product_variant_back_in_stock(allocation.stock)
-            )
+    stocks: dict[int, Stock] = {}
+    quantity_to_deallocate: dict[int, int] = defaultdict(int)
+    for allocation in allocations:
+        stocks[allocation.stock_id] = allocation.stock
+        quantity_to_deallocate[allocation.stock_id] += allocation.quantity_allocated
+
+    stocks_to_update = list(stocks.values())
+    for stock in stocks_to_update:
+        if stock.quantity - stock.quantity_allocated <= 0:
+            transaction.on_commit(partial(manager.product_variant_back_in_stock, stock))
+        stock.quantity_allocated = (
+            F("quantity_allocated") - quantity_to_deallocate[stock.pk]
+        )
 
-    allocations.update(quantity_allocated=0)
+    Allocation.objects.filter(
+        id__in=[allocation.pk for allocation in allocations]
+    ).update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    schedule_products_stock_availability_update(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
 
 @traced_atomic_transaction()
@@ -900,6 +1149,7 @@ def deactivate_preorder_for_variant(product_variant: ProductVariant):
 
     if allocations_to_create:
         Allocation.objects.bulk_create(allocations_to_create)
+    schedule_products_stock_availability_update([product_variant.pk])
 
     if preorder_allocations:
         preorder_allocations.delete()
@@ -13,6 +13,7 @@ from ..core.tracing import traced_atomic_transaction
 from ..product.models import ProductVariant, ProductVariantChannelListing
 from .management import sort_stocks, stock_qs_select_for_update
 from .models import Allocation, PreorderReservation, Reservation
+from .stock_availability import schedule_products_stock_availability_update
 
 if TYPE_CHECKING:
     from ..channel.models import Channel
@@ -177,6 +178,9 @@ def reserve_stocks(
         if replace:
             Reservation.objects.filter(checkout_line__in=checkout_lines).delete()
         Reservation.objects.bulk_create(reservations)
+        schedule_products_stock_availability_update(
+            line.variant_id for line in checkout_lines
+        )
 
 
 def _create_stock_reservations(
@@ -0,0 +1,106 @@
+"""Maintain the `ProductChannelListing.is_in_stock` flag.
+
+The flag is refreshed by a task scheduled after the stock quantities,
+allocations or reservations of the product variants change, and periodically
+for all products to reflect the expired reservations and the changes of
+the warehouses and shipping zones.
+"""
+
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from ..channel.models import Channel
+from ..product.models import ProductChannelListing, ProductVariant
+from .models import Allocation, Reservation, Stock, Warehouse
+
+
+def get_product_variants_in_stock(database_connection_name: str, channel_slug):
+    allocations = (
+        Allocation.objects.using(database_connection_name)
+        .values("stock_id")
+        .filter(quantity_allocated__gt=0, stock_id=OuterRef("pk"))
+        .values_list(Sum("quantity_allocated"))
+    )
+    allocated_subquery = Subquery(queryset=allocations, output_field=IntegerField())
+
+    reservations = (
+        Reservation.objects.using(database_connection_name)
+        .values("stock_id")
+        .filter(
+            quantity_reserved__gt=0,
+            stock_id=OuterRef("pk"),
+            reserved_until__gt=timezone.now(),
+        )
+        .values_list(Sum("quantity_reserved"))
+    )
+    reservation_subquery = Subquery(queryset=reservations, output_field=IntegerField())
+    warehouse_pks = list(
+        Warehouse.objects.using(database_connection_name)
+        .for_channel_with_active_shipping_zone_or_cc(channel_slug)
+        .values_list("pk", flat=True)
+    )
+    stocks = (
+        Stock.objects.using(database_connection_name)
+        .filter(
+            warehouse_id__in=warehouse_pks,
+            quantity__gt=Coalesce(allocated_subquery, 0)
+            + Coalesce(reservation_subquery, 0),
+        )
+        .values("product_variant_id")
+    )
+
+    return (
+        ProductVariant.objects.using(database_connection_name)
+        .filter(Exists(stocks.filter(product_variant_id=OuterRef("pk"))))
+        .values("product_id")
+    )
+
+
+def update_products_stock_availability(product_ids: Iterable[int] | None = None):
+    """Refresh the `is_in_stock` flag of the product channel listings.
+
+    All listings are refreshed when `product_ids` is not given. Only the listings
+    which availability has changed are updated.
+    """
+    if product_ids is not None:
+        product_ids = list(product_ids)
+        if not product_ids:
+            return
+
+    database_connection_name = settings.DATABASE_CONNECTION_DEFAULT_NAME
+    for channel in Channel.objects.only("slug"):
+        variants_in_stock = get_product_variants_in_stock(
+            database_connection_name, channel.slug
+        )
+        in_stock = Exists(variants_in_stock.filter(product_id=OuterRef("product_id")))
+        listings = ProductChannelListing.objects.filter(channel_id=channel.pk)
+        if product_ids is not None:
+            listings = listings.filter(product_id__in=product_ids)
+        listings.filter(in_stock, is_in_stock=False).update(is_in_stock=True)
+        listings.filter(~in_stock, is_in_stock=True).update(is_in_stock=False)
+
+
+def schedule_products_stock_availability_update(
+    variant_ids: Iterable[int] = (), product_ids: Iterable[int] = ()
+):
+    """Refresh the stock availability of the products after the commit.
+
+    The update is done asynchronously to not lock the product channel listings
+    in the transactions changing the stocks.
+    """
+    from .tasks import update_products_stock_availability_task
+
+    variant_ids = sorted(set(variant_ids))
+    product_ids = sorted(set(product_ids))
+    if not variant_ids and not product_ids:
+        return
+    transaction.on_commit(
+        lambda: update_products_stock_availability_task.delay(
+            variant_ids=variant_ids, product_ids=product_ids
+        )
+    )
@@ -5,8 +5,10 @@ from django.utils import timezone
 
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
+from ..product.models import ProductVariant
 from .management import delete_allocations, stock_bulk_update
 from .models import Allocation, PreorderReservation, Reservation, Stock
+from .stock_availability import update_products_stock_availability
 
 task_logger = get_task_logger(__name__)
 
@@ -66,3 +68,25 @@ def update_stocks_quantity_allocated_task():
         "Finished updating quantity_allocated on stocks, %d were corrected.",
         len(stocks_to_update),
     )
+
+
+@app.task
+@allow_writer()
+def update_products_stock_availability_task(variant_ids=None, product_ids=None):
+    """Refresh the stock availability flags of the given products and variants.
+
+    All products are refreshed when neither `variant_ids` nor `product_ids`
+    is given.
+    """
+    if variant_ids is None and product_ids is None:
+        update_products_stock_availability()
+        return
+
+    product_ids = set(product_ids or [])
+    if variant_ids:
+        product_ids.update(
+            ProductVariant.objects.filter(id__in=variant_ids).values_list(
+                "product_id", flat=True
+            )
+        )
+    update_products_stock_availability(product_ids)
@@ -0,0 +1,99 @@
+from unittest import mock
+
+from ...product.models import ProductChannelListing
+from ..management import stock_bulk_update
+from ..models import Allocation, Stock
+from ..stock_availability import update_products_stock_availability
+
+
+def test_update_products_stock_availability(product, channel_USD):
+    # given
+    listing = product.channel_listings.get(channel=channel_USD)
+    assert listing.is_in_stock is False
+
+    # when
+    update_products_stock_availability([product.pk])
+
+    # then
+    listing.refresh_from_db()
+    assert listing.is_in_stock is True
+
+
+def test_update_products_stock_availability_out_of_stock(product, channel_USD):
+    # given
+    ProductChannelListing.objects.filter(product=product).update(is_in_stock=True)
+    Stock.objects.filter(product_variant__product=product).update(quantity=0)
+
+    # when
+    update_products_stock_availability([product.pk])
+
+    # then
+    listing = product.channel_listings.get(channel=channel_USD)
+    assert listing.is_in_stock is False
+
+
+def test_update_products_stock_availability_includes_allocations(
+    product, order_line, channel_USD
+):
+    # given
+    stocks = Stock.objects.filter(product_variant__product=product)
+    assert stocks
+    Allocation.objects.bulk_create(
+        [
+            Allocation(
+                order_line=order_line, stock=stock, quantity_allocated=stock.quantity
+            )
+            for stock in stocks
+        ]
+    )
+
+    # when
+    update_products_stock_availability([product.pk])
+
+    # then
+    listing = product.channel_listings.get(channel=channel_USD)
+    assert listing.is_in_stock is False
+
+
+def test_update_products_stock_availability_only_given_products(
+    product_list, channel_USD
+):
+    # given
+    product = product_list[0]
+
+    # when
+    update_products_stock_availability([product.pk])
+
+    # then
+    listings = ProductChannelListing.objects.filter(channel=channel_USD)
+    assert set(
+        listings.filter(is_in_stock=True).values_list("product_id", flat=True)
+    ) == {product.pk}
+
+
+def test_update_products_stock_availability_all_products(product_list, channel_USD):
+    # when
+    update_products_stock_availability()
+
+    # then
+    listings = ProductChannelListing.objects.filter(channel=channel_USD)
+    assert listings.filter(is_in_stock=True).count() == len(product_list)
+
+
+@mock.patch("saleor.warehouse.tasks.update_products_stock_availability_task.delay")
+def test_stock_bulk_update_schedules_stock_availability_update(
+    mocked_task, variant_with_many_stocks, django_capture_on_commit_callbacks
+):
+    # given
+    stocks = list(variant_with_many_stocks.stocks.all())
+    for stock in stocks:
+        stock.quantity = 0
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        stock_bulk_update(stocks, ["quantity"])
+
+    # then
+    mocked_task.assert_called_once_with(
+        variant_ids=[variant_with_many_stocks.pk], product_ids=[]
+    )
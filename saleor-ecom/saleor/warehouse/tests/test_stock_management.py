@@ -10,11 +10,13 @@ from ...order.fetch import OrderLineInfo
 from ...order.models import OrderLine
 from ...plugins.manager import get_plugins_manager
 from ...warehouse.models import Stock
+from .. import management
 from ..management import (
     allocate_preorders,
     allocate_stocks,
     deallocate_stock,
     deallocate_stock_for_order,
+    deallocate_stock_for_orders,
     decrease_stock,
     increase_allocations,
     increase_stock,
@@ -474,6 +476,182 @@ def test_allocate_stock_insufficient_stocks_for_multiple_lines(
     ).exists()
 
 
+def test_allocate_stocks_with_conditional_update(
+    order_line, stock, channel_USD, settings
+):
+    # given
+    settings.STOCK_ALLOCATION_CONDITIONAL_UPDATE = True
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity == 100
+    allocation = Allocation.objects.get(order_line=order_line, stock=stock)
+    assert allocation.quantity_allocated == stock.quantity_allocated == 50
+
+
+def test_allocate_stock_many_stocks_with_conditional_update(
+    order_line, variant_with_many_stocks, channel_USD, settings
+):
+    # given
+    settings.STOCK_ALLOCATION_CONDITIONAL_UPDATE = True
+    variant = variant_with_many_stocks
+    stocks = variant.stocks.all()
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=5)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+
+    # then
+    allocations = Allocation.objects.filter(order_line=order_line, stock__in=stocks)
+    assert allocations[0].quantity_allocated == stocks[0].quantity_allocated == 4
+    assert allocations[1].quantity_allocated == stocks[1].quantity_allocated == 1
+
+
+def test_allocate_stock_with_conditional_update_and_reservations(
+    order_line,
+    variant_with_many_stocks,
+    channel_USD,
+    checkout_line_with_one_reservation,
+    settings,
+):
+    # given
+    settings.STOCK_ALLOCATION_CONDITIONAL_UPDATE = True
+    variant = variant_with_many_stocks
+    stocks = variant.stocks.all()
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=3)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+        check_reservations=True,
+    )
+
+    # then
+    allocations = Allocation.objects.filter(order_line=order_line, stock__in=stocks)
+    assert allocations[0].quantity_allocated == 2
+    assert allocations[1].quantity_allocated == 1
+
+
+def test_allocate_stock_with_conditional_update_stock_allocated_concurrently(
+    order_line, variant_with_many_stocks, channel_USD, settings
+):
+    # given
+    settings.STOCK_ALLOCATION_CONDITIONAL_UPDATE = True
+    variant = variant_with_many_stocks
+    stocks = list(variant.stocks.order_by("-quantity"))
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=3)
+
+    def allocate_by_concurrent_checkout(stock_pk, *args, **kwargs):
+        # the concurrent checkout allocates the whole first stock in the meantime
+        Stock.objects.filter(pk=stocks[0].pk).update(quantity_allocated=4)
+        mocked_update.side_effect = original_update
+        return original_update(stock_pk, *args, **kwargs)
+
+    # when
+    original_update = management._increase_stock_quantity_allocated_if_available
+    with mock.patch.object(
+        management,
+        "_increase_stock_quantity_allocated_if_available",
+        side_effect=allocate_by_concurrent_checkout,
+    ) as mocked_update:
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    allocation = Allocation.objects.get(order_line=order_line)
+    assert allocation.stock_id == stocks[1].pk
+    assert allocation.quantity_allocated == 3
+    for stock in stocks:
+        stock.refresh_from_db()
+    assert stocks[0].quantity_allocated == 4
+    assert stocks[1].quantity_allocated == 3
+
+
+def test_allocate_stock_insufficient_stocks_with_conditional_update(
+    order_line, variant_with_many_stocks, channel_USD, settings
+):
+    # given
+    settings.STOCK_ALLOCATION_CONDITIONAL_UPDATE = True
+    variant = variant_with_many_stocks
+    stocks = variant.stocks.all()
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=10)
+
+    # when
+    with pytest.raises(InsufficientStock) as exc:
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    [item] = exc.value.items
+    assert item.variant == variant
+    assert item.available_quantity == sum(stock.quantity for stock in stocks)
+    assert not Allocation.objects.filter(
+        order_line=order_line, stock__in=stocks
+    ).exists()
+    assert not stocks.filter(quantity_allocated__gt=0).exists()
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_with_conditional_update_out_of_stock_webhook_triggered(
+    product_variant_out_of_stock_mock,
+    order_line,
+    stock,
+    channel_USD,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.STOCK_ALLOCATION_CONDITIONAL_UPDATE = True
+    stock.quantity = 5
+    stock.save(update_fields=["quantity"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=5)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    product_variant_out_of_stock_mock.assert_called_once_with(stock)
+
+
 def test_deallocate_stock(allocation):
     stock = allocation.stock
     stock.quantity = 100
@@ -1033,6 +1211,33 @@ def test_deallocate_stock_for_order(order_line_with_allocation_in_many_stocks):
     )
 
 
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_back_in_stock")
+def test_deallocate_stock_for_orders_with_shared_stock(
+    product_variant_back_in_stock_webhook,
+    allocations,
+    order_list,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    stock = allocations[0].stock
+    stock.quantity = 7
+    stock.quantity_allocated = 7
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        deallocate_stock_for_orders(
+            [order.pk for order in order_list],
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 0
+    assert not Allocation.objects.filter(quantity_allocated__gt=0).exists()
+    product_variant_back_in_stock_webhook.assert_called_once_with(stock)
+
+
 @mock.patch("saleor.plugins.manager.PluginsManager.product_variant_back_in_stock")
 def test_increase_stock_with_back_in_stock_webhook_not_triggered(
     product_variant_back_in_stock_webhook,
@@ -3,10 +3,12 @@ import datetime
 import pytest
 from django.utils import timezone
 
+from ...product.models import ProductChannelListing
 from ..models import Allocation, PreorderReservation, Reservation
 from ..tasks import (
     delete_empty_allocations_task,
     delete_expired_reservations_task,
+    update_products_stock_availability_task,
     update_stocks_quantity_allocated_task,
 )
 
@@ -104,3 +106,22 @@ def test_update_stocks_quantity_allocated_task_stock_without_allocations(stock):
 
     stock.refresh_from_db()
     assert stock.quantity_allocated == 0
+
+
+def test_update_products_stock_availability_task(product_list, channel_USD):
+    # given
+    variant = product_list[0].variants.first()
+
+    # when
+    update_products_stock_availability_task(
+        variant_ids=[variant.pk], product_ids=[product_list[1].pk]
+    )
+
+    # then
+    listings = ProductChannelListing.objects.filter(
+        channel=channel_USD, is_in_stock=True
+    )
+    assert set(listings.values_list("product_id", flat=True)) == {
+        product_list[0].pk,
+        product_list[1].pk,
+    }
@@ -154,6 +154,15 @@ class BreakerBoard:
                 )
         return state
 
+    def is_webhook_blocked(self, app: "App", event_type: str) -> bool:
+        """Check if the webhooks of the event are skipped for the app."""
+        if (
+            event_type not in settings.BREAKER_BOARD_SYNC_EVENTS
+            or event_type in settings.BREAKER_BOARD_DRY_RUN_SYNC_EVENTS
+        ):
+            return False
+        return self.update_breaker_state(app) == CircuitBreakerState.OPEN
+
     def register_error(self, app_id: int):
         self.storage.register_event(app_id, "error", self.ttl_seconds)
         self.storage.register_event(app_id, "total", self.ttl_seconds)
@@ -223,3 +223,52 @@ def test_breaker_board_configuration_unexpected_dry_run_event(
         e.value.args[0]
         == f'Dry-run event "{event_name}" is not monitored by circuit breaker.'
     )
+
+
+def test_breaker_board_is_webhook_blocked(settings, breaker_storage, app_with_webhook):
+    # given
+    settings.BREAKER_BOARD_SYNC_EVENTS = [
+        WebhookEventSyncType.TRANSACTION_CANCELATION_REQUESTED,
+        WebhookEventSyncType.TRANSACTION_REFUND_REQUESTED,
+    ]
+    settings.BREAKER_BOARD_DRY_RUN_SYNC_EVENTS = [
+        WebhookEventSyncType.TRANSACTION_REFUND_REQUESTED
+    ]
+    breaker_board = create_breaker_board(breaker_storage, cooldown_seconds=60)
+    app, _webhook = app_with_webhook
+    breaker_board.set_breaker_state(app, CircuitBreakerState.OPEN, 10, 10)
+
+    # when
+    cancel_blocked = breaker_board.is_webhook_blocked(
+        app, WebhookEventSyncType.TRANSACTION_CANCELATION_REQUESTED
+    )
+    refund_blocked = breaker_board.is_webhook_blocked(
+        app, WebhookEventSyncType.TRANSACTION_REFUND_REQUESTED
+    )
+    charge_blocked = breaker_board.is_webhook_blocked(
+        app, WebhookEventSyncType.TRANSACTION_CHARGE_REQUESTED
+    )
+
+    # then
+    assert cancel_blocked is True
+    assert refund_blocked is False
+    assert charge_blocked is False
+
+
+def test_breaker_board_is_webhook_blocked_closed_breaker(
+    settings, breaker_storage, app_with_webhook
+):
+    # given
+    settings.BREAKER_BOARD_SYNC_EVENTS = [
+        WebhookEventSyncType.TRANSACTION_CANCELATION_REQUESTED
+    ]
+    breaker_board = create_breaker_board(breaker_storage)
+    app, _webhook = app_with_webhook
+
+    # when
+    blocked = breaker_board.is_webhook_blocked(
+        app, WebhookEventSyncType.TRANSACTION_CANCELATION_REQUESTED
+    )
+
+    # then
+    assert blocked is False
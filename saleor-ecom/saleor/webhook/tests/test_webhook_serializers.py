@@ -18,7 +18,7 @@ from ...discount.utils.checkout import (
 from ...plugins.manager import get_plugins_manager
 from ...product.models import Product
 from ...product.utils.variant_prices import update_discounted_prices_for_promotion
-from ...product.utils.variants import fetch_variants_for_promotion_rules
+from ...product.utils.variants import update_variants_for_promotion_rules
 from ..serializers import (
     serialize_checkout_lines,
     serialize_checkout_lines_for_tax_calculation,
@@ -349,7 +349,9 @@ def test_serialize_checkout_lines_for_tax_calculation_with_promotion(
     }
     promotion_rule.save(update_fields=["catalogue_predicate"])
 
-    fetch_variants_for_promotion_rules(PromotionRule.objects.all())
+    update_variants_for_promotion_rules(
+        PromotionRule.objects.all(), mark_products_as_dirty=False
+    )
     update_discounted_prices_for_promotion(Product.objects.all())
 
     lines, _ = fetch_checkout_lines(checkout)
@@ -100,21 +100,21 @@ def create_deliveries_for_multiple_subscription_objects(
     event_deliveries = []
     event_deliveries_for_bulk_update = []
 
-    for subscribable_object in subscribable_objects:
-        # Dataloaders are shared between calls to generate_payload_from_subscription to
-        # reuse their cache. This avoids unnecessary DB queries when different webhooks
-        # need to resolve the same data.
-        dataloaders: dict[str, type[DataLoader]] = {}
+    # Dataloaders are shared between calls to generate_payload_from_subscription to
+    # reuse their cache. This avoids unnecessary DB queries when different webhooks
+    # or different objects need to resolve the same data.
+    dataloaders: dict[str, type[DataLoader]] = {}
 
-        request = initialize_request(
-            requestor,
-            event_type in WebhookEventSyncType.ALL,
-            event_type=event_type,
-            allow_replica=allow_replica,
-            request_time=request_time,
-            dataloaders=dataloaders,
-        )
+    request = initialize_request(
+        requestor,
+        event_type in WebhookEventSyncType.ALL,
+        event_type=event_type,
+        allow_replica=allow_replica,
+        request_time=request_time,
+        dataloaders=dataloaders,
+    )
 
+    for subscribable_object in subscribable_objects:
         for webhook in webhooks:
             data = generate_payload_from_subscription(
                 event_type=event_type,
@@ -19,8 +19,17 @@ from ...plugins.base_plugin import ExcludedShippingMethod, RequestorOrLazyObject
 from ...settings import WEBHOOK_SYNC_TIMEOUT
 from ...shipping.interface import ShippingMethodData
 from ...webhook.utils import get_webhooks_for_event
-from ..const import APP_ID_PREFIX, CACHE_EXCLUDED_SHIPPING_TIME
-from .synchronous.transport import trigger_webhook_sync_if_not_cached
+from ..const import (
+    APP_ID_PREFIX,
+    CACHE_EXCLUDED_SHIPPING_TIME,
+    CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+)
+from ..event_types import WebhookEventSyncType
+from ..payloads import generate_checkout_payload
+from .synchronous.transport import (
+    trigger_webhook_sync_if_not_cached,
+    trigger_webhook_sync_if_not_cached_in_background,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -126,29 +135,40 @@ def get_excluded_shipping_methods_or_fetch(
     """Return data of all excluded shipping methods.
 
     The data will be fetched from the cache. If missing it will fetch it from all
-    defined webhooks by calling a request to each of them one by one.
+    defined webhooks, the requests to multiple webhooks are sent concurrently.
     """
     if pregenerated_subscription_payloads is None:
         pregenerated_subscription_payloads = {}
     cache_data = get_cache_data_for_exclude_shipping_methods(payload)
-    excluded_methods = []
-    # Gather responses from webhooks
+    # With multiple webhooks the requests are sent concurrently
+    trigger_webhook = (
+        trigger_webhook_sync_if_not_cached_in_background
+        if len(webhooks) > 1
+        else _trigger_webhook_sync_if_not_cached_now
+    )
+    get_responses = []
     for webhook in webhooks:
         pregenerated_subscription_payload = get_pregenerated_subscription_payload(
             webhook, pregenerated_subscription_payloads
         )
-        response_data = trigger_webhook_sync_if_not_cached(
-            event_type=event_type,
-            payload=payload,
-            webhook=webhook,
-            cache_data=cache_data,
-            allow_replica=allow_replica,
-            subscribable_object=subscribable_object,
-            request_timeout=WEBHOOK_SYNC_TIMEOUT,
-            cache_timeout=CACHE_EXCLUDED_SHIPPING_TIME,
-            requestor=requestor,
-            pregenerated_subscription_payload=pregenerated_subscription_payload,
+        get_responses.append(
+            trigger_webhook(
+                event_type=event_type,
+                payload=payload,
+                webhook=webhook,
+                cache_data=cache_data,
+                allow_replica=allow_replica,
+                subscribable_object=subscribable_object,
+                request_timeout=WEBHOOK_SYNC_TIMEOUT,
+                cache_timeout=CACHE_EXCLUDED_SHIPPING_TIME,
+                requestor=requestor,
+                pregenerated_subscription_payload=pregenerated_subscription_payload,
+            )
         )
+    excluded_methods = []
+    # Gather responses from webhooks
+    for get_response in get_responses:
+        response_data = get_response()
         if response_data and isinstance(response_data, dict):
             excluded_methods.extend(
                 get_excluded_shipping_methods_from_response(response_data)
@@ -254,3 +274,58 @@ def get_cache_data_for_shipping_list_methods_for_checkout(payload: str) -> dict:
     if "external_app_shipping_id" in key_data[0].get("private_metadata", {}):
         del key_data[0]["private_metadata"]["external_app_shipping_id"]
     return key_data
+
+
+def request_shipping_methods_for_checkout(
+    checkout: "Checkout",
+    webhooks: QuerySet,
+    allow_replica: bool,
+    requestor: RequestorOrLazyObject | None = None,
+    in_background: bool = False,
+) -> Callable[[], list[ShippingMethodData]]:
+    """Request the shipping methods for the checkout from the shipping apps.
+
+    Return the function that collects the shipping methods from the responses.
+    With `in_background`, the requests are sent concurrently in the background
+    threads and the function waits for them.
+    """
+    trigger_webhook = (
+        trigger_webhook_sync_if_not_cached_in_background
+        if in_background
+        else _trigger_webhook_sync_if_not_cached_now
+    )
+    payload = generate_checkout_payload(checkout, requestor)
+    cache_data = get_cache_data_for_shipping_list_methods_for_checkout(payload)
+    get_responses = [
+        (
+            webhook,
+            trigger_webhook(
+                event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                payload=payload,
+                webhook=webhook,
+                cache_data=cache_data,
+                allow_replica=allow_replica,
+                subscribable_object=checkout,
+                request_timeout=WEBHOOK_SYNC_TIMEOUT,
+                cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                requestor=requestor,
+            ),
+        )
+        for webhook in webhooks
+    ]
+
+    def get_shipping_methods() -> list[ShippingMethodData]:
+        methods = []
+        for webhook, get_response in get_responses:
+            if response_data := get_response():
+                methods.extend(
+                    parse_list_shipping_methods_response(response_data, webhook.app)
+                )
+        return methods
+
+    return get_shipping_methods
+
+
+def _trigger_webhook_sync_if_not_cached_now(**kwargs) -> Callable[[], dict | None]:
+    response_data = trigger_webhook_sync_if_not_cached(**kwargs)
+    return lambda: response_data
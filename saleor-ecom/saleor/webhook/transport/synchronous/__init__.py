@@ -2,10 +2,12 @@ from .transport import (
     trigger_all_webhooks_sync,
     trigger_webhook_sync,
     trigger_webhook_sync_if_not_cached,
+    trigger_webhook_sync_if_not_cached_in_background,
 )
 
 __all__ = [
     "trigger_all_webhooks_sync",
     "trigger_webhook_sync",
     "trigger_webhook_sync_if_not_cached",
+    "trigger_webhook_sync_if_not_cached_in_background",
 ]
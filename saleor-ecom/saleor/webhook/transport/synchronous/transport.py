@@ -1,13 +1,15 @@
 import json
 import logging
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, TypeVar
 from urllib.parse import urlparse
 
 from django.conf import settings
 from django.core.cache import cache
-from django.db import transaction
+from django.db import connections, transaction
 
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
@@ -305,8 +307,38 @@ def trigger_webhook_sync(
     pregenerated_subscription_payload: dict | None = None,
 ) -> dict[Any, Any] | None:
     """Send a synchronous webhook request."""
+    delivery = _create_delivery_for_sync_event(
+        event_type,
+        payload,
+        webhook,
+        allow_replica,
+        subscribable_object=subscribable_object,
+        request=request,
+        requestor=requestor,
+        pregenerated_subscription_payload=pregenerated_subscription_payload,
+    )
+    if not delivery:
+        return None
+
+    kwargs = {}
+    if timeout:
+        kwargs = {"timeout": timeout}
+
+    return send_webhook_request_sync(delivery, **kwargs)
+
+
+def _create_delivery_for_sync_event(
+    event_type: str,
+    payload: str,
+    webhook: "Webhook",
+    allow_replica,
+    subscribable_object=None,
+    request=None,
+    requestor=None,
+    pregenerated_subscription_payload: dict | None = None,
+) -> EventDelivery | None:
     if webhook.subscription_query:
-        delivery = create_delivery_for_subscription_sync_event(
+        return create_delivery_for_subscription_sync_event(
             event_type=event_type,
             subscribable_object=subscribable_object,
             webhook=webhook,
@@ -316,25 +348,118 @@ def trigger_webhook_sync(
             pregenerated_payload=pregenerated_subscription_payload,
             with_save=False,
         )
-        if not delivery:
-            return None
-    else:
-        delivery = EventDelivery(
-            status=EventDeliveryStatus.PENDING,
+    return EventDelivery(
+        status=EventDeliveryStatus.PENDING,
+        event_type=event_type,
+        payload=EventPayload(payload=payload),
+        webhook=webhook,
+    )
+
+
+if breaker_board := initialize_breaker_board():
+    trigger_webhook_sync = breaker_board(trigger_webhook_sync)
+
+
+def trigger_webhook_sync_if_not_cached_in_background(
+    event_type: str,
+    payload: str,
+    webhook: "Webhook",
+    cache_data: dict,
+    allow_replica: bool,
+    subscribable_object=None,
+    request_timeout=None,
+    cache_timeout=None,
+    request=None,
+    requestor=None,
+    pregenerated_subscription_payload: dict | None = None,
+) -> Callable[[], dict | None]:
+    """Start a synchronous webhook request and return a function waiting for it.
+
+    Works like `trigger_webhook_sync_if_not_cached`, but the request is sent in
+    a background thread, so the independent webhooks can be called concurrently.
+    The payload is generated in the calling thread. When the concurrent requests
+    are disabled, the circuit breaker is used or the database transaction is in
+    progress, the request is sent right away.
+    """
+    cache_key = generate_cache_key_for_webhook(
+        cache_data, webhook.target_url, event_type, webhook.app_id
+    )
+    response_data = cache.get(cache_key)
+    if response_data is not None:
+        return lambda: response_data
+
+    if (
+        settings.WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS <= 1
+        or breaker_board
+        # The background thread uses its own database connection that doesn't see
+        # the delivery created in the not committed transaction.
+        or connections[settings.DATABASE_CONNECTION_DEFAULT_NAME].in_atomic_block
+    ):
+        response_data = trigger_webhook_sync_if_not_cached(
             event_type=event_type,
-            payload=EventPayload(payload=payload),
+            payload=payload,
             webhook=webhook,
+            cache_data=cache_data,
+            allow_replica=allow_replica,
+            subscribable_object=subscribable_object,
+            request_timeout=request_timeout,
+            cache_timeout=cache_timeout,
+            request=request,
+            requestor=requestor,
+            pregenerated_subscription_payload=pregenerated_subscription_payload,
         )
+        return lambda: response_data
+
+    delivery = _create_delivery_for_sync_event(
+        event_type,
+        payload,
+        webhook,
+        allow_replica,
+        subscribable_object=subscribable_object,
+        request=request,
+        requestor=requestor,
+        pregenerated_subscription_payload=pregenerated_subscription_payload,
+    )
+    if not delivery:
+        return lambda: None
 
     kwargs = {}
-    if timeout:
-        kwargs = {"timeout": timeout}
+    if request_timeout:
+        kwargs = {"timeout": request_timeout}
+    # load the data used for sending the request before leaving the thread
+    get_domain()
+    _ = delivery.webhook.app
+    future = _get_sync_webhooks_executor().submit(
+        _send_webhook_request_sync_in_thread, delivery, **kwargs
+    )
 
-    return send_webhook_request_sync(delivery, **kwargs)
+    def wait_for_response() -> dict | None:
+        response_data = future.result()
+        if response_data is not None:
+            cache.set(
+                cache_key,
+                response_data,
+                timeout=cache_timeout or WEBHOOK_CACHE_DEFAULT_TIMEOUT,
+            )
+        return response_data
 
+    return wait_for_response
 
-if breaker_board := initialize_breaker_board():
-    trigger_webhook_sync = breaker_board(trigger_webhook_sync)
+
+@lru_cache(maxsize=1)
+def _get_sync_webhooks_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=settings.WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS,
+        thread_name_prefix="sync-webhooks",
+    )
+
+
+def _send_webhook_request_sync_in_thread(delivery, **kwargs) -> dict | None:
+    try:
+        return send_webhook_request_sync(delivery, **kwargs)
+    finally:
+        # the unsuccessful delivery attempts are saved with the thread connection
+        connections.close_all()
 
 
 def trigger_all_webhooks_sync(
@@ -1,11 +1,20 @@
+import threading
+from unittest import mock
+
+import pytest
+
 from ....checkout.utils import get_or_create_checkout_metadata
+from ...event_types import WebhookEventSyncType
+from ...models import Webhook, WebhookEvent
 from ...payloads import (
     generate_checkout_payload,
     generate_excluded_shipping_methods_for_checkout_payload,
 )
+from ...utils import get_webhooks_for_event
 from ..shipping import (
     get_cache_data_for_exclude_shipping_methods,
     get_cache_data_for_shipping_list_methods_for_checkout,
+    request_shipping_methods_for_checkout,
 )
 
 
@@ -42,3 +51,138 @@ def test_get_cache_data_for_exclude_shipping_methods(checkout_with_items):
     # then
     assert "last_change" not in cache_data
     assert "meta" not in cache_data
+
+
+def _add_shipping_list_webhook(app, name):
+    webhook = Webhook.objects.create(
+        name=name, app=app, target_url=f"https://{name}.com/api/"
+    )
+    WebhookEvent.objects.create(
+        event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+        webhook=webhook,
+    )
+    return webhook
+
+
+@pytest.mark.django_db(transaction=True)
+@mock.patch("saleor.webhook.transport.synchronous.transport.cache.set")
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_request_shipping_methods_for_checkout_in_background(
+    mocked_webhook, mocked_cache_set, checkout_with_item, shipping_app, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS = 4
+    _add_shipping_list_webhook(shipping_app, "second-shipping-webhook")
+    webhooks = get_webhooks_for_event(
+        WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    )
+    assert len(webhooks) == 2
+
+    threads = set()
+
+    def send_request(delivery, **kwargs):
+        threads.add(threading.get_ident())
+        return [
+            {
+                "id": delivery.webhook.name,
+                "name": "Standard Shipping",
+                "amount": 5,
+                "currency": "USD",
+            }
+        ]
+
+    mocked_webhook.side_effect = send_request
+
+    # when
+    get_shipping_methods = request_shipping_methods_for_checkout(
+        checkout_with_item, webhooks, allow_replica=False, in_background=True
+    )
+    methods = get_shipping_methods()
+
+    # then
+    assert mocked_webhook.call_count == 2
+    assert mocked_cache_set.call_count == 2
+    assert threading.get_ident() not in threads
+    assert sorted(method.name for method in methods) == [
+        "Standard Shipping",
+        "Standard Shipping",
+    ]
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_request_shipping_methods_for_checkout_in_background_disabled(
+    mocked_webhook, checkout_with_item, shipping_app, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS = 1
+    _add_shipping_list_webhook(shipping_app, "second-shipping-webhook")
+    webhooks = get_webhooks_for_event(
+        WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    )
+    threads = set()
+
+    def send_request(delivery, **kwargs):
+        threads.add(threading.get_ident())
+
+    mocked_webhook.side_effect = send_request
+
+    # when
+    get_shipping_methods = request_shipping_methods_for_checkout(
+        checkout_with_item, webhooks, allow_replica=False, in_background=True
+    )
+
+    # then
+    assert mocked_webhook.call_count == 2
+    assert threads == {threading.get_ident()}
+    assert get_shipping_methods() == []
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_request_shipping_methods_for_checkout_in_background_in_transaction(
+    mocked_webhook, checkout_with_item, shipping_app, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS = 4
+    _add_shipping_list_webhook(shipping_app, "second-shipping-webhook")
+    webhooks = get_webhooks_for_event(
+        WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    )
+    threads = set()
+
+    def send_request(delivery, **kwargs):
+        threads.add(threading.get_ident())
+
+    mocked_webhook.side_effect = send_request
+
+    # when
+    get_shipping_methods = request_shipping_methods_for_checkout(
+        checkout_with_item, webhooks, allow_replica=False, in_background=True
+    )
+
+    # then
+    assert mocked_webhook.call_count == 2
+    assert threads == {threading.get_ident()}
+    assert get_shipping_methods() == []
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.cache.get")
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_request_shipping_methods_for_checkout_in_background_use_cache(
+    mocked_webhook, mocked_cache_get, checkout_with_item, shipping_app, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_CONCURRENT_REQUESTS = 4
+    _add_shipping_list_webhook(shipping_app, "second-shipping-webhook")
+    webhooks = get_webhooks_for_event(
+        WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    )
+    mocked_cache_get.return_value = []
+
+    # when
+    methods = request_shipping_methods_for_checkout(
+        checkout_with_item, webhooks, allow_replica=False, in_background=True
+    )()
+
+    # then
+    assert not mocked_webhook.called
+    assert methods == []